@@ -8,10 +8,13 @@ from authlib.integrations.base_client import OAuthError
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from authlib.oidc.discovery import get_well_known_url
 
+from shared.http_client import HTTPPoolConfig, get_http_client_registry
+
 from ...configs.settings import get_settings
 from ...domain.entities.auth_response import AuthResponse
 from ...domain.entities.token_response import TokenResponse
 from ...domain.entities.user_info import UserInfo
+from .token_verifier import JWKSCache, TokenVerifier, UserInfoCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,12 @@ class OAuthService:
         self.client: AsyncOAuth2Client = None
         self.server_metadata: dict[str, Any] = {}
         self.sessions: dict[str, dict[str, Any]] = {}
+        self.token_verifier: TokenVerifier | None = None
+        self._jwks: JWKSCache | None = None
+        self._userinfo_cache = UserInfoCache(
+            ttl=self.settings.auth.oidc.userinfo_cache_ttl,
+            max_size=self.settings.auth.oidc.userinfo_cache_size,
+        )
         self._setup_client()
 
     def _is_local_development(self) -> bool:
@@ -46,6 +55,20 @@ class OAuthService:
             return False
         return True
 
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared pooled client for provider calls, so connections are reused"""
+        oidc = self.settings.auth.oidc
+        config = HTTPPoolConfig(
+            max_connections=oidc.http_max_connections,
+            max_keepalive_connections=oidc.http_max_keepalive_connections,
+            keepalive_expiry=oidc.http_keepalive_expiry,
+            http2=oidc.http2_enabled,
+            timeout=10.0,
+            connect_timeout=5.0,
+            verify=self._get_ssl_context(),
+        )
+        return get_http_client_registry().get(oidc.issuer_url, config)
+
     def _setup_client(self):
         """Setup OAuth client with configured provider"""
         self.client = AsyncOAuth2Client(
@@ -58,23 +81,21 @@ class OAuthService:
     async def initialize(self):
         """Initialize OIDC provider metadata"""
         try:
-            # Create HTTP client with timeout and error handling
             timeout = httpx.Timeout(30.0, connect=10.0)
             # Method 1: Using authlib's get_well_known_url helper
             discovery_url = get_well_known_url(self.settings.auth.oidc.issuer_url, external=True)
-            # SSL configuration for local development
-            ssl_verify = self._get_ssl_context()
-            async with httpx.AsyncClient(timeout=timeout, verify=ssl_verify) as http_client:
-                logger.debug(f"Making request to: {discovery_url}")
-                response = await http_client.get(discovery_url)
-                logger.info(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
-                response.raise_for_status()
-                self.server_metadata = response.json()
+            logger.debug(f"Making request to: {discovery_url}")
+            response = await self._http_client().get(discovery_url, timeout=timeout)
+            logger.info(f"Response status: {response.status_code}")
+            logger.debug(f"Response headers: {dict(response.headers)}")
+            response.raise_for_status()
+            self.server_metadata = response.json()
 
             # Update client with server metadata
             self.client.server_metadata = self.server_metadata
 
+            await self._setup_token_verifier()
+
             logger.info("OIDC provider metadata initialized")
             logger.debug(f"Available endpoints: {list(self.server_metadata.keys())}")
 
@@ -82,6 +103,44 @@ class OAuthService:
             logger.error(f"Failed to initialize OIDC provider: {e}")
             raise
 
+    async def _setup_token_verifier(self) -> None:
+        """Load the provider JWKS so access tokens can be verified locally"""
+        jwks_uri = self.server_metadata.get("jwks_uri")
+        if not jwks_uri:
+            logger.warning("Provider has no jwks_uri - falling back to remote userinfo")
+            return
+
+        oidc = self.settings.auth.oidc
+        jwks = JWKSCache(
+            jwks_uri,
+            refresh_interval=oidc.jwks_refresh_interval,
+            min_refetch_interval=oidc.jwks_min_refetch_interval,
+            http_client=self._http_client(),
+        )
+        try:
+            await jwks.start()
+        except Exception as e:
+            await jwks.stop()
+            logger.warning(f"Failed to load JWKS - falling back to remote userinfo: {e}")
+            return
+
+        self._jwks = jwks
+        self.token_verifier = TokenVerifier(
+            jwks,
+            issuer=self.server_metadata.get("issuer"),
+            audience=oidc.audience,
+            algorithms=oidc.algorithms,
+            leeway=oidc.clock_skew_seconds,
+        )
+        logger.info(f"Local token verification enabled with keys {jwks.key_ids}")
+
+    async def close(self):
+        """Stop background JWKS refresh"""
+        if self._jwks is not None:
+            await self._jwks.stop()
+            self._jwks = None
+            self.token_verifier = None
+
     async def get_authorization_url(self, redirect_uri: str = None) -> AuthResponse:
         """Get authorization URL"""
         if not self.server_metadata:
@@ -144,32 +203,41 @@ class OAuthService:
             logger.error(f"Token exchange failed: {e}")
             raise Exception(f"Token exchange failed: {str(e)}")
 
-    async def get_user_info(self, access_token: str) -> UserInfo:
-        """Get user information using access token"""
+    async def get_user_info(self, access_token: str, expires_in: float | None = None) -> UserInfo:
+        """Get user information using access token
+
+        Responses are cached by token hash for ``userinfo_cache_ttl`` seconds,
+        or until ``expires_in`` if the token expires sooner.
+        """
         if not self.server_metadata:
             raise Exception("OIDC service not initialized")
 
+        cached = self._userinfo_cache.get(access_token)
+        if cached is not None:
+            return cached
+
         userinfo_endpoint = self.server_metadata.get("userinfo_endpoint")
 
         if not userinfo_endpoint:
             raise Exception("Userinfo endpoint not available")
 
         try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(
-                    userinfo_endpoint, headers={"Authorization": f"Bearer {access_token}"}
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http_client().get(
+                userinfo_endpoint, headers={"Authorization": f"Bearer {access_token}"}
+            )
+            response.raise_for_status()
+            data = response.json()
 
             logger.info("User info retrieved successfully")
-            return UserInfo(
+            user_info = UserInfo(
                 sub=data.get("sub"),
                 name=data.get("name"),
                 email=data.get("email"),
                 preferred_username=data.get("preferred_username"),
                 roles=data.get("roles", []),
             )
+            self._userinfo_cache.set(access_token, user_info, expires_in)
+            return user_info
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
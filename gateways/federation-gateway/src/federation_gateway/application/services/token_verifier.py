@@ -0,0 +1,242 @@
+"""Local access token verification against the provider JWKS.
+
+Verifying a JWT signature locally costs tens of microseconds, whereas a
+remote userinfo call costs a network round trip on every request. This
+module keeps the provider's JSON Web Key Set in memory and refreshes it in
+the background. If a token is signed with a ``kid`` that is not cached yet
+(key rotation), the set is fetched again, rate limited so random ``kid``
+values cannot turn the gateway into a JWKS request amplifier.
+
+``UserInfoCache`` is a small TTL cache for the remote userinfo fallback.
+It is keyed by a hash of the token, so raw tokens are never held as keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+import jwt
+
+from ...domain.entities.user_info import UserInfo
+
+logger = logging.getLogger(__name__)
+
+
+class TokenVerificationError(Exception):
+    """Raised when an access token cannot be verified locally."""
+
+
+class JWKSCache:
+    """In-memory JWKS with background refresh and refetch on unknown ``kid``."""
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        *,
+        refresh_interval: float = 300.0,
+        min_refetch_interval: float = 10.0,
+        verify_ssl: bool = True,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._jwks_uri = jwks_uri
+        self._refresh_interval = refresh_interval
+        self._min_refetch_interval = min_refetch_interval
+        # A client passed in is borrowed and left open on stop()
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0), verify=verify_ssl
+        )
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def key_ids(self) -> list[str]:
+        """Key IDs currently cached."""
+        return list(self._keys)
+
+    async def start(self) -> None:
+        """Fetch the key set and start the background refresh task."""
+        await self.refresh()
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop background refresh and close the HTTP client."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def refresh(self) -> None:
+        """Fetch the key set and replace the cached keys."""
+        response = await self._http.get(self._jwks_uri)
+        response.raise_for_status()
+        keys: dict[str, jwt.PyJWK] = {}
+        for jwk in response.json().get("keys", []):
+            if jwk.get("use", "sig") != "sig" or "kid" not in jwk:
+                continue
+            try:
+                keys[jwk["kid"]] = jwt.PyJWK(jwk)
+            except jwt.PyJWTError as e:
+                logger.warning(f"Skipping unusable JWK {jwk.get('kid')}: {e}")
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        logger.debug(f"JWKS refreshed with {len(keys)} keys")
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        """Return the key for ``kid``, refetching once if it is unknown.
+
+        Raises:
+            TokenVerificationError: If no key with that ID exists.
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        async with self._lock:
+            # Another request may have refetched while we waited
+            key = self._keys.get(kid)
+            if key is None and time.monotonic() - self._fetched_at >= self._min_refetch_interval:
+                logger.info(f"Unknown signing key {kid}, refetching JWKS")
+                # Count failed attempts too, so an unreachable provider is not hammered
+                self._fetched_at = time.monotonic()
+                try:
+                    await self.refresh()
+                except httpx.HTTPError as e:
+                    logger.warning(f"JWKS refetch failed: {e}")
+                key = self._keys.get(kid)
+
+        if key is None:
+            raise TokenVerificationError(f"Unknown signing key: {kid}")
+        return key
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the last known keys until the provider recovers
+                logger.warning(f"Background JWKS refresh failed: {e}")
+
+
+class TokenVerifier:
+    """Verifies access token signatures and standard claims locally."""
+
+    def __init__(
+        self,
+        jwks: JWKSCache,
+        *,
+        issuer: str | None,
+        audience: str | None = None,
+        algorithms: list[str] | None = None,
+        leeway: int = 30,
+    ) -> None:
+        self._jwks = jwks
+        self._issuer = issuer
+        self._audience = audience
+        self._algorithms = algorithms or ["RS256"]
+        self._leeway = leeway
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """Verify ``token`` and return its claims.
+
+        Raises:
+            TokenVerificationError: If the signature or any claim is invalid.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError as e:
+            raise TokenVerificationError(f"Malformed token: {e}") from e
+
+        kid = header.get("kid")
+        if not kid:
+            raise TokenVerificationError("Token has no key ID")
+        if header.get("alg") not in self._algorithms:
+            raise TokenVerificationError(f"Algorithm not allowed: {header.get('alg')}")
+
+        key = await self._jwks.get_key(kid)
+        try:
+            return jwt.decode(
+                token,
+                key.key,
+                algorithms=self._algorithms,
+                issuer=self._issuer,
+                audience=self._audience,
+                leeway=self._leeway,
+                options={"verify_aud": self._audience is not None, "require": ["exp"]},
+            )
+        except jwt.PyJWTError as e:
+            raise TokenVerificationError(str(e)) from e
+
+
+def user_info_from_claims(claims: dict[str, Any]) -> UserInfo | None:
+    """Build ``UserInfo`` from token claims.
+
+    Returns ``None`` when the token carries no profile claims (e.g. a bare
+    client-credentials token), in which case the caller falls back to the
+    userinfo endpoint.
+    """
+    if not any(claim in claims for claim in ("email", "name", "preferred_username")):
+        return None
+    roles = claims.get("roles")
+    if roles is None:
+        # Keycloak puts realm roles under realm_access
+        roles = claims.get("realm_access", {}).get("roles", [])
+    return UserInfo(
+        sub=claims["sub"],
+        name=claims.get("name"),
+        email=claims.get("email"),
+        preferred_username=claims.get("preferred_username"),
+        roles=roles,
+    )
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a token for use as a cache key."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class UserInfoCache:
+    """Bounded TTL cache of userinfo responses keyed by token hash."""
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 10_000) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, UserInfo]] = OrderedDict()
+
+    def get(self, token: str) -> UserInfo | None:
+        """Return the cached userinfo for ``token`` if it has not expired."""
+        key = token_cache_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user_info = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user_info
+
+    def set(self, token: str, user_info: UserInfo, expires_in: float | None = None) -> None:
+        """Cache ``user_info`` for ``token``, never beyond the token's own expiry."""
+        ttl = self._ttl if expires_in is None else min(self._ttl, expires_in)
+        if ttl <= 0:
+            return
+        key = token_cache_key(token)
+        self._entries[key] = (time.monotonic() + ttl, user_info)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -27,6 +27,17 @@ class OIDCSettings(BaseSettings):
         client_secret: OAuth2 client secret.
         redirect_uri: OAuth2 redirect URI.
         scopes: OAuth2 scopes to request.
+        audience: Expected access token audience (not checked if unset).
+        algorithms: Accepted access token signing algorithms.
+        clock_skew_seconds: Leeway for ``exp``/``nbf`` checks.
+        jwks_refresh_interval: Seconds between background JWKS refreshes.
+        jwks_min_refetch_interval: Minimum seconds between refetches on unknown ``kid``.
+        userinfo_cache_ttl: Seconds a userinfo response is reused.
+        userinfo_cache_size: Maximum cached userinfo responses.
+        http_max_connections: Maximum open connections to the provider.
+        http_max_keepalive_connections: Maximum idle connections kept open.
+        http_keepalive_expiry: Seconds an idle provider connection is kept.
+        http2_enabled: Use HTTP/2 to the provider (needs ``h2``).
     """
 
     model_config = SettingsConfigDict(
@@ -55,6 +66,59 @@ class OIDCSettings(BaseSettings):
         default="openid profile email",
         description="OAuth2 scopes to request",
     )
+    audience: str | None = Field(
+        default=None,
+        description="Expected access token audience (not checked if unset)",
+    )
+    algorithms: list[str] = Field(
+        default_factory=lambda: ["RS256"],
+        description="Accepted access token signing algorithms",
+    )
+    clock_skew_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=300,
+        description="Leeway for exp/nbf checks",
+    )
+    jwks_refresh_interval: int = Field(
+        default=300,
+        ge=10,
+        description="Seconds between background JWKS refreshes",
+    )
+    jwks_min_refetch_interval: int = Field(
+        default=10,
+        ge=0,
+        description="Minimum seconds between JWKS refetches on unknown kid",
+    )
+    userinfo_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        description="Seconds a userinfo response is reused (0 disables caching)",
+    )
+    userinfo_cache_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum cached userinfo responses",
+    )
+    http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum open connections to the OIDC provider",
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum idle connections to the OIDC provider kept open",
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle connection to the OIDC provider is kept open",
+    )
+    http2_enabled: bool = Field(
+        default=False,
+        description="Use HTTP/2 for OIDC provider requests (requires h2)",
+    )
 
 
 class GatewayAuthSettings(BaseSettings):
@@ -1,7 +1,11 @@
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from ...application.services.oauth_service import OAuthService
+from ...application.services.token_verifier import user_info_from_claims
+from ...domain.entities.user_info import UserInfo
 
 security = HTTPBearer(auto_error=False)
 
@@ -10,6 +14,29 @@ class AuthMiddleware:
     def __init__(self, oidc_service: OAuthService):
         self.oidc_service = oidc_service
 
+    async def authenticate(self, token: str) -> UserInfo:
+        """Resolve the user for an access token
+
+        Verifies the token locally against the cached provider JWKS and builds
+        the user from its claims. The (cached) userinfo endpoint is only called
+        when the token carries no profile claims, or when local verification
+        is unavailable because the provider publishes no JWKS.
+
+        Raises:
+            TokenVerificationError: If the token fails local verification.
+        """
+        verifier = self.oidc_service.token_verifier
+        if verifier is None:
+            return await self.oidc_service.get_user_info(token)
+
+        claims = await verifier.verify(token)
+        user_info = user_info_from_claims(claims)
+        if user_info is not None:
+            return user_info
+
+        expires_in = claims["exp"] - time.time() if "exp" in claims else None
+        return await self.oidc_service.get_user_info(token, expires_in=expires_in)
+
     async def get_current_user(
         self, credentials: HTTPAuthorizationCredentials | None = Depends(security)
     ):
@@ -18,8 +45,7 @@ class AuthMiddleware:
             return None
 
         try:
-            user_info = await self.oidc_service.get_user_info(credentials.credentials)
-            return user_info
+            return await self.authenticate(credentials.credentials)
         except Exception:
             return None
 
@@ -31,7 +57,6 @@ class AuthMiddleware:
             )
 
         try:
-            user = await self.oidc_service.get_user_info(credentials.credentials)
-            return user
+            return await self.authenticate(credentials.credentials)
         except Exception:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
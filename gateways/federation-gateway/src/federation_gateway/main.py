@@ -15,7 +15,8 @@ from fastapi.responses import JSONResponse
 
 from shared.fastapi_utils.exception_handlers import register_exception_handlers
 from shared.fastapi_utils.health_router import create_health_router
-from shared.fastapi_utils.middleware import RequestContextMiddleware
+from shared.fastapi_utils.middleware import RequestContextHook
+from shared.http_client import close_http_clients
 from shared.observability import (
     LoggingConfig,
     RequestLoggingMiddleware,
@@ -61,6 +62,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     logger.info("Shutting down federation-gateway")
+    if app.state.oauth_service is not None:
+        await app.state.oauth_service.close()
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -77,8 +81,7 @@ app = FastAPI(
 setup_cors_middleware(app, settings_manager)
 setup_compress_middleware(app)
 setup_session_middleware(app, settings_manager)
-app.add_middleware(RequestContextMiddleware)
-app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
 
 # Exception handlers
 register_exception_handlers(app)
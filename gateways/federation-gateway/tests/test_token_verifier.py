@@ -0,0 +1,139 @@
+"""Tests for local access token verification."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from federation_gateway.application.services.token_verifier import (
+    JWKSCache,
+    TokenVerificationError,
+    TokenVerifier,
+    UserInfoCache,
+    user_info_from_claims,
+)
+from federation_gateway.domain.entities.user_info import UserInfo
+
+ISSUER = "https://idp.example.com"
+JWKS_URI = f"{ISSUER}/.well-known/jwks.json"
+
+
+def _key_pair(kid: str) -> tuple[rsa.RSAPrivateKey, dict]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+def _token(private_key: rsa.RSAPrivateKey, kid: str, **claims: object) -> str:
+    payload = {"iss": ISSUER, "sub": "user-1", "exp": int(time.time()) + 300, **claims}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+class _JWKSServer:
+    """Serves a mutable key set and counts fetches."""
+
+    def __init__(self, *jwks: dict) -> None:
+        self.keys = list(jwks)
+        self.fetches = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        return httpx.Response(200, json={"keys": self.keys})
+
+
+@pytest.fixture
+def key_one() -> tuple[rsa.RSAPrivateKey, dict]:
+    return _key_pair("key-1")
+
+
+async def _verifier(server: _JWKSServer, min_refetch_interval: float = 0.0) -> TokenVerifier:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    jwks = JWKSCache(JWKS_URI, min_refetch_interval=min_refetch_interval, http_client=http)
+    await jwks.refresh()
+    return TokenVerifier(jwks, issuer=ISSUER)
+
+
+class TestTokenVerifier:
+    async def test_verifies_signature_and_claims(self, key_one) -> None:
+        private_key, jwk = key_one
+        verifier = await _verifier(_JWKSServer(jwk))
+
+        claims = await verifier.verify(_token(private_key, "key-1", email="a@example.com"))
+
+        assert claims["sub"] == "user-1"
+
+    async def test_rejects_expired_and_foreign_tokens(self, key_one) -> None:
+        private_key, jwk = key_one
+        verifier = await _verifier(_JWKSServer(jwk))
+
+        with pytest.raises(TokenVerificationError):
+            await verifier.verify(_token(private_key, "key-1", exp=int(time.time()) - 3600))
+        with pytest.raises(TokenVerificationError):
+            await verifier.verify(_token(private_key, "key-1", iss="https://evil.example.com"))
+        with pytest.raises(TokenVerificationError):
+            await verifier.verify("not-a-jwt")
+
+    async def test_rejects_tokens_without_expiry(self, key_one) -> None:
+        private_key, jwk = key_one
+        verifier = await _verifier(_JWKSServer(jwk))
+        token = jwt.encode(
+            {"iss": ISSUER, "sub": "user-1"},
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "key-1"},
+        )
+
+        with pytest.raises(TokenVerificationError, match="exp"):
+            await verifier.verify(token)
+
+    async def test_refetches_on_unknown_kid(self, key_one) -> None:
+        _, jwk = key_one
+        server = _JWKSServer(jwk)
+        verifier = await _verifier(server)
+        rotated_key, rotated_jwk = _key_pair("key-2")
+        server.keys.append(rotated_jwk)
+
+        claims = await verifier.verify(_token(rotated_key, "key-2"))
+
+        assert claims["sub"] == "user-1"
+        assert server.fetches == 2
+
+    async def test_unknown_kid_refetch_is_rate_limited(self, key_one) -> None:
+        _, jwk = key_one
+        server = _JWKSServer(jwk)
+        verifier = await _verifier(server, min_refetch_interval=60)
+        other_key, _ = _key_pair("key-3")
+
+        for _ in range(3):
+            with pytest.raises(TokenVerificationError):
+                await verifier.verify(_token(other_key, "key-3"))
+
+        assert server.fetches == 1
+
+
+class TestUserInfo:
+    def test_claims_with_profile_build_user(self) -> None:
+        user = user_info_from_claims(
+            {"sub": "u1", "email": "a@example.com", "realm_access": {"roles": ["admin"]}}
+        )
+
+        assert user == UserInfo(sub="u1", email="a@example.com", roles=["admin"])
+
+    def test_claims_without_profile_need_userinfo(self) -> None:
+        assert user_info_from_claims({"sub": "u1", "scope": "read"}) is None
+
+    def test_cache_expires_and_evicts(self) -> None:
+        cache = UserInfoCache(ttl=60, max_size=1)
+        cache.set("token-a", UserInfo(sub="a"))
+        cache.set("token-b", UserInfo(sub="b"))
+        cache.set("token-c", UserInfo(sub="c"), expires_in=0)
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") == UserInfo(sub="b")
+        assert cache.get("token-c") is None
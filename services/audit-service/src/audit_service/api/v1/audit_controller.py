@@ -5,23 +5,26 @@ Provides CRUD operations for audit events including create, list, get, search,
 and export functionality.
 """
 
+import json
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import BaseModel, Field
 
 from audit_service.application.services.audit_service import (
     AuditAppService,
     get_audit_service,
 )
+from audit_service.configs.settings import Settings, get_settings
 from audit_service.domain.entities.audit_event import (
     AuditAction,
     AuditEventResponse,
     AuditSeverity,
     CreateAuditEventRequest,
 )
+from shared.exceptions import BadRequestException
 
 router = APIRouter()
 
@@ -30,10 +33,108 @@ class PaginatedResponse(BaseModel):
     """Paginated response wrapper."""
 
     items: list[AuditEventResponse] = Field(description="List of audit events")
-    total: int = Field(description="Total number of items")
+    total: int | None = Field(description="Total number of items (omitted for cursor pages)")
     page: int = Field(description="Current page number")
     page_size: int = Field(description="Items per page")
     has_next: bool = Field(description="Whether there are more pages")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+
+
+class BatchItemResponse(BaseModel):
+    """Result for one item of a batch ingestion."""
+
+    index: int = Field(description="Position of the item in the request")
+    status: Literal["created", "rejected"] = Field(description="Item outcome")
+    id: UUID | None = Field(default=None, description="ID of the created event")
+    errors: list[dict[str, Any]] | None = Field(
+        default=None, description="Validation errors of a rejected item"
+    )
+
+
+class BatchIngestResponse(BaseModel):
+    """Batch ingestion response."""
+
+    created: int = Field(description="Number of events created")
+    rejected: int = Field(description="Number of items rejected")
+    results: list[BatchItemResponse] = Field(description="Per-item results, in request order")
+
+
+NDJSON_MEDIA_TYPES = frozenset({"application/x-ndjson", "application/ndjson", "application/jsonl"})
+
+
+async def read_batch_body(request: Request, max_bytes: int) -> bytes:
+    """
+    Read a batch request body, refusing it once it exceeds ``max_bytes``.
+
+    A declared ``Content-Length`` above the limit is rejected before any of
+    the body is read; otherwise the stream is consumed until the limit is hit.
+
+    Args:
+        request: Incoming request carrying the batch body.
+        max_bytes: Maximum accepted body size.
+
+    Returns:
+        bytes: The raw request body.
+
+    Raises:
+        ValueError: If the body is larger than ``max_bytes``.
+    """
+    too_large = f"Batch body exceeds the maximum of {max_bytes} bytes"
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError(too_large)
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise ValueError(too_large)
+    return bytes(body)
+
+
+def parse_batch_body(body: bytes, content_type: str, max_items: int | None = None) -> list[Any]:
+    """
+    Decode a batch request body.
+
+    NDJSON lines are decoded one at a time and decoding stops as soon as
+    the batch has more than ``max_items`` events.
+
+    Args:
+        body: Raw request body.
+        content_type: Request ``Content-Type`` header.
+        max_items: Maximum number of events accepted (unbounded if None).
+
+    Returns:
+        list[Any]: Decoded items (one per NDJSON line or array element).
+
+    Raises:
+        ValueError: If the body is not valid NDJSON or a JSON array, or
+            holds more than ``max_items`` events.
+    """
+    too_many = f"Batch exceeds the maximum of {max_items} events"
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        items = []
+        for number, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            if max_items is not None and len(items) >= max_items:
+                raise ValueError(too_many)
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {number}: {e.msg}") from e
+        return items
+
+    try:
+        items = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON body: {e.msg}") from e
+    if not isinstance(items, list):
+        raise ValueError("Batch body must be a JSON array or NDJSON")
+    if max_items is not None and len(items) > max_items:
+        raise ValueError(too_many)
+    return items
 
 
 class SearchFilters(BaseModel):
@@ -75,6 +176,69 @@ async def create_audit_event(
     return await service.create_event(request)
 
 
+@router.post(
+    "/events/batch",
+    response_model=BatchIngestResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Audit Events in Batch",
+    description="Create audit events from an NDJSON stream or a JSON array",
+    responses={207: {"model": BatchIngestResponse, "description": "Some items were rejected"}},
+)
+async def create_audit_events_batch(
+    request: Request,
+    response: Response,
+    service: Annotated[AuditAppService, Depends(get_audit_service)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> BatchIngestResponse:
+    """
+    Create audit events in bulk.
+
+    The body is either ``application/x-ndjson`` (one event per line) or a
+    JSON array of events. Each item is validated on its own; valid items are
+    stored in one write and invalid ones are reported without failing the
+    batch. The response is 201 when every item was created and 207 otherwise.
+
+    Args:
+        request: Incoming request carrying the batch body.
+        response: Outgoing response (status set per outcome).
+        service: Injected audit service.
+        settings: Application settings (maximum batch size and body size).
+
+    Returns:
+        BatchIngestResponse: Counts and per-item results.
+
+    Raises:
+        BadRequestException: If the body is malformed, empty or too large (400).
+    """
+    try:
+        body = await read_batch_body(request, settings.audit_batch_max_bytes)
+        items = parse_batch_body(
+            body, request.headers.get("content-type", ""), settings.audit_batch_size
+        )
+    except ValueError as e:
+        raise BadRequestException(message=str(e)) from e
+    if not items:
+        raise BadRequestException(message="Batch contains no events")
+
+    result = await service.create_events(items)
+    if result.rejected:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+
+    return BatchIngestResponse(
+        created=result.created,
+        rejected=result.rejected,
+        results=[
+            BatchItemResponse(
+                index=item.index,
+                status="created" if item.event is not None else "rejected",
+                id=item.event.id if item.event is not None else None,
+                errors=item.errors,
+            )
+            for item in result.items
+        ],
+    )
+
+
 @router.get(
     "/events",
     response_model=PaginatedResponse,
@@ -89,21 +253,31 @@ async def list_audit_events(
     resource_type: Annotated[str | None, Query(description="Filter by resource type")] = None,
     action: Annotated[AuditAction | None, Query(description="Filter by action")] = None,
     severity: Annotated[AuditSeverity | None, Query(description="Filter by severity")] = None,
+    cursor: Annotated[
+        str | None, Query(description="Cursor from a previous page (keyset pagination)")
+    ] = None,
 ) -> PaginatedResponse:
     """
     List audit events with optional filtering and pagination.
 
+    Pass ``next_cursor`` back as ``cursor`` to page by keyset: deep pages
+    then cost the same as the first one, and ``total`` is omitted.
+
     Args:
         service: Injected audit service.
-        page: Page number (1-indexed).
+        page: Page number (1-indexed), ignored when ``cursor`` is given.
         page_size: Number of items per page.
         actor_id: Optional filter by actor ID.
         resource_type: Optional filter by resource type.
         action: Optional filter by action type.
         severity: Optional filter by severity level.
+        cursor: Optional cursor returned by the previous page.
 
     Returns:
         PaginatedResponse: Paginated list of audit events.
+
+    Raises:
+        BadRequestException: If the cursor is malformed (400).
     """
     filters = SearchFilters(
         actor_id=actor_id,
@@ -112,18 +286,23 @@ async def list_audit_events(
         severity=severity,
     )
 
-    result = await service.list_events(
-        page=page,
-        page_size=page_size,
-        filters=filters,
-    )
+    try:
+        result = await service.list_events(
+            page=page,
+            page_size=page_size,
+            filters=filters,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise BadRequestException(message=str(e)) from e
 
     return PaginatedResponse(
         items=result.items,
         total=result.total,
         page=page,
         page_size=page_size,
-        has_next=result.total > page * page_size,
+        has_next=result.next_cursor is not None,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -5,17 +5,23 @@ Implements the business logic for audit event operations, coordinating
 between the API layer and the domain/infrastructure layers.
 """
 
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from audit_service.domain.entities.audit_event import (
     AuditEvent,
     AuditEventResponse,
     CreateAuditEventRequest,
 )
-from audit_service.domain.repositories.audit_repository import IAuditRepository
+from audit_service.domain.repositories.audit_repository import (
+    IAuditRepository,
+    encode_event_cursor,
+)
 
 # Import shared library components
 try:
@@ -40,7 +46,34 @@ class PaginatedResult:
     """Paginated result container."""
 
     items: list[AuditEventResponse]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one item in a batch ingestion."""
+
+    index: int
+    event: AuditEventResponse | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+@dataclass
+class BatchResult:
+    """Per-item outcomes of a batch ingestion, in input order."""
+
+    items: list[BatchItemResult] = field(default_factory=list)
+
+    @property
+    def created(self) -> int:
+        """Number of events persisted."""
+        return sum(1 for item in self.items if item.event is not None)
+
+    @property
+    def rejected(self) -> int:
+        """Number of items that failed validation."""
+        return len(self.items) - self.created
 
 
 class AuditAppService:
@@ -70,30 +103,8 @@ class AuditAppService:
         Returns:
             AuditEventResponse: Created audit event.
         """
-        # Create domain entity from request
-        event = AuditEvent(
-            service_name=request.service_name,
-            correlation_id=request.correlation_id,
-            actor_id=request.actor_id,
-            actor_type=request.actor_type,
-            actor_name=request.actor_name,
-            actor_email=request.actor_email,
-            actor_ip=request.actor_ip,
-            actor_user_agent=request.actor_user_agent,
-            action=request.action,
-            severity=request.severity,
-            resource_type=request.resource_type,
-            resource_id=request.resource_id,
-            resource_name=request.resource_name,
-            description=request.description,
-            metadata=request.metadata,
-            old_value=request.old_value,
-            new_value=request.new_value,
-            compliance_tags=request.compliance_tags,
-        )
-
         # Persist the event
-        created_event = await self._repository.create(event)
+        created_event = await self._repository.create(self._to_entity(request))
 
         self._logger.info(
             "Audit event created",
@@ -105,6 +116,55 @@ class AuditAppService:
 
         return self._to_response(created_event)
 
+    async def create_events(self, items: list[Any]) -> BatchResult:
+        """
+        Validate and persist a batch of audit events.
+
+        Items are validated individually; invalid ones are reported and the
+        rest are written with a single ``create_many`` call. One log line
+        summarizes the whole batch.
+
+        Args:
+            items: Raw event payloads (decoded JSON objects).
+
+        Returns:
+            BatchResult: Per-item results in input order.
+        """
+        result = BatchResult()
+        events: list[AuditEvent] = []
+        accepted: list[BatchItemResult] = []
+
+        for index, item in enumerate(items):
+            try:
+                request = CreateAuditEventRequest.model_validate(item)
+            except ValidationError as e:
+                result.items.append(
+                    BatchItemResult(
+                        index=index,
+                        errors=e.errors(include_url=False, include_context=False),
+                    )
+                )
+                continue
+            item_result = BatchItemResult(index=index)
+            result.items.append(item_result)
+            accepted.append(item_result)
+            events.append(self._to_entity(request))
+
+        created = await self._repository.create_many(events) if events else []
+        for item_result, event in zip(accepted, created, strict=True):
+            item_result.event = self._to_response(event)
+
+        self._logger.info(
+            "Audit event batch created",
+            received=len(items),
+            created=result.created,
+            rejected=result.rejected,
+            actions=dict(Counter(e.action.value for e in created)),
+            services=sorted({e.service_name for e in created}),
+        )
+
+        return result
+
     async def get_event(self, event_id: UUID) -> AuditEventResponse:
         """
         Get an audit event by ID.
@@ -131,23 +191,44 @@ class AuditAppService:
         page: int = 1,
         page_size: int = 20,
         filters: Any | None = None,
+        cursor: str | None = None,
     ) -> PaginatedResult:
         """
         List audit events with pagination and filtering.
 
+        Offset pages also return a cursor for the following page, so clients
+        can switch to keyset pagination (``cursor``) after the first page.
+        Keyset pages skip the total count.
+
         Args:
-            page: Page number (1-indexed).
+            page: Page number (1-indexed), ignored when ``cursor`` is given.
             page_size: Number of items per page.
             filters: Optional filter criteria.
+            cursor: Cursor from a previous page.
 
         Returns:
             PaginatedResult: Paginated list of audit events.
+
+        Raises:
+            ValueError: If the cursor is malformed.
         """
         # Convert filters to dict if provided
         filter_dict: dict[str, Any] | None = None
         if filters is not None:
             filter_dict = {k: v for k, v in filters.model_dump().items() if v is not None}
 
+        if cursor is not None:
+            events, next_cursor = await self._repository.list_events_after(
+                cursor=cursor,
+                page_size=page_size,
+                filters=filter_dict,
+            )
+            return PaginatedResult(
+                items=[self._to_response(e) for e in events],
+                total=None,
+                next_cursor=next_cursor,
+            )
+
         events, total = await self._repository.list_events(
             page=page,
             page_size=page_size,
@@ -157,6 +238,9 @@ class AuditAppService:
         return PaginatedResult(
             items=[self._to_response(e) for e in events],
             total=total,
+            next_cursor=(
+                encode_event_cursor(events[-1]) if events and total > page * page_size else None
+            ),
         )
 
     async def search_events(
@@ -239,6 +323,29 @@ class AuditAppService:
 
         return deleted_count
 
+    def _to_entity(self, request: CreateAuditEventRequest) -> AuditEvent:
+        """Create domain entity from request."""
+        return AuditEvent(
+            service_name=request.service_name,
+            correlation_id=request.correlation_id,
+            actor_id=request.actor_id,
+            actor_type=request.actor_type,
+            actor_name=request.actor_name,
+            actor_email=request.actor_email,
+            actor_ip=request.actor_ip,
+            actor_user_agent=request.actor_user_agent,
+            action=request.action,
+            severity=request.severity,
+            resource_type=request.resource_type,
+            resource_id=request.resource_id,
+            resource_name=request.resource_name,
+            description=request.description,
+            metadata=request.metadata,
+            old_value=request.old_value,
+            new_value=request.new_value,
+            compliance_tags=request.compliance_tags,
+        )
+
     def _to_response(self, event: AuditEvent) -> AuditEventResponse:
         """Convert domain entity to response model."""
         return AuditEventResponse(
@@ -268,6 +375,8 @@ def get_audit_service() -> AuditAppService:
     Get the audit application service instance.
 
     Uses a simple singleton pattern. In production, use proper DI container.
+    The repository follows ``audit_storage_backend``; the postgres backend
+    requires the database manager to be initialized first (app lifespan).
 
     Returns:
         AuditAppService: Audit application service instance.
@@ -275,10 +384,32 @@ def get_audit_service() -> AuditAppService:
     global _audit_service
 
     if _audit_service is None:
-        # Import repository implementation
-        from audit_service.infrastructure.persistence import InMemoryAuditRepository
-
-        repository = InMemoryAuditRepository()
+        from audit_service.configs.settings import get_settings
+
+        settings = get_settings()
+        repository: IAuditRepository
+        if settings.audit_storage_backend == "postgres":
+            from audit_service.infrastructure.database import get_db_manager
+            from audit_service.infrastructure.persistence import (
+                AuditPartitionManager,
+                PostgresAuditRepository,
+            )
+
+            db = get_db_manager()
+            repository = PostgresAuditRepository(
+                db,
+                AuditPartitionManager(db, months_ahead=settings.audit_partition_months_ahead),
+            )
+        else:
+            from audit_service.infrastructure.persistence import InMemoryAuditRepository
+
+            repository = InMemoryAuditRepository()
         _audit_service = AuditAppService(repository)
 
     return _audit_service
+
+
+def reset_audit_service() -> None:
+    """Drop the cached service so the next call rebuilds it (shutdown, tests)."""
+    global _audit_service
+    _audit_service = None
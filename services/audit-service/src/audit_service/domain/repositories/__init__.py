@@ -1,5 +1,9 @@
 """Repository interfaces for Audit Service."""
 
-from audit_service.domain.repositories.audit_repository import IAuditRepository
+from audit_service.domain.repositories.audit_repository import (
+    IAuditRepository,
+    decode_event_cursor,
+    encode_event_cursor,
+)
 
-__all__ = ["IAuditRepository"]
+__all__ = ["IAuditRepository", "decode_event_cursor", "encode_event_cursor"]
@@ -11,6 +11,43 @@ from typing import Any
 from uuid import UUID
 
 from audit_service.domain.entities.audit_event import AuditEvent
+from shared.dbs.repository import decode_cursor, encode_cursor
+
+
+def encode_event_cursor(event: AuditEvent) -> str:
+    """
+    Encode the keyset position just after ``event``.
+
+    Events are ordered by ``(timestamp, id)`` descending, so the position
+    is that pair.
+
+    Args:
+        event: Last event of the current page.
+
+    Returns:
+        str: Opaque cursor for the next page.
+    """
+    return encode_cursor({"t": event.timestamp.isoformat(), "i": str(event.id)})
+
+
+def decode_event_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_event_cursor``.
+
+    Args:
+        cursor: Opaque cursor string.
+
+    Returns:
+        tuple[datetime, UUID]: Timestamp and ID of the last event seen.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    payload = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(payload["t"]), UUID(payload["i"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
 
 
 class IAuditRepository(ABC):
@@ -34,6 +71,22 @@ class IAuditRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def create_many(self, events: list[AuditEvent]) -> list[AuditEvent]:
+        """
+        Create several audit events in one write.
+
+        Implementations should persist the batch atomically with a single
+        round trip (multi-row insert, COPY, ...) rather than per event.
+
+        Args:
+            events: Audit events to persist.
+
+        Returns:
+            list[AuditEvent]: Created events, in input order.
+        """
+        ...
+
     @abstractmethod
     async def get_by_id(self, event_id: UUID) -> AuditEvent | None:
         """
@@ -68,6 +121,34 @@ class IAuditRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def list_events_after(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[AuditEvent], str | None]:
+        """
+        List audit events with keyset pagination.
+
+        Unlike ``list_events`` the cost of a page does not grow with its
+        depth, and no total is computed.
+
+        Args:
+            cursor: Cursor from the previous page, or None for the first page.
+            page_size: Number of items per page.
+            filters: Optional filter criteria.
+
+        Returns:
+            tuple[list[AuditEvent], str | None]: Events, newest first, and
+            the cursor for the next page (None on the last page).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        ...
+
     @abstractmethod
     async def search(
         self,
@@ -5,12 +5,10 @@ Provides structured logging for all HTTP requests with timing information.
 """
 
 import time
-from collections.abc import Callable
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Import shared library logger
 try:
@@ -23,45 +21,49 @@ except ImportError:
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for structured request/response logging.
 
     Logs request start, completion, and timing for observability.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Response],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
         """
-        Process the request with logging.
+        Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request.
-            call_next: Next middleware/handler in the chain.
+            app: The ASGI application.
+        """
+        self.app = app
 
-        Returns:
-            Response: HTTP response.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process the request with logging.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
         """
         # Skip logging for health checks to reduce noise
-        if request.url.path in ("/health", "/ready", "/metrics"):
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in ("/health", "/ready", "/metrics"):
+            await self.app(scope, receive, send)
+            return
 
         # Extract request context
-        request_id = getattr(request.state, "request_id", "unknown")
-        correlation_id = getattr(request.state, "correlation_id", "unknown")
+        headers = Headers(scope=scope)
+        state = scope.get("state", {})
 
         # Build log context
         log_context: dict[str, Any] = {
-            "request_id": request_id,
-            "correlation_id": correlation_id,
-            "method": request.method,
-            "path": request.url.path,
-            "query": str(request.query_params) if request.query_params else None,
-            "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent"),
+            "request_id": state.get("request_id", "unknown"),
+            "correlation_id": state.get("correlation_id", "unknown"),
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1") or None,
+            "client_ip": self._get_client_ip(scope, headers),
+            "user_agent": headers.get("user-agent"),
         }
 
         # Log request start
@@ -69,23 +71,16 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         # Time the request
         start_time = time.perf_counter()
+        status_code = 500
 
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log request completion
-            logger.info(
-                "Request completed",
-                **log_context,
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
-            )
-
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
             # Calculate duration
             duration_ms = (time.perf_counter() - start_time) * 1000
@@ -101,29 +96,42 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             raise
 
-    def _get_client_ip(self, request: Request) -> str:
+        # Calculate duration
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Log request completion
+        logger.info(
+            "Request completed",
+            **log_context,
+            status_code=status_code,
+            duration_ms=round(duration_ms, 2),
+        )
+
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """
         Extract client IP from request, handling proxies.
 
         Args:
-            request: HTTP request.
+            scope: ASGI connection scope.
+            headers: Request headers.
 
         Returns:
             str: Client IP address.
         """
         # Check X-Forwarded-For header (for proxied requests)
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             # Take the first IP in the chain
             return forwarded_for.split(",")[0].strip()
 
         # Check X-Real-IP header
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fall back to direct client IP
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         return "unknown"
@@ -5,17 +5,15 @@ Ensures every request has a unique identifier for tracing across services.
 """
 
 import uuid
-from collections.abc import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUEST_ID_HEADER = "X-Request-ID"
 CORRELATION_ID_HEADER = "X-Correlation-ID"
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+class RequestIdMiddleware:
     """
     Middleware to add request ID to all requests.
 
@@ -23,38 +21,47 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
     Also propagates X-Correlation-ID if present.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Response],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
         """
-        Process the request and add request ID.
+        Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request.
-            call_next: Next middleware/handler in the chain.
+            app: The ASGI application.
+        """
+        self.app = app
 
-        Returns:
-            Response: HTTP response with request ID header.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Process the request and add request ID.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+
         # Get or generate request ID
-        request_id = request.headers.get(REQUEST_ID_HEADER)
-        if not request_id:
-            request_id = str(uuid.uuid4())
+        request_id = headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
 
         # Get or propagate correlation ID
-        correlation_id = request.headers.get(CORRELATION_ID_HEADER, request_id)
+        correlation_id = headers.get(CORRELATION_ID_HEADER, request_id)
 
         # Store in request state for access in handlers
-        request.state.request_id = request_id
-        request.state.correlation_id = correlation_id
-
-        # Process request
-        response = await call_next(request)
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["correlation_id"] = correlation_id
 
-        # Add headers to response
-        response.headers[REQUEST_ID_HEADER] = request_id
-        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add headers to response
+                response_headers = MutableHeaders(scope=message)
+                response_headers[REQUEST_ID_HEADER] = request_id
+                response_headers[CORRELATION_ID_HEADER] = correlation_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -3,5 +3,9 @@
 from audit_service.infrastructure.persistence.in_memory_repository import (
     InMemoryAuditRepository,
 )
+from audit_service.infrastructure.persistence.partitions import AuditPartitionManager
+from audit_service.infrastructure.persistence.postgres_repository import (
+    PostgresAuditRepository,
+)
 
-__all__ = ["InMemoryAuditRepository"]
+__all__ = ["AuditPartitionManager", "InMemoryAuditRepository", "PostgresAuditRepository"]
@@ -3,6 +3,8 @@ In-memory audit repository implementation.
 
 Provides a simple in-memory storage for development and testing.
 Should be replaced with SQLAlchemy implementation for production.
+Search and per-actor/resource counts are answered from an inverted index
+(see ``search_index.py``) rather than by scanning every event.
 """
 
 from datetime import datetime
@@ -10,7 +12,12 @@ from typing import Any
 from uuid import UUID
 
 from audit_service.domain.entities.audit_event import AuditEvent
-from audit_service.domain.repositories.audit_repository import IAuditRepository
+from audit_service.domain.repositories.audit_repository import (
+    IAuditRepository,
+    decode_event_cursor,
+    encode_event_cursor,
+)
+from audit_service.infrastructure.persistence.search_index import AuditSearchIndex
 
 
 class InMemoryAuditRepository(IAuditRepository):
@@ -23,24 +30,32 @@ class InMemoryAuditRepository(IAuditRepository):
     def __init__(self) -> None:
         """Initialize the in-memory repository."""
         self._events: dict[UUID, AuditEvent] = {}
+        self._index = AuditSearchIndex()
+
+    def _store(self, event: AuditEvent) -> None:
+        """Store an event and (re)index it."""
+        if (previous := self._events.get(event.id)) is not None:
+            self._index.remove(previous)
+        self._events[event.id] = event
+        self._index.add(event)
 
     async def create(self, event: AuditEvent) -> AuditEvent:
         """Create a new audit event."""
-        self._events[event.id] = event
+        self._store(event)
         return event
 
+    async def create_many(self, events: list[AuditEvent]) -> list[AuditEvent]:
+        """Create several audit events in one write."""
+        for event in events:
+            self._store(event)
+        return events
+
     async def get_by_id(self, event_id: UUID) -> AuditEvent | None:
         """Get an audit event by ID."""
         return self._events.get(event_id)
 
-    async def list_events(
-        self,
-        *,
-        page: int = 1,
-        page_size: int = 20,
-        filters: dict[str, Any] | None = None,
-    ) -> tuple[list[AuditEvent], int]:
-        """List audit events with pagination and filtering."""
+    def _filtered(self, filters: dict[str, Any] | None) -> list[AuditEvent]:
+        """Apply filters and sort by (timestamp, id) descending."""
         events = list(self._events.values())
 
         # Apply filters
@@ -55,7 +70,18 @@ class InMemoryAuditRepository(IAuditRepository):
                 events = [e for e in events if e.severity == severity]
 
         # Sort by timestamp descending
-        events.sort(key=lambda e: e.timestamp, reverse=True)
+        events.sort(key=lambda e: (e.timestamp, e.id), reverse=True)
+        return events
+
+    async def list_events(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[AuditEvent], int]:
+        """List audit events with pagination and filtering."""
+        events = self._filtered(filters)
 
         total = len(events)
 
@@ -66,6 +92,25 @@ class InMemoryAuditRepository(IAuditRepository):
 
         return paginated, total
 
+    async def list_events_after(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[AuditEvent], str | None]:
+        """List audit events with keyset pagination."""
+        events = self._filtered(filters)
+
+        if cursor is not None:
+            position = decode_event_cursor(cursor)
+            events = [e for e in events if (e.timestamp, e.id) < position]
+
+        page = events[: page_size + 1]
+        if len(page) > page_size:
+            return page[:page_size], encode_event_cursor(page[page_size - 1])
+        return page, None
+
     async def search(
         self,
         query: str,
@@ -75,59 +120,30 @@ class InMemoryAuditRepository(IAuditRepository):
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> tuple[list[AuditEvent], int]:
-        """Full-text search across audit events."""
-        query_lower = query.lower()
-        events = []
-
-        for event in self._events.values():
-            # Simple text search across relevant fields
-            searchable = " ".join(
-                [
-                    event.actor_id,
-                    event.actor_name or "",
-                    event.resource_type,
-                    event.resource_id,
-                    event.resource_name or "",
-                    event.description or "",
-                    event.action.value,
-                ]
-            ).lower()
-
-            if query_lower in searchable:
-                # Apply date filters
-                if start_date and event.timestamp < start_date:
-                    continue
-                if end_date and event.timestamp > end_date:
-                    continue
-                events.append(event)
-
-        # Sort by timestamp descending
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-
-        total = len(events)
+        """Search audit events containing every term of the query."""
+        matches = self._index.search(query, start_date=start_date, end_date=end_date)
 
-        # Apply pagination
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
-        paginated = events[start_idx:end_idx]
+        paginated = [self._events[event_id] for event_id in matches[start_idx:end_idx]]
 
-        return paginated, total
+        return paginated, len(matches)
 
     async def delete_by_id(self, event_id: UUID) -> bool:
         """Delete an audit event by ID."""
-        if event_id in self._events:
-            del self._events[event_id]
-            return True
-        return False
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return False
+        self._index.remove(event)
+        return True
 
     async def delete_before_date(self, cutoff_date: datetime) -> int:
         """Delete audit events older than the specified date."""
-        to_delete = [
-            event_id for event_id, event in self._events.items() if event.timestamp < cutoff_date
-        ]
+        to_delete = self._index.ids_before(cutoff_date)
 
         for event_id in to_delete:
             del self._events[event_id]
+        self._index.prune_before(cutoff_date)
 
         return len(to_delete)
 
@@ -139,16 +155,7 @@ class InMemoryAuditRepository(IAuditRepository):
         end_date: datetime | None = None,
     ) -> int:
         """Count audit events for a specific actor."""
-        count = 0
-        for event in self._events.values():
-            if event.actor_id != actor_id:
-                continue
-            if start_date and event.timestamp < start_date:
-                continue
-            if end_date and event.timestamp > end_date:
-                continue
-            count += 1
-        return count
+        return self._index.count_by_actor(actor_id, start_date, end_date)
 
     async def count_by_resource(
         self,
@@ -159,15 +166,4 @@ class InMemoryAuditRepository(IAuditRepository):
         end_date: datetime | None = None,
     ) -> int:
         """Count audit events for a specific resource."""
-        count = 0
-        for event in self._events.values():
-            if event.resource_type != resource_type:
-                continue
-            if event.resource_id != resource_id:
-                continue
-            if start_date and event.timestamp < start_date:
-                continue
-            if end_date and event.timestamp > end_date:
-                continue
-            count += 1
-        return count
+        return self._index.count_by_resource(resource_type, resource_id, start_date, end_date)
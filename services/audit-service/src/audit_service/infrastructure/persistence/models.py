@@ -0,0 +1,88 @@
+"""
+SQLAlchemy models for audit event storage.
+
+On PostgreSQL ``audit_events`` is a table partitioned by month on
+``timestamp`` (see ``partitions.py``), so the primary key includes the
+partition key. The secondary indexes mirror the list filters and are
+created on every partition automatically.
+
+Search uses a GIN index over ``SEARCH_VECTOR``, an expression index rather
+than a stored column so that inserts need no extra column. Queries must
+use the exact same expression for PostgreSQL to pick the index.
+"""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DDL, JSON, DateTime, Index, String, Text, Uuid, event
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class AuditBase(DeclarativeBase):
+    """Declarative base for audit storage models."""
+
+
+class AuditEventModel(AuditBase):
+    """Persistent audit event row."""
+
+    __tablename__ = "audit_events"
+    __table_args__ = (
+        Index("ix_audit_events_id", "id"),
+        Index("ix_audit_events_actor_ts", "actor_id", "timestamp"),
+        Index("ix_audit_events_resource_ts", "resource_type", "resource_id", "timestamp"),
+        Index("ix_audit_events_action_ts", "action", "timestamp"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
+
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+
+    service_name: Mapped[str] = mapped_column(String(255))
+    correlation_id: Mapped[str | None] = mapped_column(String(255))
+
+    actor_id: Mapped[str] = mapped_column(String(255))
+    actor_type: Mapped[str] = mapped_column(String(50))
+    actor_name: Mapped[str | None] = mapped_column(String(255))
+    actor_email: Mapped[str | None] = mapped_column(String(255))
+    actor_ip: Mapped[str | None] = mapped_column(String(64))
+    actor_user_agent: Mapped[str | None] = mapped_column(Text)
+
+    action: Mapped[str] = mapped_column(String(32))
+    severity: Mapped[str] = mapped_column(String(16))
+
+    resource_type: Mapped[str] = mapped_column(String(255))
+    resource_id: Mapped[str] = mapped_column(String(255))
+    resource_name: Mapped[str | None] = mapped_column(String(255))
+
+    description: Mapped[str | None] = mapped_column(Text)
+    # "metadata" is reserved on declarative classes
+    event_metadata: Mapped[dict[str, Any]] = mapped_column("metadata", JSON, default=dict)
+    old_value: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    new_value: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    compliance_tags: Mapped[list[str]] = mapped_column(JSON, default=list)
+
+
+# Text searched by /events/search; every part must be immutable for the index
+SEARCH_DOCUMENT = " || ' ' || ".join(
+    f"coalesce({column}, '')"
+    for column in (
+        "actor_id",
+        "actor_name",
+        "resource_type",
+        "resource_id",
+        "resource_name",
+        "description",
+        "action",
+    )
+)
+SEARCH_VECTOR = f"to_tsvector('simple', {SEARCH_DOCUMENT})"
+
+event.listen(
+    AuditEventModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_audit_events_search "
+        f"ON audit_events USING gin (({SEARCH_VECTOR}))"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,175 @@
+"""
+Monthly range partitions for the PostgreSQL audit table.
+
+Retention used to delete expired events row by row, which rewrites
+indexes, bloats the table and competes with ingestion. With one
+partition per month, expiring a month is a metadata operation: the
+partition is detached with ``DETACH PARTITION ... CONCURRENTLY`` (which
+does not block inserts or reads on the parent) and dropped. Only the
+partition straddling the cutoff still needs a row-level ``DELETE``.
+
+Partitions are named ``<table>_pYYYY_MM`` and created ahead of time by
+``ensure_partitions``. There is deliberately no default partition:
+PostgreSQL refuses concurrent detaches while one exists.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+
+from audit_service.infrastructure.persistence.models import AuditBase
+from shared.observability import get_structlog_logger
+from shared.sqlalchemy_async import AsyncDatabaseManager
+
+logger = get_structlog_logger(__name__)
+
+_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def _month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(UTC) if moment.tzinfo else moment.replace(tzinfo=UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """One monthly partition of the audit table."""
+
+    name: str
+    start: datetime
+    end: datetime
+
+
+class AuditPartitionManager:
+    """
+    Create and expire monthly partitions of the audit table.
+
+    Args:
+        db: Database manager for the audit database.
+        table: Partitioned parent table name.
+        months_ahead: Future months to keep partitions ready for.
+    """
+
+    def __init__(
+        self,
+        db: AsyncDatabaseManager,
+        *,
+        table: str = "audit_events",
+        months_ahead: int = 3,
+    ) -> None:
+        if not _IDENTIFIER.match(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        self._db = db
+        self._table = table
+        self._months_ahead = months_ahead
+        self._name_pattern = re.compile(rf"^{table}_p(\d{{4}})_(\d{{2}})$")
+
+    def partition_for(self, moment: datetime) -> Partition:
+        """Return the partition covering ``moment``."""
+        start = _month_start(moment)
+        return Partition(
+            name=f"{self._table}_p{start.year:04d}_{start.month:02d}",
+            start=start,
+            end=_add_months(start, 1),
+        )
+
+    def create_statement(self, partition: Partition) -> str:
+        """Build the DDL creating ``partition`` if it does not exist."""
+        return (
+            f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {self._table} "
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+        )
+
+    async def create_schema(self, now: datetime | None = None) -> None:
+        """
+        Create the partitioned parent table, its indexes and partitions.
+
+        Args:
+            now: Reference time for the initial partitions.
+        """
+        await self._db.create_all(AuditBase)
+        await self.ensure_partitions(now)
+
+    async def ensure_partitions(self, now: datetime | None = None) -> list[str]:
+        """
+        Create partitions for the current month and ``months_ahead`` more.
+
+        Args:
+            now: Reference time (defaults to the current time).
+
+        Returns:
+            list[str]: Names of the partitions ensured.
+        """
+        current = _month_start(now or datetime.now(UTC))
+        partitions = [
+            self.partition_for(_add_months(current, i)) for i in range(self._months_ahead + 1)
+        ]
+        async with self._db.engine.begin() as conn:
+            for partition in partitions:
+                await conn.execute(text(self.create_statement(partition)))
+        return [p.name for p in partitions]
+
+    async def list_partitions(self) -> list[tuple[Partition, int]]:
+        """
+        List managed partitions with their planner row estimates.
+
+        Returns:
+            list[tuple[Partition, int]]: Partitions ordered by start, each
+            with ``pg_class.reltuples`` (``0`` if never analyzed).
+        """
+        stmt = text(
+            "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        )
+        async with self._db.engine.connect() as conn:
+            rows = (await conn.execute(stmt, {"table": self._table})).all()
+
+        partitions = []
+        for name, estimate in rows:
+            match = self._name_pattern.match(name)
+            if match is None:
+                continue
+            start = datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)
+            partitions.append((self.partition_for(start), max(int(estimate), 0)))
+        return sorted(partitions, key=lambda item: item[0].start)
+
+    async def drop_partitions_before(self, cutoff: datetime) -> int:
+        """
+        Detach and drop partitions that end at or before ``cutoff``.
+
+        Args:
+            cutoff: Events before this instant are expired.
+
+        Returns:
+            int: Estimated number of rows removed, from planner statistics.
+        """
+        expired = [(p, n) for p, n in await self.list_partitions() if p.end <= cutoff]
+        if not expired:
+            return 0
+
+        removed = 0
+        # DETACH ... CONCURRENTLY cannot run inside a transaction block
+        async with self._db.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for partition, estimate in expired:
+                await conn.execute(
+                    text(
+                        f"ALTER TABLE {self._table} DETACH PARTITION {partition.name} CONCURRENTLY"
+                    )
+                )
+                await conn.execute(text(f"DROP TABLE {partition.name}"))
+                removed += estimate
+                logger.info(
+                    "Audit partition dropped",
+                    partition=partition.name,
+                    estimated_rows=estimate,
+                )
+        return removed
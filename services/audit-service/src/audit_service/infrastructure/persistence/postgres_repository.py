@@ -0,0 +1,306 @@
+"""
+PostgreSQL audit repository implementation.
+
+Durable storage for audit events on the monthly-partitioned
+``audit_events`` table. Every method opens its own session, so one
+repository instance can be shared by the whole application.
+
+Listing uses the ``(timestamp, id)`` ordering that the filter indexes
+already provide, so keyset pages are index range scans. Search matches
+``plainto_tsquery`` against the GIN-indexed ``tsvector`` expression, so
+its cost follows the number of matches rather than the table size.
+Retention drops whole partitions through ``AuditPartitionManager`` and
+only deletes rows individually in the partition straddling the cutoff.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    false,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+)
+
+from audit_service.domain.entities.audit_event import AuditEvent
+from audit_service.domain.repositories.audit_repository import (
+    IAuditRepository,
+    decode_event_cursor,
+    encode_event_cursor,
+)
+from audit_service.infrastructure.persistence.models import SEARCH_VECTOR, AuditEventModel
+from audit_service.infrastructure.persistence.partitions import AuditPartitionManager
+from audit_service.infrastructure.persistence.search_index import tokenize
+from shared.sqlalchemy_async import AsyncDatabaseManager
+
+_FILTER_COLUMNS = ("actor_id", "resource_type", "action", "severity")
+_SEARCH_COLUMNS = (
+    AuditEventModel.actor_id,
+    AuditEventModel.actor_name,
+    AuditEventModel.resource_type,
+    AuditEventModel.resource_id,
+    AuditEventModel.resource_name,
+    AuditEventModel.description,
+    AuditEventModel.action,
+)
+_NEWEST_FIRST = (AuditEventModel.timestamp.desc(), AuditEventModel.id.desc())
+
+
+def _to_row(event: AuditEvent) -> dict[str, Any]:
+    data = event.model_dump(exclude={"metadata"})
+    data["action"] = event.action.value
+    data["severity"] = event.severity.value
+    data["event_metadata"] = event.metadata
+    return data
+
+
+def _to_entity(model: AuditEventModel) -> AuditEvent:
+    timestamp = model.timestamp
+    if timestamp.tzinfo is None:
+        # SQLite drops the offset; values are always stored in UTC
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return AuditEvent(
+        id=model.id,
+        timestamp=timestamp,
+        service_name=model.service_name,
+        correlation_id=model.correlation_id,
+        actor_id=model.actor_id,
+        actor_type=model.actor_type,
+        actor_name=model.actor_name,
+        actor_email=model.actor_email,
+        actor_ip=model.actor_ip,
+        actor_user_agent=model.actor_user_agent,
+        action=model.action,
+        severity=model.severity,
+        resource_type=model.resource_type,
+        resource_id=model.resource_id,
+        resource_name=model.resource_name,
+        description=model.description,
+        metadata=model.event_metadata or {},
+        old_value=model.old_value,
+        new_value=model.new_value,
+        compliance_tags=model.compliance_tags or [],
+    )
+
+
+def _filter_conditions(filters: dict[str, Any] | None) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    for name in _FILTER_COLUMNS:
+        value = (filters or {}).get(name)
+        if value:
+            conditions.append(getattr(AuditEventModel, name) == getattr(value, "value", value))
+    return conditions
+
+
+def _date_conditions(
+    start_date: datetime | None, end_date: datetime | None
+) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if start_date is not None:
+        conditions.append(AuditEventModel.timestamp >= start_date)
+    if end_date is not None:
+        conditions.append(AuditEventModel.timestamp <= end_date)
+    return conditions
+
+
+class PostgresAuditRepository(IAuditRepository):
+    """
+    PostgreSQL implementation of audit repository.
+
+    Args:
+        db: Database manager for the audit database.
+        partitions: Partition manager used for retention. Without one,
+            ``delete_before_date`` falls back to a plain ``DELETE``.
+    """
+
+    def __init__(
+        self,
+        db: AsyncDatabaseManager,
+        partitions: AuditPartitionManager | None = None,
+    ) -> None:
+        """Initialize the repository."""
+        self._db = db
+        self._partitions = partitions
+
+    async def create(self, event: AuditEvent) -> AuditEvent:
+        """Create a new audit event."""
+        async with self._db.get_session() as session:
+            session.add(AuditEventModel(**_to_row(event)))
+        return event
+
+    async def create_many(self, events: list[AuditEvent]) -> list[AuditEvent]:
+        """
+        Create several audit events in one write.
+
+        The rows go out as one executemany of a prepared ``INSERT`` in a
+        single transaction; asyncpg pipelines it in one round trip.
+        """
+        if events:
+            async with self._db.get_session() as session:
+                await session.execute(insert(AuditEventModel), [_to_row(e) for e in events])
+        return events
+
+    async def get_by_id(self, event_id: UUID) -> AuditEvent | None:
+        """Get an audit event by ID."""
+        stmt = select(AuditEventModel).where(AuditEventModel.id == event_id)
+        async with self._db.get_session() as session:
+            model = await session.scalar(stmt)
+            return _to_entity(model) if model is not None else None
+
+    async def list_events(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[AuditEvent], int]:
+        """List audit events with pagination and filtering."""
+        conditions = _filter_conditions(filters)
+        stmt = (
+            select(AuditEventModel)
+            .where(*conditions)
+            .order_by(*_NEWEST_FIRST)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        return await self._page(stmt, conditions)
+
+    async def list_events_after(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[AuditEvent], str | None]:
+        """List audit events with keyset pagination."""
+        conditions = _filter_conditions(filters)
+        if cursor is not None:
+            timestamp, event_id = decode_event_cursor(cursor)
+            conditions.append(
+                tuple_(AuditEventModel.timestamp, AuditEventModel.id) < (timestamp, event_id)
+            )
+
+        stmt = (
+            select(AuditEventModel).where(*conditions).order_by(*_NEWEST_FIRST).limit(page_size + 1)
+        )
+        async with self._db.get_session() as session:
+            events = [_to_entity(m) for m in await session.scalars(stmt)]
+
+        if len(events) > page_size:
+            return events[:page_size], encode_event_cursor(events[page_size - 1])
+        return events, None
+
+    async def search(
+        self,
+        query: str,
+        *,
+        page: int = 1,
+        page_size: int = 20,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> tuple[list[AuditEvent], int]:
+        """Search audit events containing every term of the query."""
+        conditions = [
+            self._search_condition(query),
+            *_date_conditions(start_date, end_date),
+        ]
+        stmt = (
+            select(AuditEventModel)
+            .where(*conditions)
+            .order_by(*_NEWEST_FIRST)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        return await self._page(stmt, conditions)
+
+    async def delete_by_id(self, event_id: UUID) -> bool:
+        """Delete an audit event by ID."""
+        stmt = delete(AuditEventModel).where(AuditEventModel.id == event_id)
+        async with self._db.get_session() as session:
+            result = await session.execute(stmt)
+        return result.rowcount > 0
+
+    async def delete_before_date(self, cutoff_date: datetime) -> int:
+        """
+        Delete audit events older than the specified date.
+
+        Whole partitions before the cutoff are dropped; their row count
+        comes from planner statistics and is therefore approximate.
+        """
+        dropped = 0
+        if self._partitions is not None:
+            dropped = await self._partitions.drop_partitions_before(cutoff_date)
+
+        stmt = delete(AuditEventModel).where(AuditEventModel.timestamp < cutoff_date)
+        async with self._db.get_session() as session:
+            result = await session.execute(stmt)
+        return dropped + result.rowcount
+
+    async def count_by_actor(
+        self,
+        actor_id: str,
+        *,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        """Count audit events for a specific actor."""
+        return await self._count(
+            AuditEventModel.actor_id == actor_id,
+            *_date_conditions(start_date, end_date),
+        )
+
+    async def count_by_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        *,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> int:
+        """Count audit events for a specific resource."""
+        return await self._count(
+            AuditEventModel.resource_type == resource_type,
+            AuditEventModel.resource_id == resource_id,
+            *_date_conditions(start_date, end_date),
+        )
+
+    def _search_condition(self, query: str) -> ColumnElement[bool]:
+        """Match all query terms, through the GIN index on PostgreSQL."""
+        if self._db.engine.dialect.name == "postgresql":
+            return literal_column(SEARCH_VECTOR).bool_op("@@")(
+                func.plainto_tsquery("simple", query)
+            )
+
+        # Other dialects (tests) match each term as a substring instead
+        terms = []
+        for term in tokenize(query):
+            escaped = term.replace("_", "\\_")
+            pattern = f"%{escaped}%"
+            terms.append(or_(*(c.ilike(pattern, escape="\\") for c in _SEARCH_COLUMNS)))
+        return and_(*terms) if terms else false()
+
+    async def _page(
+        self,
+        stmt: Select[tuple[AuditEventModel]],
+        conditions: list[ColumnElement[bool]],
+    ) -> tuple[list[AuditEvent], int]:
+        """Run a page query and the matching count in one session."""
+        count_stmt = select(func.count()).select_from(AuditEventModel).where(*conditions)
+        async with self._db.get_session() as session:
+            events = [_to_entity(m) for m in await session.scalars(stmt)]
+            total = await session.scalar(count_stmt)
+        return events, total or 0
+
+    async def _count(self, *conditions: ColumnElement[bool]) -> int:
+        stmt = select(func.count()).select_from(AuditEventModel).where(*conditions)
+        async with self._db.get_session() as session:
+            return await session.scalar(stmt) or 0
@@ -0,0 +1,222 @@
+"""
+Inverted index for in-memory audit search.
+
+Searching used to build a lowercase string for every stored event on
+every query and substring-match it, which costs O(events x text length)
+and grows with retention. The index here maps each search term to a
+posting list of ``(timestamp, event_id)`` pairs kept in timestamp order:
+
+- a query is split into terms and the postings of all terms intersected,
+  starting from the shortest list;
+- date filters bisect each posting list, so only the requested window
+  is visited;
+- matches come out newest first, already in page order.
+
+Actor and resource postings use the same structure to answer the
+``count_by_*`` queries with two binary searches, and a timeline of all
+events lets retention find expired events without a scan.
+"""
+
+import bisect
+import re
+from collections.abc import Hashable, Iterator
+from datetime import datetime
+from uuid import UUID
+
+from audit_service.domain.entities.audit_event import AuditEvent
+
+_TOKEN = re.compile(r"\w+")
+
+Posting = tuple[datetime, UUID]
+
+_ALL = "*"
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase search terms.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        list[str]: Terms in order of appearance (duplicates kept).
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def searchable_terms(event: AuditEvent) -> set[str]:
+    """
+    Collect the distinct search terms of an event.
+
+    Args:
+        event: Audit event to index.
+
+    Returns:
+        set[str]: Terms from the actor, resource, description and action.
+    """
+    fields = (
+        event.actor_id,
+        event.actor_name,
+        event.resource_type,
+        event.resource_id,
+        event.resource_name,
+        event.description,
+        event.action.value,
+    )
+    return {term for value in fields if value for term in tokenize(value)}
+
+
+def _window(postings: list[Posting], start: datetime | None, end: datetime | None) -> range:
+    """Index range of postings with ``start <= timestamp <= end``."""
+    lo = bisect.bisect_left(postings, start, key=lambda p: p[0]) if start else 0
+    hi = bisect.bisect_right(postings, end, key=lambda p: p[0]) if end else len(postings)
+    return range(lo, max(lo, hi))
+
+
+def _contains(postings: list[Posting], posting: Posting) -> bool:
+    pos = bisect.bisect_left(postings, posting)
+    return pos < len(postings) and postings[pos] == posting
+
+
+class _PostingIndex:
+    """Key to timestamp-ordered posting list."""
+
+    def __init__(self) -> None:
+        self._postings: dict[Hashable, list[Posting]] = {}
+
+    def add(self, key: Hashable, posting: Posting) -> None:
+        bisect.insort(self._postings.setdefault(key, []), posting)
+
+    def remove(self, key: Hashable, posting: Posting) -> None:
+        postings = self._postings.get(key)
+        if postings is None:
+            return
+        pos = bisect.bisect_left(postings, posting)
+        if pos < len(postings) and postings[pos] == posting:
+            del postings[pos]
+        if not postings:
+            del self._postings[key]
+
+    def get(self, key: Hashable) -> list[Posting]:
+        return self._postings.get(key, [])
+
+    def prune_before(self, cutoff: datetime) -> None:
+        for key in list(self._postings):
+            postings = self._postings[key]
+            del postings[: bisect.bisect_left(postings, cutoff, key=lambda p: p[0])]
+            if not postings:
+                del self._postings[key]
+
+    def count(self, key: Hashable, start: datetime | None, end: datetime | None) -> int:
+        return len(_window(self.get(key), start, end))
+
+    def clear(self) -> None:
+        self._postings.clear()
+
+
+class AuditSearchIndex:
+    """Inverted index over audit events for search and counting."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._terms = _PostingIndex()
+        self._actors = _PostingIndex()
+        self._resources = _PostingIndex()
+        self._timeline = _PostingIndex()
+
+    def add(self, event: AuditEvent) -> None:
+        """Index an event."""
+        posting = (event.timestamp, event.id)
+        for term in searchable_terms(event):
+            self._terms.add(term, posting)
+        self._actors.add(event.actor_id, posting)
+        self._resources.add((event.resource_type, event.resource_id), posting)
+        self._timeline.add(_ALL, posting)
+
+    def remove(self, event: AuditEvent) -> None:
+        """Remove an indexed event."""
+        posting = (event.timestamp, event.id)
+        for term in searchable_terms(event):
+            self._terms.remove(term, posting)
+        self._actors.remove(event.actor_id, posting)
+        self._resources.remove((event.resource_type, event.resource_id), posting)
+        self._timeline.remove(_ALL, posting)
+
+    def prune_before(self, cutoff: datetime) -> None:
+        """Drop every posting older than ``cutoff``."""
+        for index in self._indexes:
+            index.prune_before(cutoff)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for index in self._indexes:
+            index.clear()
+
+    def ids_before(self, cutoff: datetime) -> list[UUID]:
+        """Return the IDs of indexed events older than ``cutoff``."""
+        timeline = self._timeline.get(_ALL)
+        end = bisect.bisect_left(timeline, cutoff, key=lambda p: p[0])
+        return [event_id for _, event_id in timeline[:end]]
+
+    @property
+    def _indexes(self) -> tuple[_PostingIndex, ...]:
+        return (self._terms, self._actors, self._resources, self._timeline)
+
+    def search(
+        self,
+        query: str,
+        *,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[UUID]:
+        """
+        Find events containing every term of ``query``.
+
+        Args:
+            query: Search query; all of its terms must match.
+            start_date: Optional inclusive lower timestamp bound.
+            end_date: Optional inclusive upper timestamp bound.
+
+        Returns:
+            list[UUID]: Matching event IDs, newest first.
+        """
+        return list(self._matches(query, start_date, end_date))
+
+    def count_by_actor(
+        self, actor_id: str, start_date: datetime | None, end_date: datetime | None
+    ) -> int:
+        """Count indexed events of an actor within the date bounds."""
+        return self._actors.count(actor_id, start_date, end_date)
+
+    def count_by_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> int:
+        """Count indexed events of a resource within the date bounds."""
+        return self._resources.count((resource_type, resource_id), start_date, end_date)
+
+    def _matches(
+        self, query: str, start_date: datetime | None, end_date: datetime | None
+    ) -> Iterator[UUID]:
+        terms = set(tokenize(query))
+        if not terms:
+            return
+        windows = []
+        for term in terms:
+            postings = self._terms.get(term)
+            window = _window(postings, start_date, end_date)
+            if not window:
+                return
+            windows.append((postings, window))
+
+        # Walk the shortest window newest first and probe the other lists
+        windows.sort(key=lambda item: len(item[1]))
+        (driver, window), others = windows[0], windows[1:]
+        for i in reversed(window):
+            posting = driver[i]
+            if all(_contains(postings, posting) for postings, _ in others):
+                yield posting[1]
@@ -0,0 +1,61 @@
+"""
+Scheduled audit retention.
+
+Registers the retention policy, and partition upkeep for the PostgreSQL
+backend, as periodic tasks on a ``shared.tasks.TaskRunner`` that the
+application lifespan starts and stops.
+"""
+
+from audit_service.application.services.audit_service import AuditAppService
+from audit_service.configs.settings import Settings
+from audit_service.infrastructure.persistence.partitions import AuditPartitionManager
+from shared.tasks import TaskRunner
+
+RETENTION_TASK = "audit-retention"
+PARTITION_TASK = "audit-partition-maintenance"
+
+
+def create_retention_runner(
+    service: AuditAppService,
+    settings: Settings,
+    partitions: AuditPartitionManager | None = None,
+) -> TaskRunner:
+    """
+    Build the task runner for audit retention.
+
+    Args:
+        service: Audit application service applying the policy.
+        settings: Application settings (retention days and interval).
+        partitions: Partition manager; when given, future partitions are
+            created on the same schedule so inserts never miss one.
+
+    Returns:
+        TaskRunner: Runner with the retention tasks registered (not started).
+    """
+    runner = TaskRunner(name="audit-retention")
+    interval = settings.audit_retention_interval_seconds
+
+    @runner.periodic(
+        interval_seconds=interval,
+        name=RETENTION_TASK,
+        run_immediately=True,
+        jitter_seconds=interval * 0.1,
+        max_attempts=3,
+        retry_delay=30.0,
+    )
+    async def apply_retention() -> int:
+        return await service.apply_retention_policy(settings.audit_retention_days)
+
+    if partitions is not None:
+
+        @runner.periodic(
+            interval_seconds=interval,
+            name=PARTITION_TASK,
+            run_immediately=True,
+            max_attempts=3,
+            retry_delay=30.0,
+        )
+        async def ensure_partitions() -> list[str]:
+            return await partitions.ensure_partitions()
+
+    return runner
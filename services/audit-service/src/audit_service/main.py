@@ -13,9 +13,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 from audit_service.api.v1 import audit_controller, health_controller
+from audit_service.application.services.audit_service import (
+    get_audit_service,
+    reset_audit_service,
+)
 from audit_service.configs.settings import get_settings
+from audit_service.infrastructure.database import dispose_db, init_db_manager
+from audit_service.infrastructure.persistence import AuditPartitionManager
+from audit_service.infrastructure.retention import create_retention_runner
 from shared.fastapi_utils.exception_handlers import register_exception_handlers
-from shared.fastapi_utils.middleware import RequestContextMiddleware
+from shared.fastapi_utils.middleware import RequestContextHook
 from shared.observability import (
     LoggingConfig,
     RequestLoggingMiddleware,
@@ -53,9 +60,29 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         logger.info("OpenTelemetry tracing initialized")
 
+    partitions = None
+    if settings.audit_storage_backend == "postgres":
+        db = init_db_manager(
+            settings.postgres_url,
+            pool_size=settings.postgres_pool_size,
+            max_overflow=settings.postgres_max_overflow,
+        )
+        partitions = AuditPartitionManager(db, months_ahead=settings.audit_partition_months_ahead)
+        await partitions.create_schema()
+        logger.info("PostgreSQL audit storage initialized")
+
+    retention_runner = None
+    if settings.audit_retention_enabled:
+        retention_runner = create_retention_runner(get_audit_service(), settings, partitions)
+        await retention_runner.start()
+
     yield
 
     logger.info("Shutting down Audit Service")
+    if retention_runner is not None:
+        await retention_runner.stop()
+    reset_audit_service()
+    await dispose_db()
 
 
 def create_app() -> FastAPI:
@@ -87,8 +114,7 @@ def configure_middleware(app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(RequestContextMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
 
 
 def configure_routers(app: FastAPI) -> None:
@@ -2,9 +2,12 @@
 Integration tests for Audit Service API endpoints.
 """
 
+import json
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from audit_service.configs.settings import Settings, get_settings
 from audit_service.domain.entities.audit_event import AuditAction, AuditSeverity
 from audit_service.main import app
 
@@ -91,3 +94,81 @@ class TestAuditEndpoints:
         data = response.json()
         assert data["page"] == 1
         assert data["page_size"] == 10
+
+
+class TestBatchIngestion:
+    """Tests for the batch ingestion endpoint."""
+
+    @staticmethod
+    def _event(resource_id: str) -> dict:
+        return {
+            "service_name": "test-service",
+            "actor_id": "user-123",
+            "action": AuditAction.UPDATE.value,
+            "resource_type": "document",
+            "resource_id": resource_id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_ndjson_batch(self, client: AsyncClient) -> None:
+        """Test every line of an NDJSON body becomes an event."""
+        body = "\n".join(json.dumps(self._event(f"doc-{i}")) for i in range(3)) + "\n"
+
+        response = await client.post(
+            "/api/v1/audit/events/batch",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert [r["status"] for r in data["results"]] == ["created"] * 3
+
+    @pytest.mark.asyncio
+    async def test_json_array_with_invalid_item(self, client: AsyncClient) -> None:
+        """Test invalid items are reported without failing the batch."""
+        invalid = self._event("doc-2") | {"action": "NOT_AN_ACTION"}
+
+        response = await client.post(
+            "/api/v1/audit/events/batch",
+            json=[self._event("doc-1"), invalid],
+        )
+
+        assert response.status_code == 207
+        data = response.json()
+        assert (data["created"], data["rejected"]) == (1, 1)
+        assert data["results"][0]["id"] is not None
+        assert data["results"][1]["errors"][0]["loc"] == ["action"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_body(self, client: AsyncClient) -> None:
+        """Test bodies that are neither NDJSON nor a JSON array are rejected."""
+        response = await client.post("/api/v1/audit/events/batch", json=self._event("doc-1"))
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch(self, client: AsyncClient) -> None:
+        """Test batches over the event or byte limit are rejected."""
+        app.dependency_overrides[get_settings] = lambda: Settings(
+            audit_batch_size=2, audit_batch_max_bytes=1024
+        )
+        try:
+            lines = [json.dumps(self._event(f"doc-{i}")) for i in range(3)]
+            too_many = await client.post(
+                "/api/v1/audit/events/batch",
+                content="\n".join([*lines, "not json"]),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            too_large = await client.post(
+                "/api/v1/audit/events/batch",
+                json=[self._event("x" * 2048)],
+            )
+        finally:
+            app.dependency_overrides.pop(get_settings, None)
+
+        assert too_many.status_code == 400
+        assert "maximum of 2 events" in too_many.json()["error"]["message"]
+        assert too_large.status_code == 400
+        assert "maximum of 1024 bytes" in too_large.json()["error"]["message"]
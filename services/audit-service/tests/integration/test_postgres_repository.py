@@ -0,0 +1,125 @@
+"""
+Integration tests for the SQL audit repository on SQLite.
+
+Partitioning is PostgreSQL-only, so these tests cover the queries shared
+by both dialects: filters, keyset pagination, search and the row-level
+retention fallback.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from audit_service.domain.entities.audit_event import AuditAction, AuditEvent, AuditSeverity
+from audit_service.infrastructure.persistence import PostgresAuditRepository
+from audit_service.infrastructure.persistence.models import AuditBase
+from shared.sqlalchemy_async.database import AsyncDatabaseManager, DatabaseConfig
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def repository():
+    """Create a repository over an in-memory SQLite database."""
+    manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await manager.create_all(AuditBase)
+    yield PostgresAuditRepository(manager)
+    await manager.dispose()
+
+
+def _event(minutes_ago: int, **overrides) -> AuditEvent:
+    data = {
+        "timestamp": NOW - timedelta(minutes=minutes_ago),
+        "service_name": "test-service",
+        "actor_id": "user-123",
+        "action": AuditAction.UPDATE,
+        "resource_type": "document",
+        "resource_id": "doc-1",
+        "description": "Updated the quarterly report",
+        "metadata": {"ip_country": "VN"},
+    }
+    return AuditEvent(**(data | overrides))
+
+
+class TestPostgresAuditRepository:
+    """Tests for PostgresAuditRepository."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, repository: PostgresAuditRepository) -> None:
+        """Test events are stored and loaded without loss."""
+        event = _event(0, severity=AuditSeverity.WARNING, compliance_tags=["SOC2"])
+        await repository.create(event)
+
+        assert await repository.get_by_id(event.id) == event
+
+    @pytest.mark.asyncio
+    async def test_list_events_filters_and_orders(
+        self, repository: PostgresAuditRepository
+    ) -> None:
+        """Test filters are applied and events come newest first."""
+        for i in range(4):
+            await repository.create(_event(i))
+        await repository.create(_event(0, actor_id="user-999"))
+        await repository.create(_event(0, action=AuditAction.DELETE))
+
+        events, total = await repository.list_events(
+            page=1, page_size=2, filters={"actor_id": "user-123", "action": AuditAction.UPDATE}
+        )
+
+        assert total == 4
+        assert [e.timestamp for e in events] == [NOW, NOW - timedelta(minutes=1)]
+
+    @pytest.mark.asyncio
+    async def test_keyset_walks_all_pages(self, repository: PostgresAuditRepository) -> None:
+        """Test cursor pages cover every event once, including timestamp ties."""
+        created = [await repository.create(_event(i // 2)) for i in range(7)]
+
+        seen = []
+        cursor = None
+        while True:
+            events, cursor = await repository.list_events_after(cursor=cursor, page_size=3)
+            seen.extend(e.id for e in events)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(e.id for e in created)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_search_matches_all_terms(self, repository: PostgresAuditRepository) -> None:
+        """Test search requires every term and ignores case and punctuation."""
+        await repository.create(_event(0, description="Discount set to 50%"))
+        await repository.create(_event(1, description="Discount removed"))
+        await repository.create(_event(2, description="Set page_size to 50"))
+
+        events, total = await repository.search("DISCOUNT 50")
+        assert total == 1
+        assert events[0].description == "Discount set to 50%"
+
+        _, total = await repository.search("page_size")
+        assert total == 1
+
+        _, total = await repository.search("%")
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_before_date(self, repository: PostgresAuditRepository) -> None:
+        """Test retention without partitions deletes expired rows."""
+        await repository.create(_event(0))
+        await repository.create(_event(60 * 24 * 400))
+
+        deleted = await repository.delete_before_date(NOW - timedelta(days=365))
+
+        assert deleted == 1
+        assert await repository.count_by_actor("user-123") == 1
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, repository: PostgresAuditRepository) -> None:
+        """Test a batch is written in one call and read back intact."""
+        events = [_event(i, resource_id=f"doc-{i}") for i in range(5)]
+
+        created = await repository.create_many(events)
+
+        assert created == events
+        assert await repository.get_by_id(events[3].id) == events[3]
+        assert await repository.count_by_actor("user-123") == 5
@@ -167,3 +167,49 @@ class TestAuditAppService:
         """Test deleting a non-existent event returns False."""
         deleted = await service.delete_event(uuid4())
         assert deleted is False
+
+    @pytest.mark.asyncio
+    async def test_list_events_cursor_walks_all_pages(
+        self,
+        service: AuditAppService,
+        sample_request: CreateAuditEventRequest,
+    ) -> None:
+        """Test keyset pagination continues from the offset page's cursor."""
+        for i in range(7):
+            request = sample_request.model_copy(update={"resource_id": f"doc-{i}"})
+            await service.create_event(request)
+
+        first = await service.list_events(page=1, page_size=3)
+        seen = [item.id for item in first.items]
+        cursor = first.next_cursor
+        while cursor is not None:
+            result = await service.list_events(page_size=3, cursor=cursor)
+            assert result.total is None
+            seen.extend(item.id for item in result.items)
+            cursor = result.next_cursor
+
+        assert len(seen) == len(set(seen)) == 7
+
+    @pytest.mark.asyncio
+    async def test_list_events_invalid_cursor(self, service: AuditAppService) -> None:
+        """Test a malformed cursor is rejected."""
+        with pytest.raises(ValueError):
+            await service.list_events(cursor="not-a-cursor!")
+
+    @pytest.mark.asyncio
+    async def test_create_events_batch(
+        self,
+        service: AuditAppService,
+        repository: InMemoryAuditRepository,
+        sample_request: CreateAuditEventRequest,
+    ) -> None:
+        """Test a batch stores valid items and reports invalid ones in order."""
+        valid = sample_request.model_dump(mode="json")
+        invalid = {**valid, "actor_id": None}
+
+        result = await service.create_events([valid, invalid, valid])
+
+        assert (result.created, result.rejected) == (2, 1)
+        assert [item.index for item in result.items] == [0, 1, 2]
+        assert result.items[1].errors[0]["loc"] == ("actor_id",)
+        assert await repository.count_by_actor("user-123") == 2
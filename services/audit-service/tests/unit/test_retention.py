@@ -0,0 +1,122 @@
+"""
+Unit tests for audit partitions and scheduled retention.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audit_service.application.services.audit_service import AuditAppService
+from audit_service.configs.settings import Settings
+from audit_service.domain.entities.audit_event import AuditAction, AuditEvent
+from audit_service.infrastructure.persistence import (
+    AuditPartitionManager,
+    InMemoryAuditRepository,
+)
+from audit_service.infrastructure.retention import (
+    PARTITION_TASK,
+    RETENTION_TASK,
+    create_retention_runner,
+)
+
+
+@pytest.fixture
+def partitions() -> AuditPartitionManager:
+    """Create a partition manager without a live database."""
+    return AuditPartitionManager(MagicMock())
+
+
+class TestAuditPartitionManager:
+    """Tests for partition naming and DDL."""
+
+    def test_partition_for_month(self, partitions: AuditPartitionManager) -> None:
+        """Test a timestamp maps to its calendar month."""
+        partition = partitions.partition_for(datetime(2025, 3, 17, 12, 30, tzinfo=UTC))
+
+        assert partition.name == "audit_events_p2025_03"
+        assert partition.start == datetime(2025, 3, 1, tzinfo=UTC)
+        assert partition.end == datetime(2025, 4, 1, tzinfo=UTC)
+
+    def test_partition_rolls_over_year(self, partitions: AuditPartitionManager) -> None:
+        """Test December partitions end in January of the next year."""
+        partition = partitions.partition_for(datetime(2025, 12, 31, 23, 59, tzinfo=UTC))
+
+        assert partition.end == datetime(2026, 1, 1, tzinfo=UTC)
+
+    def test_create_statement(self, partitions: AuditPartitionManager) -> None:
+        """Test partition DDL attaches a monthly range."""
+        partition = partitions.partition_for(datetime(2025, 1, 5, tzinfo=UTC))
+
+        assert partitions.create_statement(partition) == (
+            "CREATE TABLE IF NOT EXISTS audit_events_p2025_01 PARTITION OF audit_events "
+            "FOR VALUES FROM ('2025-01-01T00:00:00+00:00') TO ('2025-02-01T00:00:00+00:00')"
+        )
+
+    def test_rejects_unsafe_table_name(self) -> None:
+        """Test table names are validated before being used in DDL."""
+        with pytest.raises(ValueError):
+            AuditPartitionManager(MagicMock(), table="audit; DROP TABLE users")
+
+    @pytest.mark.asyncio
+    async def test_drop_skips_partitions_overlapping_cutoff(
+        self, partitions: AuditPartitionManager
+    ) -> None:
+        """Test only partitions entirely before the cutoff are dropped."""
+        old = partitions.partition_for(datetime(2024, 1, 1, tzinfo=UTC))
+        current = partitions.partition_for(datetime(2024, 2, 1, tzinfo=UTC))
+        partitions.list_partitions = AsyncMock(return_value=[(old, 10), (current, 20)])
+
+        executed: list[str] = []
+        conn = AsyncMock()
+        conn.execution_options.return_value = conn
+        conn.execute.side_effect = lambda stmt: executed.append(str(stmt))
+        partitions._db.engine.connect.return_value.__aenter__.return_value = conn
+
+        removed = await partitions.drop_partitions_before(datetime(2024, 2, 15, tzinfo=UTC))
+
+        assert removed == 10
+        assert executed == [
+            "ALTER TABLE audit_events DETACH PARTITION audit_events_p2024_01 CONCURRENTLY",
+            "DROP TABLE audit_events_p2024_01",
+        ]
+
+
+class TestRetentionRunner:
+    """Tests for the scheduled retention job."""
+
+    @pytest.mark.asyncio
+    async def test_retention_task_deletes_expired_events(self) -> None:
+        """Test the retention task applies the configured policy."""
+        repository = InMemoryAuditRepository()
+        now = datetime.now(UTC)
+        for age in (1, 400):
+            await repository.create(
+                AuditEvent(
+                    timestamp=now - timedelta(days=age),
+                    service_name="test-service",
+                    actor_id="user-123",
+                    action=AuditAction.READ,
+                    resource_type="document",
+                    resource_id="doc-1",
+                )
+            )
+
+        runner = create_retention_runner(
+            AuditAppService(repository), Settings(audit_retention_days=365)
+        )
+        result = await runner.enqueue(RETENTION_TASK)
+
+        assert result.result == 1
+        assert await repository.count_by_actor("user-123") == 1
+        assert PARTITION_TASK not in runner.tasks
+
+    def test_partition_task_registered_with_manager(
+        self, partitions: AuditPartitionManager
+    ) -> None:
+        """Test partition upkeep is scheduled for the postgres backend."""
+        runner = create_retention_runner(
+            AuditAppService(InMemoryAuditRepository()), Settings(), partitions
+        )
+
+        assert set(runner.tasks) == {RETENTION_TASK, PARTITION_TASK}
@@ -0,0 +1,144 @@
+"""
+Unit tests for the audit search index.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_mock_engine
+from sqlalchemy.dialects import postgresql
+
+from audit_service.domain.entities.audit_event import AuditAction, AuditEvent
+from audit_service.infrastructure.persistence import (
+    InMemoryAuditRepository,
+    PostgresAuditRepository,
+)
+from audit_service.infrastructure.persistence.models import SEARCH_VECTOR, AuditBase
+from audit_service.infrastructure.persistence.search_index import AuditSearchIndex, tokenize
+
+NOW = datetime(2025, 6, 15, tzinfo=UTC)
+
+
+def _event(days_ago: int, description: str, **overrides) -> AuditEvent:
+    data = {
+        "timestamp": NOW - timedelta(days=days_ago),
+        "service_name": "test-service",
+        "actor_id": "user-123",
+        "action": AuditAction.UPDATE,
+        "resource_type": "invoice",
+        "resource_id": f"inv-{days_ago}",
+        "description": description,
+    }
+    return AuditEvent(**(data | overrides))
+
+
+@pytest.fixture
+def events() -> list[AuditEvent]:
+    """Create events spread over ten days."""
+    return [
+        _event(0, "Payment refunded to customer"),
+        _event(2, "Payment captured"),
+        _event(5, "Refund requested by customer"),
+        _event(9, "Payment refunded after dispute", actor_id="user-456"),
+    ]
+
+
+@pytest.fixture
+def index(events: list[AuditEvent]) -> AuditSearchIndex:
+    """Create an index over the sample events."""
+    index = AuditSearchIndex()
+    for event in events:
+        index.add(event)
+    return index
+
+
+class TestAuditSearchIndex:
+    """Tests for AuditSearchIndex."""
+
+    def test_tokenize(self) -> None:
+        """Test text is split into lowercase word terms."""
+        assert tokenize("User-42 EXPORTED report_v2.pdf") == [
+            "user",
+            "42",
+            "exported",
+            "report_v2",
+            "pdf",
+        ]
+
+    def test_intersects_terms_newest_first(
+        self, index: AuditSearchIndex, events: list[AuditEvent]
+    ) -> None:
+        """Test every term must match and results are newest first."""
+        assert index.search("payment REFUNDED") == [events[0].id, events[3].id]
+        assert index.search("payment unknown") == []
+        assert index.search("   ") == []
+
+    def test_date_range(self, index: AuditSearchIndex, events: list[AuditEvent]) -> None:
+        """Test date bounds are inclusive."""
+        matches = index.search(
+            "customer", start_date=NOW - timedelta(days=5), end_date=NOW - timedelta(days=1)
+        )
+
+        assert matches == [events[2].id]
+
+    def test_remove_and_prune(self, index: AuditSearchIndex, events: list[AuditEvent]) -> None:
+        """Test removed and expired events leave no postings."""
+        index.remove(events[0])
+        cutoff = NOW - timedelta(days=4)
+        assert index.ids_before(cutoff) == [events[3].id, events[2].id]
+
+        index.prune_before(cutoff)
+
+        assert index.search("payment") == [events[1].id]
+        assert index.ids_before(NOW) == [events[1].id]
+
+    def test_counts(self, index: AuditSearchIndex) -> None:
+        """Test actor and resource counts honour date bounds."""
+        assert index.count_by_actor("user-123", None, None) == 3
+        assert index.count_by_actor("user-123", NOW - timedelta(days=3), None) == 2
+        assert index.count_by_resource("invoice", "inv-5", None, None) == 1
+        assert index.count_by_resource("invoice", "inv-5", NOW, None) == 0
+
+    def test_postgres_query_uses_gin_expression(self) -> None:
+        """Test the PostgreSQL query and GIN index share the tsvector expression."""
+        statements: list[str] = []
+        engine = create_mock_engine(
+            "postgresql://", lambda sql, *_, **__: statements.append(str(sql.compile(engine)))
+        )
+        AuditBase.metadata.create_all(engine, checkfirst=False)
+
+        db = MagicMock()
+        db.engine.dialect.name = "postgresql"
+        condition = PostgresAuditRepository(db)._search_condition("refund")
+        sql = str(condition.compile(dialect=postgresql.dialect()))
+
+        assert any(f"USING gin (({SEARCH_VECTOR}))" in s for s in statements)
+        assert sql.startswith(f"{SEARCH_VECTOR} @@ plainto_tsquery(")
+
+
+class TestInMemorySearch:
+    """Tests for search through InMemoryAuditRepository."""
+
+    @pytest.mark.asyncio
+    async def test_search_paginates(self, events: list[AuditEvent]) -> None:
+        """Test pages slice the ordered matches and report the total."""
+        repository = InMemoryAuditRepository()
+        await repository.create_many(events)
+
+        page, total = await repository.search("payment", page=2, page_size=2)
+
+        assert total == 3
+        assert [e.id for e in page] == [events[3].id]
+
+    @pytest.mark.asyncio
+    async def test_retention_prunes_index(self, events: list[AuditEvent]) -> None:
+        """Test expired events disappear from search and counts."""
+        repository = InMemoryAuditRepository()
+        await repository.create_many(events)
+
+        deleted = await repository.delete_before_date(NOW - timedelta(days=4))
+
+        assert deleted == 2
+        assert (await repository.search("refunded"))[1] == 1
+        assert await repository.count_by_actor("user-456") == 0
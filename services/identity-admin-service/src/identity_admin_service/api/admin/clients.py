@@ -180,13 +180,17 @@ class ClientResponse(BaseModel):
 
 
 class ClientListResponse(BaseModel):
-    """Response schema for paginated client list."""
+    """Response schema for paginated client list.
+
+    ``total`` and ``total_pages`` are omitted on cursor-paged requests.
+    """
 
     items: list[ClientResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class GenerateSecretRequest(BaseModel):
@@ -432,39 +436,31 @@ async def list_clients(
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     include_inactive: bool = False,
     search: str | None = Query(None, description="Search by name or client_id"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
     client_repo=Depends(get_client_repository),
 ) -> ClientListResponse:
-    """List all OAuth2 clients with pagination."""
-    skip = (page - 1) * page_size
-
-    if search:
-        clients = await client_repo.search(
-            query=search,
-            skip=skip,
-            limit=page_size,
+    """List OAuth2 clients with offset or cursor pagination."""
+    try:
+        result = await client_repo.search_page(
+            search,
             include_inactive=include_inactive,
-        )
-        total = len(clients) + skip
-    elif include_inactive:
-        clients = await client_repo.search(
-            query="",
-            skip=skip,
+            skip=(page - 1) * page_size,
             limit=page_size,
-            include_inactive=True,
+            cursor=cursor,
         )
-        total = await client_repo.count(include_inactive=True)
-    else:
-        clients = await client_repo.list_active(skip=skip, limit=page_size)
-        total = await client_repo.count(include_inactive=False)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    total = result.total
+    total_pages = None if total is None else max(1, (total + page_size - 1) // page_size)
 
     return ClientListResponse(
-        items=[_client_to_response(c) for c in clients],
+        items=[_client_to_response(c) for c in result.items],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=result.next_cursor,
     )
 
 
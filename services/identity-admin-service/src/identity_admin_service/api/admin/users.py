@@ -218,13 +218,17 @@ def _user_to_response(user: User) -> UserResponse:
 
 
 class UserListResponse(BaseModel):
-    """Response schema for paginated user list."""
+    """Response schema for paginated user list.
+
+    ``total`` and ``total_pages`` are omitted on cursor-paged requests.
+    """
 
     items: list[UserResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    next_cursor: str | None = None
 
 
 class AddRoleRequest(BaseModel):
@@ -253,51 +257,32 @@ async def list_users(
     include_inactive: bool = False,
     search: str | None = Query(None, description="Search by email or username"),
     role: str | None = Query(None, description="Filter by role"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
     user_repo=Depends(get_user_repository),
 ) -> UserListResponse:
-    """List all users with pagination and filtering."""
-    skip = (page - 1) * page_size
-
-    # Handle role filtering separately
-    if role:
-        users = await user_repo.find_by_role(role)
-        if search:
-            search_lower = search.lower()
-            users = [
-                u
-                for u in users
-                if search_lower in u.email.lower()
-                or (u.username and search_lower in u.username.lower())
-            ]
-        if not include_inactive:
-            users = [u for u in users if u.is_active]
-        total = len(users)
-        users = users[skip : skip + page_size]
-    elif search:
-        users = await user_repo.search(
-            query=search,
-            skip=skip,
-            limit=page_size,
+    """List users with filtering and offset or cursor pagination."""
+    try:
+        result = await user_repo.search_page(
+            search,
+            role=role,
             include_inactive=include_inactive,
-        )
-        total = len(users) + skip
-    else:
-        users = await user_repo.search(
-            query="",
-            skip=skip,
+            skip=(page - 1) * page_size,
             limit=page_size,
-            include_inactive=include_inactive,
+            cursor=cursor,
         )
-        total = await user_repo.count(include_inactive=include_inactive)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    total = result.total
+    total_pages = None if total is None else max(1, (total + page_size - 1) // page_size)
 
     return UserListResponse(
-        items=[_user_to_response(u) for u in users],
+        items=[_user_to_response(u) for u in result.items],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -129,26 +129,13 @@ async def admin_clients_list(
 
     include_inactive = status is None or status == "inactive"
 
-    if search:
-        clients = await client_repo.search(
-            query=search,
-            skip=skip,
-            limit=page_size,
-            include_inactive=include_inactive,
-        )
-        total = len(clients) + skip
-    else:
-        if include_inactive and status is None:
-            clients = await client_repo.search(
-                query="",
-                skip=skip,
-                limit=page_size,
-                include_inactive=True,
-            )
-            total = await client_repo.count(include_inactive=True)
-        else:
-            clients = await client_repo.list_active(skip=skip, limit=page_size)
-            total = await client_repo.count(include_inactive=False)
+    result = await client_repo.search_page(
+        search,
+        include_inactive=include_inactive,
+        skip=skip,
+        limit=page_size,
+    )
+    clients, total = result.items, result.total or 0
 
     # Filter by client type if specified
     if client_type:
@@ -226,36 +213,14 @@ async def admin_users_list(
 
     include_inactive = status is None or status == "inactive"
 
-    if role:
-        users = await user_repo.find_by_role(role)
-        if search:
-            search_lower = search.lower()
-            users = [
-                u
-                for u in users
-                if search_lower in u.email.lower()
-                or (u.username and search_lower in u.username.lower())
-            ]
-        if not include_inactive:
-            users = [u for u in users if u.is_active]
-        total = len(users)
-        users = users[skip : skip + page_size]
-    elif search:
-        users = await user_repo.search(
-            query=search,
-            skip=skip,
-            limit=page_size,
-            include_inactive=include_inactive,
-        )
-        total = len(users) + skip
-    else:
-        users = await user_repo.search(
-            query="",
-            skip=skip,
-            limit=page_size,
-            include_inactive=include_inactive,
-        )
-        total = await user_repo.count(include_inactive=include_inactive)
+    result = await user_repo.search_page(
+        search,
+        role=role,
+        include_inactive=include_inactive,
+        skip=skip,
+        limit=page_size,
+    )
+    users, total = result.items, result.total or 0
 
     # Filter by status
     if status == "active":
@@ -17,7 +17,7 @@ from identity_admin_service.configs import get_settings
 from identity_admin_service.middleware import IPWhitelistMiddleware
 
 # Shared observability
-from shared.fastapi_utils import RequestContextMiddleware, register_exception_handlers
+from shared.fastapi_utils import RequestContextHook, register_exception_handlers
 from shared.observability import (
     LoggingConfig,
     RequestLoggingConfig,
@@ -157,12 +157,10 @@ def create_app() -> FastAPI:
             allowed_ips=settings.allowed_ip_list,
         )
 
-    # Request context middleware (correlation/request IDs)
-    app.add_middleware(RequestContextMiddleware)
-
-    # Request logging middleware
+    # Request logging middleware (correlation/request IDs, access log)
     app.add_middleware(
         RequestLoggingMiddleware,
+        hooks=[RequestContextHook()],
         config=RequestLoggingConfig(
             exclude_paths=[
                 "/health",
@@ -0,0 +1,51 @@
+"""Add pg_trgm GIN indexes for admin user and client search
+
+Admin search filters with ILIKE '%term%' on users.email, users.username,
+clients.client_id and clients.client_name, which B-tree indexes cannot
+serve. Trigram GIN indexes can. Indexes are built CONCURRENTLY so large
+tables stay writable while they build.
+
+Revision ID: a3f1c2d4e5b6
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c2d4e5b6"
+down_revision: str | None = None
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+_INDEXES = (
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_username_trgm", "users", "username"),
+    ("ix_clients_client_id_trgm", "clients", "client_id"),
+    ("ix_clients_client_name_trgm", "clients", "client_name"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, column in _INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name, _table, _column in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,84 @@
+"""Benchmark JWT issuance and verification throughput.
+
+Measures tokens/sec for each signing algorithm using ``JWTService`` with
+cached key objects, plus an RS256 baseline that passes PEM bytes to
+authlib on every call (the previous behaviour) to show the parsing cost.
+
+Usage:
+    python -m scripts.bench_jwt
+    python -m scripts.bench_jwt --tokens 2000 --algorithms RS256 ES256 EdDSA
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+from identity_service.infrastructure.security.jwt_service import JWTService, KeyManager
+
+
+def _rate(func: Callable[[], object], n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        func()
+    return n / (time.perf_counter() - started)
+
+
+def _bench_service(algorithm: str, n: int, key_dir: Path) -> tuple[float, float]:
+    settings = SimpleNamespace(
+        jwt_issuer="http://localhost:8003",
+        jwt_audience="http://localhost:8003",
+        access_token_lifetime=3600,
+    )
+    key_manager = KeyManager(
+        str(key_dir / f"{algorithm}-private.pem"),
+        str(key_dir / f"{algorithm}-public.pem"),
+        algorithm,
+    )
+    service = JWTService(settings, key_manager)  # type: ignore[arg-type]
+
+    def issue() -> str:
+        return service.create_access_token("user-1", "bench-client", "openid profile")[0]
+
+    token = issue()
+    return _rate(issue, n), _rate(lambda: service.decode_token(token), n)
+
+
+def _bench_pem_baseline(n: int, key_dir: Path) -> tuple[float, float]:
+    from authlib.jose import jwt
+
+    key_manager = KeyManager(str(key_dir / "pem-private.pem"), str(key_dir / "pem-public.pem"))
+    header = {"alg": "RS256", "kid": key_manager.kid}
+    payload = {"iss": "http://localhost:8003", "sub": "user-1", "exp": int(time.time()) + 3600}
+    private_pem, public_pem = key_manager.private_key, key_manager.public_key
+
+    token = jwt.encode(header, payload, private_pem)
+    return (
+        _rate(lambda: jwt.encode(header, payload, private_pem), n),
+        _rate(lambda: jwt.decode(token, public_pem), n),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--algorithms", nargs="+", default=["RS256", "ES256", "EdDSA"])
+    args = parser.parse_args()
+
+    print(f"{'variant':<16} {'issue/s':>10} {'verify/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        key_dir = Path(tmp)
+        issue, verify = _bench_pem_baseline(args.tokens, key_dir)
+        print(f"{'RS256 (PEM)':<16} {issue:>10.0f} {verify:>10.0f}")
+        for algorithm in args.algorithms:
+            issue, verify = _bench_service(algorithm, args.tokens, key_dir)
+            print(f"{algorithm + ' (cached)':<16} {issue:>10.0f} {verify:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
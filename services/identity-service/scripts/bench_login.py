@@ -0,0 +1,126 @@
+"""Benchmark password verification under concurrent logins.
+
+Compares verifying Argon2 hashes inline in the coroutine (blocking the
+event loop) with offloading them to the bounded ``HashingPool``. For each
+mode it reports login throughput, login latency, how late a 5 ms heartbeat
+task wakes up (event loop lag) and how many logins were shed with 429.
+
+Usage:
+    python -m scripts.bench_login
+    python -m scripts.bench_login --concurrency 64 --logins 512 --workers 4 --queue 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+
+from identity_service.infrastructure.security.password_service import PasswordService
+from shared.auth.hashing_pool import HashingPoolSaturatedError
+
+_HEARTBEAT_INTERVAL = 0.005
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late the loop wakes a periodic task."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - started - _HEARTBEAT_INTERVAL)
+
+
+async def _run(
+    service: PasswordService,
+    password_hash: str,
+    *,
+    offload: bool,
+    concurrency: int,
+    logins: int,
+) -> dict[str, float]:
+    latencies: list[float] = []
+    lags: list[float] = []
+    shed = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login() -> None:
+        nonlocal shed
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if offload:
+                    await service.verify_password_async("SecureP@ssw0rd!", password_hash)
+                else:
+                    service.verify_password("SecureP@ssw0rd!", password_hash)
+                    # Yield like a real handler would between awaits
+                    await asyncio.sleep(0)
+            except HashingPoolSaturatedError:
+                shed += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+
+    return {
+        "logins_per_s": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "loop_lag_p99_ms": _percentile(lags, 0.99) * 1000,
+        "loop_lag_max_ms": max(lags, default=0.0) * 1000,
+        "shed": shed,
+    }
+
+
+async def main() -> None:
+    """Run both modes and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--logins", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=32)
+    args = parser.parse_args()
+
+    settings = SimpleNamespace(
+        bcrypt_rounds=12,
+        password_hash_workers=args.workers,
+        password_hash_max_queue=args.queue,
+    )
+    service = PasswordService(settings)  # type: ignore[arg-type]
+    password_hash = service.hash_password("SecureP@ssw0rd!")
+
+    print(
+        f"{'mode':<8} {'logins/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'lag p99':>8} {'lag max':>8} {'shed':>5}"
+    )
+    for mode, offload in (("inline", False), ("pool", True)):
+        r = await _run(
+            service,
+            password_hash,
+            offload=offload,
+            concurrency=args.concurrency,
+            logins=args.logins,
+        )
+        print(
+            f"{mode:<8} {r['logins_per_s']:>9.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+            f"{r['loop_lag_p99_ms']:>8.1f} {r['loop_lag_max_ms']:>8.1f} {r['shed']:>5.0f}"
+        )
+    service.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -24,7 +24,7 @@ router = APIRouter()
         202: {"model": MFARequiredResponse, "description": "MFA verification required"},
         401: {"model": AuthErrorResponse, "description": "Invalid credentials"},
         423: {"model": AuthErrorResponse, "description": "Account locked"},
-        429: {"model": AuthErrorResponse, "description": "Too many attempts"},
+        429: {"model": AuthErrorResponse, "description": "Too many attempts or server busy"},
     },
     summary="Authenticate user",
     description="Login with email and password. May return MFA challenge if enabled.",
@@ -59,6 +59,7 @@ async def login(
             "account_locked": status.HTTP_423_LOCKED,
             "ip_blocked": status.HTTP_429_TOO_MANY_REQUESTS,
             "too_many_attempts": status.HTTP_429_TOO_MANY_REQUESTS,
+            "server_busy": status.HTTP_429_TOO_MANY_REQUESTS,
             "invalid_credentials": status.HTTP_401_UNAUTHORIZED,
             "login_disabled": status.HTTP_403_FORBIDDEN,
         }
@@ -70,6 +71,7 @@ async def login(
                 "error": result.error or "authentication_failed",
                 "error_description": _error_description(result.error),
             },
+            headers={"Retry-After": "1"} if result.error == "server_busy" else None,
         )
 
     return LoginResponse(
@@ -85,6 +87,7 @@ def _error_description(error: str | None) -> str:
         "account_locked": "Account is temporarily locked due to too many failed attempts",
         "ip_blocked": "Too many failed login attempts from this IP address",
         "too_many_attempts": "Please wait before trying again",
+        "server_busy": "Server is busy, please retry shortly",
         "invalid_credentials": "Invalid email or password",
         "login_disabled": "This account has been deactivated",
     }
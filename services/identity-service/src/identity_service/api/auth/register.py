@@ -22,6 +22,7 @@ router = APIRouter()
     responses={
         409: {"model": AuthErrorResponse, "description": "Email or username already exists"},
         422: {"model": AuthErrorResponse, "description": "Validation error"},
+        429: {"model": AuthErrorResponse, "description": "Server busy, retry shortly"},
     },
     summary="Register a new user",
     description="Create a new user account with email, password, and optional profile details.",
@@ -43,6 +44,8 @@ async def register(
         status_code = status.HTTP_409_CONFLICT
         if result.error == "weak_password":
             status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        elif result.error == "server_busy":
+            status_code = status.HTTP_429_TOO_MANY_REQUESTS
 
         return JSONResponse(
             status_code=status_code,
@@ -2,8 +2,9 @@
 
 Defines reusable Annotated type aliases following FastAPI best practices.
 Uses PostgreSQL repositories (via shared.identity) for persistent storage
-and in-memory repositories for Redis-backed entities (auth codes, sessions,
-token blacklist).
+the token revocation store (Redis when ``security_state_backend`` is
+``"redis"``) and in-memory repositories for the remaining Redis-backed
+entities (auth codes, sessions).
 
 See: https://fastapi.tiangolo.com/tutorial/dependencies/
 """
@@ -44,7 +45,7 @@ SettingsDep = Annotated[Settings, Depends(get_settings)]
 # =============================================================================
 # In-Memory Repositories (Redis-backed entities - kept until Redis implementation)
 # =============================================================================
-# These entities (auth codes, token blacklist, sessions) are designed for
+# These entities (auth codes, sessions) are designed for
 # Redis storage. Using in-memory stubs until Redis implementation.
 # NOTE: In multi-worker deployments, each worker has its own instance.
 # =============================================================================
@@ -75,25 +76,6 @@ class InMemoryAuthCodeRepository:
         return False
 
 
-class InMemoryTokenBlacklistRepository:
-    """In-memory token blacklist repository."""
-
-    def __init__(self):
-        self._blacklist = {}
-
-    async def add(self, entry):
-        self._blacklist[entry.jti] = entry
-
-    async def is_blacklisted(self, jti):
-        return jti in self._blacklist
-
-    async def remove(self, jti):
-        if jti in self._blacklist:
-            del self._blacklist[jti]
-            return True
-        return False
-
-
 class InMemorySessionRepository:
     """In-memory session repository."""
 
@@ -192,7 +174,6 @@ PasswordResetRepoDep = Annotated[PasswordResetRepository, Depends(get_password_r
 
 # Singleton instances for Redis-only repositories
 _auth_code_repo = InMemoryAuthCodeRepository()
-_blacklist_repo = InMemoryTokenBlacklistRepository()
 _session_repo = InMemorySessionRepository()
 
 
@@ -218,6 +199,7 @@ async def get_oauth2_service(
     from identity_service.infrastructure.security import (
         get_jwt_service,
         get_password_service,
+        get_token_revocation_store,
     )
 
     return OAuth2Service(
@@ -228,7 +210,7 @@ async def get_oauth2_service(
         client_repository=client_repository,
         auth_code_repository=_auth_code_repo,
         refresh_token_repository=refresh_token_repository,
-        token_blacklist_repository=_blacklist_repo,
+        token_blacklist_repository=get_token_revocation_store(settings),
         consent_repository=consent_repository,
         session_repository=_session_repo,
     )
@@ -268,7 +250,7 @@ async def get_user_auth_service(
         password_service=get_password_service(settings),
         password_policy_service=get_password_policy_service(settings),
         brute_force_service=get_brute_force_protection_service(settings),
-        session_service=get_session_management_service(),
+        session_service=get_session_management_service(settings),
         jwt_service=get_jwt_service(settings),
     )
 
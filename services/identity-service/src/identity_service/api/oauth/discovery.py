@@ -1,11 +1,14 @@
 """OpenID Connect Discovery endpoint - .well-known/openid-configuration."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
 from identity_service.configs import get_settings
 
 router = APIRouter(tags=["discovery"])
 
+# Short enough that verifiers pick up a rotated key within minutes
+_JWKS_MAX_AGE = 300
+
 
 @router.get("/.well-known/openid-configuration")
 async def get_openid_configuration(request: Request) -> dict:
@@ -40,7 +43,7 @@ async def get_openid_configuration(request: Request) -> dict:
             "refresh_token",
         ],
         "subject_types_supported": ["public"],
-        "id_token_signing_alg_values_supported": ["RS256"],
+        "id_token_signing_alg_values_supported": [settings.jwt_algorithm],
         "token_endpoint_auth_methods_supported": [
             "client_secret_basic",
             "client_secret_post",
@@ -95,14 +98,15 @@ async def get_openid_configuration(request: Request) -> dict:
 
 
 @router.get("/.well-known/jwks.json")
-async def get_jwks(request: Request) -> dict:
+async def get_jwks(request: Request) -> Response:
     """Return JSON Web Key Set (JWKS).
 
     This endpoint provides the public keys used to verify
-    JWT signatures (RFC 7517).
+    JWT signatures (RFC 7517). The document is precomputed by the key
+    manager and served with an ETag so clients can revalidate cheaply.
 
     Returns:
-        JWKS containing public keys.
+        JWKS containing public keys, or 304 if the client copy is current.
     """
     from identity_service.infrastructure.security import get_key_manager
 
@@ -110,5 +114,12 @@ async def get_jwks(request: Request) -> dict:
     key_manager = get_key_manager(
         settings.jwt_private_key_path,
         settings.jwt_public_key_path,
+        settings.jwt_algorithm,
     )
-    return key_manager.get_jwks()
+    headers = {
+        "ETag": key_manager.jwks_etag,
+        "Cache-Control": f"public, max-age={_JWKS_MAX_AGE}",
+    }
+    if request.headers.get("if-none-match") == key_manager.jwks_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=key_manager.jwks_json, media_type="application/json", headers=headers)
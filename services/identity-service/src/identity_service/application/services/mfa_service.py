@@ -286,7 +286,9 @@ class MFAService:
             return False, "MFA is not enabled"
 
         # Verify password
-        if not self._password_service.verify_password(password, user.credential.password_hash):
+        if not await self._password_service.verify_password_async(
+            password, user.credential.password_hash
+        ):
             return False, "Invalid password"
 
         # Verify TOTP
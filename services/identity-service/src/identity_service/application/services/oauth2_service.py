@@ -551,7 +551,7 @@ class OAuth2Service:
             client_id: Client that owns the token
             token_type_hint: Hint about token type
         """
-        from datetime import datetime
+        from datetime import UTC, datetime
 
         from identity_service.domain.entities import TokenBlacklistEntry
 
@@ -564,7 +564,7 @@ class OAuth2Service:
                 entry = TokenBlacklistEntry(
                     jti=jti,
                     reason="client_revocation",
-                    expires_at=datetime.fromtimestamp(exp) if exp else None,
+                    expires_at=datetime.fromtimestamp(exp, tz=UTC) if exp else None,
                 )
                 await self._blacklist_repo.add(entry)
 
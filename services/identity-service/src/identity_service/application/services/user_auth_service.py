@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from identity_service.application.dtos import LoginResult, RegistrationResult
 from identity_service.domain.entities.password_reset import PasswordResetToken
 from identity_service.domain.entities.user import User, UserCredential, UserProfile
+from shared.auth.hashing_pool import HashingPoolSaturatedError
 from shared.observability import get_structlog_logger
 from shared.utils import now_utc
 
@@ -24,6 +25,8 @@ if TYPE_CHECKING:
 
 logger = get_structlog_logger(__name__)
 
+_SERVER_BUSY_MESSAGE = "Server is busy, please retry shortly"
+
 
 class UserAuthService:
     """Application service for user authentication operations.
@@ -108,7 +111,15 @@ class UserAuthService:
             )
 
         # Hash password
-        password_hash = self._password_service.hash_password(password)
+        try:
+            password_hash = await self._password_service.hash_password_async(password)
+        except HashingPoolSaturatedError:
+            logger.warning("Registration shed, password hashing saturated", email=email)
+            return RegistrationResult(
+                success=False,
+                error="server_busy",
+                errors=[_SERVER_BUSY_MESSAGE],
+            )
 
         # Create user entity
         user_id = uuid.uuid4()
@@ -167,8 +178,13 @@ class UserAuthService:
         Returns:
             LoginResult with tokens or error/MFA prompt.
         """
+        # Shed load before doing any work if password hashing is saturated
+        if self._password_service.saturated:
+            logger.warning("Login shed, password hashing saturated", email=email)
+            return LoginResult(success=False, error="server_busy")
+
         # Check brute force protection
-        account_status = self._brute_force.check_account(email)
+        account_status = await self._brute_force.check_account(email)
         if account_status.is_locked:
             logger.warning(
                 "Login attempt on locked account",
@@ -182,7 +198,7 @@ class UserAuthService:
 
         # Check IP-based rate limiting
         if ip_address:
-            ip_status = self._brute_force.check_ip(ip_address)
+            ip_status = await self._brute_force.check_ip(ip_address)
             if ip_status.is_blocked:
                 logger.warning(
                     "Login attempt from blocked IP",
@@ -206,7 +222,7 @@ class UserAuthService:
         user = await self._user_repo.get_by_email(email)
         if not user:
             # Record failed attempt (prevents email enumeration timing attacks)
-            self._brute_force.record_attempt(
+            await self._brute_force.record_attempt(
                 email,
                 ip_address or "unknown",
                 success=False,
@@ -220,12 +236,20 @@ class UserAuthService:
         if not can_login:
             return LoginResult(success=False, error=reason or "login_disabled")
 
-        # Verify password
-        if not user.credential or not self._password_service.verify_password(
-            password, user.credential.password_hash
-        ):
+        # Verify password (off the event loop)
+        password_valid = False
+        if user.credential:
+            try:
+                password_valid = await self._password_service.verify_password_async(
+                    password, user.credential.password_hash
+                )
+            except HashingPoolSaturatedError:
+                logger.warning("Login shed, password hashing saturated", email=email)
+                return LoginResult(success=False, error="server_busy")
+
+        if not password_valid:
             # Record failed attempt
-            self._brute_force.record_attempt(
+            await self._brute_force.record_attempt(
                 email,
                 ip_address or "unknown",
                 success=False,
@@ -280,7 +304,7 @@ class UserAuthService:
             LoginResult with tokens and session.
         """
         # Reset failed attempts
-        self._brute_force.record_attempt(
+        await self._brute_force.record_attempt(
             user.email,
             ip_address or "unknown",
             success=True,
@@ -291,7 +315,7 @@ class UserAuthService:
             await self._user_repo.update(user)
 
         # Create session
-        session_result = self._session_service.create_session(
+        session_result = await self._session_service.create_session(
             user_id=str(user.id),
             ip_address=ip_address,
             user_agent=user_agent,
@@ -364,9 +388,13 @@ class UserAuthService:
             return False, "User not found"
 
         # Verify current password
-        if not self._password_service.verify_password(
-            current_password, user.credential.password_hash
-        ):
+        try:
+            current_valid = await self._password_service.verify_password_async(
+                current_password, user.credential.password_hash
+            )
+        except HashingPoolSaturatedError:
+            return False, _SERVER_BUSY_MESSAGE
+        if not current_valid:
             return False, "Current password is incorrect"
 
         # Validate new password against policy
@@ -378,15 +406,22 @@ class UserAuthService:
         if not policy_result.is_valid:
             return False, "; ".join(policy_result.errors)
 
-        # Ensure new password is different
-        if self._password_service.verify_password(new_password, user.credential.password_hash):
-            return False, "New password must be different from current password"
+        try:
+            # Ensure new password is different
+            if await self._password_service.verify_password_async(
+                new_password, user.credential.password_hash
+            ):
+                return False, "New password must be different from current password"
 
-        # Hash and update
+            new_hash = await self._password_service.hash_password_async(new_password)
+        except HashingPoolSaturatedError:
+            return False, _SERVER_BUSY_MESSAGE
+
+        # Update credential
         from identity_service.infrastructure.security import add_to_password_history
 
         add_to_password_history(str(user_id), user.credential.password_hash)
-        user.credential.password_hash = self._password_service.hash_password(new_password)
+        user.credential.password_hash = new_hash
         user.credential.password_changed_at = now_utc()
         user.credential.updated_at = now_utc()
 
@@ -474,10 +509,15 @@ class UserAuthService:
             return False, "; ".join(policy_result.errors)
 
         # Hash and update
+        try:
+            new_hash = await self._password_service.hash_password_async(new_password)
+        except HashingPoolSaturatedError:
+            return False, _SERVER_BUSY_MESSAGE
+
         from identity_service.infrastructure.security import add_to_password_history
 
         add_to_password_history(str(user.id), user.credential.password_hash)
-        user.credential.password_hash = self._password_service.hash_password(new_password)
+        user.credential.password_hash = new_hash
         user.credential.password_changed_at = now_utc()
         user.credential.reset_failed_attempts()
 
@@ -42,6 +42,23 @@ class Settings(BaseSettings):
         description="Redis connection URL",
     )
     redis_pool_size: int = Field(default=10, ge=1, le=100, description="Redis pool size")
+    security_state_backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        description=(
+            "Backend for brute force, session and token revocation state "
+            "(redis shares it across replicas)"
+        ),
+    )
+    token_revocation_filter_capacity: int = Field(
+        default=100_000,
+        ge=1000,
+        description="Revoked tokens the local Bloom filter is sized for (redis backend)",
+    )
+    token_revocation_rebuild_interval: int = Field(
+        default=300,
+        ge=10,
+        description="Seconds between rebuilds of the revocation Bloom filter from Redis",
+    )
 
     # JWT / Token Configuration
     jwt_issuer: str = Field(
@@ -52,16 +69,17 @@ class Settings(BaseSettings):
         default="http://localhost:8003",
         description="Default JWT audience",
     )
-    jwt_algorithm: Literal["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"] = Field(
-        default="RS256", description="JWT signing algorithm"
+    jwt_algorithm: Literal["RS256", "RS384", "RS512", "ES256", "ES384", "ES512", "EdDSA"] = Field(
+        default="RS256",
+        description="JWT signing algorithm (changing it rotates the signing key)",
     )
     jwt_private_key_path: str = Field(
         default="/app/keys/private.pem",
-        description="Path to RSA private key for signing",
+        description="Path to private key for signing",
     )
     jwt_public_key_path: str = Field(
         default="/app/keys/public.pem",
-        description="Path to RSA public key for verification",
+        description="Path to public key for verification (retired keys are kept beside it)",
     )
 
     # Token Lifetimes (in seconds)
@@ -95,6 +113,15 @@ class Settings(BaseSettings):
     password_require_digit: bool = Field(default=True, description="Require digit")
     password_require_special: bool = Field(default=True, description="Require special character")
     bcrypt_rounds: int = Field(default=12, ge=4, le=15, description="bcrypt work factor")
+    password_hash_workers: int = Field(
+        default=4, ge=1, le=64, description="Threads for password hashing off the event loop"
+    )
+    password_hash_max_queue: int = Field(
+        default=32,
+        ge=0,
+        le=4096,
+        description="Hashing calls allowed to wait for a thread before logins get 429",
+    )
 
     # Rate Limiting
     rate_limit_enabled: bool = Field(default=True, description="Enable rate limiting")
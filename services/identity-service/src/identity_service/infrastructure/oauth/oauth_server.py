@@ -154,7 +154,7 @@ class IdentityAuthorizationServer(AuthorizationServer):
         Args:
             settings: Application settings
             jwt_service: JWT service for token generation
-            key_manager: RSA key manager
+            key_manager: Signing key manager
         """
         super().__init__()
         self._settings = settings
@@ -324,8 +324,8 @@ class IdentityAuthorizationServer(AuthorizationServer):
             JWT configuration dictionary.
         """
         return {
-            "key": self._key_manager.private_key,
-            "alg": self._settings.jwt_algorithm,
+            "key": self._key_manager.signing_key,
+            "alg": self._key_manager.algorithm,
             "iss": self._settings.jwt_issuer,
             "exp": self._settings.id_token_lifetime,
         }
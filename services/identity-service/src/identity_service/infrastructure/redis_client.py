@@ -0,0 +1,43 @@
+"""Redis infrastructure for identity-service.
+
+Provides the shared async Redis client used by security state stores
+(brute force tracking, sessions, token revocation).
+"""
+
+from __future__ import annotations
+
+import redis.asyncio as redis
+
+# Module-level Redis client - created lazily, closed during app shutdown
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client(redis_url: str, max_connections: int = 10) -> redis.Redis:
+    """Get the Redis client singleton.
+
+    The underlying connection pool is created on first use; connections
+    are opened lazily by redis-py.
+
+    Args:
+        redis_url: Redis connection URL.
+        max_connections: Connection pool size.
+
+    Returns:
+        Async Redis client returning ``str`` responses.
+    """
+    global _redis_client  # noqa: PLW0603
+    if _redis_client is None:
+        _redis_client = redis.from_url(
+            redis_url,
+            max_connections=max_connections,
+            decode_responses=True,
+        )
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool during shutdown."""
+    global _redis_client  # noqa: PLW0603
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
@@ -3,9 +3,12 @@
 from identity_service.infrastructure.security.brute_force import (
     AccountLockStatus,
     BruteForceProtectionService,
+    InMemoryLoginAttemptStore,
     IPStatus,
     LockoutReason,
     LoginAttempt,
+    LoginAttemptStore,
+    RedisLoginAttemptStore,
     get_brute_force_protection_service,
 )
 from identity_service.infrastructure.security.jwt_service import (
@@ -32,6 +35,13 @@ from identity_service.infrastructure.security.sessions import (
     SessionStatus,
     get_session_management_service,
 )
+from identity_service.infrastructure.security.token_revocation import (
+    BloomFilter,
+    InMemoryTokenRevocationStore,
+    RedisTokenRevocationStore,
+    TokenRevocationStore,
+    get_token_revocation_store,
+)
 
 __all__ = [
     # JWT
@@ -52,13 +62,22 @@ __all__ = [
     # Brute Force
     "AccountLockStatus",
     "BruteForceProtectionService",
+    "InMemoryLoginAttemptStore",
     "IPStatus",
     "LoginAttempt",
+    "LoginAttemptStore",
     "LockoutReason",
+    "RedisLoginAttemptStore",
     "get_brute_force_protection_service",
     # Sessions
     "SessionInfo",
     "SessionManagementService",
     "SessionStatus",
     "get_session_management_service",
+    # Token Revocation
+    "BloomFilter",
+    "InMemoryTokenRevocationStore",
+    "RedisTokenRevocationStore",
+    "TokenRevocationStore",
+    "get_token_revocation_store",
 ]
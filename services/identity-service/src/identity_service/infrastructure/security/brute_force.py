@@ -4,13 +4,19 @@ Features:
 - Account lockout after configurable failed attempts
 - Progressive delay between attempts
 - IP-based rate limiting and blocking
-- Distributed tracking support (Redis-ready)
+- Distributed tracking via Redis sliding windows (in-process fallback)
 - Automatic unlock after cooldown period
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import itertools
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -18,6 +24,8 @@ from typing import TYPE_CHECKING
 from shared.observability import get_structlog_logger
 
 if TYPE_CHECKING:
+    import redis.asyncio as redis
+
     from identity_service.configs.settings import Settings
 
 logger = get_structlog_logger(__name__)
@@ -75,11 +83,11 @@ class IPStatus:
 
 
 @dataclass
-class AttemptTracker:
-    """Tracks login attempts for a user or IP."""
+class TrackerState:
+    """Snapshot of the attempt window and lock for a user or IP key."""
 
-    attempts: list[LoginAttempt] = field(default_factory=list)
     failed_count: int = 0
+    last_attempt_at: datetime | None = None
     locked: bool = False
     locked_at: datetime | None = None
     locked_until: datetime | None = None
@@ -87,40 +95,450 @@ class AttemptTracker:
 
 
 # ========================================
-# In-Memory Storage (Replace with Redis in production)
+# Attempt Stores
 # ========================================
 
-# username -> AttemptTracker
-_user_trackers: dict[str, AttemptTracker] = {}
 
-# ip_address -> AttemptTracker
-_ip_trackers: dict[str, AttemptTracker] = {}
+def _window_capacity(settings: Settings) -> int:
+    """Failures a store must retain per key to evaluate every threshold."""
+    # Suspicious score saturates at 20 failures
+    return max(
+        getattr(settings, "max_failed_login_attempts", 5),
+        getattr(settings, "ip_max_failed_attempts", 20),
+        20,
+    )
+
+
+def _user_key(username: str) -> str:
+    return f"user:{username}"
+
+
+def _ip_key(ip_address: str) -> str:
+    return f"ip:{ip_address}"
+
+
+class LoginAttemptStore(ABC):
+    """Storage backend for sliding-window failure counters and locks.
+
+    Every operation costs a constant number of backend commands,
+    independent of how many attempts a key has accumulated.
+
+    Taking a lock clears the key's failure window; the lock itself
+    expires at ``locked_until`` and the key starts from a clean slate.
+    """
+
+    @abstractmethod
+    async def get_state(self, key: str, window_seconds: int) -> TrackerState:
+        """Return failures inside the window and the current lock for a key."""
+
+    @abstractmethod
+    async def record(
+        self,
+        user_key: str,
+        ip_key: str,
+        attempt: LoginAttempt,
+        window_seconds: int,
+    ) -> tuple[int, int]:
+        """Record an attempt against both the user and the IP key.
+
+        A failed attempt is added to both failure windows. A successful
+        attempt resets the user window but leaves the IP window intact,
+        as the IP may be shared.
+
+        Returns:
+            Tuple of (user_failures, ip_failures) inside the window.
+        """
+
+    @abstractmethod
+    async def lock(
+        self,
+        key: str,
+        locked_at: datetime,
+        locked_until: datetime,
+        reason: LockoutReason,
+    ) -> None:
+        """Lock a key until ``locked_until``."""
+
+    @abstractmethod
+    async def unlock(self, key: str) -> bool:
+        """Remove a lock and reset the failure window.
+
+        Returns:
+            True if the key was locked.
+        """
+
+    @abstractmethod
+    async def block_permanently(self, ip_address: str) -> None:
+        """Add an IP to the permanent block list."""
+
+    @abstractmethod
+    async def unblock_permanently(self, ip_address: str) -> bool:
+        """Remove an IP from the permanent block list."""
+
+    @abstractmethod
+    async def is_permanently_blocked(self, ip_address: str) -> bool:
+        """Check the permanent block list."""
+
+    @abstractmethod
+    async def recent_attempts(self, key: str | None, limit: int) -> list[LoginAttempt]:
+        """Return the most recent attempts for a key (or all keys), newest first."""
+
+
+@dataclass
+class _KeyState:
+    """Per-key state of the in-memory store."""
+
+    failures: deque[float]
+    log: deque[LoginAttempt]
+    last_seen: float = 0.0
+    locked_at: datetime | None = None
+    locked_until: datetime | None = None
+    lock_reason: LockoutReason | None = None
+    locked_failures: int = 0
+
+
+class InMemoryLoginAttemptStore(LoginAttemptStore):
+    """Per-process store using a fixed-size ring buffer per key.
+
+    Failure timestamps are kept in a bounded deque in arrival order, so
+    expiring the window pops from the left in amortized O(1). Keys are
+    kept in LRU order and idle keys (no attempts inside the window, no
+    active lock) are evicted incrementally on every write.
+
+    Suitable for single-replica deployments and tests; state is not
+    shared across processes.
+    """
+
+    _EVICTION_BATCH = 64
+
+    def __init__(
+        self,
+        capacity: int = 20,
+        log_size: int = 50,
+        max_keys: int = 100_000,
+        idle_seconds: int = 1800,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            capacity: Failures kept per key (at least the highest lock threshold).
+            log_size: Attempts kept per key for auditing.
+            max_keys: Hard cap on tracked keys; least recently used are dropped.
+            idle_seconds: Inactivity after which an unlocked key is evicted.
+        """
+        self._capacity = capacity
+        self._log_size = log_size
+        self._max_keys = max_keys
+        self._idle_seconds = idle_seconds
+        self._keys: OrderedDict[str, _KeyState] = OrderedDict()
+        self._recent: deque[LoginAttempt] = deque(maxlen=log_size * 20)
+        self._blocked_ips: set[str] = set()
+
+    def _touch(self, key: str, now: float) -> _KeyState:
+        state = self._keys.get(key)
+        if state is None:
+            state = _KeyState(
+                failures=deque(maxlen=self._capacity),
+                log=deque(maxlen=self._log_size),
+            )
+            self._keys[key] = state
+        else:
+            self._keys.move_to_end(key)
+        state.last_seen = now
+        return state
+
+    def _evict_idle(self, now: float) -> None:
+        while len(self._keys) > self._max_keys:
+            self._keys.popitem(last=False)
+        cutoff = now - self._idle_seconds
+        for _ in range(self._EVICTION_BATCH):
+            if not self._keys:
+                return
+            key, state = next(iter(self._keys.items()))
+            if state.last_seen > cutoff:
+                return
+            if state.locked_until is not None and state.locked_until.timestamp() > now:
+                # Still locked: keep it, but look past it next time
+                self._keys.move_to_end(key)
+                continue
+            del self._keys[key]
+
+    @staticmethod
+    def _expire(state: _KeyState, now: float, window_seconds: int) -> None:
+        cutoff = now - window_seconds
+        failures = state.failures
+        while failures and failures[0] <= cutoff:
+            failures.popleft()
+        if state.locked_until is not None and state.locked_until.timestamp() <= now:
+            state.locked_at = None
+            state.locked_until = None
+            state.lock_reason = None
+            state.locked_failures = 0
+
+    async def get_state(self, key: str, window_seconds: int) -> TrackerState:
+        state = self._keys.get(key)
+        if state is None:
+            return TrackerState()
+        now = time.time()
+        self._expire(state, now, window_seconds)
+        locked = state.locked_until is not None
+        return TrackerState(
+            failed_count=state.locked_failures if locked else len(state.failures),
+            last_attempt_at=state.log[-1].timestamp if state.log else None,
+            locked=locked,
+            locked_at=state.locked_at,
+            locked_until=state.locked_until,
+            lock_reason=state.lock_reason,
+        )
+
+    async def record(
+        self,
+        user_key: str,
+        ip_key: str,
+        attempt: LoginAttempt,
+        window_seconds: int,
+    ) -> tuple[int, int]:
+        now = attempt.timestamp.timestamp()
+        user = self._touch(user_key, now)
+        ip = self._touch(ip_key, now)
+        for state in (user, ip):
+            self._expire(state, now, window_seconds)
+            state.log.append(attempt)
+        self._recent.append(attempt)
+
+        if attempt.success:
+            user.failures.clear()
+        else:
+            user.failures.append(now)
+            ip.failures.append(now)
+
+        self._evict_idle(now)
+        return len(user.failures), len(ip.failures)
+
+    async def lock(
+        self,
+        key: str,
+        locked_at: datetime,
+        locked_until: datetime,
+        reason: LockoutReason,
+    ) -> None:
+        state = self._touch(key, locked_at.timestamp())
+        state.locked_at = locked_at
+        state.locked_until = locked_until
+        state.lock_reason = reason
+        state.locked_failures = len(state.failures)
+        state.failures.clear()
+
+    async def unlock(self, key: str) -> bool:
+        state = self._keys.get(key)
+        if state is None:
+            return False
+        self._expire(state, time.time(), 0)
+        was_locked = state.locked_until is not None
+        state.locked_at = None
+        state.locked_until = None
+        state.lock_reason = None
+        state.locked_failures = 0
+        state.failures.clear()
+        state.log.clear()
+        return was_locked
+
+    async def block_permanently(self, ip_address: str) -> None:
+        self._blocked_ips.add(ip_address)
+
+    async def unblock_permanently(self, ip_address: str) -> bool:
+        if ip_address in self._blocked_ips:
+            self._blocked_ips.discard(ip_address)
+            return True
+        return False
+
+    async def is_permanently_blocked(self, ip_address: str) -> bool:
+        return ip_address in self._blocked_ips
+
+    async def recent_attempts(self, key: str | None, limit: int) -> list[LoginAttempt]:
+        if key is None:
+            source: deque[LoginAttempt] = self._recent
+        else:
+            state = self._keys.get(key)
+            if state is None:
+                return []
+            source = state.log
+        return list(itertools.islice(reversed(source), limit))
+
+
+# Records one attempt against the user and IP windows in a single round trip.
+# KEYS: user_failures, ip_failures, user_log, ip_log, recent_log
+# ARGV: now_ms, window_ms, success (0/1), attempt_json, member, capacity, log_size
+_RECORD_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[6])
+local log_size = tonumber(ARGV[7])
+for i = 3, 5 do
+    redis.call('LPUSH', KEYS[i], ARGV[4])
+    redis.call('LTRIM', KEYS[i], 0, log_size - 1)
+    redis.call('PEXPIRE', KEYS[i], window)
+end
+for i = 1, 2 do
+    redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+end
+if ARGV[3] == '1' then
+    redis.call('DEL', KEYS[1])
+else
+    for i = 1, 2 do
+        redis.call('ZADD', KEYS[i], now, ARGV[5])
+        redis.call('ZREMRANGEBYRANK', KEYS[i], 0, -(capacity + 1))
+        redis.call('PEXPIRE', KEYS[i], window)
+    end
+end
+return {redis.call('ZCARD', KEYS[1]), redis.call('ZCARD', KEYS[2])}
+"""
+
+
+class RedisLoginAttemptStore(LoginAttemptStore):
+    """Redis store shared by all replicas.
+
+    Failures live in a sorted set per key scored by timestamp; the window
+    is trimmed with ``ZREMRANGEBYSCORE`` and capped with
+    ``ZREMRANGEBYRANK``, so the set never exceeds ``capacity`` members.
+    Recording an attempt is a single ``EVALSHA``. Locks are hashes with a
+    native expiry at ``locked_until``, so unlocks need no sweeps.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str = "identity:bf",
+        capacity: int = 20,
+        log_size: int = 50,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            client: Async Redis client (``decode_responses=True``).
+            prefix: Key namespace.
+            capacity: Failures kept per key (at least the highest lock threshold).
+            log_size: Attempts kept per key for auditing.
+        """
+        self._redis = client
+        self._prefix = prefix
+        self._capacity = capacity
+        self._log_size = log_size
+        self._record_script = client.register_script(_RECORD_SCRIPT)
+
+    def _k(self, kind: str, key: str) -> str:
+        return f"{self._prefix}:{kind}:{key}"
+
+    async def get_state(self, key: str, window_seconds: int) -> TrackerState:
+        failures_key = self._k("fail", key)
+        now_ms = int(time.time() * 1000)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(failures_key, "-inf", now_ms - window_seconds * 1000)
+            pipe.zcard(failures_key)
+            pipe.lindex(self._k("log", key), 0)
+            pipe.hgetall(self._k("lock", key))
+            _, failed_count, last_raw, lock = await pipe.execute()
+
+        last_attempt_at = _attempt_from_json(last_raw).timestamp if last_raw else None
+        if lock:
+            return TrackerState(
+                failed_count=int(lock.get("failed_attempts", 0)),
+                last_attempt_at=last_attempt_at,
+                locked=True,
+                locked_at=datetime.fromisoformat(lock["locked_at"]),
+                locked_until=datetime.fromisoformat(lock["locked_until"]),
+                lock_reason=LockoutReason(lock["reason"]),
+            )
+        return TrackerState(failed_count=int(failed_count), last_attempt_at=last_attempt_at)
+
+    async def record(
+        self,
+        user_key: str,
+        ip_key: str,
+        attempt: LoginAttempt,
+        window_seconds: int,
+    ) -> tuple[int, int]:
+        user_failures, ip_failures = await self._record_script(
+            keys=[
+                self._k("fail", user_key),
+                self._k("fail", ip_key),
+                self._k("log", user_key),
+                self._k("log", ip_key),
+                self._k("log", "recent"),
+            ],
+            args=[
+                int(attempt.timestamp.timestamp() * 1000),
+                window_seconds * 1000,
+                1 if attempt.success else 0,
+                _attempt_to_json(attempt),
+                uuid.uuid4().hex,
+                self._capacity,
+                self._log_size,
+            ],
+        )
+        return int(user_failures), int(ip_failures)
+
+    async def lock(
+        self,
+        key: str,
+        locked_at: datetime,
+        locked_until: datetime,
+        reason: LockoutReason,
+    ) -> None:
+        failures_key = self._k("fail", key)
+        lock_key = self._k("lock", key)
+        failed_count = await self._redis.zcard(failures_key)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                lock_key,
+                mapping={
+                    "locked_at": locked_at.isoformat(),
+                    "locked_until": locked_until.isoformat(),
+                    "reason": reason.value,
+                    "failed_attempts": failed_count,
+                },
+            )
+            pipe.pexpireat(lock_key, int(locked_until.timestamp() * 1000))
+            pipe.delete(failures_key)
+            await pipe.execute()
+
+    async def unlock(self, key: str) -> bool:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._k("lock", key))
+            pipe.delete(self._k("fail", key), self._k("log", key))
+            removed, _ = await pipe.execute()
+        return bool(removed)
 
-# Set of permanently blocked IPs
-_blocked_ips: set[str] = set()
+    async def block_permanently(self, ip_address: str) -> None:
+        await self._redis.sadd(self._k("blocked", "ips"), ip_address)
 
+    async def unblock_permanently(self, ip_address: str) -> bool:
+        return bool(await self._redis.srem(self._k("blocked", "ips"), ip_address))
 
-def _get_user_tracker(username: str) -> AttemptTracker:
-    """Get or create tracker for user."""
-    if username not in _user_trackers:
-        _user_trackers[username] = AttemptTracker()
-    return _user_trackers[username]
+    async def is_permanently_blocked(self, ip_address: str) -> bool:
+        return bool(await self._redis.sismember(self._k("blocked", "ips"), ip_address))
 
+    async def recent_attempts(self, key: str | None, limit: int) -> list[LoginAttempt]:
+        raw = await self._redis.lrange(self._k("log", key or "recent"), 0, limit - 1)
+        return [_attempt_from_json(item) for item in raw]
 
-def _get_ip_tracker(ip_address: str) -> AttemptTracker:
-    """Get or create tracker for IP."""
-    if ip_address not in _ip_trackers:
-        _ip_trackers[ip_address] = AttemptTracker()
-    return _ip_trackers[ip_address]
 
+def _attempt_to_json(attempt: LoginAttempt) -> str:
+    return json.dumps(
+        {
+            "timestamp": attempt.timestamp.isoformat(),
+            "ip_address": attempt.ip_address,
+            "user_agent": attempt.user_agent,
+            "success": attempt.success,
+            "failure_reason": attempt.failure_reason,
+        }
+    )
 
-def _cleanup_old_attempts(tracker: AttemptTracker, window_minutes: int = 30) -> None:
-    """Remove attempts older than the tracking window."""
-    cutoff = datetime.now(UTC) - timedelta(minutes=window_minutes)
-    tracker.attempts = [a for a in tracker.attempts if a.timestamp > cutoff]
 
-    # Recalculate failed count
-    tracker.failed_count = sum(1 for a in tracker.attempts if not a.success)
+def _attempt_from_json(raw: str) -> LoginAttempt:
+    data = json.loads(raw)
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return LoginAttempt(**data)
 
 
 # ========================================
@@ -131,11 +549,12 @@ def _cleanup_old_attempts(tracker: AttemptTracker, window_minutes: int = 30) ->
 class BruteForceProtectionService:
     """Service for protecting against brute force attacks."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, store: LoginAttemptStore | None = None) -> None:
         """Initialize protection service.
 
         Args:
             settings: Application settings
+            store: Attempt store (per-process in-memory store if omitted)
         """
         self._settings = settings
 
@@ -147,7 +566,16 @@ class BruteForceProtectionService:
         self.ip_max_failed_attempts = getattr(settings, "ip_max_failed_attempts", 20)
         self.ip_block_duration_hours = getattr(settings, "ip_block_duration_hours", 1)
 
-    def check_account(self, username: str) -> AccountLockStatus:
+        self._store = store or InMemoryLoginAttemptStore(
+            capacity=_window_capacity(settings),
+            idle_seconds=self.tracking_window_minutes * 60,
+        )
+
+    @property
+    def _window_seconds(self) -> int:
+        return self.tracking_window_minutes * 60
+
+    async def check_account(self, username: str) -> AccountLockStatus:
         """Check if account is locked.
 
         Args:
@@ -156,44 +584,30 @@ class BruteForceProtectionService:
         Returns:
             Current lock status
         """
-        tracker = _get_user_tracker(username)
-        _cleanup_old_attempts(tracker, self.tracking_window_minutes)
-
-        # Check if lock has expired
-        if tracker.locked and tracker.locked_until:
-            if datetime.now(UTC) > tracker.locked_until:
-                # Auto-unlock
-                tracker.locked = False
-                tracker.locked_at = None
-                tracker.locked_until = None
-                tracker.lock_reason = None
-                tracker.failed_count = 0
-                tracker.attempts.clear()
-                logger.info("Account auto-unlocked", username=username)
+        state = await self._store.get_state(_user_key(username), self._window_seconds)
 
         # Calculate required delay (progressive)
         required_delay = 0.0
-        if self.progressive_delay_enabled and tracker.failed_count > 0:
+        if self.progressive_delay_enabled and state.failed_count > 0:
             # Exponential backoff: 2^(attempts-1) seconds, capped at 30 seconds
-            required_delay = min(30, 2 ** (tracker.failed_count - 1))
+            required_delay = min(30, 2 ** (state.failed_count - 1))
 
             # Check if enough time has passed since last attempt
-            if tracker.attempts:
-                last_attempt = tracker.attempts[-1]
-                elapsed = (datetime.now(UTC) - last_attempt.timestamp).total_seconds()
+            if state.last_attempt_at:
+                elapsed = (datetime.now(UTC) - state.last_attempt_at).total_seconds()
                 required_delay = max(0, required_delay - elapsed)
 
         return AccountLockStatus(
-            is_locked=tracker.locked,
-            reason=tracker.lock_reason,
-            locked_at=tracker.locked_at,
-            unlock_at=tracker.locked_until,
-            failed_attempts=tracker.failed_count,
-            last_attempt_at=tracker.attempts[-1].timestamp if tracker.attempts else None,
+            is_locked=state.locked,
+            reason=state.lock_reason,
+            locked_at=state.locked_at,
+            unlock_at=state.locked_until,
+            failed_attempts=state.failed_count,
+            last_attempt_at=state.last_attempt_at,
             required_delay_seconds=required_delay,
         )
 
-    def check_ip(self, ip_address: str) -> IPStatus:
+    async def check_ip(self, ip_address: str) -> IPStatus:
         """Check if IP address is blocked.
 
         Args:
@@ -203,39 +617,29 @@ class BruteForceProtectionService:
             Current IP status
         """
         # Check permanent block list
-        if ip_address in _blocked_ips:
+        if await self._store.is_permanently_blocked(ip_address):
             return IPStatus(
                 ip_address=ip_address,
                 is_blocked=True,
                 suspicious_score=100,
             )
 
-        tracker = _get_ip_tracker(ip_address)
-        _cleanup_old_attempts(tracker, self.tracking_window_minutes)
-
-        # Check if block has expired
-        if tracker.locked and tracker.locked_until:
-            if datetime.now(UTC) > tracker.locked_until:
-                tracker.locked = False
-                tracker.locked_at = None
-                tracker.locked_until = None
-                tracker.failed_count = 0
-                logger.info("IP auto-unblocked", ip_address=ip_address)
+        state = await self._store.get_state(_ip_key(ip_address), self._window_seconds)
 
         # Calculate suspicious score (0-100)
-        suspicious_score = min(100, tracker.failed_count * 5)
+        suspicious_score = min(100, state.failed_count * 5)
 
         return IPStatus(
             ip_address=ip_address,
-            is_blocked=tracker.locked,
-            blocked_at=tracker.locked_at,
-            blocked_until=tracker.locked_until,
-            failed_attempts=tracker.failed_count,
-            last_attempt_at=tracker.attempts[-1].timestamp if tracker.attempts else None,
+            is_blocked=state.locked,
+            blocked_at=state.locked_at,
+            blocked_until=state.locked_until,
+            failed_attempts=state.failed_count,
+            last_attempt_at=state.last_attempt_at,
             suspicious_score=suspicious_score,
         )
 
-    def record_attempt(
+    async def record_attempt(
         self,
         username: str,
         ip_address: str,
@@ -264,65 +668,58 @@ class BruteForceProtectionService:
             failure_reason=failure_reason,
         )
 
-        # Track by username
-        user_tracker = _get_user_tracker(username)
-        _cleanup_old_attempts(user_tracker, self.tracking_window_minutes)
-        user_tracker.attempts.append(attempt)
-
-        # Track by IP
-        ip_tracker = _get_ip_tracker(ip_address)
-        _cleanup_old_attempts(ip_tracker, self.tracking_window_minutes)
-        ip_tracker.attempts.append(attempt)
+        user_failures, ip_failures = await self._store.record(
+            _user_key(username),
+            _ip_key(ip_address),
+            attempt,
+            self._window_seconds,
+        )
 
         if success:
-            # Reset failed counts on success
-            user_tracker.failed_count = 0
-            # Don't reset IP tracker - could be shared IP
+            # User window is reset on success; IP window is kept - could be shared IP
             logger.info(
                 "Successful login",
                 username=username,
                 ip_address=ip_address,
             )
         else:
-            user_tracker.failed_count += 1
-            ip_tracker.failed_count += 1
-
             logger.warning(
                 "Failed login attempt",
                 username=username,
                 ip_address=ip_address,
-                failed_attempts=user_tracker.failed_count,
+                failed_attempts=user_failures,
                 reason=failure_reason,
             )
 
             # Check if account should be locked
-            if user_tracker.failed_count >= self.max_failed_attempts:
-                user_tracker.locked = True
-                user_tracker.locked_at = now
-                user_tracker.locked_until = now + timedelta(minutes=self.lockout_duration_minutes)
-                user_tracker.lock_reason = LockoutReason.FAILED_ATTEMPTS
+            if user_failures >= self.max_failed_attempts:
+                locked_until = now + timedelta(minutes=self.lockout_duration_minutes)
+                await self._store.lock(
+                    _user_key(username), now, locked_until, LockoutReason.FAILED_ATTEMPTS
+                )
 
                 logger.warning(
                     "Account locked due to failed attempts",
                     username=username,
-                    locked_until=user_tracker.locked_until.isoformat(),
+                    locked_until=locked_until.isoformat(),
                 )
 
             # Check if IP should be blocked
-            if ip_tracker.failed_count >= self.ip_max_failed_attempts:
-                ip_tracker.locked = True
-                ip_tracker.locked_at = now
-                ip_tracker.locked_until = now + timedelta(hours=self.ip_block_duration_hours)
+            if ip_failures >= self.ip_max_failed_attempts:
+                blocked_until = now + timedelta(hours=self.ip_block_duration_hours)
+                await self._store.lock(
+                    _ip_key(ip_address), now, blocked_until, LockoutReason.IP_BLOCKED
+                )
 
                 logger.warning(
                     "IP blocked due to failed attempts",
                     ip_address=ip_address,
-                    blocked_until=ip_tracker.locked_until.isoformat(),
+                    blocked_until=blocked_until.isoformat(),
                 )
 
-        return self.check_account(username), self.check_ip(ip_address)
+        return await self.check_account(username), await self.check_ip(ip_address)
 
-    def unlock_account(self, username: str, reason: str = "admin_unlock") -> bool:
+    async def unlock_account(self, username: str, reason: str = "admin_unlock") -> bool:
         """Manually unlock an account.
 
         Args:
@@ -332,17 +729,9 @@ class BruteForceProtectionService:
         Returns:
             True if account was unlocked
         """
-        tracker = _get_user_tracker(username)
-        if not tracker.locked:
+        if not await self._store.unlock(_user_key(username)):
             return False
 
-        tracker.locked = False
-        tracker.locked_at = None
-        tracker.locked_until = None
-        tracker.lock_reason = None
-        tracker.failed_count = 0
-        tracker.attempts.clear()
-
         logger.info(
             "Account manually unlocked",
             username=username,
@@ -350,7 +739,7 @@ class BruteForceProtectionService:
         )
         return True
 
-    def unblock_ip(self, ip_address: str) -> bool:
+    async def unblock_ip(self, ip_address: str) -> bool:
         """Manually unblock an IP address.
 
         Args:
@@ -360,36 +749,29 @@ class BruteForceProtectionService:
             True if IP was unblocked
         """
         # Remove from permanent block list
-        _blocked_ips.discard(ip_address)
+        was_blocked = await self._store.unblock_permanently(ip_address)
 
-        tracker = _get_ip_tracker(ip_address)
-        if not tracker.locked:
+        if not await self._store.unlock(_ip_key(ip_address)) and not was_blocked:
             return False
 
-        tracker.locked = False
-        tracker.locked_at = None
-        tracker.locked_until = None
-        tracker.failed_count = 0
-        tracker.attempts.clear()
-
         logger.info("IP manually unblocked", ip_address=ip_address)
         return True
 
-    def block_ip_permanently(self, ip_address: str, reason: str = "admin_action") -> None:
+    async def block_ip_permanently(self, ip_address: str, reason: str = "admin_action") -> None:
         """Permanently block an IP address.
 
         Args:
             ip_address: IP to block
             reason: Reason for block
         """
-        _blocked_ips.add(ip_address)
+        await self._store.block_permanently(ip_address)
         logger.warning(
             "IP permanently blocked",
             ip_address=ip_address,
             reason=reason,
         )
 
-    def get_recent_attempts(
+    async def get_recent_attempts(
         self,
         username: str | None = None,
         ip_address: str | None = None,
@@ -403,24 +785,15 @@ class BruteForceProtectionService:
             limit: Maximum attempts to return
 
         Returns:
-            List of recent attempts
+            List of recent attempts, newest first
         """
-        attempts: list[LoginAttempt] = []
-
         if username:
-            tracker = _get_user_tracker(username)
-            attempts.extend(tracker.attempts)
+            key: str | None = _user_key(username)
         elif ip_address:
-            tracker = _get_ip_tracker(ip_address)
-            attempts.extend(tracker.attempts)
+            key = _ip_key(ip_address)
         else:
-            # Get all attempts (expensive, use with caution)
-            for tracker in _user_trackers.values():
-                attempts.extend(tracker.attempts)
-
-        # Sort by timestamp descending
-        attempts.sort(key=lambda a: a.timestamp, reverse=True)
-        return attempts[:limit]
+            key = None
+        return await self._store.recent_attempts(key, limit)
 
 
 # ========================================
@@ -431,8 +804,20 @@ _protection_service: BruteForceProtectionService | None = None
 
 
 def get_brute_force_protection_service(settings: Settings) -> BruteForceProtectionService:
-    """Get brute force protection service instance."""
+    """Get brute force protection service instance.
+
+    Uses the Redis store when ``security_state_backend`` is ``"redis"`` so
+    lockouts hold across replicas, otherwise the per-process store.
+    """
     global _protection_service
     if _protection_service is None:
-        _protection_service = BruteForceProtectionService(settings)
+        store: LoginAttemptStore | None = None
+        if settings.security_state_backend == "redis":
+            from identity_service.infrastructure.redis_client import get_redis_client
+
+            store = RedisLoginAttemptStore(
+                get_redis_client(settings.redis_url, settings.redis_pool_size),
+                capacity=_window_capacity(settings),
+            )
+        _protection_service = BruteForceProtectionService(settings, store=store)
     return _protection_service
@@ -1,62 +1,140 @@
-"""JWT token utilities - RSA key management and JWT operations."""
+"""JWT token utilities - signing key management and JWT operations.
+
+Keys are parsed into JWK objects once and reused for every token, and the
+JWKS document (with its ETag) is precomputed whenever the key set changes.
+RSA (RS256/384/512), EC (ES256/384/512) and Ed25519 (EdDSA) keys are
+supported; EC and Ed25519 sign an order of magnitude faster than RSA.
+
+Rotation keeps retired public keys next to the active one as
+``<public stem>.<kid>.pem`` so tokens signed before a rotation still
+verify until the retired key is removed.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import time
 import uuid
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
 
 if TYPE_CHECKING:
     from identity_service.configs.settings import Settings
 
+# Curve for each EC algorithm (RFC 7518 section 3.4)
+_EC_CURVES: dict[str, type[ec.EllipticCurve]] = {
+    "ES256": ec.SECP256R1,
+    "ES384": ec.SECP384R1,
+    "ES512": ec.SECP521R1,
+}
+
+
+def _algorithms_for_key(public_key: Any) -> list[str]:
+    """Return the JWS algorithms a public key can verify."""
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return ["RS256", "RS384", "RS512"]
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return [alg for alg, curve in _EC_CURVES.items() if isinstance(public_key.curve, curve)]
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return ["EdDSA"]
+    return []
+
+
+def _generate_private_key(algorithm: str) -> Any:
+    """Generate a private key suitable for ``algorithm``."""
+    if algorithm in _EC_CURVES:
+        return ec.generate_private_key(_EC_CURVES[algorithm]())
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _kid_for(public_pem: bytes) -> str:
+    return hashlib.sha256(public_pem).hexdigest()[:16]
+
 
 class KeyManager:
-    """RSA key manager for JWT signing and verification.
+    """Signing key manager for JWT signing and verification.
 
-    Handles loading, generating, and rotating RSA key pairs.
+    Handles loading, generating, and rotating key pairs. The active key
+    signs new tokens; the active and retired public keys all verify.
     """
 
-    def __init__(self, private_key_path: str, public_key_path: str) -> None:
+    def __init__(
+        self,
+        private_key_path: str,
+        public_key_path: str,
+        algorithm: str = "RS256",
+    ) -> None:
         """Initialize key manager.
 
         Args:
-            private_key_path: Path to RSA private key PEM file
-            public_key_path: Path to RSA public key PEM file
+            private_key_path: Path to private key PEM file
+            public_key_path: Path to public key PEM file
+            algorithm: JWS algorithm of the active key
         """
         self._private_key_path = Path(private_key_path)
         self._public_key_path = Path(public_key_path)
+        self._algorithm = algorithm
         self._private_key: bytes | None = None
         self._public_key: bytes | None = None
         self._kid: str | None = None
+        # Parsed key objects, built once per key set
+        self._signing_key: Any = None
+        self._verification_keys: dict[str, Any] = {}
+        self._retired: dict[str, bytes] = {}
+        self._algorithms: list[str] = []
+        self._jwks: dict = {"keys": []}
+        self._jwks_json: bytes = b""
+        self._jwks_etag: str = ""
 
     def load_or_generate_keys(self) -> None:
-        """Load existing keys or generate new ones if not found."""
+        """Load existing keys or generate new ones if not found.
+
+        If the stored key does not fit the configured algorithm (e.g. the
+        algorithm changed from RS256 to ES256), the key is rotated so
+        outstanding tokens keep verifying against the retired key.
+        """
+        self._load_retired_keys()
         if self._private_key_path.exists() and self._public_key_path.exists():
             self._load_keys()
+            public_key = serialization.load_pem_public_key(self.public_key)
+            if self._algorithm not in _algorithms_for_key(public_key):
+                self.rotate()
+                return
         else:
             self._generate_keys()
+        self._rebuild()
 
     def _load_keys(self) -> None:
         """Load keys from files."""
         self._private_key = self._private_key_path.read_bytes()
         self._public_key = self._public_key_path.read_bytes()
         # Generate KID from public key hash
-        import hashlib
-
-        self._kid = hashlib.sha256(self._public_key).hexdigest()[:16]
+        self._kid = _kid_for(self._public_key)
+
+    def _retired_key_path(self, kid: str) -> Path:
+        path = self._public_key_path
+        return path.with_name(f"{path.stem}.{kid}{path.suffix}")
+
+    def _load_retired_keys(self) -> None:
+        """Load retired public keys stored beside the active one."""
+        path = self._public_key_path
+        self._retired = {}
+        if not path.parent.exists():
+            return
+        for retired_path in sorted(path.parent.glob(f"{path.stem}.*{path.suffix}")):
+            kid = retired_path.name[len(path.stem) + 1 : -len(path.suffix) or None]
+            self._retired[kid] = retired_path.read_bytes()
 
     def _generate_keys(self) -> None:
-        """Generate new RSA key pair."""
-        # Generate RSA key pair
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
+        """Generate a new key pair for the configured algorithm."""
+        private_key = _generate_private_key(self._algorithm)
 
         # Serialize private key
         self._private_key = private_key.private_bytes(
@@ -81,9 +159,75 @@ class KeyManager:
         self._public_key_path.write_bytes(self._public_key)
 
         # Generate KID
-        import hashlib
+        self._kid = _kid_for(self._public_key)
+
+    def _rebuild(self) -> None:
+        """Parse keys and precompute the JWKS document and ETag."""
+        from authlib.jose import JsonWebKey
+
+        self._signing_key = JsonWebKey.import_key(self.private_key)
+        keys = {self.kid: self.public_key, **self._retired}
+        verification_keys: dict[str, Any] = {}
+        algorithms = {self._algorithm}
+        jwks: list[dict] = []
+        for kid, pem in keys.items():
+            verification_keys[kid] = JsonWebKey.import_key(pem)
+            jwk_dict = verification_keys[kid].as_dict()
+            jwk_dict["kid"] = kid
+            jwk_dict["use"] = "sig"
+            if kid == self.kid:
+                jwk_dict["alg"] = self._algorithm
+            else:
+                algorithms.update(_algorithms_for_key(serialization.load_pem_public_key(pem)))
+            jwks.append(jwk_dict)
+
+        self._verification_keys = verification_keys
+        self._algorithms = sorted(algorithms)
+        self._jwks = {"keys": jwks}
+        self._jwks_json = json.dumps(self._jwks, separators=(",", ":"), sort_keys=True).encode()
+        self._jwks_etag = f'"{hashlib.sha256(self._jwks_json).hexdigest()[:32]}"'
+
+    def rotate(self) -> str:
+        """Generate a new active key, retiring the current public key.
+
+        Returns:
+            Key ID of the new active key.
+        """
+        if self._public_key is not None and self._kid is not None:
+            self._retired[self._kid] = self._public_key
+            self._retired_key_path(self._kid).write_bytes(self._public_key)
+        self._generate_keys()
+        self._retired.pop(self.kid, None)
+        self._rebuild()
+        return self.kid
+
+    def retire(self, kid: str) -> bool:
+        """Stop accepting tokens signed with a retired key.
+
+        Args:
+            kid: Key ID of a retired key
+
+        Returns:
+            True if the key was removed.
+        """
+        if kid not in self._retired:
+            return False
+        del self._retired[kid]
+        self._retired_key_path(kid).unlink(missing_ok=True)
+        self._rebuild()
+        return True
 
-        self._kid = hashlib.sha256(self._public_key).hexdigest()[:16]
+    @property
+    def algorithm(self) -> str:
+        """Get the JWS algorithm of the active key."""
+        return self._algorithm
+
+    @property
+    def algorithms(self) -> list[str]:
+        """Get all JWS algorithms accepted for verification."""
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._algorithms
 
     @property
     def private_key(self) -> bytes:
@@ -106,21 +250,42 @@ class KeyManager:
             self.load_or_generate_keys()
         return self._kid  # type: ignore
 
+    @property
+    def signing_key(self) -> Any:
+        """Get the parsed private key of the active key."""
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._signing_key
+
+    def verification_key(self, kid: str | None) -> Any | None:
+        """Get the parsed public key for ``kid`` (active key if ``kid`` is None)."""
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._verification_keys.get(kid or self.kid)
+
+    @property
+    def jwks_json(self) -> bytes:
+        """Get the serialized JWKS document."""
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._jwks_json
+
+    @property
+    def jwks_etag(self) -> str:
+        """Get the ETag of the JWKS document."""
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._jwks_etag
+
     def get_jwks(self) -> dict:
-        """Get JSON Web Key Set (JWKS) for public key.
+        """Get JSON Web Key Set (JWKS) for the active and retired public keys.
 
         Returns:
-            JWKS dictionary with public key in JWK format.
+            JWKS dictionary with public keys in JWK format.
         """
-        from authlib.jose import JsonWebKey
-
-        jwk = JsonWebKey.import_key(self.public_key, {"kty": "RSA"})
-        jwk_dict = dict(jwk)
-        jwk_dict["kid"] = self.kid
-        jwk_dict["use"] = "sig"
-        jwk_dict["alg"] = "RS256"
-
-        return {"keys": [jwk_dict]}
+        if self._signing_key is None:
+            self.load_or_generate_keys()
+        return self._jwks
 
 
 class JWTService:
@@ -131,10 +296,37 @@ class JWTService:
 
         Args:
             settings: Application settings
-            key_manager: RSA key manager
+            key_manager: Signing key manager
         """
         self._settings = settings
         self._key_manager = key_manager
+        self._jwt: Any = None
+        self._jwt_algorithms: list[str] | None = None
+
+    @property
+    def _codec(self) -> Any:
+        """JWT codec restricted to the algorithms of the current key set."""
+        algorithms = self._key_manager.algorithms
+        # The key manager builds a new list whenever the key set changes
+        if algorithms is not self._jwt_algorithms:
+            from authlib.jose import JsonWebToken
+
+            self._jwt = JsonWebToken(algorithms)
+            self._jwt_algorithms = algorithms
+        return self._jwt
+
+    def _encode(self, header: dict, payload: dict) -> str:
+        """Sign a token with the cached active key."""
+        return self._codec.encode(header, payload, self._key_manager.signing_key).decode("utf-8")
+
+    def _resolve_key(self, header: dict, payload: Any) -> Any:
+        """Select the verification key by the token's ``kid``."""
+        from authlib.jose.errors import DecodeError
+
+        key = self._key_manager.verification_key(header.get("kid"))
+        if key is None:
+            raise DecodeError("Unknown signing key")
+        return key
 
     def create_access_token(
         self,
@@ -158,8 +350,6 @@ class JWTService:
         Returns:
             Tuple of (token, jti, expires_in).
         """
-        from authlib.jose import jwt
-
         # Use time.time() for correct Unix timestamps (UTC)
         # Note: datetime.utcnow().timestamp() is incorrect because it treats
         # naive datetime as local time when converting to timestamp
@@ -184,13 +374,12 @@ class JWTService:
             payload.update(claims)
 
         header = {
-            "alg": self._settings.jwt_algorithm,
+            "alg": self._key_manager.algorithm,
             "typ": "at+jwt",  # RFC 9068 access token type
             "kid": self._key_manager.kid,
         }
 
-        token = jwt.encode(header, payload, self._key_manager.private_key)
-        return token.decode("utf-8"), jti, lifetime
+        return self._encode(header, payload), jti, lifetime
 
     def create_id_token(
         self,
@@ -214,8 +403,6 @@ class JWTService:
         Returns:
             Encoded ID token.
         """
-        from authlib.jose import jwt
-
         # Use time.time() for correct Unix timestamps (UTC)
         now = int(time.time())
         lifetime = expires_in or self._settings.id_token_lifetime
@@ -239,13 +426,12 @@ class JWTService:
             payload.update(claims)
 
         header = {
-            "alg": self._settings.jwt_algorithm,
+            "alg": self._key_manager.algorithm,
             "typ": "JWT",
             "kid": self._key_manager.kid,
         }
 
-        token = jwt.encode(header, payload, self._key_manager.private_key)
-        return token.decode("utf-8")
+        return self._encode(header, payload)
 
     def decode_token(self, token: str, verify: bool = True) -> dict | None:
         """Decode and optionally verify a JWT token.
@@ -257,13 +443,12 @@ class JWTService:
         Returns:
             Token claims if valid, None otherwise.
         """
-        from authlib.jose import jwt
         from authlib.jose.errors import JoseError
 
         try:
-            claims = jwt.decode(
+            claims = self._codec.decode(
                 token,
-                self._key_manager.public_key,
+                self._resolve_key,
                 claims_options={
                     "iss": {"essential": True, "value": self._settings.jwt_issuer},
                 },
@@ -291,8 +476,6 @@ class JWTService:
         Returns:
             Encoded MFA token.
         """
-        from authlib.jose import jwt
-
         now = int(time.time())
         exp = now + expires_in
 
@@ -306,13 +489,12 @@ class JWTService:
         }
 
         header = {
-            "alg": self._settings.jwt_algorithm,
+            "alg": self._key_manager.algorithm,
             "typ": "JWT",
             "kid": self._key_manager.kid,
         }
 
-        token = jwt.encode(header, payload, self._key_manager.private_key)
-        return token.decode("utf-8")
+        return self._encode(header, payload)
 
     def get_token_jti(self, token: str) -> str | None:
         """Extract JTI from token without verification.
@@ -328,12 +510,17 @@ class JWTService:
 
 
 @lru_cache
-def get_key_manager(private_key_path: str, public_key_path: str) -> KeyManager:
+def get_key_manager(
+    private_key_path: str,
+    public_key_path: str,
+    algorithm: str = "RS256",
+) -> KeyManager:
     """Get cached key manager instance.
 
     Args:
-        private_key_path: Path to RSA private key
-        public_key_path: Path to RSA public key
+        private_key_path: Path to private key
+        public_key_path: Path to public key
+        algorithm: JWS algorithm of the active key
 
     Returns:
         Initialized KeyManager instance
@@ -341,6 +528,7 @@ def get_key_manager(private_key_path: str, public_key_path: str) -> KeyManager:
     manager = KeyManager(
         private_key_path=private_key_path,
         public_key_path=public_key_path,
+        algorithm=algorithm,
     )
     manager.load_or_generate_keys()
     return manager
@@ -364,6 +552,7 @@ def get_jwt_service(settings: Settings) -> JWTService:
         key_manager = get_key_manager(
             settings.jwt_private_key_path,
             settings.jwt_public_key_path,
+            settings.jwt_algorithm,
         )
         _jwt_service_cache[cache_key] = JWTService(settings, key_manager)
     return _jwt_service_cache[cache_key]
@@ -1,4 +1,8 @@
-"""Password hashing service using Argon2 (with bcrypt fallback for migration)."""
+"""Password hashing service using Argon2 (with bcrypt fallback for migration).
+
+Async callers use the ``*_async`` variants, which run the hash on a bounded
+``HashingPool`` so Argon2 never blocks the event loop.
+"""
 
 from __future__ import annotations
 
@@ -8,6 +12,8 @@ from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 from pwdlib.hashers.bcrypt import BcryptHasher
 
+from shared.auth.hashing_pool import HashingPool
+
 if TYPE_CHECKING:
     from identity_service.configs.settings import Settings
 
@@ -34,6 +40,21 @@ class PasswordService:
                 BcryptHasher(rounds=settings.bcrypt_rounds),
             )
         )
+        self._pool = HashingPool(
+            max_workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+            name="identity",
+        )
+
+    @property
+    def pool(self) -> HashingPool:
+        """Worker pool used by the async variants."""
+        return self._pool
+
+    @property
+    def saturated(self) -> bool:
+        """Whether new hashing calls would currently be rejected."""
+        return self._pool.saturated
 
     def hash_password(self, password: str) -> str:
         """Hash a password using Argon2.
@@ -76,6 +97,36 @@ class PasswordService:
         """
         return self._hasher.verify_and_update(password, password_hash)
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password on the worker pool.
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing queue is full.
+        """
+        return await self._pool.run(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a password on the worker pool.
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing queue is full.
+        """
+        return await self._pool.run(self.verify_password, password, password_hash)
+
+    async def verify_and_update_async(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """Verify and upgrade a password hash on the worker pool.
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing queue is full.
+        """
+        return await self._pool.run(self.verify_and_update, password, password_hash)
+
+    def close(self) -> None:
+        """Shut down the hashing threads."""
+        self._pool.shutdown(wait=False)
+
     def needs_rehash(self, password_hash: str) -> bool:
         """Check if password hash needs to be updated.
 
@@ -132,3 +183,11 @@ def get_password_service(settings: Settings) -> PasswordService:
     if _password_service is None:
         _password_service = PasswordService(settings)
     return _password_service
+
+
+def close_password_service() -> None:
+    """Shut down the password service worker pool during app shutdown."""
+    global _password_service
+    if _password_service is not None:
+        _password_service.close()
+        _password_service = None
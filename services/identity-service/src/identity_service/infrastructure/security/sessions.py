@@ -14,10 +14,16 @@ import hashlib
 import secrets
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+from shared.identity.sessions import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    SessionInfo,
+    SessionStatus,
+    SessionStore,
+)
 from shared.observability import get_structlog_logger
 
 if TYPE_CHECKING:
@@ -31,44 +37,6 @@ logger = get_structlog_logger(__name__)
 # ========================================
 
 
-class SessionStatus(str, Enum):
-    """Session status."""
-
-    ACTIVE = "active"
-    EXPIRED = "expired"
-    REVOKED = "revoked"
-
-
-@dataclass
-class SessionInfo:
-    """Information about a user session."""
-
-    session_id: str
-    user_id: str
-    created_at: datetime
-    last_activity_at: datetime
-    expires_at: datetime
-    status: SessionStatus = SessionStatus.ACTIVE
-
-    # Device/client info
-    ip_address: str | None = None
-    user_agent: str | None = None
-    device_type: str | None = None
-    device_name: str | None = None
-    browser: str | None = None
-    os: str | None = None
-    location: str | None = None
-
-    # OAuth info
-    client_id: str | None = None
-    scope: str | None = None
-
-    # Metadata
-    is_current: bool = False  # Is this the requesting session?
-    revoked_at: datetime | None = None
-    revoke_reason: str | None = None
-
-
 @dataclass
 class SessionCreateResult:
     """Result of session creation."""
@@ -79,18 +47,9 @@ class SessionCreateResult:
 
 
 # ========================================
-# In-Memory Storage (Replace with Redis in production)
+# Helpers
 # ========================================
 
-# session_id -> SessionInfo
-_sessions: dict[str, SessionInfo] = {}
-
-# session_token_hash -> session_id
-_token_to_session: dict[str, str] = {}
-
-# user_id -> set of session_ids
-_user_sessions: dict[str, set[str]] = {}
-
 
 def _hash_token(token: str) -> str:
     """Hash session token for storage."""
@@ -156,20 +115,24 @@ def _parse_user_agent(user_agent: str | None) -> dict:
 class SessionManagementService:
     """Service for managing user sessions."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, store: SessionStore | None = None) -> None:
         """Initialize session service.
 
         Args:
             settings: Application settings
+            store: Session store (per-process in-memory store if omitted)
         """
         self._settings = settings
+        self._store = store or InMemorySessionStore()
 
         # Default configuration
         self.session_lifetime_hours = getattr(settings, "session_lifetime_hours", 24)
         self.max_sessions_per_user = getattr(settings, "max_sessions_per_user", 10)
         self.session_idle_timeout_minutes = getattr(settings, "session_idle_timeout_minutes", 60)
+        # Expired/revoked sessions are kept this long for audit
+        self.session_retention_hours = getattr(settings, "session_retention_hours", 24)
 
-    def create_session(
+    async def create_session(
         self,
         user_id: str,
         ip_address: str | None = None,
@@ -219,17 +182,15 @@ class SessionManagementService:
             scope=scope,
         )
 
-        # Store session
-        _sessions[session_id] = session
-        _token_to_session[token_hash] = session_id
-
-        # Track by user
-        if user_id not in _user_sessions:
-            _user_sessions[user_id] = set()
-        _user_sessions[user_id].add(session_id)
+        # Store session (indexed by token hash and user)
+        await self._store.add(
+            session,
+            token_hash,
+            purge_at=expires_at + timedelta(hours=self.session_retention_hours),
+        )
 
         # Enforce max sessions limit
-        self._enforce_session_limit(user_id)
+        await self._enforce_session_limit(user_id)
 
         logger.info(
             "Session created",
@@ -244,7 +205,7 @@ class SessionManagementService:
             expires_at=expires_at,
         )
 
-    def validate_session(
+    async def validate_session(
         self,
         session_token: str,
         update_activity: bool = True,
@@ -258,13 +219,7 @@ class SessionManagementService:
         Returns:
             Session info if valid, None otherwise
         """
-        token_hash = _hash_token(session_token)
-        session_id = _token_to_session.get(token_hash)
-
-        if not session_id:
-            return None
-
-        session = _sessions.get(session_id)
+        session = await self._store.get_by_token_hash(_hash_token(session_token))
         if not session:
             return None
 
@@ -273,6 +228,7 @@ class SessionManagementService:
         # Check if expired
         if session.expires_at < now:
             session.status = SessionStatus.EXPIRED
+            await self._store.mark_expired(session.session_id)
             return None
 
         # Check if revoked
@@ -283,16 +239,18 @@ class SessionManagementService:
         idle_cutoff = now - timedelta(minutes=self.session_idle_timeout_minutes)
         if session.last_activity_at < idle_cutoff:
             session.status = SessionStatus.EXPIRED
-            logger.info("Session expired due to inactivity", session_id=session_id)
+            await self._store.mark_expired(session.session_id)
+            logger.info("Session expired due to inactivity", session_id=session.session_id)
             return None
 
         # Update activity
         if update_activity:
             session.last_activity_at = now
+            await self._store.touch(session.session_id, now)
 
         return session
 
-    def get_session(self, session_id: str) -> SessionInfo | None:
+    async def get_session(self, session_id: str) -> SessionInfo | None:
         """Get session by ID.
 
         Args:
@@ -301,9 +259,9 @@ class SessionManagementService:
         Returns:
             Session info or None
         """
-        return _sessions.get(session_id)
+        return await self._store.get(session_id)
 
-    def get_user_sessions(
+    async def get_user_sessions(
         self,
         user_id: str,
         include_expired: bool = False,
@@ -319,15 +277,10 @@ class SessionManagementService:
         Returns:
             List of sessions
         """
-        session_ids = _user_sessions.get(user_id, set())
         sessions: list[SessionInfo] = []
         now = datetime.now(UTC)
 
-        for sid in session_ids:
-            session = _sessions.get(sid)
-            if not session:
-                continue
-
+        for session in await self._store.list_for_user(user_id):
             # Check expiry
             if session.expires_at < now:
                 session.status = SessionStatus.EXPIRED
@@ -336,10 +289,9 @@ class SessionManagementService:
                 continue
 
             # Mark current session
-            if current_session_id and session.session_id == current_session_id:
-                session.is_current = True
-            else:
-                session.is_current = False
+            session.is_current = bool(
+                current_session_id and session.session_id == current_session_id
+            )
 
             sessions.append(session)
 
@@ -347,7 +299,7 @@ class SessionManagementService:
         sessions.sort(key=lambda s: s.last_activity_at, reverse=True)
         return sessions
 
-    def revoke_session(
+    async def revoke_session(
         self,
         session_id: str,
         reason: str = "user_logout",
@@ -361,24 +313,18 @@ class SessionManagementService:
         Returns:
             True if session was revoked
         """
-        session = _sessions.get(session_id)
-        if not session:
+        if not await self._revoke([session_id], reason):
             return False
 
-        session.status = SessionStatus.REVOKED
-        session.revoked_at = datetime.now(UTC)
-        session.revoke_reason = reason
-
         logger.info(
             "Session revoked",
             session_id=session_id,
-            user_id=session.user_id,
             reason=reason,
         )
 
         return True
 
-    def revoke_all_sessions(
+    async def revoke_all_sessions(
         self,
         user_id: str,
         except_session_id: str | None = None,
@@ -394,15 +340,12 @@ class SessionManagementService:
         Returns:
             Number of sessions revoked
         """
-        session_ids = _user_sessions.get(user_id, set())
-        revoked_count = 0
-
-        for sid in session_ids:
-            if except_session_id and sid == except_session_id:
-                continue
-
-            if self.revoke_session(sid, reason):
-                revoked_count += 1
+        session_ids = [
+            session.session_id
+            for session in await self._store.list_for_user(user_id)
+            if session.session_id != except_session_id
+        ]
+        revoked_count = await self._revoke(session_ids, reason)
 
         logger.info(
             "All user sessions revoked",
@@ -413,7 +356,7 @@ class SessionManagementService:
 
         return revoked_count
 
-    def revoke_sessions_by_client(
+    async def revoke_sessions_by_client(
         self,
         user_id: str,
         client_id: str,
@@ -429,23 +372,29 @@ class SessionManagementService:
         Returns:
             Number of sessions revoked
         """
-        session_ids = _user_sessions.get(user_id, set())
-        revoked_count = 0
-
-        for sid in session_ids:
-            session = _sessions.get(sid)
-            if session and session.client_id == client_id:
-                if self.revoke_session(sid, reason):
-                    revoked_count += 1
-
-        return revoked_count
+        session_ids = [
+            session.session_id
+            for session in await self._store.list_for_user(user_id)
+            if session.client_id == client_id
+        ]
+        return await self._revoke(session_ids, reason)
+
+    async def _revoke(self, session_ids: list[str], reason: str) -> int:
+        """Revoke sessions in one store call, keeping them for the audit period."""
+        now = datetime.now(UTC)
+        return await self._store.revoke(
+            session_ids,
+            revoked_at=now,
+            reason=reason,
+            purge_at=now + timedelta(hours=self.session_retention_hours),
+        )
 
-    def _enforce_session_limit(self, user_id: str) -> None:
+    async def _enforce_session_limit(self, user_id: str) -> None:
         """Enforce maximum sessions per user.
 
         Revokes oldest sessions if limit exceeded.
         """
-        sessions = self.get_user_sessions(user_id)
+        sessions = await self.get_user_sessions(user_id)
 
         if len(sessions) <= self.max_sessions_per_user:
             return
@@ -455,8 +404,7 @@ class SessionManagementService:
 
         # Revoke oldest sessions
         to_revoke = len(sessions) - self.max_sessions_per_user
-        for i in range(to_revoke):
-            self.revoke_session(sessions[i].session_id, "session_limit_exceeded")
+        await self._revoke([s.session_id for s in sessions[:to_revoke]], "session_limit_exceeded")
 
         logger.info(
             "Enforced session limit",
@@ -464,51 +412,21 @@ class SessionManagementService:
             revoked=to_revoke,
         )
 
-    def cleanup_expired_sessions(self) -> int:
-        """Remove expired and revoked sessions from storage.
+    async def cleanup_expired_sessions(self) -> int:
+        """Remove expired and revoked sessions past their audit retention.
 
-        Should be run periodically.
+        Only sessions that are due are touched; with the Redis store the
+        session and token keys have already expired natively.
 
         Returns:
             Number of sessions cleaned up
         """
-        now = datetime.now(UTC)
-        # Keep revoked sessions for 24 hours for audit
-        cleanup_cutoff = now - timedelta(hours=24)
-
-        to_remove: list[str] = []
-
-        for session_id, session in _sessions.items():
-            should_remove = False
-
-            if session.status == SessionStatus.EXPIRED and session.expires_at < cleanup_cutoff:
-                should_remove = True
-            elif session.status == SessionStatus.REVOKED and session.revoked_at:
-                if session.revoked_at < cleanup_cutoff:
-                    should_remove = True
+        removed = await self._store.purge_expired()
 
-            if should_remove:
-                to_remove.append(session_id)
+        if removed:
+            logger.info("Cleaned up expired sessions", count=removed)
 
-        # Remove sessions
-        for session_id in to_remove:
-            session = _sessions.pop(session_id, None)
-            if session:
-                # Remove from user's session list
-                user_sessions = _user_sessions.get(session.user_id)
-                if user_sessions:
-                    user_sessions.discard(session_id)
-
-                # Remove token mapping
-                for token_hash, sid in list(_token_to_session.items()):
-                    if sid == session_id:
-                        _token_to_session.pop(token_hash, None)
-                        break
-
-        if to_remove:
-            logger.info("Cleaned up expired sessions", count=len(to_remove))
-
-        return len(to_remove)
+        return removed
 
 
 # ========================================
@@ -519,8 +437,19 @@ _session_service: SessionManagementService | None = None
 
 
 def get_session_management_service(settings: Settings) -> SessionManagementService:
-    """Get session management service instance."""
+    """Get session management service instance.
+
+    Uses the Redis store when ``security_state_backend`` is ``"redis"`` so
+    sessions survive restarts and are shared across replicas.
+    """
     global _session_service
     if _session_service is None:
-        _session_service = SessionManagementService(settings)
+        store: SessionStore | None = None
+        if settings.security_state_backend == "redis":
+            from identity_service.infrastructure.redis_client import get_redis_client
+
+            store = RedisSessionStore(
+                get_redis_client(settings.redis_url, settings.redis_pool_size)
+            )
+        _session_service = SessionManagementService(settings, store=store)
     return _session_service
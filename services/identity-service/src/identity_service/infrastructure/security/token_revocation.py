@@ -0,0 +1,391 @@
+"""Token revocation store.
+
+Revoked access tokens only need to be remembered until they expire, after
+which signature validation rejects them anyway. Each entry therefore lives
+exactly until the token's ``exp``:
+
+- ``InMemoryTokenRevocationStore`` keeps a dict plus an expiry heap for a
+  single process.
+- ``RedisTokenRevocationStore`` stores one key per JTI with ``PXAT`` set to
+  the token expiry, so entries are shared by all replicas and expire on
+  their own.
+
+Nearly every introspection or userinfo call asks about a token that was
+never revoked. The Redis store keeps a per-process ``BloomFilter`` of
+revoked JTIs so that answer needs no network call; only a filter hit (a
+real revocation or a rare false positive) goes to Redis. The filter is kept
+in sync by publishing each revocation on a pub/sub channel and is rebuilt
+from a ``SCAN`` periodically, which also drops expired JTIs from it. While
+the subscription is down the filter is not trusted and every check goes to
+Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import heapq
+import math
+import time
+from typing import TYPE_CHECKING
+
+from identity_service.domain.repositories import TokenBlacklistRepository
+from shared.observability import get_structlog_logger
+from shared.observability.prometheus_bridge import get_metrics_backend
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from identity_service.configs.settings import Settings
+    from identity_service.domain.entities import TokenBlacklistEntry
+
+logger = get_structlog_logger(__name__)
+
+
+# ========================================
+# Bloom Filter
+# ========================================
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Uses double hashing of a single BLAKE2b digest to derive the bit
+    positions, so adding or checking a key costs one hash call.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """Size the filter for ``capacity`` keys at ``error_rate`` false positives.
+
+        Args:
+            capacity: Expected number of keys.
+            error_rate: Target false positive rate once ``capacity`` is reached.
+
+        Raises:
+            ValueError: If ``capacity`` < 1 or ``error_rate`` is not in (0, 1).
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size = max(8, bits)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        """Add ``key`` to the filter."""
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# ========================================
+# Stores
+# ========================================
+
+
+class TokenRevocationStore(TokenBlacklistRepository):
+    """Token blacklist whose entries expire with the revoked token.
+
+    ``start`` and ``stop`` are called from the application lifespan; the
+    in-memory store needs neither.
+    """
+
+    def __init__(self, default_ttl: int = 3600) -> None:
+        """Initialize store.
+
+        Args:
+            default_ttl: Seconds to keep entries whose token has no ``exp``.
+        """
+        self._default_ttl = default_ttl
+
+    def _expires_at(self, entry: TokenBlacklistEntry) -> float:
+        if entry.expires_at is None:
+            return time.time() + self._default_ttl
+        return entry.expires_at.timestamp()
+
+    async def start(self) -> None:
+        """Start background work."""
+
+    async def stop(self) -> None:
+        """Stop background work."""
+
+
+class InMemoryTokenRevocationStore(TokenRevocationStore):
+    """Per-process store for development and tests.
+
+    Expired entries are dropped lazily on lookup and swept from an expiry
+    heap on every ``add``, so memory stays bounded by live revocations.
+    """
+
+    def __init__(self, default_ttl: int = 3600) -> None:
+        """Initialize store.
+
+        Args:
+            default_ttl: Seconds to keep entries whose token has no ``exp``.
+        """
+        super().__init__(default_ttl)
+        self._entries: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def add(self, entry: TokenBlacklistEntry) -> None:
+        """Revoke ``entry.jti`` until the token expires."""
+        now = time.time()
+        self._purge(now)
+        expires_at = self._expires_at(entry)
+        if expires_at <= now:
+            return
+        self._entries[entry.jti] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, entry.jti))
+
+    async def is_blacklisted(self, jti: str) -> bool:
+        """Check whether ``jti`` is revoked and not yet expired."""
+        expires_at = self._entries.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._entries[jti]
+            return False
+        return True
+
+    async def remove(self, jti: str) -> bool:
+        """Remove ``jti`` from the store."""
+        return self._entries.pop(jti, None) is not None
+
+    def _purge(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, jti = heapq.heappop(heap)
+            # Skip stale heap items for entries that were removed or re-added
+            if self._entries.get(jti) == expires_at:
+                del self._entries[jti]
+
+
+class RedisTokenRevocationStore(TokenRevocationStore):
+    """Redis store shared by all replicas, fronted by a local Bloom filter.
+
+    Each revoked JTI is a key expiring at the token's ``exp``. Revocations
+    are published on ``<prefix>:events`` so every process adds the JTI to
+    its filter, and the filter is rebuilt from Redis every
+    ``rebuild_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str = "identity:revoked",
+        *,
+        default_ttl: int = 3600,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        rebuild_interval: float = 300.0,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            client: Async Redis client (``decode_responses=True``).
+            prefix: Key namespace.
+            default_ttl: Seconds to keep entries whose token has no ``exp``.
+            capacity: Minimum number of JTIs the filter is sized for.
+            error_rate: Target false positive rate of the filter.
+            rebuild_interval: Seconds between full filter rebuilds.
+        """
+        super().__init__(default_ttl)
+        self._redis = client
+        self._prefix = prefix
+        self._channel = f"{prefix}:events"
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._rebuild_interval = rebuild_interval
+
+        self._filter = BloomFilter(capacity, error_rate)
+        # Only answer "not revoked" locally while subscribed and rebuilt
+        self._filter_ready = False
+        # JTIs published while a rebuild is scanning, replayed into the new filter
+        self._rebuild_deltas: list[str] | None = None
+        self._rebuild_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task[None]] = []
+
+        self._checks = get_metrics_backend().counter(
+            "token_revocation_checks_total",
+            "Token revocation checks by how they were answered",
+            ["result"],
+        )
+
+    def _k(self, jti: str) -> str:
+        return f"{self._prefix}:jti:{jti}"
+
+    @property
+    def filter_ready(self) -> bool:
+        """Whether negative lookups are answered from the local filter."""
+        return self._filter_ready
+
+    async def start(self) -> None:
+        """Subscribe to revocation events and start periodic rebuilds."""
+        if self._tasks:
+            return
+        subscribed = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._listen(subscribed)),
+            asyncio.create_task(self._rebuild_loop()),
+        ]
+        # Don't hold up startup if Redis is unreachable; checks fall back to Redis
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(subscribed.wait(), timeout=5.0)
+
+    async def stop(self) -> None:
+        """Stop the subscriber and rebuild tasks."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._filter_ready = False
+
+    async def add(self, entry: TokenBlacklistEntry) -> None:
+        """Revoke ``entry.jti`` until the token expires and notify other processes."""
+        expires_at = self._expires_at(entry)
+        if expires_at <= time.time():
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._k(entry.jti), entry.reason or "", pxat=int(expires_at * 1000))
+            pipe.publish(self._channel, entry.jti)
+            await pipe.execute()
+        self._remember(entry.jti)
+
+    async def is_blacklisted(self, jti: str) -> bool:
+        """Check whether ``jti`` is revoked, skipping Redis on a filter miss."""
+        if self._filter_ready and jti not in self._filter:
+            self._checks.labels(result="filter_miss").inc()
+            return False
+        revoked = bool(await self._redis.exists(self._k(jti)))
+        self._checks.labels(result="revoked" if revoked else "not_revoked").inc()
+        return revoked
+
+    async def remove(self, jti: str) -> bool:
+        """Remove ``jti``; its filter bit clears on the next rebuild."""
+        return bool(await self._redis.delete(self._k(jti)))
+
+    def _remember(self, jti: str) -> None:
+        self._filter.add(jti)
+        if self._rebuild_deltas is not None:
+            self._rebuild_deltas.append(jti)
+
+    async def rebuild(self) -> int:
+        """Replace the filter with one built from the keys currently in Redis.
+
+        Returns:
+            Number of revoked JTIs loaded.
+        """
+        async with self._rebuild_lock:
+            self._rebuild_deltas = []
+            try:
+                jtis: list[str] = []
+                offset = len(self._k(""))
+                async for key in self._redis.scan_iter(match=self._k("*"), count=1000):
+                    jtis.append(key[offset:])
+                jtis.extend(self._rebuild_deltas)
+                # Leave headroom so the error rate holds until the next rebuild
+                fresh = BloomFilter(max(self._capacity, len(jtis) * 2), self._error_rate)
+                for jti in jtis:
+                    fresh.add(jti)
+                self._filter = fresh
+            finally:
+                self._rebuild_deltas = None
+        logger.debug("Token revocation filter rebuilt", entries=len(jtis))
+        return len(jtis)
+
+    async def _listen(self, subscribed: asyncio.Event) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                # Rebuild after subscribing so no revocation falls in between
+                await self.rebuild()
+                self._filter_ready = True
+                subscribed.set()
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._remember(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._filter_ready = False
+                logger.warning(
+                    "Token revocation subscription lost, checking Redis directly",
+                    error=str(e),
+                    retry_in=backoff,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                self._filter_ready = False
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+
+    async def _rebuild_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._rebuild_interval)
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logger.warning("Token revocation filter rebuild failed", error=str(e))
+
+
+# ========================================
+# Singleton Instance
+# ========================================
+
+_revocation_store: TokenRevocationStore | None = None
+
+
+def get_token_revocation_store(settings: Settings) -> TokenRevocationStore:
+    """Get token revocation store instance.
+
+    Uses the Redis store when ``security_state_backend`` is ``"redis"`` so
+    revocations hold across replicas, otherwise the per-process store.
+    """
+    global _revocation_store  # noqa: PLW0603
+    if _revocation_store is None:
+        if settings.security_state_backend == "redis":
+            from identity_service.infrastructure.redis_client import get_redis_client
+
+            _revocation_store = RedisTokenRevocationStore(
+                get_redis_client(settings.redis_url, settings.redis_pool_size),
+                default_ttl=settings.access_token_lifetime,
+                capacity=settings.token_revocation_filter_capacity,
+                rebuild_interval=settings.token_revocation_rebuild_interval,
+            )
+        else:
+            _revocation_store = InMemoryTokenRevocationStore(
+                default_ttl=settings.access_token_lifetime
+            )
+    return _revocation_store
+
+
+async def close_token_revocation_store() -> None:
+    """Stop the token revocation store during shutdown."""
+    global _revocation_store  # noqa: PLW0603
+    if _revocation_store is not None:
+        await _revocation_store.stop()
+        _revocation_store = None
@@ -16,7 +16,7 @@ from identity_service.api.web import routes as web_routes
 from identity_service.configs import get_settings
 
 # Shared observability
-from shared.fastapi_utils import RequestContextMiddleware, register_exception_handlers
+from shared.fastapi_utils import RequestContextHook, register_exception_handlers
 from shared.observability import (
     LoggingConfig,
     RequestLoggingConfig,
@@ -53,6 +53,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events including:
     - Database connection pool initialization
     - RSA key initialization for JWT signing
+    - Token revocation store sync
     - Default OAuth2 client seeding
     """
     settings = get_settings()
@@ -101,14 +102,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             endpoint=settings.otel_exporter_endpoint,
         )
 
-    # Initialize RSA keys
+    # Initialize signing keys
     from identity_service.infrastructure.security import get_key_manager
 
     key_manager = get_key_manager(
         settings.jwt_private_key_path,
         settings.jwt_public_key_path,
+        settings.jwt_algorithm,
     )
-    logger.info("RSA keys initialized", kid=key_manager.kid)
+    logger.info("Signing keys initialized", kid=key_manager.kid, alg=key_manager.algorithm)
+
+    # Start token revocation sync (pub/sub + periodic filter rebuilds)
+    from identity_service.infrastructure.security import get_token_revocation_store
+
+    await get_token_revocation_store(settings).start()
 
     # Seed default OAuth2 clients
     from identity_service.api.dependencies import get_client_repository
@@ -131,6 +138,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await dispose_db()
     logger.info("Database connections disposed")
 
+    from identity_service.infrastructure.security.token_revocation import (
+        close_token_revocation_store,
+    )
+
+    await close_token_revocation_store()
+
+    from identity_service.infrastructure.redis_client import close_redis
+
+    await close_redis()
+
+    from identity_service.infrastructure.security.password_service import close_password_service
+
+    close_password_service()
+
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application.
@@ -159,12 +180,10 @@ def create_app() -> FastAPI:
         templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
         web_routes.templates = templates
 
-    # Request context middleware (correlation ID, request metadata)
-    app.add_middleware(RequestContextMiddleware)
-
-    # Request logging middleware (must be added after context middleware)
+    # Request logging middleware (correlation ID, request context, access log)
     app.add_middleware(
         RequestLoggingMiddleware,
+        hooks=[RequestContextHook()],
         config=RequestLoggingConfig(
             exclude_paths=[
                 "/health",
@@ -71,6 +71,16 @@ class TestDiscoveryEndpoints:
         assert "n" in key
         assert "e" in key
 
+    def test_jwks_endpoint_etag(self, client: TestClient):
+        """JWKS responses carry an ETag and honour If-None-Match."""
+        response = client.get("/.well-known/jwks.json")
+        etag = response.headers["etag"]
+
+        cached = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
 
 class TestAuthorizationEndpoint:
     """Tests for authorization endpoint."""
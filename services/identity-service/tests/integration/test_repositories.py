@@ -0,0 +1,211 @@
+"""Integration tests for the shared identity repositories on SQLite."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from identity_service.domain.entities import (
+    Client,
+    ClientScope,
+    User,
+    UserCredential,
+    UserProfile,
+)
+from shared.identity.models.base import IdentityBase
+from shared.identity.repositories import ClientRepository, UserRepository
+from shared.sqlalchemy_async.database import AsyncDatabaseManager, DatabaseConfig
+
+
+@pytest.fixture
+async def db_manager():
+    """Create an in-memory SQLite database with the identity tables."""
+    manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await manager.create_all(IdentityBase)
+    yield manager
+    await manager.dispose()
+
+
+@pytest.fixture
+def statements(db_manager: AsyncDatabaseManager) -> list[str]:
+    """Record every SQL statement sent to the database."""
+    captured: list[str] = []
+
+    @event.listens_for(db_manager.engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    return captured
+
+
+def _new_user() -> User:
+    user_id = uuid.uuid4()
+    return User(
+        id=user_id,
+        email="alice@example.com",
+        username="alice",
+        credential=UserCredential(user_id=user_id, password_hash="hash"),
+        profile=UserProfile(user_id=user_id, given_name="Alice"),
+    )
+
+
+def _new_client() -> Client:
+    client_id = uuid.uuid4()
+    return Client(
+        id=client_id,
+        client_id="test-client",
+        client_name="Test Application",
+        scopes=[ClientScope(client_id=client_id, scope=scope) for scope in ("openid", "email")],
+    )
+
+
+class TestUserRepositoryUpdate:
+    """Tests for change-tracked user updates."""
+
+    async def test_failed_login_is_single_update(
+        self, db_manager: AsyncDatabaseManager, statements: list[str]
+    ) -> None:
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            user = await repo.create(_new_user())
+            user = await repo.get_by_email("alice@example.com")
+
+            statements.clear()
+            user.credential.increment_failed_attempts(max_attempts=5, lockout_duration=60)
+            updated = await repo.update(user)
+
+        assert updated.credential.failed_login_attempts == 1
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE user_credentials SET failed_login_attempts")
+
+    async def test_unchanged_user_writes_nothing(
+        self, db_manager: AsyncDatabaseManager, statements: list[str]
+    ) -> None:
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            user = await repo.create(_new_user())
+
+            statements.clear()
+            await repo.update(user)
+
+        assert statements == []
+
+    async def test_role_changes_are_diffed(self, db_manager: AsyncDatabaseManager) -> None:
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            user = _new_user()
+            user.add_role("admin")
+            user.add_role("auditor")
+            user = await repo.create(user)
+
+            user.remove_role("auditor")
+            user.add_role("support")
+            user.add_claim("department", "it")
+            await repo.update(user)
+
+        async with db_manager.get_session() as session:
+            loaded = await UserRepository(session).get_by_id(user.id)
+
+        assert sorted(r.role_name for r in loaded.roles) == ["admin", "support"]
+        assert loaded.get_claims_dict() == {"department": "it"}
+        assert loaded.profile.given_name == "Alice"
+
+    async def test_update_inserts_unknown_user(self, db_manager: AsyncDatabaseManager) -> None:
+        user = _new_user()
+        async with db_manager.get_session() as session:
+            await UserRepository(session).update(user)
+
+        async with db_manager.get_session() as session:
+            assert await UserRepository(session).get_by_id(user.id) is not None
+
+
+class TestClientRepositoryUpdate:
+    """Tests for change-tracked client updates."""
+
+    async def test_scope_changes_touch_only_child_rows(
+        self, db_manager: AsyncDatabaseManager, statements: list[str]
+    ) -> None:
+        async with db_manager.get_session() as session:
+            repo = ClientRepository(session)
+            client = await repo.create(_new_client())
+
+            statements.clear()
+            client.scopes = [s for s in client.scopes if s.scope != "email"]
+            client.scopes.append(ClientScope(client_id=client.id, scope="offline_access"))
+            await repo.update(client)
+
+        assert not any(s.startswith("UPDATE clients") for s in statements)
+        assert any(s.startswith("INSERT INTO client_scopes") for s in statements)
+        assert any(s.startswith("DELETE FROM client_scopes") for s in statements)
+
+        async with db_manager.get_session() as session:
+            loaded = await ClientRepository(session).get_by_id(client.id)
+        assert "offline_access" in {s.scope for s in loaded.scopes}
+        assert "email" not in {s.scope for s in loaded.scopes}
+
+
+class TestSearchPage:
+    """Tests for filtered admin search with window totals and cursors."""
+
+    async def _seed(self, session, count: int = 5) -> None:
+        repo = UserRepository(session)
+        for i in range(count):
+            user = User(email=f"user{i}@example.com", username=f"user_{i}")
+            if i % 2 == 0:
+                user.add_role("admin")
+            await repo.create(user)
+        await repo.create(User(email="other@example.org", username="other"))
+
+    async def test_total_is_filtered(self, db_manager: AsyncDatabaseManager) -> None:
+        async with db_manager.get_session() as session:
+            await self._seed(session)
+            page = await UserRepository(session).search_page("example.com", limit=2)
+
+        assert page.total == 5
+        assert [u.email for u in page.items] == ["user0@example.com", "user1@example.com"]
+
+    async def test_cursor_walks_all_pages(self, db_manager: AsyncDatabaseManager) -> None:
+        async with db_manager.get_session() as session:
+            await self._seed(session)
+            repo = UserRepository(session)
+            emails: list[str] = []
+            cursor = None
+            while True:
+                page = await repo.search_page("example.com", limit=2, cursor=cursor)
+                # Only the first (offset) page pays for the total
+                assert (page.total is None) == (cursor is not None)
+                emails.extend(u.email for u in page.items)
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+
+        assert emails == [f"user{i}@example.com" for i in range(5)]
+
+    async def test_role_filter_and_wildcards(self, db_manager: AsyncDatabaseManager) -> None:
+        async with db_manager.get_session() as session:
+            await self._seed(session)
+            repo = UserRepository(session)
+            admins = await repo.search_page(role="admin")
+            # "_" must match literally, not as a single-character wildcard
+            literal = await repo.search_page("r_1")
+
+        assert admins.total == 3
+        assert literal.total == 1
+        assert literal.items[0].username == "user_1"
+
+    async def test_page_past_end_still_reports_total(
+        self, db_manager: AsyncDatabaseManager
+    ) -> None:
+        async with db_manager.get_session() as session:
+            await self._seed(session)
+            page = await UserRepository(session).search_page(skip=50, limit=10)
+
+        assert page.items == []
+        assert page.total == 6
+
+    async def test_invalid_cursor(self, db_manager: AsyncDatabaseManager) -> None:
+        async with db_manager.get_session() as session:
+            with pytest.raises(ValueError):
+                await UserRepository(session).search_page(cursor="not-a-cursor!")
@@ -0,0 +1,152 @@
+"""Unit tests for brute force protection and its attempt stores."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from identity_service.configs import Settings
+from identity_service.infrastructure.security import (
+    BruteForceProtectionService,
+    InMemoryLoginAttemptStore,
+    LockoutReason,
+    LoginAttempt,
+)
+
+
+def _attempt(success: bool, at: datetime | None = None, ip: str = "10.0.0.1") -> LoginAttempt:
+    return LoginAttempt(
+        timestamp=at or datetime.now(UTC),
+        ip_address=ip,
+        user_agent=None,
+        success=success,
+    )
+
+
+@pytest.fixture
+def service(test_settings: Settings) -> BruteForceProtectionService:
+    """Create a protection service with a fresh in-memory store."""
+    return BruteForceProtectionService(test_settings)
+
+
+class TestBruteForceProtectionService:
+    """Tests for lockout, IP blocking and progressive delay."""
+
+    async def test_account_locks_after_max_failures(self, service: BruteForceProtectionService):
+        for _ in range(service.max_failed_attempts - 1):
+            status, _ = await service.record_attempt("alice", "10.0.0.1", success=False)
+            assert not status.is_locked
+
+        status, _ = await service.record_attempt("alice", "10.0.0.1", success=False)
+
+        assert status.is_locked
+        assert status.reason == LockoutReason.FAILED_ATTEMPTS
+        assert status.failed_attempts == service.max_failed_attempts
+        assert status.unlock_at is not None
+
+    async def test_success_resets_user_but_not_ip(self, service: BruteForceProtectionService):
+        await service.record_attempt("bob", "10.0.0.2", success=False)
+        await service.record_attempt("bob", "10.0.0.2", success=False)
+
+        account, ip = await service.record_attempt("bob", "10.0.0.2", success=True)
+
+        assert account.failed_attempts == 0
+        assert ip.failed_attempts == 2
+
+    async def test_progressive_delay(self, service: BruteForceProtectionService):
+        await service.record_attempt("carol", "10.0.0.3", success=False)
+        await service.record_attempt("carol", "10.0.0.3", success=False)
+
+        status = await service.check_account("carol")
+
+        assert 0 < status.required_delay_seconds <= 2
+
+    async def test_ip_blocked_across_usernames(self, service: BruteForceProtectionService):
+        for i in range(service.ip_max_failed_attempts):
+            _, ip = await service.record_attempt(f"user{i}", "10.0.0.4", success=False)
+
+        assert ip.is_blocked
+        assert ip.suspicious_score == 100
+
+    async def test_unlock_account(self, service: BruteForceProtectionService):
+        for _ in range(service.max_failed_attempts):
+            await service.record_attempt("dave", "10.0.0.5", success=False)
+
+        assert await service.unlock_account("dave")
+        status = await service.check_account("dave")
+        assert not status.is_locked
+        assert status.failed_attempts == 0
+        assert not await service.unlock_account("dave")
+
+    async def test_permanent_ip_block(self, service: BruteForceProtectionService):
+        await service.block_ip_permanently("10.0.0.6")
+        assert (await service.check_ip("10.0.0.6")).is_blocked
+
+        assert await service.unblock_ip("10.0.0.6")
+        assert not (await service.check_ip("10.0.0.6")).is_blocked
+
+    async def test_recent_attempts_newest_first(self, service: BruteForceProtectionService):
+        await service.record_attempt("erin", "10.0.0.7", success=False, failure_reason="a")
+        await service.record_attempt("erin", "10.0.0.7", success=False, failure_reason="b")
+
+        attempts = await service.get_recent_attempts(username="erin")
+
+        assert [a.failure_reason for a in attempts] == ["b", "a"]
+        assert len(await service.get_recent_attempts(ip_address="10.0.0.7")) == 2
+        assert len(await service.get_recent_attempts(limit=1)) == 1
+
+
+class TestInMemoryLoginAttemptStore:
+    """Tests for the ring-buffer store."""
+
+    async def test_window_expires_old_failures(self):
+        store = InMemoryLoginAttemptStore()
+        old = datetime.now(UTC) - timedelta(minutes=31)
+        await store.record("user:a", "ip:x", _attempt(False, at=old), window_seconds=1800)
+
+        user_failures, _ = await store.record(
+            "user:a", "ip:x", _attempt(False), window_seconds=1800
+        )
+
+        assert user_failures == 1
+
+    async def test_ring_buffer_is_bounded(self):
+        store = InMemoryLoginAttemptStore(capacity=3)
+        for _ in range(10):
+            counts = await store.record("user:a", "ip:x", _attempt(False), window_seconds=60)
+
+        assert counts == (3, 3)
+
+    async def test_lock_expires_natively(self):
+        store = InMemoryLoginAttemptStore()
+        now = datetime.now(UTC)
+        await store.lock(
+            "user:a",
+            now - timedelta(minutes=2),
+            now - timedelta(minutes=1),
+            LockoutReason.ADMIN_ACTION,
+        )
+
+        state = await store.get_state("user:a", window_seconds=60)
+
+        assert not state.locked
+        assert state.failed_count == 0
+
+    async def test_idle_keys_are_evicted(self):
+        store = InMemoryLoginAttemptStore(idle_seconds=60)
+        old = datetime.now(UTC) - timedelta(minutes=5)
+        await store.record("user:old", "ip:old", _attempt(False, at=old), window_seconds=60)
+
+        await store.record("user:new", "ip:new", _attempt(False), window_seconds=60)
+
+        assert (await store.get_state("user:old", window_seconds=60)).failed_count == 0
+        assert await store.recent_attempts("user:old", limit=10) == []
+
+    async def test_max_keys_cap(self):
+        store = InMemoryLoginAttemptStore(max_keys=4)
+        for i in range(10):
+            await store.record(f"user:{i}", f"ip:{i}", _attempt(False), window_seconds=60)
+
+        assert await store.recent_attempts("user:0", limit=10) == []
+        assert len(await store.recent_attempts("user:9", limit=10)) == 1
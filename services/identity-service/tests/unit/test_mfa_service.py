@@ -76,7 +76,7 @@ def mock_user_repo() -> AsyncMock:
 def mock_password_service() -> MagicMock:
     """Create mock password service."""
     svc = MagicMock()
-    svc.verify_password = MagicMock(return_value=True)
+    svc.verify_password_async = AsyncMock(return_value=True)
     return svc
 
 
@@ -428,7 +428,7 @@ class TestMFADisable:
         """Disable MFA fails with wrong password."""
         user = _make_user(mfa_enabled=True, mfa_secret="JBSWY3DPEHPK3PXP")
         mock_user_repo.get_by_id.return_value = user
-        mock_password_service.verify_password.return_value = False
+        mock_password_service.verify_password_async.return_value = False
 
         success, error = await mfa_service.disable_mfa(
             user_id=user.id,
@@ -130,6 +130,52 @@ class TestKeyManager:
         assert "n" in key
         assert "e" in key
 
+    def test_jwks_is_precomputed(self, tmp_path: Path):
+        """JWKS and ETag are built once per key set."""
+        km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"))
+
+        assert km.get_jwks() is km.get_jwks()
+        assert km.jwks_etag.startswith('"')
+
+    @pytest.mark.parametrize(("algorithm", "kty"), [("ES256", "EC"), ("EdDSA", "OKP")])
+    def test_generates_key_for_algorithm(self, tmp_path: Path, algorithm: str, kty: str):
+        """Key type follows the configured algorithm."""
+        km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"), algorithm)
+
+        key = km.get_jwks()["keys"][0]
+        assert key["kty"] == kty
+        assert key["alg"] == algorithm
+
+    def test_rotate_keeps_retired_key(self, tmp_path: Path):
+        """Rotation publishes both keys until the old one is retired."""
+        km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"))
+        old_kid = km.kid
+        old_etag = km.jwks_etag
+
+        new_kid = km.rotate()
+
+        assert new_kid != old_kid
+        assert {k["kid"] for k in km.get_jwks()["keys"]} == {old_kid, new_kid}
+        assert km.jwks_etag != old_etag
+
+        # Retired keys are reloaded from disk
+        reloaded = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"))
+        assert reloaded.verification_key(old_kid) is not None
+
+        assert km.retire(old_kid) is True
+        assert [k["kid"] for k in km.get_jwks()["keys"]] == [new_kid]
+
+    def test_algorithm_change_rotates_key(self, tmp_path: Path):
+        """Switching algorithm rotates instead of signing with a mismatched key."""
+        rsa_km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"))
+        rsa_kid = rsa_km.kid
+
+        ec_km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"), "ES256")
+
+        assert ec_km.kid != rsa_kid
+        assert ec_km.verification_key(rsa_kid) is not None
+        assert "RS256" in ec_km.algorithms
+
 
 class TestJWTService:
     """Tests for JWT Service."""
@@ -189,6 +235,34 @@ class TestJWTService:
         assert payload["nonce"] == "nonce-123"
         assert payload["name"] == "Test User"
 
+    @pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+    def test_round_trip_with_fast_algorithms(
+        self, test_settings: Settings, tmp_path: Path, algorithm: str
+    ):
+        """EC and Ed25519 keys sign and verify tokens."""
+        km = KeyManager(str(tmp_path / "private.pem"), str(tmp_path / "public.pem"), algorithm)
+        service = JWTService(test_settings, km)
+
+        token, _, _ = service.create_access_token(
+            subject="user-123", client_id="my-client", scope="openid"
+        )
+
+        assert service.decode_token(token)["sub"] == "user-123"
+
+    def test_token_from_retired_key_still_verifies(self, jwt_service: JWTService):
+        """Tokens issued before a rotation verify until the key is retired."""
+        token, _, _ = jwt_service.create_access_token(
+            subject="user-123", client_id="my-client", scope="openid"
+        )
+        key_manager = jwt_service._key_manager
+        old_kid = key_manager.kid
+
+        key_manager.rotate()
+        assert jwt_service.decode_token(token)["sub"] == "user-123"
+
+        key_manager.retire(old_kid)
+        assert jwt_service.decode_token(token) is None
+
     def test_decode_invalid_token(self, jwt_service: JWTService):
         """Test decoding invalid token."""
         # decode_token returns None for invalid tokens instead of raising
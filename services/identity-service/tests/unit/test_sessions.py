@@ -0,0 +1,75 @@
+"""Unit tests for session management."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from identity_service.configs import Settings
+from identity_service.infrastructure.security import SessionManagementService, SessionStatus
+
+
+@pytest.fixture
+def service(test_settings: Settings) -> SessionManagementService:
+    """Create a session service with a fresh in-memory store."""
+    return SessionManagementService(test_settings)
+
+
+class TestSessionManagementService:
+    """Tests for session lifecycle on top of the session store."""
+
+    async def test_create_and_validate(self, service: SessionManagementService) -> None:
+        result = await service.create_session("user-1", user_agent="Mozilla/5.0 (Windows) Chrome")
+
+        session = await service.validate_session(result.session_token)
+
+        assert session is not None
+        assert session.session_id == result.session_id
+        assert session.browser == "Chrome"
+        assert await service.validate_session("bogus-token") is None
+
+    async def test_revoked_session_is_rejected(self, service: SessionManagementService) -> None:
+        result = await service.create_session("user-1")
+
+        assert await service.revoke_session(result.session_id) is True
+        assert await service.validate_session(result.session_token) is None
+        assert await service.revoke_session("unknown") is False
+
+    async def test_revoke_all_keeps_current(self, service: SessionManagementService) -> None:
+        current = await service.create_session("user-1")
+        await service.create_session("user-1")
+        await service.create_session("user-1")
+
+        revoked = await service.revoke_all_sessions("user-1", except_session_id=current.session_id)
+
+        assert revoked == 2
+        active = await service.get_user_sessions("user-1", current_session_id=current.session_id)
+        assert [s.session_id for s in active] == [current.session_id]
+        assert active[0].is_current
+
+    async def test_session_limit_revokes_oldest(self, service: SessionManagementService) -> None:
+        service.max_sessions_per_user = 2
+        first = await service.create_session("user-1")
+        await service.create_session("user-1")
+        await service.create_session("user-1")
+
+        oldest = await service.get_session(first.session_id)
+        assert oldest.status == SessionStatus.REVOKED
+        assert len(await service.get_user_sessions("user-1")) == 2
+
+    async def test_idle_session_expires(self, service: SessionManagementService) -> None:
+        result = await service.create_session("user-1")
+        session = await service.get_session(result.session_id)
+        session.last_activity_at = datetime.now(UTC) - timedelta(days=1)
+
+        assert await service.validate_session(result.session_token) is None
+        assert session.status == SessionStatus.EXPIRED
+
+    async def test_cleanup_purges_after_retention(self, service: SessionManagementService) -> None:
+        service.session_retention_hours = 0
+        result = await service.create_session("user-1")
+        await service.revoke_session(result.session_id)
+
+        assert await service.cleanup_expired_sessions() == 1
+        assert await service.get_session(result.session_id) is None
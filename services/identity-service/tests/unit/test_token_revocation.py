@@ -0,0 +1,144 @@
+"""Unit tests for the token revocation store."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from identity_service.domain.entities import TokenBlacklistEntry
+from identity_service.infrastructure.security import (
+    BloomFilter,
+    InMemoryTokenRevocationStore,
+    RedisTokenRevocationStore,
+)
+
+
+def _entry(jti: str, seconds: float = 3600) -> TokenBlacklistEntry:
+    return TokenBlacklistEntry(
+        jti=jti,
+        reason="client_revocation",
+        expires_at=datetime.now(UTC) + timedelta(seconds=seconds),
+    )
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter fast path."""
+
+    def test_no_false_negatives(self) -> None:
+        bloom = BloomFilter(1000)
+        keys = [f"jti-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self) -> None:
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+
+        assert false_positives < 300
+
+    def test_rejects_invalid_parameters(self) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(0)
+        with pytest.raises(ValueError):
+            BloomFilter(10, error_rate=1.5)
+
+
+class TestInMemoryTokenRevocationStore:
+    """Tests for the per-process revocation store."""
+
+    async def test_revoked_until_expiry(self) -> None:
+        store = InMemoryTokenRevocationStore()
+        await store.add(_entry("live"))
+        await store.add(_entry("expired", seconds=-1))
+
+        assert await store.is_blacklisted("live") is True
+        assert await store.is_blacklisted("expired") is False
+        assert await store.is_blacklisted("unknown") is False
+
+    async def test_expired_entries_are_purged(self) -> None:
+        store = InMemoryTokenRevocationStore()
+        await store.add(_entry("short", seconds=0.05))
+        await asyncio.sleep(0.1)
+
+        await store.add(_entry("long"))
+
+        assert len(store) == 1
+        assert await store.is_blacklisted("short") is False
+
+    async def test_entry_without_expiry_uses_default_ttl(self) -> None:
+        store = InMemoryTokenRevocationStore(default_ttl=60)
+        await store.add(TokenBlacklistEntry(jti="no-exp"))
+
+        assert await store.is_blacklisted("no-exp") is True
+
+    async def test_remove(self) -> None:
+        store = InMemoryTokenRevocationStore()
+        await store.add(_entry("jti"))
+
+        assert await store.remove("jti") is True
+        assert await store.remove("jti") is False
+        assert await store.is_blacklisted("jti") is False
+
+
+class TestRedisTokenRevocationStore:
+    """Tests for the Redis store and its filter sync."""
+
+    @pytest.fixture
+    async def client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        yield client
+        await client.aclose()
+
+    async def test_entries_expire_with_token(self, client) -> None:
+        store = RedisTokenRevocationStore(client)
+        await store.add(_entry("jti-1", seconds=120))
+
+        assert await store.is_blacklisted("jti-1") is True
+        ttl = await client.pttl("identity:revoked:jti:jti-1")
+        assert 0 < ttl <= 120_000
+
+    async def test_filter_answers_misses_after_start(self, client) -> None:
+        await client.set("identity:revoked:jti:existing", "", px=60_000)
+        store = RedisTokenRevocationStore(client)
+        await store.start()
+        try:
+            assert store.filter_ready
+            assert await store.is_blacklisted("existing") is True
+            assert await store.is_blacklisted("never-revoked") is False
+        finally:
+            await store.stop()
+
+        assert not store.filter_ready
+
+    async def test_revocation_reaches_other_process(self, client) -> None:
+        publisher = RedisTokenRevocationStore(client)
+        subscriber = RedisTokenRevocationStore(client)
+        await subscriber.start()
+        try:
+            await publisher.add(_entry("jti-2"))
+            for _ in range(50):
+                if "jti-2" in subscriber._filter:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await subscriber.is_blacklisted("jti-2") is True
+        finally:
+            await subscriber.stop()
+
+    async def test_rebuild_drops_removed_entries(self, client) -> None:
+        store = RedisTokenRevocationStore(client)
+        await store.add(_entry("a"))
+        await store.add(_entry("b"))
+        await store.remove("a")
+
+        assert await store.rebuild() == 1
+        assert "a" not in store._filter
+        assert "b" in store._filter
@@ -12,6 +12,7 @@ import pytest
 from identity_service.application.services.user_auth_service import UserAuthService
 from identity_service.domain.entities.password_reset import PasswordResetToken
 from identity_service.domain.entities.user import User, UserCredential, UserProfile
+from shared.auth.hashing_pool import HashingPoolSaturatedError
 
 # =============================================================================
 # Fixtures
@@ -122,8 +123,10 @@ def mock_reset_repo() -> AsyncMock:
 def mock_password_service() -> MagicMock:
     """Create mock password service."""
     svc = MagicMock()
-    svc.hash_password = MagicMock(return_value="hashed_new_pw")
+    svc.saturated = False
+    svc.hash_password_async = AsyncMock(return_value="hashed_new_pw")
     svc.verify_password = MagicMock(return_value=True)
+    svc.verify_password_async = AsyncMock(return_value=True)
     return svc
 
 
@@ -139,9 +142,9 @@ def mock_password_policy() -> MagicMock:
 def mock_brute_force() -> MagicMock:
     """Create mock brute force protection service."""
     svc = MagicMock()
-    svc.check_account = MagicMock(return_value=FakeAccountStatus())
-    svc.check_ip = MagicMock(return_value=FakeIPStatus())
-    svc.record_attempt = MagicMock()
+    svc.check_account = AsyncMock(return_value=FakeAccountStatus())
+    svc.check_ip = AsyncMock(return_value=FakeIPStatus())
+    svc.record_attempt = AsyncMock()
     return svc
 
 
@@ -149,7 +152,7 @@ def mock_brute_force() -> MagicMock:
 def mock_session_service() -> MagicMock:
     """Create mock session management service."""
     svc = MagicMock()
-    svc.create_session = MagicMock(return_value=FakeSessionResult())
+    svc.create_session = AsyncMock(return_value=FakeSessionResult())
     return svc
 
 
@@ -277,7 +280,7 @@ class TestRegister:
             password="StrongPassword123!",
         )
 
-        mock_password_service.hash_password.assert_called_once_with("StrongPassword123!")
+        mock_password_service.hash_password_async.assert_awaited_once_with("StrongPassword123!")
         # Verify the created user has the hashed password
         created_user = mock_user_repo.create.call_args[0][0]
         assert created_user.credential.password_hash == "hashed_new_pw"
@@ -313,6 +316,38 @@ class TestLogin:
         assert result.session_id is not None
         mock_brute_force.record_attempt.assert_called()
 
+    @pytest.mark.unit
+    async def test_login_shed_when_hashing_saturated(
+        self,
+        auth_service: UserAuthService,
+        mock_user_repo: AsyncMock,
+        mock_password_service: MagicMock,
+    ) -> None:
+        """Login is shed before any lookup when the hashing pool is full."""
+        mock_password_service.saturated = True
+
+        result = await auth_service.login(email="user@example.com", password="any")
+
+        assert result.error == "server_busy"
+        mock_user_repo.get_by_email.assert_not_awaited()
+
+    @pytest.mark.unit
+    async def test_login_shed_does_not_count_as_failure(
+        self,
+        auth_service: UserAuthService,
+        mock_user_repo: AsyncMock,
+        mock_password_service: MagicMock,
+        mock_brute_force: MagicMock,
+    ) -> None:
+        """A rejected verification is not recorded as a failed attempt."""
+        mock_user_repo.get_by_email.return_value = _make_user()
+        mock_password_service.verify_password_async.side_effect = HashingPoolSaturatedError("full")
+
+        result = await auth_service.login(email="user@example.com", password="any")
+
+        assert result.error == "server_busy"
+        mock_brute_force.record_attempt.assert_not_called()
+
     @pytest.mark.unit
     async def test_login_account_locked(
         self,
@@ -382,7 +417,7 @@ class TestLogin:
         """Login with wrong password returns error and records attempt."""
         user = _make_user()
         mock_user_repo.get_by_email.return_value = user
-        mock_password_service.verify_password.return_value = False
+        mock_password_service.verify_password_async.return_value = False
 
         result = await auth_service.login(
             email="user@example.com",
@@ -453,7 +488,7 @@ class TestChangePassword:
         user = _make_user()
         mock_user_repo.get_by_id.return_value = user
         # verify_password: True for current, False for new (not same as current)
-        mock_password_service.verify_password.side_effect = [True, False]
+        mock_password_service.verify_password_async.side_effect = [True, False]
 
         with patch(
             "identity_service.infrastructure.security.password_policy.add_to_password_history"
@@ -478,7 +513,7 @@ class TestChangePassword:
         """Password change with wrong current password fails."""
         user = _make_user()
         mock_user_repo.get_by_id.return_value = user
-        mock_password_service.verify_password.return_value = False
+        mock_password_service.verify_password_async.return_value = False
 
         success, error = await auth_service.change_password(
             user_id=user.id,
@@ -518,7 +553,7 @@ class TestChangePassword:
         user = _make_user()
         mock_user_repo.get_by_id.return_value = user
         # Both verify calls return True (current matches, new also matches old hash)
-        mock_password_service.verify_password.return_value = True
+        mock_password_service.verify_password_async.return_value = True
 
         success, error = await auth_service.change_password(
             user_id=user.id,
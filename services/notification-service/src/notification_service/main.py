@@ -12,7 +12,7 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 
 from shared.fastapi_utils import (
-    RequestContextMiddleware,
+    RequestContextHook,
     create_health_router,
     register_exception_handlers,
 )
@@ -67,8 +67,7 @@ def create_app() -> FastAPI:
     )
 
     # Middleware
-    app.add_middleware(RequestContextMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
 
     # Exception handlers
     register_exception_handlers(app)
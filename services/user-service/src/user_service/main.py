@@ -14,7 +14,7 @@ from starlette.requests import Request
 
 from shared.application.base_service import ConflictError, NotFoundError, ServiceError
 from shared.fastapi_utils import (
-    RequestContextMiddleware,
+    RequestContextHook,
     create_health_router,
     register_exception_handlers,
 )
@@ -68,8 +68,7 @@ def create_app() -> FastAPI:
     )
 
     # Middleware (order matters: outermost first)
-    app.add_middleware(RequestContextMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
 
     # Exception handlers
     register_exception_handlers(app)
@@ -10,7 +10,11 @@ logger = structlog.get_logger()
 
 
 async def cleanup_expired_sessions(ctx: dict[str, Any]) -> int:
-    """Remove expired sessions and stale temporary data.
+    """Purge identity sessions whose retention period has passed.
+
+    Uses the ``SessionStore`` placed in the context by the worker startup
+    hook. The store only visits sessions that are due, so the cost scales
+    with the number purged rather than the number stored.
 
     Args:
         ctx: ARQ context dict.
@@ -18,8 +22,12 @@ async def cleanup_expired_sessions(ctx: dict[str, Any]) -> int:
     Returns:
         Number of records cleaned up.
     """
-    # TODO: Wire up DB session and perform cleanup queries
     logger.info("cleanup_started")
-    cleaned = 0
+    store = ctx.get("session_store")
+    if store is None:
+        logger.info("cleanup_skipped", reason="session store not configured")
+        return 0
+
+    cleaned = await store.purge_expired()
     logger.info("cleanup_completed", cleaned=cleaned)
     return cleaned
@@ -10,9 +10,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import redis.asyncio as redis
 import structlog
 from arq import cron
 from arq.connections import RedisSettings
+from shared.identity.sessions import RedisSessionStore
 
 from worker_service.configs.settings import get_settings
 from worker_service.tasks.outbox_relay import process_outbox
@@ -30,11 +32,18 @@ async def startup(ctx: dict[str, Any]) -> None:
         max_jobs=settings.arq_max_jobs,
     )
     ctx["settings"] = settings
+    if settings.identity_redis_url:
+        ctx["identity_redis"] = redis.from_url(settings.identity_redis_url, decode_responses=True)
+        ctx["session_store"] = RedisSessionStore(ctx["identity_redis"])
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """ARQ worker shutdown hook."""
     logger.info("Worker shutting down")
+    ctx.pop("session_store", None)
+    identity_redis = ctx.pop("identity_redis", None)
+    if identity_redis is not None:
+        await identity_redis.aclose()
 
 
 class WorkerSettings:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from worker_service.tasks.outbox_relay import process_outbox
@@ -39,6 +41,15 @@ class TestCleanupExpiredSessions:
         result = await cleanup_expired_sessions(ctx)
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_purges_configured_store(self):
+        """Cleanup should delegate to the session store in context."""
+        store = AsyncMock()
+        store.purge_expired.return_value = 3
+        result = await cleanup_expired_sessions({"session_store": store})
+        assert result == 3
+        store.purge_expired.assert_awaited_once()
+
 
 # ---- Worker configuration tests ----
 
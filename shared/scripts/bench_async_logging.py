@@ -0,0 +1,74 @@
+"""Benchmark the cost of a log call on the calling thread.
+
+Logs through ``configure_logging`` with JSON output to a stream that
+sleeps on every write, standing in for a slow pipe or a busy disk, and
+reports the time each ``logger.info`` call spends on the caller:
+
+* synchronous: the caller formats and writes each record,
+* async: the caller queues the record for the listener thread.
+
+With a queue smaller than the run, the async rows also show how many
+records the drop policy discarded.
+
+Usage:
+    python scripts/bench_async_logging.py
+    python scripts/bench_async_logging.py --records 50000 --write-delay-us 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import time
+
+from shared.observability.async_logging import AsyncLogHandler
+from shared.observability.logging import configure_logging, with_context
+
+
+class SlowStream(io.StringIO):
+    """Text stream whose writes take a fixed time."""
+
+    def __init__(self, delay_seconds: float) -> None:
+        super().__init__()
+        self.delay_seconds = delay_seconds
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay_seconds)
+        return len(text)
+
+
+def _per_call_us(n: int) -> float:
+    logger = logging.getLogger("bench")
+    started = time.perf_counter()
+    with with_context(order_id="o-1"):
+        for i in range(n):
+            logger.info("order %d processed", i, extra={"amount": 12.5})
+    return (time.perf_counter() - started) / n * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--write-delay-us", type=float, default=10.0)
+    args = parser.parse_args()
+    delay = args.write_delay_us / 1_000_000
+
+    print(f"{'mode':<26}{'us/call':>10}{'dropped':>10}")
+    configure_logging(stream=SlowStream(delay))
+    print(f"{'synchronous':<26}{_per_call_us(args.records):>10.2f}{'-':>10}")
+
+    for max_queue in (args.records, args.records // 10):
+        configure_logging(stream=SlowStream(delay), async_logging=True, max_queue=max_queue)
+        cost = _per_call_us(args.records)
+        (handler,) = logging.getLogger().handlers
+        assert isinstance(handler, AsyncLogHandler)
+        dropped = handler.stats().dropped
+        print(f"{f'async max_queue={max_queue}':<26}{cost:>10.2f}{dropped:>10}")
+
+    # Drains the last async handler
+    configure_logging(stream=io.StringIO())
+
+
+if __name__ == "__main__":
+    main()
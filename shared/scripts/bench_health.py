@@ -0,0 +1,73 @@
+"""Benchmark readiness probe latency.
+
+Registers three checks that each take ``--check-ms`` (standing in for a
+database, Redis and a downstream service ping) and reports the latency
+of ``check_readiness``:
+
+* sequential: the checks awaited one after another, as before,
+* concurrent: the checks run together on every probe,
+* cached: probes answered by a ``HealthMonitor``.
+
+Usage:
+    python scripts/bench_health.py
+    python scripts/bench_health.py --probes 500 --check-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from shared.observability.health import (
+    HealthCheckResult,
+    HealthMonitor,
+    HealthStatus,
+    check_readiness,
+    register_health_check,
+    set_health_monitor,
+)
+from shared.observability.health import _health_checks as registered_checks
+
+
+async def _sequential() -> None:
+    for check in registered_checks.values():
+        await check.run()
+
+
+async def _per_probe_ms(probe: Callable[[], Awaitable[object]], n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        await probe()
+    return (time.perf_counter() - started) / n * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--probes", type=int, default=100)
+    parser.add_argument("--check-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    for name in ("database", "redis", "payments"):
+
+        async def check(name: str = name) -> HealthCheckResult:
+            await asyncio.sleep(args.check_ms / 1000)
+            return HealthCheckResult(name=name, status=HealthStatus.HEALTHY)
+
+        register_health_check(name, check)
+
+    print(f"{'mode':<14}{'ms/probe':>10}")
+    print(f"{'sequential':<14}{await _per_probe_ms(_sequential, args.probes):>10.3f}")
+    print(f"{'concurrent':<14}{await _per_probe_ms(check_readiness, args.probes):>10.3f}")
+
+    monitor = HealthMonitor(ttl_seconds=5.0)
+    set_health_monitor(monitor)
+    await monitor.start()
+    cached = await _per_probe_ms(check_readiness, args.probes * 100)
+    await monitor.stop()
+    print(f"{'cached':<14}{cached:>10.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
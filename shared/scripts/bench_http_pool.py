@@ -0,0 +1,70 @@
+"""Benchmark request latency with a client per call versus the shared pool.
+
+Starts a local keep-alive HTTP/1.1 server and sends ``--requests``
+sequential GETs:
+
+* per-call: a new ``httpx.AsyncClient`` per request, so every request
+  opens a connection (as ``OAuthService.get_user_info`` did),
+* registry: the client from ``HTTPClientRegistry``, reusing connections.
+
+Against a remote host each new connection also pays DNS, TLS and the
+network round trips, so the gap is larger than measured here.
+
+Usage:
+    python scripts/bench_http_pool.py
+    python scripts/bench_http_pool.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from shared.http_client.pool import HTTPClientRegistry
+
+
+async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    url = f"http://localhost:{server.sockets[0].getsockname()[1]}/"
+
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        async with httpx.AsyncClient() as client:
+            await client.get(url)
+    per_call = (time.perf_counter() - started) / args.requests * 1000
+
+    registry = HTTPClientRegistry()
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        await registry.get().get(url)
+    pooled = (time.perf_counter() - started) / args.requests * 1000
+    (stats,) = registry.stats()
+    await registry.aclose()
+    server.close()
+
+    print(f"{'client':<10}{'ms/request':>12}{'connections':>13}")
+    print(f"{'per-call':<10}{per_call:>12.3f}{args.requests:>13}")
+    print(f"{'registry':<10}{pooled:>12.3f}{stats.connections_opened:>13}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Benchmark InMemoryRepository queries with and without secondary indexes.
+
+Loads the same entities into an unindexed repository and one with a hash
+index on ``status`` and a sorted index on ``score``, then times equality
+lookups, range filters, counts and ordered pagination on both.
+
+Usage:
+    python scripts/bench_inmemory_repository.py
+    python scripts/bench_inmemory_repository.py --entities 100000 --queries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from shared.dbs.repository import (
+    Filter,
+    FilterOperator,
+    InMemoryRepository,
+    OrderBy,
+    OrderDirection,
+    PageRequest,
+)
+
+STATUSES = [f"status-{i}" for i in range(1000)]
+
+
+@dataclass
+class Entity:
+    id: str
+    status: str
+    score: int
+
+
+async def _load(n: int) -> tuple[InMemoryRepository[Entity], InMemoryRepository[Entity]]:
+    rng = random.Random(42)
+    plain = InMemoryRepository[Entity]()
+    indexed = InMemoryRepository[Entity](hash_indexes=["status"], sorted_indexes=["score"])
+    for i in range(n):
+        entity = Entity(id=str(i), status=rng.choice(STATUSES), score=rng.randrange(n))
+        await plain.add(entity)
+        await indexed.add(entity)
+    return plain, indexed
+
+
+async def _ms_per_query(query: Callable[[], Awaitable[object]], n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        await query()
+    return (time.perf_counter() - started) * 1000 / n
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    plain, indexed = await _load(args.entities)
+    print(f"loaded {args.entities} entities x2 in {time.perf_counter() - started:.2f}s\n")
+
+    eq = [Filter(field="status", value="status-7")]
+    rng = [Filter(field="score", operator=FilterOperator.LT, value=args.entities // 1000)]
+    order = [OrderBy(field="score", direction=OrderDirection.DESC)]
+    deep_page = PageRequest(page=50, size=20)
+
+    cases: dict[str, Callable[[InMemoryRepository[Entity]], Awaitable[object]]] = {
+        "find status = x": lambda repo: repo.find(eq),
+        "find score < x": lambda repo: repo.find(rng),
+        "count status = x": lambda repo: repo.count(eq),
+        "page 50 order by score": lambda repo: repo.find_paginated(deep_page, order_by=order),
+    }
+
+    print(f"{'query':<26}{'scan ms':>10}{'indexed ms':>12}{'speedup':>10}")
+    for name, case in cases.items():
+        scan = await _ms_per_query(lambda case=case: case(plain), args.queries)
+        fast = await _ms_per_query(lambda case=case: case(indexed), args.queries)
+        print(f"{name:<26}{scan:>10.3f}{fast:>12.3f}{scan / fast:>9.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""Benchmark Mediator dispatch overhead.
+
+Times ``Mediator.send`` with 0, 3 and 10 pass-through behaviors against
+a baseline that rebuilds the behavior chain on every dispatch (the
+previous behaviour), and ``publish`` fan-out to I/O-bound handlers in
+each :class:`PublishMode`.
+
+Usage:
+    python scripts/bench_mediator.py
+    python scripts/bench_mediator.py --dispatches 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from shared.cqrs import Command, CommandHandler, Mediator, PipelineBehavior, PublishMode
+from shared.cqrs.mediator import _wrap
+from shared.ddd.events import DomainEvent, DomainEventHandler
+
+
+@dataclass(frozen=True)
+class Noop(Command[int]):
+    value: int = 0
+
+
+class NoopHandler(CommandHandler[Noop, int]):
+    async def handle(self, command: Noop) -> int:
+        return command.value
+
+
+class PassThrough(PipelineBehavior):
+    async def handle(self, request: Any, next_: Any) -> Any:
+        return await next_(request)
+
+
+@dataclass
+class Tick(DomainEvent):
+    pass
+
+
+class SleepyHandler(DomainEventHandler[Tick]):
+    async def handle(self, event: Tick) -> None:
+        await asyncio.sleep(0.005)
+
+
+async def _rebuilding_send(mediator: Mediator, request: Noop) -> int:
+    handler = mediator.command_bus.dispatch
+    for behavior in reversed(mediator._behaviors):
+        if behavior.applies_to(request):
+            handler = _wrap(behavior, handler)
+    return await handler(request)
+
+
+async def _per_second(send: Any, n: int) -> float:
+    request = Noop(1)
+    started = time.perf_counter()
+    for _ in range(n):
+        await send(request)
+    return n / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dispatches", type=int, default=100_000)
+    parser.add_argument("--handlers", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'behaviors':<10}{'rebuild/s':>14}{'compiled/s':>14}{'speedup':>10}")
+    for count in (0, 3, 10):
+        mediator = Mediator(behaviors=[PassThrough() for _ in range(count)])
+        mediator.register_command_handler(Noop, NoopHandler())
+        baseline = await _per_second(lambda r, m=mediator: _rebuilding_send(m, r), args.dispatches)
+        compiled = await _per_second(mediator.send, args.dispatches)
+        print(f"{count:<10}{baseline:>14,.0f}{compiled:>14,.0f}{compiled / baseline:>9.2f}x")
+
+    mediator = Mediator()
+    for _ in range(args.handlers):
+        mediator.register_event_handler(Tick, SleepyHandler())
+    print(f"\npublish to {args.handlers} handlers sleeping 5 ms")
+    for mode, limit in [
+        (PublishMode.SEQUENTIAL, None),
+        (PublishMode.CONCURRENT, None),
+        (PublishMode.CONCURRENT, 4),
+        (PublishMode.ISOLATED, None),
+    ]:
+        started = time.perf_counter()
+        await mediator.publish(Tick(), mode=mode, max_concurrency=limit)
+        label = f"{mode.value} (limit {limit})" if limit else mode.value
+        print(f"  {label:<24}{(time.perf_counter() - started) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Benchmark ``/metrics`` rendering with several worker processes.
+
+Forks ``--workers`` processes that each record a request counter and a
+latency histogram over ``--series`` label sets, then compares the time
+to render the aggregated exposition:
+
+* prometheus_client: ``MultiProcessCollector`` + ``generate_latest``
+  (only when ``prometheus_client`` is installed),
+* shared: ``ExpositionRenderer`` reading the same data from the
+  ``MultiprocessMetricsBackend`` files.
+
+Usage:
+    python scripts/bench_metrics_exposition.py
+    python scripts/bench_metrics_exposition.py --workers 8 --series 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from shared.observability.multiprocess_metrics import (
+    ExpositionRenderer,
+    MultiprocessMetricsBackend,
+)
+
+
+def _record(directory: Path, series: int) -> None:
+    backend = MultiprocessMetricsBackend(directory, namespace="bench")
+    requests = backend.counter("requests_total", "Requests", ["route", "status"])
+    latency = backend.histogram("latency_seconds", "Latency", ["route"])
+    for i in range(series):
+        route = f"/items/{i}"
+        requests.labels(route=route, status="200").inc(i)
+        latency.labels(route=route).observe(i / series)
+
+
+def _record_prometheus(series: int) -> None:
+    from prometheus_client import Counter, Histogram
+
+    requests = Counter("bench_requests_total", "Requests", ["route", "status"])
+    latency = Histogram("bench_latency_seconds", "Latency", ["route"])
+    for i in range(series):
+        route = f"/items/{i}"
+        requests.labels(route=route, status="200").inc(i)
+        latency.labels(route=route).observe(i / series)
+
+
+def _fork_workers(work: Callable[[], None], workers: int) -> None:
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                work()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+
+
+def _ms_per_render(render: Callable[[], bytes], n: int) -> tuple[float, int]:
+    size = len(render())
+    started = time.perf_counter()
+    for _ in range(n):
+        render()
+    return (time.perf_counter() - started) / n * 1000, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--series", type=int, default=200)
+    parser.add_argument("--renders", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'renderer':<20}{'ms/render':>10}{'bytes':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # prometheus_client picks its value store on first import
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+        try:
+            import prometheus_client  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            _fork_workers(lambda: _record_prometheus(args.series), args.workers)
+            from prometheus_client import CollectorRegistry, generate_latest
+            from prometheus_client.multiprocess import MultiProcessCollector
+
+            registry = CollectorRegistry()
+            MultiProcessCollector(registry, path=directory)
+            ms, size = _ms_per_render(lambda: generate_latest(registry), args.renders)
+            print(f"{'prometheus_client':<20}{ms:>10.3f}{size:>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory)
+        _fork_workers(lambda: _record(path, args.series), args.workers)
+        renderer = ExpositionRenderer(path)
+        ms, size = _ms_per_render(renderer.render, args.renders)
+        print(f"{'shared':<20}{ms:>10.3f}{size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark request middleware throughput.
+
+Drives a FastAPI app in-process through ASGI (no sockets) with:
+
+* no middleware,
+* the previous stack: request logging and request context as two
+  ``BaseHTTPMiddleware`` layers,
+* the pure-ASGI ``RequestLoggingMiddleware`` with ``RequestContextHook``,
+
+and reports requests per second for a JSON endpoint and a streamed
+response. Log lines are rendered but discarded, so formatting cost is
+included and I/O is not.
+
+Usage:
+    python scripts/bench_request_middleware.py
+    python scripts/bench_request_middleware.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Any
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from shared.fastapi_utils.middleware import RequestContextHook
+from shared.observability.middleware import RequestLoggingMiddleware
+from shared.observability.structlog_config import (
+    bind_contextvars,
+    clear_contextvars,
+    generate_correlation_id,
+    get_structlog_logger,
+    set_correlation_id,
+)
+
+logger = get_structlog_logger("bench")
+
+
+class TwoLayerLogging(BaseHTTPMiddleware):
+    """The work of the previous logging middleware, as a BaseHTTPMiddleware."""
+
+    async def dispatch(self, request: Any, call_next: Any) -> Any:
+        correlation_id = request.headers.get("x-correlation-id") or generate_correlation_id()
+        set_correlation_id(correlation_id)
+        bind_contextvars(correlation_id=correlation_id, http_path=request.url.path)
+        logger.info("Request started")
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            logger.info("Request completed", duration_ms=time.perf_counter() - started)
+            clear_contextvars()
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+class TwoLayerContext(BaseHTTPMiddleware):
+    """The work of the previous request context middleware."""
+
+    async def dispatch(self, request: Any, call_next: Any) -> Any:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = str(uuid.uuid4())
+        return response
+
+
+def _app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_endpoint() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream_endpoint() -> StreamingResponse:
+        async def chunks() -> Any:
+            for _ in range(16):
+                yield b"x" * 1024
+
+        return StreamingResponse(chunks())
+
+    if stack == "base-http x2":
+        app.add_middleware(TwoLayerContext)
+        app.add_middleware(TwoLayerLogging)
+    elif stack == "pure asgi":
+        app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
+    return app
+
+
+async def _per_second(app: FastAPI, path: str, n: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    never = asyncio.Event()
+
+    async def send(message: dict[str, Any]) -> None:
+        pass
+
+    started = time.perf_counter()
+    for _ in range(n):
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive(messages: list[dict[str, Any]] = messages) -> dict[str, Any]:
+            if messages:
+                return messages.pop()
+            # The client stays connected; streaming responses poll for disconnect
+            await never.wait()
+            return {"type": "http.disconnect"}
+
+        await app(dict(scope), receive, send)
+    return n / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args()
+
+    structlog.configure(
+        processors=[structlog.processors.JSONRenderer()],
+        logger_factory=structlog.ReturnLoggerFactory(),
+    )
+
+    stacks = ["none", "base-http x2", "pure asgi"]
+    print(f"{'stack':<16}{'json req/s':>14}{'stream req/s':>14}")
+    for stack in stacks:
+        app = _app(stack)
+        await _per_second(app, "/json", 200)  # warm up routing and caches
+        json_rps = await _per_second(app, "/json", args.requests)
+        stream_rps = await _per_second(app, "/stream", args.requests // 4)
+        print(f"{stack:<16}{json_rps:>14,.0f}{stream_rps:>14,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Benchmark tracing overhead per request.
+
+Times a request of one root span with three child spans at several
+sample rates, against the same work with tracing disabled. Sampled spans
+go through the batch processor to an exporter that discards them, so the
+numbers show the cost on the request path, not the cost of export.
+
+Usage:
+    python scripts/bench_tracing.py
+    python scripts/bench_tracing.py --requests 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import time
+
+from shared.observability.tracing import (
+    Span,
+    TracingConfig,
+    configure_tracing,
+    create_span,
+    get_span_processor,
+    shutdown_tracing,
+)
+
+
+class DiscardExporter:
+    def export(self, spans: list[Span]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _request() -> None:
+    with create_span("GET /orders") as span:
+        span.set_attribute("http.method", "GET")
+        for name in ("auth", "db.query", "serialize"):
+            with create_span(name):
+                pass
+
+
+def _per_request_us(n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        # A fresh context per request, as each ASGI request gets its own
+        contextvars.Context().run(_request)
+    return (time.perf_counter() - started) / n * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    configure_tracing(TracingConfig(enabled=False))
+    baseline = _per_request_us(args.requests)
+    print(f"{'config':<22}{'us/request':>12}{'overhead':>12}{'dropped':>10}")
+    print(f"{'disabled':<22}{baseline:>12.2f}{'-':>12}{'-':>10}")
+
+    for rate, tail in [(0.01, False), (0.1, False), (1.0, False), (0.01, True)]:
+        config = TracingConfig(
+            sample_rate=rate, tail_sampling=tail, max_queue_size=8192, schedule_delay_seconds=0.5
+        )
+        configure_tracing(config, exporter=DiscardExporter())
+        cost = _per_request_us(args.requests)
+        processor = get_span_processor()
+        dropped = processor.dropped if processor else 0
+        label = f"sample_rate={rate}" + (" +tail" if tail else "")
+        print(f"{label:<22}{cost:>12.2f}{cost - baseline:>+12.2f}{dropped:>10}")
+    shutdown_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Check that importing a module stays within an import-time budget.
+
+Imports the module in fresh interpreters with ``python -X importtime``,
+takes the median cumulative time of the module across runs and exits
+non-zero when it exceeds the budget. The slowest imports are listed so
+a regression points at its cause. Run it from a service directory so
+the service and its dependencies are importable.
+
+Usage:
+    python scripts/check_import_time.py shared --budget-ms 50
+    python ../../shared/scripts/check_import_time.py audit_service.main --budget-ms 1500
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.exit(f"import {module} failed:\n{result.stderr[-2000:]}")
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("module")
+    parser.add_argument("--budget-ms", type=float, required=True)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [_import_times(args.module) for _ in range(args.runs)]
+    total_ms = statistics.median(run[args.module][1] for run in runs) / 1000
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)
+
+    print(f"{'self ms':>9}{'cumulative ms':>15}  module")
+    for name, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"{self_us / 1000:>9.1f}{cumulative_us / 1000:>15.1f}  {name}")
+    print(f"\nimport {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if total_ms > args.budget_ms:
+        sys.exit(f"import time over budget by {total_ms - args.budget_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
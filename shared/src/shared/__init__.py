@@ -22,257 +22,474 @@ Example:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
 __version__ = "0.1.0"
 
-# Re-export commonly used items for convenience
-# Application Layer Patterns
-from shared.application import (
-    BaseReadService,
-    BaseService,
-    BaseWriteService,
-    ConflictError,
-    CRUDService,
-    NotFoundError,
-    PaginatedResult,
-    ServiceContext,
-    ServiceError,
-)
-from shared.application import (
-    ValidationError as ServiceValidationError,
-)
+if TYPE_CHECKING:
+    # Re-export commonly used items for convenience
+    # Application Layer Patterns
+    from shared.application import (
+        BaseReadService,
+        BaseService,
+        BaseWriteService,
+        ConflictError,
+        CRUDService,
+        NotFoundError,
+        PaginatedResult,
+        ServiceContext,
+        ServiceError,
+    )
+    from shared.application import (
+        ValidationError as ServiceValidationError,
+    )
 
-# Phase 2: Cloud-Native Primitives
-from shared.audit import (
-    AuditAction,
-    AuditEvent,
-    AuditLogger,
-    AuditQuery,
-    InMemoryAuditLogger,
-    audit_log,
-)
-from shared.constants import Environment, HTTPStatus, Patterns
+    # Phase 2: Cloud-Native Primitives
+    from shared.audit import (
+        AuditAction,
+        AuditEvent,
+        AuditLogger,
+        AuditQuery,
+        BufferedAuditLogger,
+        InMemoryAuditLogger,
+        audit_log,
+    )
+    from shared.constants import Environment, HTTPStatus, Patterns
 
-# Phase 4: Advanced Enterprise Patterns
-# CQRS / Mediator
-from shared.cqrs import (
-    Command,
-    CommandBus,
-    CommandHandler,
-    LoggingBehavior,
-    Mediator,
-    PipelineBehavior,
-    Query,
-    QueryBus,
-    QueryHandler,
-    TimingBehavior,
-    ValidationBehavior,
-)
+    # Phase 4: Advanced Enterprise Patterns
+    # CQRS / Mediator
+    from shared.cqrs import (
+        Command,
+        CommandBus,
+        CommandHandler,
+        LoggingBehavior,
+        Mediator,
+        PipelineBehavior,
+        PublishMode,
+        Query,
+        QueryBus,
+        QueryHandler,
+        TimingBehavior,
+        ValidationBehavior,
+    )
 
-# Specification Pattern (also available via shared.dbs)
-from shared.dbs import (
-    AbstractRepository,
-    AbstractUnitOfWork,
-    AlwaysFalse,
-    AlwaysTrue,
-    AndSpecification,
-    Attr,
-    AttributeSpec,
-    Filter,
-    FilterOperator,
-    InMemoryRepository,
-    InMemoryUnitOfWork,
-    NotSpecification,
-    OrderBy,
-    OrderDirection,
-    OrSpecification,
-    PageRequest,
-    PageResponse,
-    Specification,
-)
+    # Specification Pattern (also available via shared.dbs)
+    from shared.dbs import (
+        AbstractRepository,
+        AbstractUnitOfWork,
+        AlwaysFalse,
+        AlwaysTrue,
+        AndSpecification,
+        Attr,
+        AttributeSpec,
+        Filter,
+        FilterOperator,
+        InMemoryRepository,
+        InMemoryUnitOfWork,
+        NotSpecification,
+        OrderBy,
+        OrderDirection,
+        OrSpecification,
+        PageRequest,
+        PageResponse,
+        Specification,
+    )
 
-# DDD Building Blocks
-from shared.ddd import (
-    AggregateRoot,
-    DomainEvent,
-    DomainEventHandler,
-    Entity,
-    EntityId,
-    EventDispatcher,
-    ValueObject,
-)
-from shared.exceptions import (
-    BadGatewayException,
-    BadRequestException,
-    BaseServiceException,
-    ConflictException,
-    ConnectionException,
-    DatabaseException,
-    ErrorSeverity,
-    FieldError,
-    ForbiddenException,
-    GatewayTimeoutException,
-    HTTPException,
-    IntegrityException,
-    InternalServerException,
-    MethodNotAllowedException,
-    NotFoundException,
-    QueryException,
-    RateLimitException,
-    ServiceUnavailableException,
-    TimeoutException,
-    TransactionException,
-    UnauthorizedException,
-    UnprocessableEntityException,
-    ValidationException,
-)
+    # DDD Building Blocks
+    from shared.ddd import (
+        AggregateRoot,
+        DomainEvent,
+        DomainEventHandler,
+        Entity,
+        EntityId,
+        EventDispatcher,
+        ValueObject,
+    )
+    from shared.exceptions import (
+        BadGatewayException,
+        BadRequestException,
+        BaseServiceException,
+        ConflictException,
+        ConnectionException,
+        DatabaseException,
+        ErrorSeverity,
+        FieldError,
+        ForbiddenException,
+        GatewayTimeoutException,
+        HTTPException,
+        IntegrityException,
+        InternalServerException,
+        MethodNotAllowedException,
+        NotFoundException,
+        QueryException,
+        RateLimitException,
+        ServiceUnavailableException,
+        TimeoutException,
+        TransactionException,
+        UnauthorizedException,
+        UnprocessableEntityException,
+        ValidationException,
+    )
 
-# Dishka DI Integration (optional)
-from shared.extensions import (
-    # Dependency Injection
-    Container,
-    Depends,
-    DishkaContainerAdapter,
-    DishkaFastAPIMiddleware,
-    Scope,
-    cache,
-    create_dishka_fastapi_middleware,
-    deprecated,
-    dishka_dependency,
-    get_container,
-    inject,
-    is_dishka_available,
-    log_calls,
-    rate_limit,
-    register,
-    resolve,
-    # Decorators
-    retry,
-    singleton,
-    timeout,
-    transactional,
-    validate_args,
-)
-from shared.feature_flags import (
-    FeatureFlag,
-    FeatureFlagProvider,
-    FeatureFlagService,
-    InMemoryFlagProvider,
-    feature_enabled,
-)
-from shared.idempotency import (
-    IdempotencyRecord,
-    IdempotencyStore,
-    InMemoryIdempotencyStore,
-    idempotent,
-)
-from shared.notifications import (
-    InMemoryNotificationChannel,
-    Notification,
-    NotificationChannel,
-    NotificationPriority,
-    NotificationResult,
-    NotificationService,
-    NotificationStatus,
-)
-from shared.observability import (
-    CorrelationIdFilter,
-    # Metrics
-    Counter,
-    Gauge,
-    HealthCheck,
-    HealthCheckResult,
-    # Health
-    HealthStatus,
-    Histogram,
-    # Prometheus bridge
-    InMemoryMetricsBackend,
-    # Logging
-    JSONFormatter,
-    MetricsBackend,
-    MetricsRegistry,
-    PrometheusMetricsBackend,
-    Span,
-    # Tracing
-    SpanKind,
-    TracingConfig,
-    check_liveness,
-    check_readiness,
-    configure_logging,
-    configure_metrics,
-    configure_tracing,
-    create_health_check,
-    create_metrics_backend,
-    create_prometheus_asgi_app,
-    create_span,
-    extract_context,
-    generate_correlation_id,
-    get_correlation_id,
-    get_current_span,
-    get_health_status,
-    get_logger,
-    get_metrics_backend,
-    get_metrics_registry,
-    get_trace_id,
-    inject_context,
-    register_health_check,
-    reset_metrics_backend,
-    set_correlation_id,
-    set_metrics_backend,
-    timed,
-    traced,
-    with_context,
-)
+    # Dishka DI Integration (optional)
+    from shared.extensions import (
+        # Dependency Injection
+        Container,
+        Depends,
+        DishkaContainerAdapter,
+        DishkaFastAPIMiddleware,
+        Scope,
+        cache,
+        create_dishka_fastapi_middleware,
+        deprecated,
+        dishka_dependency,
+        get_container,
+        inject,
+        is_dishka_available,
+        log_calls,
+        rate_limit,
+        register,
+        resolve,
+        # Decorators
+        retry,
+        singleton,
+        timeout,
+        transactional,
+        validate_args,
+    )
+    from shared.feature_flags import (
+        FeatureFlag,
+        FeatureFlagProvider,
+        FeatureFlagService,
+        InMemoryFlagProvider,
+        feature_enabled,
+    )
+    from shared.idempotency import (
+        IdempotencyRecord,
+        IdempotencyStore,
+        InMemoryIdempotencyStore,
+        idempotent,
+    )
+    from shared.notifications import (
+        InMemoryNotificationChannel,
+        Notification,
+        NotificationChannel,
+        NotificationPriority,
+        NotificationResult,
+        NotificationService,
+        NotificationStatus,
+    )
+    from shared.observability import (
+        CorrelationIdFilter,
+        # Metrics
+        Counter,
+        Gauge,
+        HealthCheck,
+        HealthCheckResult,
+        # Health
+        HealthStatus,
+        Histogram,
+        # Prometheus bridge
+        InMemoryMetricsBackend,
+        # Logging
+        JSONFormatter,
+        MetricsBackend,
+        MetricsRegistry,
+        PrometheusMetricsBackend,
+        Span,
+        # Tracing
+        SpanKind,
+        TracingConfig,
+        check_liveness,
+        check_readiness,
+        configure_logging,
+        configure_metrics,
+        configure_tracing,
+        create_health_check,
+        create_metrics_backend,
+        create_prometheus_asgi_app,
+        create_span,
+        extract_context,
+        generate_correlation_id,
+        get_correlation_id,
+        get_current_span,
+        get_health_status,
+        get_logger,
+        get_metrics_backend,
+        get_metrics_registry,
+        get_trace_id,
+        inject_context,
+        register_health_check,
+        reset_metrics_backend,
+        set_correlation_id,
+        set_metrics_backend,
+        shutdown_tracing,
+        timed,
+        traced,
+        with_context,
+    )
 
-# Proto / gRPC utilities
-from shared.proto import (
-    GrpcServiceConfig,
-    ProtobufSerializer,
-    grpc_status_to_http,
-    http_status_to_grpc,
-    pydantic_to_struct,
-    struct_to_dict,
-)
-from shared.tasks import (
-    PeriodicTask,
-    Task,
-    TaskContext,
-    TaskMiddleware,
-    TaskPriority,
-    TaskResult,
-    TaskRunner,
-    TaskState,
-    TaskStatus,
-)
-from shared.utils import (
-    CustomJSONEncoder,
-    ValidationResult,
-    camel_to_snake,
-    deserialize_json,
-    end_of_day,
-    format_iso8601,
-    format_relative_time,
-    generate_random_string,
-    get_date_range,
-    is_business_day,
-    is_valid_email,
-    is_valid_url,
-    is_valid_uuid,
-    mask_sensitive,
-    now_utc,
-    parse_iso8601,
-    pluralize,
-    safe_serialize,
-    sanitize_filename,
-    sanitize_html,
-    serialize_json,
-    slugify,
-    snake_to_camel,
-    start_of_day,
-    truncate,
-    utc_timestamp,
-    validate_length,
-    validate_range,
-    validate_required,
+    # Proto / gRPC utilities
+    from shared.proto import (
+        GrpcServiceConfig,
+        ProtobufSerializer,
+        grpc_status_to_http,
+        http_status_to_grpc,
+        pydantic_to_struct,
+        struct_to_dict,
+    )
+    from shared.tasks import (
+        PeriodicTask,
+        Task,
+        TaskContext,
+        TaskMiddleware,
+        TaskPriority,
+        TaskResult,
+        TaskRunner,
+        TaskState,
+        TaskStatus,
+    )
+    from shared.utils import (
+        CustomJSONEncoder,
+        ValidationResult,
+        camel_to_snake,
+        deserialize_json,
+        end_of_day,
+        format_iso8601,
+        format_relative_time,
+        generate_random_string,
+        get_date_range,
+        is_business_day,
+        is_valid_email,
+        is_valid_url,
+        is_valid_uuid,
+        mask_sensitive,
+        now_utc,
+        parse_iso8601,
+        pluralize,
+        safe_serialize,
+        sanitize_filename,
+        sanitize_html,
+        serialize_json,
+        slugify,
+        snake_to_camel,
+        start_of_day,
+        truncate,
+        utc_timestamp,
+        validate_length,
+        validate_range,
+        validate_required,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "BaseReadService": "shared.application",
+        "BaseService": "shared.application",
+        "BaseWriteService": "shared.application",
+        "ConflictError": "shared.application",
+        "CRUDService": "shared.application",
+        "NotFoundError": "shared.application",
+        "PaginatedResult": "shared.application",
+        "ServiceContext": "shared.application",
+        "ServiceError": "shared.application",
+        "ServiceValidationError": "shared.application:ValidationError",
+        "AuditAction": "shared.audit",
+        "AuditEvent": "shared.audit",
+        "AuditLogger": "shared.audit",
+        "AuditQuery": "shared.audit",
+        "BufferedAuditLogger": "shared.audit",
+        "InMemoryAuditLogger": "shared.audit",
+        "audit_log": "shared.audit",
+        "Environment": "shared.constants",
+        "HTTPStatus": "shared.constants",
+        "Patterns": "shared.constants",
+        "Command": "shared.cqrs",
+        "CommandBus": "shared.cqrs",
+        "CommandHandler": "shared.cqrs",
+        "LoggingBehavior": "shared.cqrs",
+        "Mediator": "shared.cqrs",
+        "PipelineBehavior": "shared.cqrs",
+        "PublishMode": "shared.cqrs",
+        "Query": "shared.cqrs",
+        "QueryBus": "shared.cqrs",
+        "QueryHandler": "shared.cqrs",
+        "TimingBehavior": "shared.cqrs",
+        "ValidationBehavior": "shared.cqrs",
+        "AbstractRepository": "shared.dbs",
+        "AbstractUnitOfWork": "shared.dbs",
+        "AlwaysFalse": "shared.dbs",
+        "AlwaysTrue": "shared.dbs",
+        "AndSpecification": "shared.dbs",
+        "Attr": "shared.dbs",
+        "AttributeSpec": "shared.dbs",
+        "Filter": "shared.dbs",
+        "FilterOperator": "shared.dbs",
+        "InMemoryRepository": "shared.dbs",
+        "InMemoryUnitOfWork": "shared.dbs",
+        "NotSpecification": "shared.dbs",
+        "OrderBy": "shared.dbs",
+        "OrderDirection": "shared.dbs",
+        "OrSpecification": "shared.dbs",
+        "PageRequest": "shared.dbs",
+        "PageResponse": "shared.dbs",
+        "Specification": "shared.dbs",
+        "AggregateRoot": "shared.ddd",
+        "DomainEvent": "shared.ddd",
+        "DomainEventHandler": "shared.ddd",
+        "Entity": "shared.ddd",
+        "EntityId": "shared.ddd",
+        "EventDispatcher": "shared.ddd",
+        "ValueObject": "shared.ddd",
+        "BadGatewayException": "shared.exceptions",
+        "BadRequestException": "shared.exceptions",
+        "BaseServiceException": "shared.exceptions",
+        "ConflictException": "shared.exceptions",
+        "ConnectionException": "shared.exceptions",
+        "DatabaseException": "shared.exceptions",
+        "ErrorSeverity": "shared.exceptions",
+        "FieldError": "shared.exceptions",
+        "ForbiddenException": "shared.exceptions",
+        "GatewayTimeoutException": "shared.exceptions",
+        "HTTPException": "shared.exceptions",
+        "IntegrityException": "shared.exceptions",
+        "InternalServerException": "shared.exceptions",
+        "MethodNotAllowedException": "shared.exceptions",
+        "NotFoundException": "shared.exceptions",
+        "QueryException": "shared.exceptions",
+        "RateLimitException": "shared.exceptions",
+        "ServiceUnavailableException": "shared.exceptions",
+        "TimeoutException": "shared.exceptions",
+        "TransactionException": "shared.exceptions",
+        "UnauthorizedException": "shared.exceptions",
+        "UnprocessableEntityException": "shared.exceptions",
+        "ValidationException": "shared.exceptions",
+        "Container": "shared.extensions",
+        "Depends": "shared.extensions",
+        "DishkaContainerAdapter": "shared.extensions",
+        "DishkaFastAPIMiddleware": "shared.extensions",
+        "Scope": "shared.extensions",
+        "cache": "shared.extensions",
+        "create_dishka_fastapi_middleware": "shared.extensions",
+        "deprecated": "shared.extensions",
+        "dishka_dependency": "shared.extensions",
+        "get_container": "shared.extensions",
+        "inject": "shared.extensions",
+        "is_dishka_available": "shared.extensions",
+        "log_calls": "shared.extensions",
+        "rate_limit": "shared.extensions",
+        "register": "shared.extensions",
+        "resolve": "shared.extensions",
+        "retry": "shared.extensions",
+        "singleton": "shared.extensions",
+        "timeout": "shared.extensions",
+        "transactional": "shared.extensions",
+        "validate_args": "shared.extensions",
+        "FeatureFlag": "shared.feature_flags",
+        "FeatureFlagProvider": "shared.feature_flags",
+        "FeatureFlagService": "shared.feature_flags",
+        "InMemoryFlagProvider": "shared.feature_flags",
+        "feature_enabled": "shared.feature_flags",
+        "IdempotencyRecord": "shared.idempotency",
+        "IdempotencyStore": "shared.idempotency",
+        "InMemoryIdempotencyStore": "shared.idempotency",
+        "idempotent": "shared.idempotency",
+        "InMemoryNotificationChannel": "shared.notifications",
+        "Notification": "shared.notifications",
+        "NotificationChannel": "shared.notifications",
+        "NotificationPriority": "shared.notifications",
+        "NotificationResult": "shared.notifications",
+        "NotificationService": "shared.notifications",
+        "NotificationStatus": "shared.notifications",
+        "CorrelationIdFilter": "shared.observability",
+        "Counter": "shared.observability",
+        "Gauge": "shared.observability",
+        "HealthCheck": "shared.observability",
+        "HealthCheckResult": "shared.observability",
+        "HealthStatus": "shared.observability",
+        "Histogram": "shared.observability",
+        "InMemoryMetricsBackend": "shared.observability",
+        "JSONFormatter": "shared.observability",
+        "MetricsBackend": "shared.observability",
+        "MetricsRegistry": "shared.observability",
+        "PrometheusMetricsBackend": "shared.observability",
+        "Span": "shared.observability",
+        "SpanKind": "shared.observability",
+        "TracingConfig": "shared.observability",
+        "check_liveness": "shared.observability",
+        "check_readiness": "shared.observability",
+        "configure_logging": "shared.observability",
+        "configure_metrics": "shared.observability",
+        "configure_tracing": "shared.observability",
+        "create_health_check": "shared.observability",
+        "create_metrics_backend": "shared.observability",
+        "create_prometheus_asgi_app": "shared.observability",
+        "create_span": "shared.observability",
+        "extract_context": "shared.observability",
+        "generate_correlation_id": "shared.observability",
+        "get_correlation_id": "shared.observability",
+        "get_current_span": "shared.observability",
+        "get_health_status": "shared.observability",
+        "get_logger": "shared.observability",
+        "get_metrics_backend": "shared.observability",
+        "get_metrics_registry": "shared.observability",
+        "get_trace_id": "shared.observability",
+        "inject_context": "shared.observability",
+        "register_health_check": "shared.observability",
+        "reset_metrics_backend": "shared.observability",
+        "set_correlation_id": "shared.observability",
+        "set_metrics_backend": "shared.observability",
+        "shutdown_tracing": "shared.observability",
+        "timed": "shared.observability",
+        "traced": "shared.observability",
+        "with_context": "shared.observability",
+        "GrpcServiceConfig": "shared.proto",
+        "ProtobufSerializer": "shared.proto",
+        "grpc_status_to_http": "shared.proto",
+        "http_status_to_grpc": "shared.proto",
+        "pydantic_to_struct": "shared.proto",
+        "struct_to_dict": "shared.proto",
+        "PeriodicTask": "shared.tasks",
+        "Task": "shared.tasks",
+        "TaskContext": "shared.tasks",
+        "TaskMiddleware": "shared.tasks",
+        "TaskPriority": "shared.tasks",
+        "TaskResult": "shared.tasks",
+        "TaskRunner": "shared.tasks",
+        "TaskState": "shared.tasks",
+        "TaskStatus": "shared.tasks",
+        "CustomJSONEncoder": "shared.utils",
+        "ValidationResult": "shared.utils",
+        "camel_to_snake": "shared.utils",
+        "deserialize_json": "shared.utils",
+        "end_of_day": "shared.utils",
+        "format_iso8601": "shared.utils",
+        "format_relative_time": "shared.utils",
+        "generate_random_string": "shared.utils",
+        "get_date_range": "shared.utils",
+        "is_business_day": "shared.utils",
+        "is_valid_email": "shared.utils",
+        "is_valid_url": "shared.utils",
+        "is_valid_uuid": "shared.utils",
+        "mask_sensitive": "shared.utils",
+        "now_utc": "shared.utils",
+        "parse_iso8601": "shared.utils",
+        "pluralize": "shared.utils",
+        "safe_serialize": "shared.utils",
+        "sanitize_filename": "shared.utils",
+        "sanitize_html": "shared.utils",
+        "serialize_json": "shared.utils",
+        "slugify": "shared.utils",
+        "snake_to_camel": "shared.utils",
+        "start_of_day": "shared.utils",
+        "truncate": "shared.utils",
+        "utc_timestamp": "shared.utils",
+        "validate_length": "shared.utils",
+        "validate_range": "shared.utils",
+        "validate_required": "shared.utils",
+    },
 )
 
 __all__ = [
@@ -331,6 +548,7 @@ __all__ = [
     "TracingConfig",
     "Span",
     "configure_tracing",
+    "shutdown_tracing",
     "get_current_span",
     "get_trace_id",
     "create_span",
@@ -435,6 +653,7 @@ __all__ = [
     "AuditEvent",
     "AuditLogger",
     "AuditQuery",
+    "BufferedAuditLogger",
     "InMemoryAuditLogger",
     "audit_log",
     # Feature Flags
@@ -481,6 +700,7 @@ __all__ = [
     "QueryHandler",
     "QueryBus",
     "Mediator",
+    "PublishMode",
     "PipelineBehavior",
     "LoggingBehavior",
     "TimingBehavior",
@@ -0,0 +1,64 @@
+"""Lazy attribute loading for package ``__init__`` modules (PEP 562).
+
+Package ``__init__`` modules re-export names from their submodules. With
+plain imports, ``import shared.exceptions`` would also execute every
+import in ``shared/__init__.py`` and pull in SQLAlchemy, redis, pydantic
+and structlog. Instead, each ``__init__`` declares an export map and
+:func:`attach` returns the module-level ``__getattr__`` and ``__dir__``
+that import a submodule the first time one of its names is used.
+
+The same imports are kept in an ``if TYPE_CHECKING:`` block so type
+checkers and IDEs still see every re-export.
+
+Example:
+    >>> __getattr__, __dir__ = attach(
+    ...     __name__,
+    ...     {
+    ...         "NotFoundError": "shared.application.base_service",
+    ...         "ServiceValidationError": "shared.application:ValidationError",
+    ...     },
+    ... )
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def attach(
+    package_name: str,
+    exports: Mapping[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a lazily loaded package.
+
+    Args:
+        package_name: ``__name__`` of the package.
+        exports: Map of exported name to the module defining it. Use
+            ``"module:attribute"`` when the name is re-exported under an
+            alias.
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}") from None
+        module_name, _, attribute = target.partition(":")
+        value = getattr(importlib.import_module(module_name), attribute or name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = ["attach"]
@@ -7,17 +7,38 @@ This module provides base service patterns for the application layer:
 - CRUDService: Combined read/write service
 """
 
-from shared.application.base_service import (
-    BaseReadService,
-    BaseService,
-    BaseWriteService,
-    ConflictError,
-    CRUDService,
-    NotFoundError,
-    PaginatedResult,
-    ServiceContext,
-    ServiceError,
-    ValidationError,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.application.base_service import (
+        BaseReadService,
+        BaseService,
+        BaseWriteService,
+        ConflictError,
+        CRUDService,
+        NotFoundError,
+        PaginatedResult,
+        ServiceContext,
+        ServiceError,
+        ValidationError,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "BaseReadService": "shared.application.base_service",
+        "BaseService": "shared.application.base_service",
+        "BaseWriteService": "shared.application.base_service",
+        "ConflictError": "shared.application.base_service",
+        "CRUDService": "shared.application.base_service",
+        "NotFoundError": "shared.application.base_service",
+        "PaginatedResult": "shared.application.base_service",
+        "ServiceContext": "shared.application.base_service",
+        "ServiceError": "shared.application.base_service",
+        "ValidationError": "shared.application.base_service",
+    },
 )
 
 __all__ = [
@@ -284,6 +284,71 @@ class BaseReadService(BaseService[T, ID]):
         """
         return await self.get_by_id(id, context=context) is not None
 
+    async def list(
+        self,
+        *,
+        page: int = 1,
+        size: int = 20,
+        filters: list[Any] | None = None,
+        order_by: list[Any] | None = None,
+        cursor: str | None = None,
+        keyset: bool = False,
+        approximate_total: bool = False,
+        context: ServiceContext | None = None,
+    ) -> PageResponse[T]:
+        """List entities with pagination, filtering and ordering.
+
+        Default implementation delegates to the repository's
+        ``find_paginated`` (InMemoryRepository) or ``paginate``
+        (AsyncCRUDRepository).  Passing ``cursor`` or ``keyset=True``
+        switches to ``paginate_keyset`` where the repository has it.
+        Override for custom behaviour.
+
+        Args:
+            page: Page number (1-based), ignored for keyset paging.
+            size: Items per page.
+            filters: Optional list of ``Filter`` instances.
+            order_by: Optional list of ``OrderBy`` instances.
+            cursor: ``next_cursor`` of the previous keyset page.
+            keyset: Start keyset paging without a cursor.
+            approximate_total: Report an estimated total on keyset pages.
+            context: Service context.
+
+        Returns:
+            Paginated response containing items and metadata.
+        """
+        from shared.dbs.repository import PageRequest
+
+        repo = self._repository  # type: ignore[attr-defined]
+        page_request = PageRequest(page=page, size=size, cursor=cursor, keyset=keyset)
+
+        if page_request.is_keyset and hasattr(repo, "paginate_keyset"):
+            return await repo.paginate_keyset(
+                page_request.cursor,
+                order_by,
+                size,
+                filters,
+                approximate_total=approximate_total,
+            )
+
+        # Support both InMemoryRepository.find_paginated and
+        # AsyncCRUDRepository.paginate
+        if hasattr(repo, "paginate"):
+            return await repo.paginate(page_request, filters=filters, order_by=order_by)
+        if hasattr(repo, "find_paginated"):
+            return await repo.find_paginated(page_request, filters=filters, order_by=order_by)
+
+        # Fallback: manual pagination from get_all
+        all_items = await repo.get_all()
+        start = page_request.offset
+        end = start + size
+        return PageResponse(
+            items=all_items[start:end],
+            total=len(all_items),
+            page=page,
+            size=size,
+        )
+
 
 class BaseWriteService(BaseService[T, ID]):
     """Base service for write operations.
@@ -499,54 +564,6 @@ class CRUDService(BaseReadService[T, ID], BaseWriteService[T, ID]):
         """
         ...
 
-    async def list(
-        self,
-        *,
-        page: int = 1,
-        size: int = 20,
-        filters: list[Any] | None = None,
-        order_by: list[Any] | None = None,
-        context: ServiceContext | None = None,
-    ) -> PageResponse[T]:
-        """List entities with pagination, filtering and ordering.
-
-        Default implementation delegates to the repository's
-        ``find_paginated`` (InMemoryRepository) or ``paginate``
-        (AsyncCRUDRepository).  Override for custom behaviour.
-
-        Args:
-            page: Page number (1-based).
-            size: Items per page.
-            filters: Optional list of ``Filter`` instances.
-            order_by: Optional list of ``OrderBy`` instances.
-            context: Service context.
-
-        Returns:
-            Paginated response containing items and metadata.
-        """
-        from shared.dbs.repository import PageRequest
-
-        repo = self._repository  # type: ignore[attr-defined]
-        page_request = PageRequest(page=page, size=size)
-
-        # Support both InMemoryRepository.find_paginated and
-        # AsyncCRUDRepository.paginate
-        if hasattr(repo, "paginate"):
-            return await repo.paginate(page_request, filters=filters, order_by=order_by)
-        if hasattr(repo, "find_paginated"):
-            return await repo.find_paginated(page_request, filters=filters, order_by=order_by)
-
-        # Fallback: manual pagination from get_all
-        all_items = await repo.get_all()
-        start = page_request.offset
-        end = start + size
-        return PageResponse(
-            items=all_items[start:end],
-            total=len(all_items),
-            page=page,
-            size=size,
-        )
-
     async def search(
         self,
         *,
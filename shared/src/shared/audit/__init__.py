@@ -9,6 +9,7 @@ Components:
 - :class:`AuditAction` — standard action verbs
 - :class:`AuditLogger` — protocol for writing audit events
 - :class:`InMemoryAuditLogger` — test / development implementation
+- :class:`BufferedAuditLogger` — queues events and flushes them in batches
 - :func:`audit_log` — decorator for automatic audit logging
 
 Example:
@@ -26,20 +27,48 @@ Example:
 
 from __future__ import annotations
 
-from shared.audit.base import (
-    AuditAction,
-    AuditEvent,
-    AuditLogger,
-    AuditQuery,
-    InMemoryAuditLogger,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.audit.base import (
+        AuditAction,
+        AuditEvent,
+        AuditLogger,
+        AuditQuery,
+        InMemoryAuditLogger,
+    )
+    from shared.audit.buffered import (
+        BufferedAuditLogger,
+        BufferedAuditLoggerStats,
+        OverflowPolicy,
+    )
+    from shared.audit.decorator import audit_log
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AuditAction": "shared.audit.base",
+        "AuditEvent": "shared.audit.base",
+        "AuditLogger": "shared.audit.base",
+        "AuditQuery": "shared.audit.base",
+        "InMemoryAuditLogger": "shared.audit.base",
+        "BufferedAuditLogger": "shared.audit.buffered",
+        "BufferedAuditLoggerStats": "shared.audit.buffered",
+        "OverflowPolicy": "shared.audit.buffered",
+        "audit_log": "shared.audit.decorator",
+    },
 )
-from shared.audit.decorator import audit_log
 
 __all__ = [
     "AuditAction",
     "AuditEvent",
     "AuditLogger",
     "AuditQuery",
+    "BufferedAuditLogger",
+    "BufferedAuditLoggerStats",
     "InMemoryAuditLogger",
+    "OverflowPolicy",
     "audit_log",
 ]
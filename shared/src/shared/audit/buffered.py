@@ -0,0 +1,357 @@
+"""Buffered audit logger with background batch flushing.
+
+``audit_log`` awaits ``AuditLogger.log`` after every audited call, so a
+slow audit sink (database, broker, HTTP collector) adds its latency to
+every business request. :class:`BufferedAuditLogger` wraps any
+:class:`~shared.audit.base.AuditLogger`: ``log`` only appends to a bounded
+in-memory queue, and a background task writes the queue to the wrapped
+logger with ``log_many`` whenever ``batch_size`` events are waiting or
+``flush_interval`` seconds have passed.
+
+When the queue is full the :class:`OverflowPolicy` decides what happens:
+
+- ``BLOCK`` makes producers wait for the flusher (no loss, backpressure).
+- ``DROP_OLDEST`` discards the oldest queued event (bounded latency).
+- ``SPILL`` appends the event as a JSON line to ``spill_path`` so it can
+  be replayed later (no loss, no backpressure).
+
+Batches the wrapped logger fails to write are spilled when ``spill_path``
+is set and dropped otherwise; both are logged and counted. Spill file
+errors are never raised to the caller of ``log``: the events are logged
+and counted as dropped, so a full or read-only disk cannot fail the
+business request being audited. Queue depth,
+flushed, dropped and spilled events are exported through the shared
+metrics backend, labelled with ``name``.
+
+Example:
+    >>> buffered = BufferedAuditLogger(DatabaseAuditLogger(db), batch_size=200)
+    >>> buffered.attach(lifespan)  # start on startup, drain on shutdown
+    >>> await buffered.log(event)  # returns as soon as the event is queued
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import enum
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from shared.audit.base import AuditEvent, AuditLogger, AuditQuery
+from shared.observability.prometheus_bridge import get_metrics_backend
+
+if TYPE_CHECKING:
+    from shared.fastapi_utils.lifespan import LifespanManager
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, enum.Enum):
+    """What ``BufferedAuditLogger.log`` does when the queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SPILL = "spill"
+
+
+@dataclass(frozen=True, slots=True)
+class BufferedAuditLoggerStats:
+    """Point-in-time snapshot of a buffered audit logger."""
+
+    queue_depth: int
+    max_queue: int
+    flushed: int
+    dropped: int
+    spilled: int
+    failed_flushes: int
+
+
+class BufferedAuditLogger:
+    """Queue audit events in memory and write them to a sink in batches.
+
+    Until :meth:`start` is called (and again after :meth:`stop`), events
+    are written straight through to the wrapped logger, so an unstarted
+    buffer behaves like the logger it wraps.
+    """
+
+    def __init__(
+        self,
+        sink: AuditLogger,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        spill_path: str | Path | None = None,
+        name: str = "default",
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            sink: Audit logger the batches are written to.
+            max_queue: Events allowed to wait for a flush.
+            batch_size: Events per ``log_many`` call; reaching it triggers a flush.
+            flush_interval: Seconds after which queued events are flushed
+                even if fewer than ``batch_size`` are waiting.
+            overflow: Policy applied when the queue is full.
+            spill_path: JSON-lines file for spilled events. Required by
+                ``OverflowPolicy.SPILL``; with other policies it receives
+                batches the sink failed to write.
+            name: Buffer name used as the metrics label.
+
+        Raises:
+            ValueError: If a size or interval is not positive, or ``SPILL``
+                is selected without ``spill_path``.
+        """
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        overflow = OverflowPolicy(overflow)
+        if overflow is OverflowPolicy.SPILL and spill_path is None:
+            raise ValueError("OverflowPolicy.SPILL requires spill_path")
+
+        self._sink = sink
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow = overflow
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._name = name
+
+        self._queue: deque[AuditEvent] = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._spill_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+        self._flushed = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._failed_flushes = 0
+
+        backend = get_metrics_backend()
+        self._depth_gauge = backend.gauge(
+            "audit_buffer_queue_depth",
+            "Audit events waiting to be flushed",
+            ["buffer"],
+        ).labels(buffer=name)
+        self._flushed_counter = backend.counter(
+            "audit_buffer_flushed_total",
+            "Audit events written to the sink",
+            ["buffer"],
+        ).labels(buffer=name)
+        self._dropped_counter = backend.counter(
+            "audit_buffer_dropped_total",
+            "Audit events discarded on overflow or sink failure",
+            ["buffer"],
+        ).labels(buffer=name)
+        self._spilled_counter = backend.counter(
+            "audit_buffer_spilled_total",
+            "Audit events written to the spill file",
+            ["buffer"],
+        ).labels(buffer=name)
+        self._flush_histogram = backend.histogram(
+            "audit_buffer_flush_duration_seconds",
+            "Time spent writing one batch to the sink",
+            ["buffer"],
+        ).labels(buffer=name)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flusher is active."""
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def stats(self) -> BufferedAuditLoggerStats:
+        """Return a snapshot of the buffer state."""
+        return BufferedAuditLoggerStats(
+            queue_depth=len(self._queue),
+            max_queue=self._max_queue,
+            flushed=self._flushed,
+            dropped=self._dropped,
+            spilled=self._spilled,
+            failed_flushes=self._failed_flushes,
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name=f"audit-buffer:{self._name}")
+
+    async def stop(self, timeout: float | None = 30.0) -> None:
+        """Stop accepting buffered writes and drain the queue.
+
+        Args:
+            timeout: Seconds to wait for the drain; events still queued
+                afterwards are spilled (if configured) or dropped.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        self._ready.set()
+        # Wake producers blocked on a full queue; they now write through
+        self._space.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            remaining = list(self._queue)
+            self._queue.clear()
+            self._depth_gauge.set(0)
+            logger.error(
+                "Audit buffer '%s' did not drain within %.1fs; %d events left",
+                self._name,
+                timeout,
+                len(remaining),
+            )
+            await self._discard(remaining)
+        finally:
+            self._task = None
+
+    def attach(self, lifespan: LifespanManager) -> None:
+        """Start with the application and drain on shutdown.
+
+        Args:
+            lifespan: Lifespan manager of the application.
+        """
+        lifespan.add_startup_handler(self.start)
+        lifespan.add_shutdown_handler(self.stop)
+
+    # ------------------------------------------------------------------
+    # AuditLogger protocol
+    # ------------------------------------------------------------------
+
+    async def log(self, event: AuditEvent) -> None:
+        """Queue an event for the next flush."""
+        if not self.running:
+            await self._sink.log(event)
+            return
+
+        while len(self._queue) >= self._max_queue:
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self._dropped += 1
+                self._dropped_counter.inc()
+            elif self._overflow is OverflowPolicy.SPILL:
+                await self._spill([event])
+                return
+            else:
+                self._ready.set()
+                self._space.clear()
+                await self._space.wait()
+                if not self.running:
+                    await self._sink.log(event)
+                    return
+
+        self._queue.append(event)
+        self._depth_gauge.set(len(self._queue))
+        if len(self._queue) >= self._batch_size:
+            self._ready.set()
+
+    async def log_many(self, events: list[AuditEvent]) -> None:
+        """Queue several events for the next flush."""
+        if not self.running:
+            await self._sink.log_many(events)
+            return
+        for event in events:
+            await self.log(event)
+
+    async def query(self, query: AuditQuery) -> list[AuditEvent]:
+        """Flush queued events, then query the wrapped logger."""
+        await self.flush()
+        return await self._sink.query(query)
+
+    async def flush(self) -> None:
+        """Write every queued event to the sink now."""
+        async with self._flush_lock:
+            while self._queue:
+                count = min(self._batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._depth_gauge.set(len(self._queue))
+                self._space.set()
+                await self._write(batch)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """Flush on size or time until stopped, then drain."""
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._ready.wait(), self._flush_interval)
+            self._ready.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # Keep the flusher alive; the next round retries what is queued
+                logger.exception("Audit buffer '%s' flush failed", self._name)
+        await self.flush()
+
+    async def _write(self, batch: list[AuditEvent]) -> None:
+        started = time.perf_counter()
+        try:
+            await self._sink.log_many(batch)
+        except Exception:
+            self._failed_flushes += 1
+            logger.exception("Audit buffer '%s' failed to write %d events", self._name, len(batch))
+            await self._discard(batch)
+            return
+        self._flush_histogram.observe(time.perf_counter() - started)
+        self._flushed += len(batch)
+        self._flushed_counter.inc(len(batch))
+
+    async def _discard(self, events: list[AuditEvent]) -> None:
+        """Spill events that cannot be written, or drop them."""
+        if not events:
+            return
+        if self._spill_path is not None:
+            await self._spill(events)
+            return
+        self._drop(events)
+
+    async def _spill(self, events: list[AuditEvent]) -> None:
+        """Append events to the spill file, dropping them if it cannot be written."""
+        assert self._spill_path is not None
+        lines = "".join(json.dumps(e.to_dict(), default=str) + "\n" for e in events)
+        try:
+            async with self._spill_lock:
+                await asyncio.to_thread(self._append, self._spill_path, lines)
+        except OSError:
+            logger.exception(
+                "Audit buffer '%s' failed to spill %d events to %s",
+                self._name,
+                len(events),
+                self._spill_path,
+            )
+            self._drop(events)
+            return
+        self._spilled += len(events)
+        self._spilled_counter.inc(len(events))
+
+    def _drop(self, events: list[AuditEvent]) -> None:
+        self._dropped += len(events)
+        self._dropped_counter.inc(len(events))
+
+    @staticmethod
+    def _append(path: Path, lines: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+__all__ = ["BufferedAuditLogger", "BufferedAuditLoggerStats", "OverflowPolicy"]
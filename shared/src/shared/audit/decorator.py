@@ -1,7 +1,9 @@
 """Decorator for automatic audit logging of service methods.
 
 Apply ``@audit_log`` to any async method that should emit an
-:class:`AuditEvent` automatically.
+:class:`AuditEvent` automatically. The event is written inline; give the
+service a :class:`~shared.audit.buffered.BufferedAuditLogger` to keep
+audit sink latency off the request path.
 
 Example:
     >>> from shared.audit import audit_log, AuditAction
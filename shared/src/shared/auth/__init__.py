@@ -3,7 +3,8 @@
 This module provides enterprise-grade authentication services:
 
 - **JWT Management**: Token creation, verification, and validation
-- **Password Hashing**: Argon2-based secure password handling
+- **Password Hashing**: Argon2-based secure password handling, offloaded
+  to a bounded worker pool in async code
 - **API Keys**: Generation and validation for service authentication
 
 Example:
@@ -37,22 +38,54 @@ Security Best Practices:
     - Use unique prefixes for different API key types
 """
 
-from shared.auth.api_key import (
-    APIKeyData,
-    APIKeyService,
-    InvalidAPIKeyError,
-)
-from shared.auth.jwt import (
-    ExpiredTokenError,
-    InvalidTokenError,
-    JWTService,
-    TokenData,
-    TokenType,
-)
-from shared.auth.password import (
-    PasswordService,
-    PasswordStrengthError,
-    check_password_strength,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.auth.api_key import (
+        APIKeyData,
+        APIKeyService,
+        InvalidAPIKeyError,
+    )
+    from shared.auth.hashing_pool import (
+        HashingPool,
+        HashingPoolSaturatedError,
+        HashingPoolStats,
+        get_hashing_pool,
+    )
+    from shared.auth.jwt import (
+        ExpiredTokenError,
+        InvalidTokenError,
+        JWTService,
+        TokenData,
+        TokenType,
+    )
+    from shared.auth.password import (
+        PasswordService,
+        PasswordStrengthError,
+        check_password_strength,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "APIKeyData": "shared.auth.api_key",
+        "APIKeyService": "shared.auth.api_key",
+        "InvalidAPIKeyError": "shared.auth.api_key",
+        "HashingPool": "shared.auth.hashing_pool",
+        "HashingPoolSaturatedError": "shared.auth.hashing_pool",
+        "HashingPoolStats": "shared.auth.hashing_pool",
+        "get_hashing_pool": "shared.auth.hashing_pool",
+        "ExpiredTokenError": "shared.auth.jwt",
+        "InvalidTokenError": "shared.auth.jwt",
+        "JWTService": "shared.auth.jwt",
+        "TokenData": "shared.auth.jwt",
+        "TokenType": "shared.auth.jwt",
+        "PasswordService": "shared.auth.password",
+        "PasswordStrengthError": "shared.auth.password",
+        "check_password_strength": "shared.auth.password",
+    },
 )
 
 __all__ = [
@@ -66,6 +99,11 @@ __all__ = [
     "PasswordService",
     "PasswordStrengthError",
     "check_password_strength",
+    # Hashing pool
+    "HashingPool",
+    "HashingPoolSaturatedError",
+    "HashingPoolStats",
+    "get_hashing_pool",
     # API Key
     "APIKeyService",
     "APIKeyData",
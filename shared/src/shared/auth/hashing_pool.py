@@ -0,0 +1,239 @@
+"""Bounded worker pool for CPU-heavy password hashing.
+
+Argon2 with production parameters (64 MB, time_cost=3) takes tens of
+milliseconds per call. Running it inline in an ``async`` handler blocks the
+event loop for that long and stalls every other request on the worker.
+``HashingPool`` moves the work onto a small dedicated thread pool
+(argon2-cffi and bcrypt release the GIL, so hashes run in parallel) and
+bounds how much work may queue behind it.
+
+When the queue is full, ``run`` raises ``HashingPoolSaturatedError``
+immediately instead of queueing more work; callers translate that into
+``429 Too Many Requests`` so load is shed before latency collapses.
+
+Example:
+    >>> pool = HashingPool(max_workers=4, max_queue=32)
+    >>> hashed = await pool.run(hasher.hash, "SecureP@ssw0rd!")
+    >>> pool.stats().queue_depth
+    0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import ParamSpec, TypeVar
+
+from shared.observability.prometheus_bridge import get_metrics_backend
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Queue wait is expected in the low milliseconds; the upper buckets show saturation
+_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class HashingPoolSaturatedError(RuntimeError):
+    """Raised when the hashing pool queue is full.
+
+    Attributes:
+        retry_after: Suggested number of seconds before retrying.
+    """
+
+    def __init__(self, message: str, retry_after: int = 1) -> None:
+        """Initialize saturation error.
+
+        Args:
+            message: Description of the error.
+            retry_after: Suggested number of seconds before retrying.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class HashingPoolStats:
+    """Point-in-time snapshot of a hashing pool."""
+
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+
+
+class HashingPool:
+    """Bounded thread pool with admission control for password hashing.
+
+    At most ``max_workers`` hashes run concurrently and at most ``max_queue``
+    more wait for a worker. Queue depth, queue wait time and rejections are
+    exported through the shared metrics backend, labelled with ``name``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+        *,
+        name: str = "default",
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Concurrent hashing threads (default: CPU count, at most 4).
+            max_queue: Calls allowed to wait for a thread (default: 8 per worker).
+            name: Pool name used as the metrics label.
+
+        Raises:
+            ValueError: If ``max_workers`` < 1 or ``max_queue`` < 0.
+        """
+        workers = max_workers if max_workers is not None else min(4, os.cpu_count() or 1)
+        queue = max_queue if max_queue is not None else workers * 8
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self._max_workers = workers
+        self._max_queue = queue
+        self._name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix=f"hashing-{name}",
+        )
+        self._lock = Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+
+        backend = get_metrics_backend()
+        self._queue_gauge = backend.gauge(
+            "password_hash_queue_depth",
+            "Password hashing calls waiting for a worker",
+            ["pool"],
+        ).labels(pool=name)
+        self._wait_histogram = backend.histogram(
+            "password_hash_queue_wait_seconds",
+            "Time password hashing calls wait for a worker",
+            ["pool"],
+            buckets=_WAIT_BUCKETS,
+        ).labels(pool=name)
+        self._duration_histogram = backend.histogram(
+            "password_hash_duration_seconds",
+            "Time spent hashing or verifying a password",
+            ["pool"],
+        ).labels(pool=name)
+        self._rejected_counter = backend.counter(
+            "password_hash_rejected_total",
+            "Password hashing calls rejected because the queue was full",
+            ["pool"],
+        ).labels(pool=name)
+
+    @property
+    def saturated(self) -> bool:
+        """Whether a new call would be rejected right now."""
+        return self._pending >= self._max_workers + self._max_queue
+
+    def stats(self) -> HashingPoolStats:
+        """Return a snapshot of the pool state."""
+        with self._lock:
+            return HashingPoolStats(
+                max_workers=self._max_workers,
+                max_queue=self._max_queue,
+                in_flight=self._running,
+                queue_depth=self._pending - self._running,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run ``func`` on a pool thread without blocking the event loop.
+
+        Args:
+            func: CPU-bound callable (e.g. ``PasswordHasher.hash``).
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            The return value of ``func``.
+
+        Raises:
+            HashingPoolSaturatedError: If the queue is full.
+        """
+        with self._lock:
+            if self._pending >= self._max_workers + self._max_queue:
+                self._rejected += 1
+                self._rejected_counter.inc()
+                raise HashingPoolSaturatedError(
+                    f"Password hashing pool '{self._name}' is saturated"
+                )
+            self._pending += 1
+            self._queue_gauge.set(self._pending - self._running)
+
+        submitted_at = time.perf_counter()
+        future: Future[T] = self._executor.submit(self._call, submitted_at, func, *args, **kwargs)
+        # Release the slot when the thread finishes, not when the caller stops
+        # waiting, so a cancelled request never under-counts queued work
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _call(
+        self,
+        submitted_at: float,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        started_at = time.perf_counter()
+        self._wait_histogram.observe(started_at - submitted_at)
+        with self._lock:
+            self._running += 1
+            self._queue_gauge.set(self._pending - self._running)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._duration_histogram.observe(time.perf_counter() - started_at)
+
+    def _release(self, future: Future[object]) -> None:
+        with self._lock:
+            self._pending -= 1
+            # A call cancelled before it started never incremented _running
+            if not future.cancelled():
+                self._running -= 1
+            self._completed += 1
+            self._queue_gauge.set(self._pending - self._running)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker threads.
+
+        Args:
+            wait: Block until running calls finish.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Module-level default pool - created lazily on first use
+_default_pool: HashingPool | None = None
+
+
+def get_hashing_pool() -> HashingPool:
+    """Get the process-wide default hashing pool."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = HashingPool()
+    return _default_pool
+
+
+__all__ = [
+    "HashingPool",
+    "HashingPoolSaturatedError",
+    "HashingPoolStats",
+    "get_hashing_pool",
+]
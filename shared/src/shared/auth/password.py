@@ -11,6 +11,10 @@ Example:
     True
     >>> check_password_strength("SecureP@ssw0rd!")
     True
+
+In async code use ``hash_async``/``verify_async``, which run Argon2 on a
+bounded ``HashingPool`` instead of blocking the event loop:
+    >>> hashed = await service.hash_async("SecureP@ssw0rd!")
 """
 
 from __future__ import annotations
@@ -20,6 +24,8 @@ import re
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerifyMismatchError
 
+from shared.auth.hashing_pool import HashingPool, get_hashing_pool
+
 
 class PasswordStrengthError(ValueError):
     """Raised when password does not meet strength requirements.
@@ -74,6 +80,7 @@ class PasswordService:
         parallelism: int = 4,
         hash_len: int = 32,
         salt_len: int = 16,
+        pool: HashingPool | None = None,
     ) -> None:
         """Initialize password service with Argon2 parameters.
 
@@ -83,7 +90,9 @@ class PasswordService:
             parallelism: Number of parallel threads.
             hash_len: Length of the hash in bytes.
             salt_len: Length of the salt in bytes.
+            pool: Worker pool for the async variants (process-wide default if omitted).
         """
+        self._pool = pool
         self._hasher = PasswordHasher(
             time_cost=time_cost,
             memory_cost=memory_cost,
@@ -131,6 +140,42 @@ class PasswordService:
         except (VerifyMismatchError, InvalidHashError):
             return False
 
+    @property
+    def pool(self) -> HashingPool:
+        """Worker pool used by the async variants."""
+        if self._pool is None:
+            self._pool = get_hashing_pool()
+        return self._pool
+
+    async def hash_async(self, password: str) -> str:
+        """Hash a password on the worker pool.
+
+        Args:
+            password: The plain text password.
+
+        Returns:
+            The hashed password string.
+
+        Raises:
+            HashingPoolSaturatedError: If the pool queue is full.
+        """
+        return await self.pool.run(self.hash, password)
+
+    async def verify_async(self, password: str, hashed: str) -> bool:
+        """Verify a password against a hash on the worker pool.
+
+        Args:
+            password: The plain text password to verify.
+            hashed: The hashed password to check against.
+
+        Returns:
+            True if the password matches, False otherwise.
+
+        Raises:
+            HashingPoolSaturatedError: If the pool queue is full.
+        """
+        return await self.pool.run(self.verify, password, hashed)
+
     def needs_rehash(self, hashed: str) -> bool:
         """Check if a hash needs to be rehashed.
 
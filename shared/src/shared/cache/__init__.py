@@ -39,60 +39,100 @@ Legacy Support:
     are still available for backward compatibility.
 """
 
-# Core abstractions
-# Backends
-from shared.cache.backends import (
-    MemoryCache,
-    NullCache,
-    RedisCache,
-)
-from shared.cache.backends.redis import RedisConfig as RedisCacheConfig
-from shared.cache.base import (
-    AbstractCacheBackend,
-    CacheBackend,
-    CacheConnectionError,
-    CacheError,
-    CacheSerializationError,
-    JsonSerializer,
-    NullSerializer,
-    PickleSerializer,
-    Serializer,
-)
+from typing import TYPE_CHECKING
 
-# Decorators
-from shared.cache.decorators import (
-    build_cache_key,
-    cache_aside,
-    cached,
-    cached_method,
-    invalidate_cache,
-)
+from shared._lazy import attach
 
-# Lock
-from shared.cache.lock import (
-    DistributedLock,
-    LockAcquisitionError,
-    LockConfig,
-    LockReleaseError,
-)
+if TYPE_CHECKING:
+    # Core abstractions
+    # Backends
+    from shared.cache.backends import (
+        MemoryCache,
+        NullCache,
+        RedisCache,
+    )
+    from shared.cache.backends.redis import RedisConfig as RedisCacheConfig
+    from shared.cache.base import (
+        AbstractCacheBackend,
+        CacheBackend,
+        CacheConnectionError,
+        CacheError,
+        CacheSerializationError,
+        JsonSerializer,
+        NullSerializer,
+        PickleSerializer,
+        Serializer,
+    )
 
-# Manager
-from shared.cache.manager import (
-    CacheConfig,
-    TieredCacheManager,
-    create_cache,
-)
+    # Decorators
+    from shared.cache.decorators import (
+        build_cache_key,
+        cache_aside,
+        cached,
+        cached_method,
+        invalidate_cache,
+    )
 
-# Legacy support - keep for backward compatibility
-from shared.cache.redis_client import (
-    AsyncRedisClient,
-    RedisConfig,
-)
-from shared.cache.redis_client import (
-    CacheError as LegacyCacheError,
-)
-from shared.cache.redis_client import (
-    RedisConnectionError as LegacyConnectionError,
+    # Lock
+    from shared.cache.lock import (
+        DistributedLock,
+        LockAcquisitionError,
+        LockConfig,
+        LockReleaseError,
+    )
+
+    # Manager
+    from shared.cache.manager import (
+        CacheConfig,
+        TieredCacheManager,
+        create_cache,
+    )
+
+    # Legacy support - keep for backward compatibility
+    from shared.cache.redis_client import (
+        AsyncRedisClient,
+        RedisConfig,
+    )
+    from shared.cache.redis_client import (
+        CacheError as LegacyCacheError,
+    )
+    from shared.cache.redis_client import (
+        RedisConnectionError as LegacyConnectionError,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "MemoryCache": "shared.cache.backends",
+        "NullCache": "shared.cache.backends",
+        "RedisCache": "shared.cache.backends",
+        "RedisCacheConfig": "shared.cache.backends.redis:RedisConfig",
+        "AbstractCacheBackend": "shared.cache.base",
+        "CacheBackend": "shared.cache.base",
+        "CacheConnectionError": "shared.cache.base",
+        "CacheError": "shared.cache.base",
+        "CacheSerializationError": "shared.cache.base",
+        "JsonSerializer": "shared.cache.base",
+        "NullSerializer": "shared.cache.base",
+        "PickleSerializer": "shared.cache.base",
+        "Serializer": "shared.cache.base",
+        "build_cache_key": "shared.cache.decorators",
+        "cache_aside": "shared.cache.decorators",
+        "cached": "shared.cache.decorators",
+        "cached_method": "shared.cache.decorators",
+        "invalidate_cache": "shared.cache.decorators",
+        "DistributedLock": "shared.cache.lock",
+        "LockAcquisitionError": "shared.cache.lock",
+        "LockConfig": "shared.cache.lock",
+        "LockReleaseError": "shared.cache.lock",
+        "CacheConfig": "shared.cache.manager",
+        "TieredCacheManager": "shared.cache.manager",
+        "create_cache": "shared.cache.manager",
+        "AsyncRedisClient": "shared.cache.redis_client",
+        "RedisConfig": "shared.cache.redis_client",
+        "LegacyCacheError": "shared.cache.redis_client:CacheError",
+        "LegacyConnectionError": "shared.cache.redis_client:RedisConnectionError",
+    },
 )
 
 __all__ = [
@@ -15,49 +15,98 @@ Example:
 
 from __future__ import annotations
 
-from shared.config.app import AppSettings, PaginationSettings
-from shared.config.auth import AuthSettings
-from shared.config.base import (
-    BaseServiceSettings,
-    SettingsError,
-    clear_settings_cache,
-    get_settings,
-)
-from shared.config.caching import (
-    CacheBackend,
-    CacheBackendType,
-    CacheClusterSettings,
-    CacheStrategy,
-    CacheWarmingSettings,
-    CachingSettings,
-    DatabaseCacheSettings,
-    MemcachedCacheSettings,
-    MemoryCacheSettings,
-    RedisCacheSettings,
-)
-from shared.config.database import DatabaseSettings, DatabaseType
-from shared.config.logging import (
-    ConsoleLoggingSettings,
-    ElasticsearchLoggingSettings,
-    FileLoggingSettings,
-    LogFormat,
-    LoggingSettings,
-    LogLevel,
-    OpenTelemetrySettings,
-    RequestLoggingSettings,
-    SentrySettings,
-)
-from shared.config.redis import RedisSettings
-from shared.config.security import (
-    CookieSettings,
-    CORSSettings,
-    CryptoSettings,
-    RateLimitSettings,
-    SameSitePolicy,
-    SecurityHeadersSettings,
-    SecuritySettings,
-    SessionSettings,
-    TLSSettings,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.config.app import AppSettings, PaginationSettings
+    from shared.config.auth import AuthSettings
+    from shared.config.base import (
+        BaseServiceSettings,
+        SettingsError,
+        clear_settings_cache,
+        get_settings,
+    )
+    from shared.config.caching import (
+        CacheBackend,
+        CacheBackendType,
+        CacheClusterSettings,
+        CacheStrategy,
+        CacheWarmingSettings,
+        CachingSettings,
+        DatabaseCacheSettings,
+        MemcachedCacheSettings,
+        MemoryCacheSettings,
+        RedisCacheSettings,
+    )
+    from shared.config.database import DatabaseSettings, DatabaseType
+    from shared.config.logging import (
+        ConsoleLoggingSettings,
+        ElasticsearchLoggingSettings,
+        FileLoggingSettings,
+        LogFormat,
+        LoggingSettings,
+        LogLevel,
+        OpenTelemetrySettings,
+        RequestLoggingSettings,
+        SentrySettings,
+    )
+    from shared.config.redis import RedisSettings
+    from shared.config.security import (
+        CookieSettings,
+        CORSSettings,
+        CryptoSettings,
+        RateLimitSettings,
+        SameSitePolicy,
+        SecurityHeadersSettings,
+        SecuritySettings,
+        SessionSettings,
+        TLSSettings,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AppSettings": "shared.config.app",
+        "PaginationSettings": "shared.config.app",
+        "AuthSettings": "shared.config.auth",
+        "BaseServiceSettings": "shared.config.base",
+        "SettingsError": "shared.config.base",
+        "clear_settings_cache": "shared.config.base",
+        "get_settings": "shared.config.base",
+        "CacheBackend": "shared.config.caching",
+        "CacheBackendType": "shared.config.caching",
+        "CacheClusterSettings": "shared.config.caching",
+        "CacheStrategy": "shared.config.caching",
+        "CacheWarmingSettings": "shared.config.caching",
+        "CachingSettings": "shared.config.caching",
+        "DatabaseCacheSettings": "shared.config.caching",
+        "MemcachedCacheSettings": "shared.config.caching",
+        "MemoryCacheSettings": "shared.config.caching",
+        "RedisCacheSettings": "shared.config.caching",
+        "DatabaseSettings": "shared.config.database",
+        "DatabaseType": "shared.config.database",
+        "ConsoleLoggingSettings": "shared.config.logging",
+        "ElasticsearchLoggingSettings": "shared.config.logging",
+        "FileLoggingSettings": "shared.config.logging",
+        "LogFormat": "shared.config.logging",
+        "LoggingSettings": "shared.config.logging",
+        "LogLevel": "shared.config.logging",
+        "OpenTelemetrySettings": "shared.config.logging",
+        "RequestLoggingSettings": "shared.config.logging",
+        "SentrySettings": "shared.config.logging",
+        "RedisSettings": "shared.config.redis",
+        "CookieSettings": "shared.config.security",
+        "CORSSettings": "shared.config.security",
+        "CryptoSettings": "shared.config.security",
+        "RateLimitSettings": "shared.config.security",
+        "SameSitePolicy": "shared.config.security",
+        "SecurityHeadersSettings": "shared.config.security",
+        "SecuritySettings": "shared.config.security",
+        "SessionSettings": "shared.config.security",
+        "TLSSettings": "shared.config.security",
+    },
 )
 
 __all__ = [
@@ -14,9 +14,23 @@ Usage:
     ...     print("Valid email")
 """
 
-from shared.constants.environments import Environment
-from shared.constants.http_status import HTTPStatus
-from shared.constants.patterns import Patterns
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.constants.environments import Environment
+    from shared.constants.http_status import HTTPStatus
+    from shared.constants.patterns import Patterns
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Environment": "shared.constants.environments",
+        "HTTPStatus": "shared.constants.http_status",
+        "Patterns": "shared.constants.patterns",
+    },
+)
 
 __all__ = [
     "Environment",
@@ -40,16 +40,40 @@ Quick start::
 
 from __future__ import annotations
 
-from shared.cqrs.bus import MessageBus
-from shared.cqrs.commands import Command, CommandBus, CommandHandler
-from shared.cqrs.mediator import Mediator
-from shared.cqrs.pipeline import (
-    LoggingBehavior,
-    PipelineBehavior,
-    TimingBehavior,
-    ValidationBehavior,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.cqrs.bus import MessageBus
+    from shared.cqrs.commands import Command, CommandBus, CommandHandler
+    from shared.cqrs.mediator import Mediator, PublishMode
+    from shared.cqrs.pipeline import (
+        LoggingBehavior,
+        PipelineBehavior,
+        TimingBehavior,
+        ValidationBehavior,
+    )
+    from shared.cqrs.queries import Query, QueryBus, QueryHandler
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "MessageBus": "shared.cqrs.bus",
+        "Command": "shared.cqrs.commands",
+        "CommandBus": "shared.cqrs.commands",
+        "CommandHandler": "shared.cqrs.commands",
+        "Mediator": "shared.cqrs.mediator",
+        "PublishMode": "shared.cqrs.mediator",
+        "LoggingBehavior": "shared.cqrs.pipeline",
+        "PipelineBehavior": "shared.cqrs.pipeline",
+        "TimingBehavior": "shared.cqrs.pipeline",
+        "ValidationBehavior": "shared.cqrs.pipeline",
+        "Query": "shared.cqrs.queries",
+        "QueryBus": "shared.cqrs.queries",
+        "QueryHandler": "shared.cqrs.queries",
+    },
 )
-from shared.cqrs.queries import Query, QueryBus, QueryHandler
 
 __all__ = [
     # Generic bus
@@ -64,6 +88,7 @@ __all__ = [
     "QueryBus",
     # Mediator
     "Mediator",
+    "PublishMode",
     # Pipeline behaviors
     "PipelineBehavior",
     "LoggingBehavior",
@@ -21,11 +21,21 @@ Example::
     mediator.register_event_handler(OrderPlaced, SendConfirmationEmail())
     mediator.register_event_handler(OrderPlaced, UpdateInventory())
     await mediator.publish(OrderPlaced(order_id="123"))
+
+    # Run event handlers concurrently, isolating failures
+    errors = await mediator.publish(OrderPlaced(order_id="124"), mode=PublishMode.ISOLATED)
+
+Pipelines are compiled once per request type and cached until the
+behavior list changes, so a dispatch costs one dict lookup plus the
+behaviors themselves.
 """
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from enum import Enum
 from typing import Any, TypeVar, overload
 
 from shared.cqrs.commands import Command, CommandBus, CommandHandler
@@ -38,6 +48,28 @@ C = TypeVar("C", bound=Command[Any])
 Q = TypeVar("Q", bound=Query[Any])
 E = TypeVar("E", bound=DomainEvent)
 
+logger = logging.getLogger(__name__)
+
+Pipeline = Callable[[Any], Awaitable[Any]]
+
+
+class PublishMode(str, Enum):
+    """How :meth:`Mediator.publish` runs the handlers of one event.
+
+    Attributes:
+        SEQUENTIAL: One after another; the first failure propagates and
+            skips the remaining handlers.
+        CONCURRENT: Concurrently in an :class:`asyncio.TaskGroup`; the
+            first failure cancels the others and propagates as an
+            :class:`ExceptionGroup`.
+        ISOLATED: Concurrently; every handler runs to completion, failures
+            are logged and returned instead of raised.
+    """
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+    ISOLATED = "isolated"
+
 
 class Mediator:
     """Unified dispatcher with middleware pipeline and event publishing.
@@ -48,17 +80,28 @@ class Mediator:
 
     Args:
         behaviors: Optional initial list of pipeline behaviors.
+        publish_mode: Default :class:`PublishMode` for :meth:`publish`.
+        max_concurrency: Default cap on handlers running at once per
+            event in the concurrent modes (``None`` for no cap).
     """
 
     def __init__(
         self,
         behaviors: list[PipelineBehavior] | None = None,
+        *,
+        publish_mode: PublishMode = PublishMode.SEQUENTIAL,
+        max_concurrency: int | None = None,
     ) -> None:
         self._command_bus = CommandBus()
         self._query_bus = QueryBus()
         self._behaviors: list[PipelineBehavior] = list(behaviors or [])
         self._pipeline_version: int = 0
+        # Compiled pipelines per request type, valid for _compiled_version
+        self._pipelines: dict[type[Any], Pipeline] = {}
+        self._compiled_version: int = 0
         self._event_handlers: dict[type[DomainEvent], list[DomainEventHandler[Any]]] = {}
+        self._publish_mode = PublishMode(publish_mode)
+        self._max_concurrency = max_concurrency
 
     # ------------------------------------------------------------------
     # Pipeline behaviors
@@ -153,36 +196,98 @@ class Mediator:
             KeyError: If no handler is registered.
             TypeError: If *request* is neither a Command nor a Query.
         """
+        if self._compiled_version != self._pipeline_version:
+            self._pipelines = {}
+            self._compiled_version = self._pipeline_version
+
+        pipeline = self._pipelines.get(type(request))
+        if pipeline is None:
+            pipeline = self._compile(request)
+            self._pipelines[type(request)] = pipeline
+        return await pipeline(request)
+
+    def _compile(self, request: Any) -> Pipeline:
+        """Build the behavior chain for requests of ``type(request)``.
+
+        Raises:
+            TypeError: If *request* is neither a Command nor a Query.
+        """
         if isinstance(request, Command):
-            inner: Callable[[Any], Awaitable[Any]] = self._command_bus.dispatch
+            handler: Pipeline = self._command_bus.dispatch
         elif isinstance(request, Query):
-            inner = self._query_bus.dispatch
+            handler = self._query_bus.dispatch
         else:
             raise TypeError(f"Expected Command or Query, got {type(request).__name__}")
 
         # Build the pipeline from the inside out, filtering by applies_to.
-        handler = inner
         for behavior in reversed(self._behaviors):
-            if behavior.applies_to(request):
+            if behavior.applies_per_request:
+                handler = _wrap_conditional(behavior, handler)
+            elif behavior.applies_to(request):
                 handler = _wrap(behavior, handler)
-
-        return await handler(request)
+        return handler
 
     # ------------------------------------------------------------------
     # Publish (domain events — 1:N)
     # ------------------------------------------------------------------
 
-    async def publish(self, event: DomainEvent) -> None:
+    async def publish(
+        self,
+        event: DomainEvent,
+        *,
+        mode: PublishMode | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[Exception]:
         """Publish a domain event to all registered handlers.
 
-        All handlers for the event type are called sequentially.
-
         Args:
             event: The domain event to publish.
+            mode: How to run the handlers (default: the mediator's
+                ``publish_mode``).
+            max_concurrency: Cap on handlers running at once in the
+                concurrent modes (default: the mediator's ``max_concurrency``).
+
+        Returns:
+            Exceptions raised by handlers in ``ISOLATED`` mode, in
+            registration order; always empty in the other modes.
+
+        Raises:
+            Exception: The first handler failure in ``SEQUENTIAL`` mode.
+            ExceptionGroup: Handler failures in ``CONCURRENT`` mode.
         """
-        handlers = self._event_handlers.get(type(event), [])
-        for handler in handlers:
-            await handler.handle(event)
+        handlers = tuple(self._event_handlers.get(type(event), ()))
+        mode = PublishMode(mode) if mode is not None else self._publish_mode
+        if max_concurrency is None:
+            max_concurrency = self._max_concurrency
+
+        if not handlers:
+            return []
+        if mode is PublishMode.SEQUENTIAL:
+            for handler in handlers:
+                await handler.handle(event)
+            return []
+
+        calls = _bounded([handler.handle for handler in handlers], event, max_concurrency)
+        if mode is PublishMode.CONCURRENT:
+            async with asyncio.TaskGroup() as group:
+                for call in calls:
+                    group.create_task(call)
+            return []
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        errors: list[Exception] = []
+        for handler, result in zip(handlers, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Event handler %s failed for %s",
+                    type(handler).__name__,
+                    type(event).__name__,
+                    exc_info=result,
+                )
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+        return errors
 
     # ------------------------------------------------------------------
     # Introspection / management
@@ -204,7 +309,8 @@ class Mediator:
         self._query_bus.clear()
         self._behaviors.clear()
         self._event_handlers.clear()
-        self._pipeline_version = 0
+        self._pipelines = {}
+        self._pipeline_version += 1
 
 
 # ------------------------------------------------------------------
@@ -218,7 +324,40 @@ def _wrap(
 ) -> Callable[[Any], Awaitable[Any]]:
     """Create a closure that threads *next_* through *behavior*."""
 
+    handle = behavior.handle
+
     async def _pipeline(request: Any) -> Any:
-        return await behavior.handle(request, next_)
+        return await handle(request, next_)
 
     return _pipeline
+
+
+def _wrap_conditional(behavior: PipelineBehavior, next_: Pipeline) -> Pipeline:
+    """Like :func:`_wrap`, but skip *behavior* for requests it does not apply to."""
+    handle = behavior.handle
+    applies_to = behavior.applies_to
+
+    async def _pipeline(request: Any) -> Any:
+        if applies_to(request):
+            return await handle(request, next_)
+        return await next_(request)
+
+    return _pipeline
+
+
+def _bounded(
+    calls: Sequence[Callable[[Any], Awaitable[None]]],
+    event: DomainEvent,
+    limit: int | None,
+) -> list[Awaitable[None]]:
+    """Create handler coroutines, gated by a semaphore when *limit* is set."""
+    if limit is None or limit >= len(calls):
+        return [call(event) for call in calls]
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _gated(call: Callable[[Any], Awaitable[None]]) -> None:
+        async with semaphore:
+            await call(event)
+
+    return [_gated(call) for call in calls]
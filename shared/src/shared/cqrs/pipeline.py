@@ -18,7 +18,7 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 R = TypeVar("R")
 
@@ -34,6 +34,10 @@ class PipelineBehavior(ABC):
 
     To restrict a behavior to specific request types, override
     :meth:`applies_to` (default returns ``True`` for all requests).
+    The mediator compiles one pipeline per request type, so
+    ``applies_to`` is evaluated once per type; set
+    ``applies_per_request = True`` if the decision depends on the
+    request's field values.
 
     Example::
 
@@ -47,6 +51,9 @@ class PipelineBehavior(ABC):
                 return await next_(request)
     """
 
+    #: Re-evaluate :meth:`applies_to` on every dispatch instead of once per type.
+    applies_per_request: ClassVar[bool] = False
+
     def applies_to(self, request: Any) -> bool:
         """Return ``True`` if this behavior should wrap *request*.
 
@@ -2,35 +2,73 @@
 
 This module provides enterprise patterns for database operations:
 - Repository pattern for data access abstraction
+- Secondary indexes for the in-memory repository
 - Unit of Work pattern for transaction management
 - Query building utilities
 """
 
 from __future__ import annotations
 
-from shared.dbs.repository import (
-    AbstractRepository,
-    Filter,
-    FilterOperator,
-    InMemoryRepository,
-    OrderBy,
-    OrderDirection,
-    PageRequest,
-    PageResponse,
-)
-from shared.dbs.specification import (
-    AlwaysFalse,
-    AlwaysTrue,
-    AndSpecification,
-    Attr,
-    AttributeSpec,
-    NotSpecification,
-    OrSpecification,
-    Specification,
-)
-from shared.dbs.unit_of_work import (
-    AbstractUnitOfWork,
-    InMemoryUnitOfWork,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.dbs.indexes import HashIndex, Index, SortedIndex
+    from shared.dbs.repository import (
+        AbstractRepository,
+        Filter,
+        FilterOperator,
+        InMemoryRepository,
+        OrderBy,
+        OrderDirection,
+        PageRequest,
+        PageResponse,
+        decode_cursor,
+        encode_cursor,
+    )
+    from shared.dbs.specification import (
+        AlwaysFalse,
+        AlwaysTrue,
+        AndSpecification,
+        Attr,
+        AttributeSpec,
+        NotSpecification,
+        OrSpecification,
+        Specification,
+    )
+    from shared.dbs.unit_of_work import (
+        AbstractUnitOfWork,
+        InMemoryUnitOfWork,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AbstractRepository": "shared.dbs.repository",
+        "Filter": "shared.dbs.repository",
+        "FilterOperator": "shared.dbs.repository",
+        "InMemoryRepository": "shared.dbs.repository",
+        "OrderBy": "shared.dbs.repository",
+        "OrderDirection": "shared.dbs.repository",
+        "PageRequest": "shared.dbs.repository",
+        "PageResponse": "shared.dbs.repository",
+        "decode_cursor": "shared.dbs.repository",
+        "encode_cursor": "shared.dbs.repository",
+        "HashIndex": "shared.dbs.indexes",
+        "Index": "shared.dbs.indexes",
+        "SortedIndex": "shared.dbs.indexes",
+        "AlwaysFalse": "shared.dbs.specification",
+        "AlwaysTrue": "shared.dbs.specification",
+        "AndSpecification": "shared.dbs.specification",
+        "Attr": "shared.dbs.specification",
+        "AttributeSpec": "shared.dbs.specification",
+        "NotSpecification": "shared.dbs.specification",
+        "OrSpecification": "shared.dbs.specification",
+        "Specification": "shared.dbs.specification",
+        "AbstractUnitOfWork": "shared.dbs.unit_of_work",
+        "InMemoryUnitOfWork": "shared.dbs.unit_of_work",
+    },
 )
 
 __all__ = [
@@ -43,6 +81,12 @@ __all__ = [
     "PageResponse",
     "AbstractRepository",
     "InMemoryRepository",
+    "encode_cursor",
+    "decode_cursor",
+    # Secondary indexes
+    "Index",
+    "HashIndex",
+    "SortedIndex",
     # Unit of Work
     "AbstractUnitOfWork",
     "InMemoryUnitOfWork",
@@ -0,0 +1,178 @@
+"""Secondary indexes for the in-memory repository.
+
+:class:`~shared.dbs.repository.InMemoryRepository` answers queries by
+scanning every entity. Declaring indexes on frequently filtered fields
+lets it resolve filters from the index instead:
+
+- :class:`HashIndex` maps each value to the ids holding it, so ``EQ`` and
+  ``IN`` filters cost O(1) per value.
+- :class:`SortedIndex` keeps ``(value, id)`` pairs in order, so range
+  filters cost O(log n + k) and ordering by the field needs no sort.
+
+Indexes are keyed by entity id and hold the value seen when the entity
+was last added or updated. Entities mutated in place must be passed to
+``update()`` again for the indexes to follow.
+"""
+
+from __future__ import annotations
+
+import bisect
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+from shared.dbs.repository import Filter, FilterOperator
+
+_RANGE_OPERATORS = frozenset(
+    {
+        FilterOperator.GT,
+        FilterOperator.GE,
+        FilterOperator.GTE,
+        FilterOperator.LT,
+        FilterOperator.LE,
+        FilterOperator.LTE,
+    }
+)
+
+
+class Index(ABC):
+    """Secondary index over one entity field."""
+
+    def __init__(self, field: str) -> None:
+        """Initialize the index.
+
+        Args:
+            field: Entity attribute to index.
+        """
+        self.field = field
+
+    @abstractmethod
+    def add(self, entity_id: str, value: Any) -> None:
+        """Record that ``entity_id`` holds ``value``."""
+        ...
+
+    @abstractmethod
+    def remove(self, entity_id: str, value: Any) -> None:
+        """Forget the ``value`` previously recorded for ``entity_id``."""
+        ...
+
+    @abstractmethod
+    def lookup(self, filter_spec: Filter) -> set[str] | None:
+        """Resolve a filter on this field to matching ids.
+
+        Returns:
+            Matching ids, or ``None`` if this index cannot answer the filter.
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+
+class HashIndex(Index):
+    """Value-to-ids index answering ``EQ`` and ``IN`` filters."""
+
+    def __init__(self, field: str) -> None:
+        super().__init__(field)
+        self._ids: dict[Any, set[str]] = {}
+
+    def add(self, entity_id: str, value: Any) -> None:
+        if isinstance(value, Hashable):
+            self._ids.setdefault(value, set()).add(entity_id)
+
+    def remove(self, entity_id: str, value: Any) -> None:
+        if not isinstance(value, Hashable):
+            return
+        ids = self._ids.get(value)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del self._ids[value]
+
+    def lookup(self, filter_spec: Filter) -> set[str] | None:
+        match filter_spec.operator:
+            case FilterOperator.EQ if isinstance(filter_spec.value, Hashable):
+                return set(self._ids.get(filter_spec.value, ()))
+            case FilterOperator.IN if all(isinstance(v, Hashable) for v in filter_spec.value):
+                matched: set[str] = set()
+                for value in filter_spec.value:
+                    matched |= self._ids.get(value, set())
+                return matched
+        return None
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+class SortedIndex(Index):
+    """Ordered ``(value, id)`` index answering range filters and ordering.
+
+    ``None`` values are tracked separately, since they do not compare with
+    other values; ordering by the index is only used when there are none.
+    """
+
+    def __init__(self, field: str) -> None:
+        super().__init__(field)
+        self._entries: list[tuple[Any, str]] = []
+        self._nulls: set[str] = set()
+
+    @property
+    def has_nulls(self) -> bool:
+        """Whether some entities hold ``None`` for the field."""
+        return bool(self._nulls)
+
+    def add(self, entity_id: str, value: Any) -> None:
+        if value is None:
+            self._nulls.add(entity_id)
+        else:
+            bisect.insort(self._entries, (value, entity_id))
+
+    def remove(self, entity_id: str, value: Any) -> None:
+        if value is None:
+            self._nulls.discard(entity_id)
+            return
+        pos = bisect.bisect_left(self._entries, (value, entity_id))
+        if pos < len(self._entries) and self._entries[pos] == (value, entity_id):
+            del self._entries[pos]
+
+    def lookup(self, filter_spec: Filter) -> set[str] | None:
+        value = filter_spec.value
+        op = filter_spec.operator
+        if value is None or (op is not FilterOperator.EQ and op not in _RANGE_OPERATORS):
+            return None
+
+        start, stop = 0, len(self._entries)
+        match op:
+            case FilterOperator.EQ:
+                start, stop = self._left(value), self._right(value)
+            case FilterOperator.GT:
+                start = self._right(value)
+            case FilterOperator.GE | FilterOperator.GTE:
+                start = self._left(value)
+            case FilterOperator.LT:
+                stop = self._left(value)
+            case FilterOperator.LE | FilterOperator.LTE:
+                stop = self._right(value)
+        return {entity_id for _, entity_id in self._entries[start:stop]}
+
+    def ordered_ids(self, *, descending: bool = False) -> Iterator[str]:
+        """Iterate ids in field order (ties broken by id)."""
+        entries = reversed(self._entries) if descending else iter(self._entries)
+        return (entity_id for _, entity_id in entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nulls.clear()
+
+    def _left(self, value: Any) -> int:
+        """Position of the first entry with a key ``>= value``."""
+        return bisect.bisect_left(self._entries, value, key=lambda entry: entry[0])
+
+    def _right(self, value: Any) -> int:
+        """Position past the last entry with a key ``<= value``."""
+        return bisect.bisect_right(self._entries, value, key=lambda entry: entry[0])
+
+
+__all__ = ["HashIndex", "Index", "SortedIndex"]
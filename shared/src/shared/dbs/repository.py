@@ -6,8 +6,12 @@ with filtering, ordering, and pagination support.
 
 from __future__ import annotations
 
+import base64
+import itertools
+import json
 import math
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
@@ -65,10 +69,17 @@ class OrderBy:
 
 @dataclass
 class PageRequest:
-    """Pagination request parameters."""
+    """Pagination request parameters.
+
+    Offset paging uses ``page``. Keyset paging starts with ``keyset=True``
+    (or any ``cursor``) and continues with the previous response's
+    ``next_cursor``; ``page`` is then ignored.
+    """
 
     page: int = 1
     size: int = 10
+    cursor: str | None = None
+    keyset: bool = False
 
     @property
     def offset(self) -> int:
@@ -79,24 +90,37 @@ class PageRequest:
         """
         return (self.page - 1) * self.size
 
+    @property
+    def is_keyset(self) -> bool:
+        """Whether this request uses keyset (cursor) paging."""
+        return self.keyset or self.cursor is not None
+
 
 @dataclass
 class PageResponse(Generic[T]):
-    """Paginated response with metadata."""
+    """Paginated response with metadata.
+
+    On keyset pages ``total`` may be ``None`` (not computed) or an
+    estimate (``total_is_estimate``), and ``next_cursor`` drives paging.
+    """
 
     items: list[T]
-    total: int
+    total: int | None
     page: int
     size: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
     @property
     def total_pages(self) -> int:
         """Calculate total number of pages.
 
         Returns:
-            Total pages.
+            Total pages (0 when the total is unknown).
         """
-        return math.ceil(self.total / self.size) if self.size > 0 else 0
+        if self.total is None or self.size <= 0:
+            return 0
+        return math.ceil(self.total / self.size)
 
     @property
     def has_next(self) -> bool:
@@ -105,6 +129,9 @@ class PageResponse(Generic[T]):
         Returns:
             True if next page exists.
         """
+        if self.next_cursor is not None or self.total is None or self.total_is_estimate:
+            # Keyset page: only the cursor knows whether more rows follow
+            return self.next_cursor is not None
         return self.page < self.total_pages
 
     @property
@@ -117,6 +144,32 @@ class PageResponse(Generic[T]):
         return self.page > 1
 
 
+def encode_cursor(payload: Any) -> str:
+    """Encode a JSON-serializable keyset position as an opaque cursor.
+
+    Args:
+        payload: Sort-key values of the last row on a page.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
 class AbstractRepository(ABC, Generic[T]):
     """Abstract repository interface.
 
@@ -265,17 +318,42 @@ class AbstractRepository(ABC, Generic[T]):
 class InMemoryRepository(AbstractRepository[T]):
     """In-memory repository implementation.
 
-    Useful for testing and prototyping. Stores entities in a dict.
+    Useful for testing, prototyping and as a read-through cache. Stores
+    entities in a dict.
+
+    Without indexes every query scans all entities. Fields declared in
+    ``hash_indexes`` resolve ``EQ``/``IN`` filters by lookup, and fields in
+    ``sorted_indexes`` resolve ``EQ`` and range filters by bisection and
+    serve single-field ``order_by`` without sorting. Remaining filters are
+    checked only against the candidates the indexes return.
+
+    Example:
+        >>> repo = InMemoryRepository(hash_indexes=["status"], sorted_indexes=["created_at"])
     """
 
-    def __init__(self, id_field: str = "id") -> None:
+    def __init__(
+        self,
+        id_field: str = "id",
+        *,
+        hash_indexes: Iterable[str] = (),
+        sorted_indexes: Iterable[str] = (),
+    ) -> None:
         """Initialize the repository.
 
         Args:
             id_field: Name of the ID field on entities.
+            hash_indexes: Fields to index for equality lookups.
+            sorted_indexes: Fields to index for ranges and ordering.
         """
+        from shared.dbs.indexes import HashIndex, Index, SortedIndex
+
         self._storage: dict[str, T] = {}
         self._id_field = id_field
+        self._sorted: dict[str, SortedIndex] = {f: SortedIndex(f) for f in sorted_indexes}
+        self._hash: dict[str, HashIndex] = {f: HashIndex(f) for f in hash_indexes}
+        self._indexes: list[Index] = [*self._hash.values(), *self._sorted.values()]
+        # Indexed values per entity id, as of the last add/update
+        self._indexed_values: dict[str, tuple[Any, ...]] = {}
 
     def _get_id(self, entity: T) -> str:
         """Get ID from entity.
@@ -307,11 +385,11 @@ class InMemoryRepository(AbstractRepository[T]):
                 return value != filter_spec.value
             case FilterOperator.GT:
                 return value > filter_spec.value
-            case FilterOperator.GTE:
+            case FilterOperator.GE | FilterOperator.GTE:
                 return value >= filter_spec.value
             case FilterOperator.LT:
                 return value < filter_spec.value
-            case FilterOperator.LTE:
+            case FilterOperator.LE | FilterOperator.LTE:
                 return value <= filter_spec.value
             case FilterOperator.LIKE:
                 return filter_spec.value.lower() in str(value).lower()
@@ -355,10 +433,95 @@ class InMemoryRepository(AbstractRepository[T]):
             )
         return result
 
+    def _index(self, entity_id: str, entity: T) -> None:
+        """Point the indexes at the current field values of ``entity``."""
+        if not self._indexes:
+            return
+        self._unindex(entity_id)
+        values = tuple(getattr(entity, index.field, None) for index in self._indexes)
+        for index, value in zip(self._indexes, values, strict=True):
+            index.add(entity_id, value)
+        self._indexed_values[entity_id] = values
+
+    def _unindex(self, entity_id: str) -> None:
+        """Remove ``entity_id`` from the indexes."""
+        values = self._indexed_values.pop(entity_id, None)
+        if values is not None:
+            for index, value in zip(self._indexes, values, strict=True):
+                index.remove(entity_id, value)
+
+    def _lookup(self, filters: list[Filter]) -> tuple[set[str] | None, list[Filter]]:
+        """Resolve filters through the indexes.
+
+        Returns:
+            Candidate ids (``None`` when no filter was indexed) and the
+            filters that still have to be checked per entity.
+        """
+        candidates: set[str] | None = None
+        residual: list[Filter] = []
+        for f in filters:
+            matched = None
+            if f.field in self._hash:
+                matched = self._hash[f.field].lookup(f)
+            if matched is None and f.field in self._sorted:
+                matched = self._sorted[f.field].lookup(f)
+            if matched is None:
+                residual.append(f)
+            elif candidates is None:
+                candidates = matched
+            else:
+                candidates &= matched
+        return candidates, residual
+
+    def _ordered_ids(self, order_by: list[OrderBy] | None) -> Iterator[str] | None:
+        """Iterate all ids in ``order_by`` order from a sorted index, if one fits."""
+        if not order_by or len(order_by) != 1:
+            return None
+        index = self._sorted.get(order_by[0].field)
+        if index is None or index.has_nulls:
+            return None
+        return index.ordered_ids(descending=order_by[0].direction == OrderDirection.DESC)
+
+    def _query(
+        self,
+        filters: list[Filter] | None,
+        order_by: list[OrderBy] | None,
+    ) -> tuple[Iterator[T], int | None]:
+        """Plan and run a query.
+
+        Returns:
+            Matching entities in order, and their count when it is known
+            without consuming the iterator.
+        """
+        candidates, residual = self._lookup(filters or [])
+        ordered = None
+        # Walking the whole index only pays off when the filters keep many rows
+        if candidates is None or len(candidates) * 8 >= len(self._storage):
+            ordered = self._ordered_ids(order_by)
+
+        if ordered is None:
+            if candidates is None:
+                entities = list(self._storage.values())
+            else:
+                entities = [self._storage[i] for i in candidates]
+            entities = self._apply_filters(entities, residual)
+            if order_by:
+                entities = self._apply_ordering(entities, order_by)
+            return iter(entities), len(entities)
+
+        if candidates is not None:
+            ordered = (i for i in ordered if i in candidates)
+        matches = (self._storage[i] for i in ordered)
+        if residual:
+            matches = (e for e in matches if all(self._matches_filter(e, f) for f in residual))
+            return matches, None
+        return matches, len(candidates) if candidates is not None else len(self._storage)
+
     async def add(self, entity: T) -> T:
         """Add a new entity."""
         entity_id = self._get_id(entity)
         self._storage[entity_id] = entity
+        self._index(entity_id, entity)
         return entity
 
     async def get(self, id: str) -> T | None:
@@ -373,12 +536,14 @@ class InMemoryRepository(AbstractRepository[T]):
         """Update an existing entity."""
         entity_id = self._get_id(entity)
         self._storage[entity_id] = entity
+        self._index(entity_id, entity)
         return entity
 
     async def delete(self, id: str) -> bool:
         """Delete entity by ID."""
         if id in self._storage:
             del self._storage[id]
+            self._unindex(id)
             return True
         return False
 
@@ -389,6 +554,9 @@ class InMemoryRepository(AbstractRepository[T]):
     async def count(self, filters: list[Filter] | None = None) -> int:
         """Count entities."""
         if filters:
+            candidates, residual = self._lookup(filters)
+            if not residual and candidates is not None:
+                return len(candidates)
             entities = await self.find(filters=filters)
             return len(entities)
         return len(self._storage)
@@ -407,15 +575,8 @@ class InMemoryRepository(AbstractRepository[T]):
         Returns:
             List of matching entities.
         """
-        result = list(self._storage.values())
-
-        if filters:
-            result = self._apply_filters(result, filters)
-
-        if order_by:
-            result = self._apply_ordering(result, order_by)
-
-        return result
+        matches, _ = self._query(filters, order_by)
+        return list(matches)
 
     async def find_one(
         self,
@@ -448,12 +609,16 @@ class InMemoryRepository(AbstractRepository[T]):
         Returns:
             Paginated response.
         """
-        all_items = await self.find(filters=filters, order_by=order_by)
-        total = len(all_items)
-
+        matches, total = self._query(filters, order_by)
         start = page_request.offset
         end = start + page_request.size
-        items = all_items[start:end]
+        if total is None:
+            all_items = list(matches)
+            total = len(all_items)
+            items = all_items[start:end]
+        else:
+            # Ordered by an index: stop once the page is filled
+            items = list(itertools.islice(matches, start, end))
 
         return PageResponse(
             items=items,
@@ -465,6 +630,9 @@ class InMemoryRepository(AbstractRepository[T]):
     async def clear(self) -> None:
         """Remove all entities."""
         self._storage.clear()
+        self._indexed_values.clear()
+        for index in self._indexes:
+            index.clear()
 
     async def find_by_specification(
         self,
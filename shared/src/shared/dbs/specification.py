@@ -217,7 +217,9 @@ class OrSpecification(Specification[T]):
         ``to_filters()`` raises :class:`NotImplementedError` because
         most repository layers do not support OR-combined filters
         natively.  Use :meth:`can_convert_to_filters` to check first,
-        or perform in-memory evaluation.
+        or perform in-memory evaluation.  SQLAlchemy repositories compile
+        OR trees to SQL instead (see
+        :func:`shared.sqlalchemy_async.specification.compile_specification`).
     """
 
     def __init__(self, left: Specification[T], right: Specification[T]) -> None:
@@ -254,7 +256,7 @@ class NotSpecification(Specification[T]):
     .. warning::
         ``to_filters()`` raises :class:`NotImplementedError` because
         generic negation is not representable by the :class:`Filter`
-        model.
+        model.  SQLAlchemy repositories compile NOT trees to SQL instead.
     """
 
     def __init__(self, spec: Specification[T]) -> None:
@@ -24,27 +24,54 @@ Example:
     ...         self._email = email
 """
 
-from shared.ddd.entity import (
-    AggregateRoot,
-    Entity,
-    EntityId,
-)
-from shared.ddd.events import (
-    DomainEvent,
-    DomainEventHandler,
-    EventDispatcher,
-)
-from shared.ddd.value_objects import (
-    Address,
-    DateRange,
-    Email,
-    Money,
-    NonEmptyString,
-    Percentage,
-    PhoneNumber,
-    PositiveDecimal,
-    PositiveInt,
-    ValueObject,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.ddd.entity import (
+        AggregateRoot,
+        Entity,
+        EntityId,
+    )
+    from shared.ddd.events import (
+        DomainEvent,
+        DomainEventHandler,
+        EventDispatcher,
+    )
+    from shared.ddd.value_objects import (
+        Address,
+        DateRange,
+        Email,
+        Money,
+        NonEmptyString,
+        Percentage,
+        PhoneNumber,
+        PositiveDecimal,
+        PositiveInt,
+        ValueObject,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AggregateRoot": "shared.ddd.entity",
+        "Entity": "shared.ddd.entity",
+        "EntityId": "shared.ddd.entity",
+        "DomainEvent": "shared.ddd.events",
+        "DomainEventHandler": "shared.ddd.events",
+        "EventDispatcher": "shared.ddd.events",
+        "Address": "shared.ddd.value_objects",
+        "DateRange": "shared.ddd.value_objects",
+        "Email": "shared.ddd.value_objects",
+        "Money": "shared.ddd.value_objects",
+        "NonEmptyString": "shared.ddd.value_objects",
+        "Percentage": "shared.ddd.value_objects",
+        "PhoneNumber": "shared.ddd.value_objects",
+        "PositiveDecimal": "shared.ddd.value_objects",
+        "PositiveInt": "shared.ddd.value_objects",
+        "ValueObject": "shared.ddd.value_objects",
+    },
 )
 
 __all__ = [
@@ -38,31 +38,65 @@ Exception Hierarchy:
         └── TimeoutException
 """
 
-from shared.exceptions.base import BaseServiceException, ErrorSeverity
-from shared.exceptions.database import (
-    ConnectionException,
-    DatabaseException,
-    IntegrityException,
-    QueryException,
-    TimeoutException,
-    TransactionException,
-)
-from shared.exceptions.http import (
-    BadGatewayException,
-    BadRequestException,
-    ConflictException,
-    ForbiddenException,
-    GatewayTimeoutException,
-    HTTPException,
-    InternalServerException,
-    MethodNotAllowedException,
-    NotFoundException,
-    RateLimitException,
-    ServiceUnavailableException,
-    UnauthorizedException,
-    UnprocessableEntityException,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.exceptions.base import BaseServiceException, ErrorSeverity
+    from shared.exceptions.database import (
+        ConnectionException,
+        DatabaseException,
+        IntegrityException,
+        QueryException,
+        TimeoutException,
+        TransactionException,
+    )
+    from shared.exceptions.http import (
+        BadGatewayException,
+        BadRequestException,
+        ConflictException,
+        ForbiddenException,
+        GatewayTimeoutException,
+        HTTPException,
+        InternalServerException,
+        MethodNotAllowedException,
+        NotFoundException,
+        RateLimitException,
+        ServiceUnavailableException,
+        UnauthorizedException,
+        UnprocessableEntityException,
+    )
+    from shared.exceptions.validation import FieldError, ValidationException
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "BaseServiceException": "shared.exceptions.base",
+        "ErrorSeverity": "shared.exceptions.base",
+        "ConnectionException": "shared.exceptions.database",
+        "DatabaseException": "shared.exceptions.database",
+        "IntegrityException": "shared.exceptions.database",
+        "QueryException": "shared.exceptions.database",
+        "TimeoutException": "shared.exceptions.database",
+        "TransactionException": "shared.exceptions.database",
+        "BadGatewayException": "shared.exceptions.http",
+        "BadRequestException": "shared.exceptions.http",
+        "ConflictException": "shared.exceptions.http",
+        "ForbiddenException": "shared.exceptions.http",
+        "GatewayTimeoutException": "shared.exceptions.http",
+        "HTTPException": "shared.exceptions.http",
+        "InternalServerException": "shared.exceptions.http",
+        "MethodNotAllowedException": "shared.exceptions.http",
+        "NotFoundException": "shared.exceptions.http",
+        "RateLimitException": "shared.exceptions.http",
+        "ServiceUnavailableException": "shared.exceptions.http",
+        "UnauthorizedException": "shared.exceptions.http",
+        "UnprocessableEntityException": "shared.exceptions.http",
+        "FieldError": "shared.exceptions.validation",
+        "ValidationException": "shared.exceptions.validation",
+    },
 )
-from shared.exceptions.validation import FieldError, ValidationException
 
 __all__ = [
     # Base
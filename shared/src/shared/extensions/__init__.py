@@ -6,35 +6,71 @@ and dependency injection utilities for microservices.
 
 from __future__ import annotations
 
-from shared.extensions.container_protocol import ContainerProtocol
-from shared.extensions.decorators import (
-    cache,
-    deprecated,
-    log_calls,
-    rate_limit,
-    retry,
-    singleton,
-    timeout,
-    validate_args,
-)
-from shared.extensions.dependency_injection import (
-    Container,
-    Depends,
-    Scope,
-    get_container,
-    inject,
-    register,
-    resolve,
-)
-from shared.extensions.dishka_adapter import (
-    DishkaContainerAdapter,
-    DishkaFastAPIMiddleware,
-    create_dishka_fastapi_middleware,
-    dishka_dependency,
-    is_dishka_available,
-)
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+# Eager: the function shares its submodule's name, so importing the
+# submodule first would otherwise leave the module as the attribute.
+# The module only uses the standard library.
 from shared.extensions.transactional import transactional
 
+if TYPE_CHECKING:
+    from shared.extensions.container_protocol import ContainerProtocol
+    from shared.extensions.decorators import (
+        cache,
+        deprecated,
+        log_calls,
+        rate_limit,
+        retry,
+        singleton,
+        timeout,
+        validate_args,
+    )
+    from shared.extensions.dependency_injection import (
+        Container,
+        Depends,
+        Scope,
+        get_container,
+        inject,
+        register,
+        resolve,
+    )
+    from shared.extensions.dishka_adapter import (
+        DishkaContainerAdapter,
+        DishkaFastAPIMiddleware,
+        create_dishka_fastapi_middleware,
+        dishka_dependency,
+        is_dishka_available,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "ContainerProtocol": "shared.extensions.container_protocol",
+        "cache": "shared.extensions.decorators",
+        "deprecated": "shared.extensions.decorators",
+        "log_calls": "shared.extensions.decorators",
+        "rate_limit": "shared.extensions.decorators",
+        "retry": "shared.extensions.decorators",
+        "singleton": "shared.extensions.decorators",
+        "timeout": "shared.extensions.decorators",
+        "validate_args": "shared.extensions.decorators",
+        "Container": "shared.extensions.dependency_injection",
+        "Depends": "shared.extensions.dependency_injection",
+        "Scope": "shared.extensions.dependency_injection",
+        "get_container": "shared.extensions.dependency_injection",
+        "inject": "shared.extensions.dependency_injection",
+        "register": "shared.extensions.dependency_injection",
+        "resolve": "shared.extensions.dependency_injection",
+        "DishkaContainerAdapter": "shared.extensions.dishka_adapter",
+        "DishkaFastAPIMiddleware": "shared.extensions.dishka_adapter",
+        "create_dishka_fastapi_middleware": "shared.extensions.dishka_adapter",
+        "dishka_dependency": "shared.extensions.dishka_adapter",
+        "is_dishka_available": "shared.extensions.dishka_adapter",
+    },
+)
+
 __all__ = [
     # Decorators
     "retry",
@@ -31,42 +31,78 @@ Example:
     >>> register_exception_handlers(app)
 """
 
-from shared.fastapi_utils.dependencies import (
-    ServiceContextDep,
-    get_service_context,
-)
-from shared.fastapi_utils.exception_handlers import (
-    generic_exception_handler,
-    http_exception_handler,
-    register_exception_handlers,
-    validation_exception_handler,
-)
-from shared.fastapi_utils.health_router import (
-    DetailedHealthResponse,
-    HealthResponse,
-    LivenessResponse,
-    ReadinessResponse,
-    create_cache_health_check,
-    create_database_health_check,
-    create_external_service_health_check,
-    create_health_router,
-)
-from shared.fastapi_utils.lifespan import (
-    LifespanManager,
-    create_lifespan,
-    register_shutdown_handler,
-    register_startup_handler,
-)
-from shared.fastapi_utils.middleware import (
-    RequestContext,
-    RequestContextMiddleware,
-    get_correlation_id,
-    get_request_context,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.fastapi_utils.dependencies import (
+        ServiceContextDep,
+        get_service_context,
+    )
+    from shared.fastapi_utils.exception_handlers import (
+        generic_exception_handler,
+        http_exception_handler,
+        register_exception_handlers,
+        validation_exception_handler,
+    )
+    from shared.fastapi_utils.health_router import (
+        DetailedHealthResponse,
+        HealthResponse,
+        LivenessResponse,
+        ReadinessResponse,
+        create_cache_health_check,
+        create_database_health_check,
+        create_external_service_health_check,
+        create_health_router,
+    )
+    from shared.fastapi_utils.lifespan import (
+        LifespanManager,
+        create_lifespan,
+        register_shutdown_handler,
+        register_startup_handler,
+    )
+    from shared.fastapi_utils.middleware import (
+        RequestContext,
+        RequestContextHook,
+        RequestContextMiddleware,
+        get_correlation_id,
+        get_request_context,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "ServiceContextDep": "shared.fastapi_utils.dependencies",
+        "get_service_context": "shared.fastapi_utils.dependencies",
+        "generic_exception_handler": "shared.fastapi_utils.exception_handlers",
+        "http_exception_handler": "shared.fastapi_utils.exception_handlers",
+        "register_exception_handlers": "shared.fastapi_utils.exception_handlers",
+        "validation_exception_handler": "shared.fastapi_utils.exception_handlers",
+        "DetailedHealthResponse": "shared.fastapi_utils.health_router",
+        "HealthResponse": "shared.fastapi_utils.health_router",
+        "LivenessResponse": "shared.fastapi_utils.health_router",
+        "ReadinessResponse": "shared.fastapi_utils.health_router",
+        "create_cache_health_check": "shared.fastapi_utils.health_router",
+        "create_database_health_check": "shared.fastapi_utils.health_router",
+        "create_external_service_health_check": "shared.fastapi_utils.health_router",
+        "create_health_router": "shared.fastapi_utils.health_router",
+        "LifespanManager": "shared.fastapi_utils.lifespan",
+        "create_lifespan": "shared.fastapi_utils.lifespan",
+        "register_shutdown_handler": "shared.fastapi_utils.lifespan",
+        "register_startup_handler": "shared.fastapi_utils.lifespan",
+        "RequestContext": "shared.fastapi_utils.middleware",
+        "RequestContextHook": "shared.fastapi_utils.middleware",
+        "RequestContextMiddleware": "shared.fastapi_utils.middleware",
+        "get_correlation_id": "shared.fastapi_utils.middleware",
+        "get_request_context": "shared.fastapi_utils.middleware",
+    },
 )
 
 __all__ = [
     # Middleware
     "RequestContext",
+    "RequestContextHook",
     "RequestContextMiddleware",
     "get_request_context",
     "get_correlation_id",
@@ -15,23 +15,29 @@ Example:
     ...     version="1.0.0",
     ... )
     >>> app.include_router(health_router)
+
+Pass ``cache_ttl_seconds`` to answer probes from a cached report that a
+background task keeps fresh, instead of running every check per probe.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, FastAPI, Response, status
 from pydantic import BaseModel, Field
 
 from shared.observability.health import (
     HealthCheckResult,
+    HealthMonitor,
     HealthStatus,
     check_liveness,
     check_readiness,
     register_health_check,
+    set_health_monitor,
 )
 
 
@@ -81,6 +87,8 @@ def create_health_router(
     tags: list[str] | None = None,
     include_details: bool = True,
     startup_time: datetime | None = None,
+    cache_ttl_seconds: float | None = None,
+    refresh_interval_seconds: float | None = None,
 ) -> APIRouter:
     """Create a health check router with standardized endpoints.
 
@@ -96,6 +104,11 @@ def create_health_router(
         tags: OpenAPI tags for the router
         include_details: Include check details in /health endpoint
         startup_time: Service startup time for uptime calculation
+        cache_ttl_seconds: Serve /health and /health/ready from a report
+            cached this long, refreshed in the background while the
+            application runs. None runs every check on every probe.
+        refresh_interval_seconds: Background refresh period for the
+            cached report (defaults to half of ``cache_ttl_seconds``)
 
     Returns:
         FastAPI router with health endpoints
@@ -108,7 +121,24 @@ def create_health_router(
         ... )
         >>> app.include_router(router)
     """
-    router = APIRouter(prefix=prefix, tags=tags or ["Health"])
+    lifespan = None
+    if cache_ttl_seconds is not None:
+        monitor = HealthMonitor(
+            ttl_seconds=cache_ttl_seconds,
+            refresh_interval_seconds=refresh_interval_seconds,
+        )
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+            set_health_monitor(monitor)
+            await monitor.start()
+            try:
+                yield
+            finally:
+                await monitor.stop()
+                set_health_monitor(None)
+
+    router = APIRouter(prefix=prefix, tags=tags or ["Health"], lifespan=lifespan)
     _startup_time = startup_time or datetime.now(UTC)
 
     @router.get(
@@ -7,21 +7,20 @@ use the RequestLoggingMiddleware from shared.observability.
 Architecture:
     - Correlation ID management: shared.observability.structlog_config
     - Request logging: shared.observability.middleware.RequestLoggingMiddleware
-    - User context (user_id, metadata): This module's RequestContextMiddleware
+    - User context (user_id, metadata): This module's RequestContextHook,
+      or RequestContextMiddleware when request logging is not used
+
+Both are pure ASGI. Running the request context as a hook of the logging
+middleware handles correlation ID, context, access log and headers in a
+single middleware layer.
 
 Example:
     >>> from fastapi import FastAPI
-    >>> from shared.fastapi_utils.middleware import RequestContextMiddleware
+    >>> from shared.fastapi_utils.middleware import RequestContextHook
     >>> from shared.observability import RequestLoggingMiddleware
     >>>
     >>> app = FastAPI()
-    >>> # Add RequestLoggingMiddleware first for correlation ID and logging
-    >>> app.add_middleware(
-    ...     RequestLoggingMiddleware,
-    ...     service_name="my-service",
-    ... )
-    >>> # Then add RequestContextMiddleware for user context
-    >>> app.add_middleware(RequestContextMiddleware)
+    >>> app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
 """
 
 from __future__ import annotations
@@ -31,10 +30,10 @@ from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from shared.observability.middleware import RequestHook, RequestInfo
 from shared.observability.structlog_config import (
     generate_correlation_id as _generate_correlation_id,
 )
@@ -98,10 +97,51 @@ def get_correlation_id() -> str | None:
     return _get_observability_correlation_id()
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextHook(RequestHook):
+    """Request logging hook that creates and manages request context.
+
+    This hook:
+    - Generates a unique request ID for each request
+    - Makes context available via get_request_context()
+    - Adds the request ID to the access log and response headers
+
+    Example:
+        >>> app = FastAPI()
+        >>> app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
+    """
+
+    def __init__(self, request_id_header: str = "X-Request-ID") -> None:
+        """Initialize the hook.
+
+        Args:
+            request_id_header: Header name for request ID.
+        """
+        self.request_id_header = request_id_header
+
+    def on_request(self, request: RequestInfo) -> None:
+        """Set the request context for the application."""
+        context = RequestContext(
+            request_id=str(uuid.uuid4()),
+            correlation_id=request.correlation_id,
+        )
+        request.state["request_context_token"] = _request_context.set(context)
+        request.state["request_id"] = context.request_id
+        request.log_fields["request_id"] = context.request_id
+
+    def on_response(self, request: RequestInfo, headers: MutableHeaders) -> None:
+        """Add the request ID to the response headers."""
+        headers[self.request_id_header] = request.state["request_id"]
+
+    def on_complete(self, request: RequestInfo) -> None:
+        """Reset the request context."""
+        _request_context.reset(request.state.pop("request_context_token"))
+
+
+class RequestContextMiddleware:
     """Middleware that creates and manages request context.
 
-    This middleware:
+    Standalone equivalent of :class:`RequestContextHook` for applications
+    without ``RequestLoggingMiddleware``. This middleware:
     - Generates a unique request ID for each request
     - Extracts or generates a correlation ID
     - Makes context available via get_request_context()
@@ -125,24 +165,22 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
             correlation_header: Header name for correlation ID.
             request_id_header: Header name for request ID.
         """
-        super().__init__(app)
+        self.app = app
         self.correlation_header = correlation_header
         self.request_id_header = request_id_header
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and manage context.
 
         Args:
-            request: The incoming request.
-            call_next: The next handler in the chain.
-
-        Returns:
-            The response with added headers.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = str(uuid.uuid4())
 
@@ -150,31 +188,26 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         # or extract from header / generate if not available
         correlation_id = _get_observability_correlation_id()
         if correlation_id is None:
-            correlation_id = request.headers.get(
-                self.correlation_header,
-                _generate_correlation_id(),
+            correlation_id = (
+                Headers(scope=scope).get(self.correlation_header) or _generate_correlation_id()
             )
             # Set in observability context for structlog
             _set_correlation_id(correlation_id)
 
-        # Create request context with user-level data
-        context = RequestContext(
-            request_id=request_id,
-            correlation_id=correlation_id,
+        # Set request context (for user_id, metadata access)
+        token_ctx = _request_context.set(
+            RequestContext(request_id=request_id, correlation_id=correlation_id)
         )
 
-        # Set request context (for user_id, metadata access)
-        token_ctx = _request_context.set(context)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[self.correlation_header] = correlation_id
+                headers[self.request_id_header] = request_id
+            await send(message)
 
         try:
-            # Process request
-            response = await call_next(request)
-
-            # Add headers to response
-            response.headers[self.correlation_header] = correlation_id
-            response.headers[self.request_id_header] = request_id
-
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
             # Reset request context
             _request_context.reset(token_ctx)
@@ -182,6 +215,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
 
 __all__ = [
     "RequestContext",
+    "RequestContextHook",
     "RequestContextMiddleware",
     "get_correlation_id",
     "get_request_context",
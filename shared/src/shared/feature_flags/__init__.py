@@ -25,12 +25,28 @@ Example:
 
 from __future__ import annotations
 
-from shared.feature_flags.base import (
-    FeatureFlag,
-    FeatureFlagProvider,
-    InMemoryFlagProvider,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.feature_flags.base import (
+        FeatureFlag,
+        FeatureFlagProvider,
+        InMemoryFlagProvider,
+    )
+    from shared.feature_flags.service import FeatureFlagService, feature_enabled
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "FeatureFlag": "shared.feature_flags.base",
+        "FeatureFlagProvider": "shared.feature_flags.base",
+        "InMemoryFlagProvider": "shared.feature_flags.base",
+        "FeatureFlagService": "shared.feature_flags.service",
+        "feature_enabled": "shared.feature_flags.service",
+    },
 )
-from shared.feature_flags.service import FeatureFlagService, feature_enabled
 
 __all__ = [
     "FeatureFlag",
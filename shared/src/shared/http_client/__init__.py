@@ -4,6 +4,7 @@ This module provides resilient HTTP client utilities:
 - ServiceClient: Async HTTP client with retry support
 - CircuitBreaker: Circuit breaker for resilience
 - ServiceResponse: Standardized response wrapper
+- HTTPClientRegistry: Process-wide pooled clients keyed by base URL
 
 Example:
     >>> from shared.http_client import (
@@ -19,18 +20,52 @@ Example:
     ...     print(response.data)
 """
 
-from shared.http_client.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitOpenError,
-    CircuitState,
-)
-from shared.http_client.client import (
-    HTTPClientError,
-    ServiceClient,
-    ServiceClientConfig,
-    ServiceResponse,
-    ServiceUnavailableError,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.http_client.circuit_breaker import (
+        CircuitBreaker,
+        CircuitBreakerConfig,
+        CircuitOpenError,
+        CircuitState,
+    )
+    from shared.http_client.client import (
+        HTTPClientError,
+        ServiceClient,
+        ServiceClientConfig,
+        ServiceResponse,
+        ServiceUnavailableError,
+    )
+    from shared.http_client.pool import (
+        HTTPClientRegistry,
+        HTTPPoolConfig,
+        HTTPPoolStats,
+        close_http_clients,
+        get_http_client_registry,
+        set_http_client_registry,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "CircuitBreaker": "shared.http_client.circuit_breaker",
+        "CircuitBreakerConfig": "shared.http_client.circuit_breaker",
+        "CircuitOpenError": "shared.http_client.circuit_breaker",
+        "CircuitState": "shared.http_client.circuit_breaker",
+        "HTTPClientError": "shared.http_client.client",
+        "ServiceClient": "shared.http_client.client",
+        "ServiceClientConfig": "shared.http_client.client",
+        "ServiceResponse": "shared.http_client.client",
+        "ServiceUnavailableError": "shared.http_client.client",
+        "HTTPClientRegistry": "shared.http_client.pool",
+        "HTTPPoolConfig": "shared.http_client.pool",
+        "HTTPPoolStats": "shared.http_client.pool",
+        "close_http_clients": "shared.http_client.pool",
+        "get_http_client_registry": "shared.http_client.pool",
+        "set_http_client_registry": "shared.http_client.pool",
+    },
 )
 
 __all__ = [
@@ -46,4 +81,11 @@ __all__ = [
     "CircuitBreaker",
     "CircuitBreakerConfig",
     "CircuitState",
+    # Connection pools
+    "HTTPClientRegistry",
+    "HTTPPoolConfig",
+    "HTTPPoolStats",
+    "close_http_clients",
+    "get_http_client_registry",
+    "set_http_client_registry",
 ]
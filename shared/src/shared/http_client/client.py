@@ -20,6 +20,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from shared.http_client.pool import HTTPPoolConfig, get_http_client_registry
+
 
 class HTTPClientError(Exception):
     """Base exception for HTTP client errors.
@@ -73,6 +75,9 @@ class ServiceClientConfig:
         headers: Default headers to include in all requests.
         auto_correlation_id: Auto-generate correlation ID if not provided.
         correlation_id_header: Header name for correlation ID.
+        use_shared_pool: Send requests through the process-wide client for
+            ``base_url`` so connections are reused across clients.
+        pool: Connection pool settings (registry default if not set).
     """
 
     base_url: str
@@ -87,6 +92,9 @@ class ServiceClientConfig:
     circuit_breaker_enabled: bool = True
     cb_failure_threshold: int = 5
     cb_recovery_timeout: float = 30.0
+    # Connection pool settings
+    use_shared_pool: bool = True
+    pool: HTTPPoolConfig | None = None
 
 
 @dataclass
@@ -143,11 +151,17 @@ class ServiceClient:
             config: Client configuration.
         """
         self._config = config
-        self._client = httpx.AsyncClient(
-            base_url=config.base_url,
-            timeout=config.timeout,
-            headers=config.headers,
-        )
+        # A shared client belongs to the registry and is closed on shutdown
+        self._owns_client = not config.use_shared_pool
+        if config.use_shared_pool:
+            self._client = get_http_client_registry().get(config.base_url, config.pool)
+        else:
+            self._client = httpx.AsyncClient(
+                base_url=config.base_url,
+                timeout=config.timeout,
+                headers=config.headers,
+                limits=(config.pool or HTTPPoolConfig()).limits,
+            )
         # Initialize circuit breaker if enabled
         from shared.http_client.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 
@@ -178,8 +192,9 @@ class ServiceClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client, unless it is shared through the registry."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def get(
         self,
@@ -363,8 +378,8 @@ class ServiceClient:
             ServiceUnavailableError: When max retries exceeded or circuit open.
             HTTPClientError: For other client errors.
         """
-        # Prepare headers
-        request_headers = dict(headers or {})
+        # Prepare headers; a shared client does not carry this client's defaults
+        request_headers = {**self._config.headers, **(headers or {})}
 
         # Add correlation ID
         if correlation_id:
@@ -380,6 +395,7 @@ class ServiceClient:
                 data=data,
                 params=params,
                 headers=request_headers,
+                timeout=self._config.timeout,
             )
 
             # Raise HTTPStatusError for 5xx to trigger retries/circuit breaker
@@ -0,0 +1,374 @@
+"""Process-wide registry of pooled HTTP clients.
+
+Creating an ``httpx.AsyncClient`` per object, or worse per call, throws
+away its connection pool, so every request pays a TCP and TLS handshake.
+:class:`HTTPClientRegistry` hands out one long-lived client per base URL
+and pool configuration:
+
+- HTTPPoolConfig: Pool limits, keep-alive expiry, HTTP/2 and DNS caching
+- HTTPClientRegistry: Shared clients keyed by base URL and configuration
+- HTTPPoolStats: Snapshot of one pool, also exported as metrics
+
+Clients belong to the registry; callers must not close them. Close the
+registry once on shutdown, from the event loop that used the clients.
+
+Like a plain ``httpx.AsyncClient``, pooled clients route requests through
+the proxies in ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY`` and honour
+``NO_PROXY`` unless ``trust_env`` is disabled. The environment is read
+when a client is created.
+
+Example:
+    >>> registry = get_http_client_registry()
+    >>> client = registry.get("https://accounts.example.com")
+    >>> response = await client.get("/users/1")
+    ...
+    >>> await close_http_clients()  # in the application lifespan
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import ipaddress
+import logging
+import socket
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any
+
+import httpcore
+import httpx
+from httpx._utils import get_environment_proxies
+
+from shared.observability.prometheus_bridge import get_metrics_backend
+
+logger = logging.getLogger(__name__)
+
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPPoolConfig:
+    """Configuration of a pooled HTTP client.
+
+    Attributes:
+        max_connections: Maximum open connections in the pool.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Negotiate HTTP/2 so requests share one connection
+            (needs the ``h2`` package; HTTP/1.1 is used without it).
+        dns_cache_ttl: Seconds a resolved host address is reused
+            (None disables the cache).
+        timeout: Default request timeout in seconds.
+        connect_timeout: Connect timeout in seconds (defaults to ``timeout``).
+        verify: Verify TLS certificates.
+        trust_env: Use proxies from the environment, as httpx does.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    dns_cache_ttl: float | None = 300.0
+    timeout: float = 30.0
+    connect_timeout: float | None = None
+    verify: bool = True
+    trust_env: bool = True
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Pool limits in the form httpx expects."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HTTPPoolStats:
+    """Point-in-time snapshot of one pooled client."""
+
+    base_url: str
+    connections: int
+    idle_connections: int
+    requests: int
+    connections_opened: int
+    dns_cache_hits: int
+    dns_cache_misses: int
+
+
+class _PoolCounters:
+    """Event counts of one pool, mirrored to the metrics backend."""
+
+    def __init__(self, name: str) -> None:
+        self.requests = 0
+        self.connections_opened = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        backend = get_metrics_backend()
+        self._requests_metric = backend.counter(
+            "http_client_requests_total", "Requests sent through a pooled HTTP client", ["pool"]
+        ).labels(pool=name)
+        self._opened_metric = backend.counter(
+            "http_client_connections_opened_total",
+            "New connections (TCP and TLS handshakes) opened by a pooled HTTP client",
+            ["pool"],
+        ).labels(pool=name)
+        dns = backend.counter(
+            "http_client_dns_lookups_total",
+            "Host lookups by a pooled HTTP client",
+            ["pool", "result"],
+        )
+        self._dns_hit_metric = dns.labels(pool=name, result="hit")
+        self._dns_miss_metric = dns.labels(pool=name, result="miss")
+        connections = backend.gauge(
+            "http_client_pool_connections", "Connections in a pooled HTTP client", ["pool", "state"]
+        )
+        self._active_metric = connections.labels(pool=name, state="active")
+        self._idle_metric = connections.labels(pool=name, state="idle")
+
+    def request(self) -> None:
+        self.requests += 1
+        self._requests_metric.inc()
+
+    def connection_opened(self) -> None:
+        self.connections_opened += 1
+        self._opened_metric.inc()
+
+    def dns_lookup(self, *, hit: bool) -> None:
+        if hit:
+            self.dns_cache_hits += 1
+            self._dns_hit_metric.inc()
+        else:
+            self.dns_cache_misses += 1
+            self._dns_miss_metric.inc()
+
+    def pool_size(self, connections: int, idle: int) -> None:
+        self._active_metric.set(connections - idle)
+        self._idle_metric.set(idle)
+
+
+class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches host lookups and counts new connections.
+
+    The connection is opened to the cached address while TLS still uses
+    the original host name for SNI and certificate checks.
+    """
+
+    def __init__(self, ttl: float | None, counters: _PoolCounters) -> None:
+        self._backend = httpcore.AnyIOBackend()
+        self._ttl = ttl
+        self._counters = counters
+        self._addresses: dict[tuple[str, int], tuple[str, float]] = {}
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self._resolve(host, port, timeout) if self._ttl else host
+        try:
+            stream = await self._backend.connect_tcp(
+                address, port, timeout, local_address, socket_options
+            )
+        except Exception:
+            # The host may have moved; look it up again on the next attempt
+            self._addresses.pop((host, port), None)
+            raise
+        self._counters.connection_opened()
+        return stream
+
+    async def _resolve(self, host: str, port: int, timeout: float | None) -> str:
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            return host
+        cached = self._addresses.get((host, port))
+        if cached is not None and cached[1] > time.monotonic():
+            self._counters.dns_lookup(hit=True)
+            return cached[0]
+        self._counters.dns_lookup(hit=False)
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout
+            )
+        except (OSError, TimeoutError):
+            # Let the underlying backend report the failure as a ConnectError
+            return host
+        address = str(infos[0][4][0])
+        self._addresses[(host, port)] = (address, time.monotonic() + (self._ttl or 0.0))
+        return address
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """HTTP transport that reports pool usage to :class:`_PoolCounters`."""
+
+    def __init__(
+        self, config: HTTPPoolConfig, counters: _PoolCounters, proxy: str | None = None
+    ) -> None:
+        super().__init__(
+            verify=config.verify,
+            http2=config.http2,
+            limits=config.limits,
+            trust_env=config.trust_env,
+            proxy=proxy,
+        )
+        self._counters = counters
+        # httpx has no option for the network backend; swap it in before
+        # the pool opens its first connection
+        self._pool._network_backend = _CachingNetworkBackend(config.dns_cache_ttl, counters)
+
+    def pool_size(self) -> tuple[int, int]:
+        """Return ``(connections, idle_connections)`` of the pool."""
+        connections = self._pool.connections
+        return len(connections), sum(1 for c in connections if c.is_idle())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counters.request()
+        self._counters.pool_size(*self.pool_size())
+        return await super().handle_async_request(request)
+
+
+_Entry = tuple[httpx.AsyncClient, _PoolCounters, list[_PooledTransport]]
+
+
+class HTTPClientRegistry:
+    """Long-lived ``httpx.AsyncClient`` instances shared by the process.
+
+    :meth:`get` returns the same client for the same base URL and
+    configuration, so connections are kept alive and reused across
+    callers instead of being re-established per client or per request.
+    """
+
+    def __init__(self, default_config: HTTPPoolConfig | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            default_config: Configuration for clients requested without one.
+        """
+        self.default_config = default_config or HTTPPoolConfig()
+        self._clients: dict[tuple[str, HTTPPoolConfig], _Entry] = {}
+
+    def get(self, base_url: str = "", config: HTTPPoolConfig | None = None) -> httpx.AsyncClient:
+        """Return the shared client for ``base_url``, creating it on first use.
+
+        Args:
+            base_url: Base URL for relative request paths. Absolute URLs
+                work with any client.
+            config: Pool configuration (defaults to the registry default).
+
+        Returns:
+            The shared client. Do not close it; see :meth:`aclose`.
+        """
+        config = config or self.default_config
+        key = (base_url, config)
+        entry = self._clients.get(key)
+        if entry is None or entry[0].is_closed:
+            entry = self._clients[key] = _create_client(base_url, config)
+        return entry[0]
+
+    def stats(self) -> list[HTTPPoolStats]:
+        """Return a snapshot of every pool, refreshing the pool gauges."""
+        snapshots: list[HTTPPoolStats] = []
+        for (base_url, _), (_, counters, transports) in self._clients.items():
+            sizes = [transport.pool_size() for transport in transports]
+            connections, idle = sum(c for c, _ in sizes), sum(i for _, i in sizes)
+            counters.pool_size(connections, idle)
+            snapshots.append(
+                HTTPPoolStats(
+                    base_url=base_url,
+                    connections=connections,
+                    idle_connections=idle,
+                    requests=counters.requests,
+                    connections_opened=counters.connections_opened,
+                    dns_cache_hits=counters.dns_cache_hits,
+                    dns_cache_misses=counters.dns_cache_misses,
+                )
+            )
+        return snapshots
+
+    async def aclose(self) -> None:
+        """Close every client and its connections."""
+        clients, self._clients = self._clients, {}
+        for client, counters, _ in clients.values():
+            await client.aclose()
+            counters.pool_size(0, 0)
+
+
+def _create_client(base_url: str, config: HTTPPoolConfig) -> _Entry:
+    if config.http2 and not _HAS_H2:
+        logger.warning("HTTP/2 requested for %s but h2 is not installed; using HTTP/1.1", base_url)
+        config = replace(config, http2=False)
+    counters = _PoolCounters(base_url or "default")
+    transport = _PooledTransport(config, counters)
+    # httpx ignores environment proxies once a transport is passed, so
+    # mount a pooled proxy transport per pattern as the client would
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    proxies = get_environment_proxies() if config.trust_env else {}
+    for pattern, proxy in proxies.items():
+        mounts[pattern] = None if proxy is None else _PooledTransport(config, counters, proxy)
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout or config.timeout),
+        transport=transport,
+        mounts=mounts,
+        trust_env=config.trust_env,
+    )
+    transports = [transport, *(t for t in mounts.values() if isinstance(t, _PooledTransport))]
+    return client, counters, transports
+
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Return the process-wide registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+def set_http_client_registry(registry: HTTPClientRegistry | None) -> None:
+    """Replace the process-wide registry (None creates a fresh one on next use).
+
+    Args:
+        registry: The registry to use. The previous one is not closed.
+    """
+    global _registry
+    _registry = registry
+
+
+async def close_http_clients() -> None:
+    """Close the clients of the process-wide registry, e.g. on shutdown."""
+    if _registry is not None:
+        await _registry.aclose()
+
+
+__all__ = [
+    "HTTPClientRegistry",
+    "HTTPPoolConfig",
+    "HTTPPoolStats",
+    "close_http_clients",
+    "get_http_client_registry",
+    "set_http_client_registry",
+]
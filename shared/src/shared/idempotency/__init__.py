@@ -24,12 +24,27 @@ Example:
 
 from __future__ import annotations
 
-from shared.idempotency.base import (
-    IdempotencyRecord,
-    IdempotencyStore,
-    InMemoryIdempotencyStore,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.idempotency.base import (
+        IdempotencyRecord,
+        IdempotencyStore,
+        InMemoryIdempotencyStore,
+    )
+    from shared.idempotency.decorator import idempotent
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "IdempotencyRecord": "shared.idempotency.base",
+        "IdempotencyStore": "shared.idempotency.base",
+        "InMemoryIdempotencyStore": "shared.idempotency.base",
+        "idempotent": "shared.idempotency.decorator",
+    },
 )
-from shared.idempotency.decorator import idempotent
 
 __all__ = [
     "IdempotencyRecord",
@@ -8,6 +8,7 @@ Submodules:
     models: SQLAlchemy ORM models
     mappers: Entity <-> ORM model conversion
     repositories: PostgreSQL repository implementations
+    sessions: Indexed session stores (in-memory and Redis)
 """
 
 __all__: list[str] = []
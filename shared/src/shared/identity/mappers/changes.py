@@ -0,0 +1,87 @@
+"""Apply mapped entity state onto persistent ORM models.
+
+Repositories used to ``merge()`` a freshly mapped model graph and then
+``refresh()`` it, which rewrote every child row and re-selected the whole
+aggregate. These helpers copy only what differs onto the models already in
+the session's identity map instead, so SQLAlchemy's unit of work emits
+column-level ``UPDATE`` statements for changed rows only, and child
+collections are diffed by primary key.
+
+The ``source`` models passed in are transient instances built by the
+``*_entity_to_model`` mappers; only the column attributes they set are
+compared.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TypeVar
+
+from sqlalchemy import inspect
+
+from shared.identity.models.base import IdentityBase
+
+M = TypeVar("M", bound=IdentityBase)
+
+
+def assign_changed(target: M, source: M, exclude: Iterable[str] = ()) -> bool:
+    """Copy column values from ``source`` onto ``target`` where they differ.
+
+    Args:
+        target: Persistent model to update.
+        source: Transient model carrying the desired state.
+        exclude: Column attributes to leave untouched (keys, foreign keys).
+
+    Returns:
+        True if any attribute was assigned.
+    """
+    skipped = {"id", *exclude}
+    columns = inspect(type(source)).column_attrs.keys()
+    state = inspect(source).dict
+    changed = False
+    for key in columns:
+        if key in skipped or key not in state:
+            continue
+        value = state[key]
+        if getattr(target, key) != value:
+            setattr(target, key, value)
+            changed = True
+    return changed
+
+
+def sync_one(current: M | None, source: M | None, exclude: Iterable[str] = ()) -> M | None:
+    """Reconcile a one-to-one child.
+
+    Returns the model to assign to the relationship: ``current`` updated in
+    place when it is the same row, otherwise ``source`` (a new row) or
+    ``None`` (row removed).
+    """
+    if source is None:
+        return None
+    if current is None or current.id != source.id:
+        return source
+    assign_changed(current, source, exclude)
+    return current
+
+
+def sync_collection(current: list[M], sources: Iterable[M], exclude: Iterable[str] = ()) -> None:
+    """Reconcile a one-to-many child collection in place, matching rows by ``id``.
+
+    New rows are appended, rows no longer present are removed (deleted by
+    the ``delete-orphan`` cascade) and remaining rows are updated in place.
+    """
+    existing = {model.id: model for model in current}
+    wanted: set[str] = set()
+    for source in sources:
+        wanted.add(source.id)
+        model = existing.get(source.id)
+        if model is None:
+            current.append(source)
+        else:
+            assign_changed(model, source, exclude)
+    for model_id, model in existing.items():
+        if model_id not in wanted:
+            current.remove(model)
+
+
+__all__ = ["assign_changed", "sync_collection", "sync_one"]
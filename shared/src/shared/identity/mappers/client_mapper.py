@@ -5,6 +5,7 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
+from shared.identity.mappers.changes import assign_changed, sync_collection
 from shared.identity.models.client import (
     ClientModel,
     ClientRedirectUriModel,
@@ -26,9 +27,9 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
-def client_entity_to_model(entity: Client) -> ClientModel:
-    """Convert Client domain entity to ORM model."""
-    model = ClientModel(
+def _client_row(entity: Client) -> ClientModel:
+    """Map the ``clients`` columns of a Client entity, without child rows."""
+    return ClientModel(
         id=str(entity.id),
         client_id=entity.client_id,
         client_name=entity.client_name,
@@ -61,6 +62,11 @@ def client_entity_to_model(entity: Client) -> ClientModel:
         created_by=str(entity.created_by) if entity.created_by else None,
     )
 
+
+def client_entity_to_model(entity: Client) -> ClientModel:
+    """Convert Client domain entity to ORM model."""
+    model = _client_row(entity)
+
     model.secrets = [secret_entity_to_model(s) for s in entity.secrets]
     model.scopes = [scope_entity_to_model(s) for s in entity.scopes]
     model.redirect_uris = [redirect_uri_entity_to_model(r) for r in entity.redirect_uris]
@@ -68,6 +74,27 @@ def client_entity_to_model(entity: Client) -> ClientModel:
     return model
 
 
+def apply_client_entity(model: ClientModel, entity: Client) -> None:
+    """Apply a Client entity onto its persistent model, touching only changed state.
+
+    Columns are assigned only when their value differs and secrets, scopes
+    and redirect URIs are matched by id, so unchanged child rows are left
+    alone.
+    """
+    assign_changed(model, _client_row(entity), exclude=("created_at",))
+    sync_collection(
+        model.secrets, [secret_entity_to_model(s) for s in entity.secrets], exclude=("client_id",)
+    )
+    sync_collection(
+        model.scopes, [scope_entity_to_model(s) for s in entity.scopes], exclude=("client_id",)
+    )
+    sync_collection(
+        model.redirect_uris,
+        [redirect_uri_entity_to_model(r) for r in entity.redirect_uris],
+        exclude=("client_id",),
+    )
+
+
 def client_model_to_entity(model: ClientModel) -> Client:
     """Convert ORM model to Client domain entity."""
     from identity_service.domain.entities import (
@@ -6,6 +6,7 @@ import json
 import uuid
 from typing import TYPE_CHECKING
 
+from shared.identity.mappers.changes import assign_changed, sync_collection, sync_one
 from shared.identity.models.user import (
     PasswordResetTokenModel,
     UserClaimModel,
@@ -31,9 +32,9 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
-def user_entity_to_model(entity: User) -> UserModel:
-    """Convert User domain entity to ORM model."""
-    model = UserModel(
+def _user_row(entity: User) -> UserModel:
+    """Map the ``users`` columns of a User entity, without child rows."""
+    return UserModel(
         id=str(entity.id),
         email=entity.email,
         username=entity.username,
@@ -45,6 +46,11 @@ def user_entity_to_model(entity: User) -> UserModel:
         updated_at=entity.updated_at,
     )
 
+
+def user_entity_to_model(entity: User) -> UserModel:
+    """Convert User domain entity to ORM model."""
+    model = _user_row(entity)
+
     if entity.credential:
         model.credential = credential_entity_to_model(entity.credential)
 
@@ -57,6 +63,32 @@ def user_entity_to_model(entity: User) -> UserModel:
     return model
 
 
+def apply_user_entity(model: UserModel, entity: User) -> None:
+    """Apply a User entity onto its persistent model, touching only changed state.
+
+    Columns are assigned only when their value differs and child rows are
+    matched by id, so flushing emits an ``UPDATE`` per changed row and
+    ``INSERT``/``DELETE`` only for added or removed claims and roles.
+    """
+    assign_changed(model, _user_row(entity), exclude=("created_at",))
+    model.credential = sync_one(
+        model.credential,
+        credential_entity_to_model(entity.credential) if entity.credential else None,
+        exclude=("user_id",),
+    )
+    model.profile = sync_one(
+        model.profile,
+        profile_entity_to_model(entity.profile) if entity.profile else None,
+        exclude=("user_id",),
+    )
+    sync_collection(
+        model.claims, [claim_entity_to_model(c) for c in entity.claims], exclude=("user_id",)
+    )
+    sync_collection(
+        model.roles, [role_entity_to_model(r) for r in entity.roles], exclude=("user_id",)
+    )
+
+
 def user_model_to_entity(model: UserModel) -> User:
     """Convert ORM model to User domain entity."""
     from identity_service.domain.entities import (
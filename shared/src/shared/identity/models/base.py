@@ -1,5 +1,6 @@
 """Declarative base for identity platform models."""
 
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -11,3 +12,11 @@ class IdentityBase(DeclarativeBase):
     """
 
     pass
+
+
+# Trigram search indexes need pg_trgm; create it before the tables on PostgreSQL
+event.listen(
+    IdentityBase.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
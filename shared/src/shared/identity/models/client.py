@@ -103,6 +103,19 @@ class ClientModel(IdentityBase):
         Index("ix_clients_client_id", "client_id", unique=True),
         Index("ix_clients_active", "is_active"),
         Index("ix_clients_created_by", "created_by"),
+        # Trigram indexes serve ILIKE '%term%' admin search (needs pg_trgm)
+        Index(
+            "ix_clients_client_id_trgm",
+            "client_id",
+            postgresql_using="gin",
+            postgresql_ops={"client_id": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_clients_client_name_trgm",
+            "client_name",
+            postgresql_using="gin",
+            postgresql_ops={"client_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -79,6 +79,19 @@ class UserModel(IdentityBase):
         Index("ix_users_username", "username", unique=True),
         Index("ix_users_external", "external_id", "external_provider"),
         Index("ix_users_active", "is_active"),
+        # Trigram indexes serve ILIKE '%term%' admin search (needs pg_trgm)
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -8,6 +8,7 @@ the shared ORM models.
 from shared.identity.repositories.client_repository import ClientRepository
 from shared.identity.repositories.consent_repository import ConsentRepository
 from shared.identity.repositories.password_reset_repository import PasswordResetRepository
+from shared.identity.repositories.search import SearchPage
 from shared.identity.repositories.token_repository import RefreshTokenRepository
 from shared.identity.repositories.user_repository import UserRepository
 
@@ -16,5 +17,6 @@ __all__ = [
     "ConsentRepository",
     "PasswordResetRepository",
     "RefreshTokenRepository",
+    "SearchPage",
     "UserRepository",
 ]
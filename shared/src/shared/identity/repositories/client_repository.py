@@ -9,10 +9,12 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.identity.mappers.client_mapper import (
+    apply_client_entity,
     client_entity_to_model,
     client_model_to_entity,
 )
 from shared.identity.models.client import ClientModel
+from shared.identity.repositories.search import SearchPage, like_pattern, search_page
 
 if TYPE_CHECKING:
     from identity_service.domain.entities import Client
@@ -23,36 +25,51 @@ class ClientRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        # The session's identity map only holds weak references to unmodified
+        # rows; pin the aggregates returned to callers so ``update`` can diff
+        # against them without reloading.
+        self._loaded: dict[str, ClientModel] = {}
+
+    def _track(self, model: ClientModel) -> Client:
+        self._loaded[model.id] = model
+        return client_model_to_entity(model)
 
     async def get_by_id(self, client_id: uuid.UUID) -> Client | None:
         """Get client by internal UUID."""
         stmt = select(ClientModel).where(ClientModel.id == str(client_id))
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return client_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def get_by_client_id(self, client_id: str) -> Client | None:
         """Get client by OAuth2 public client_id string."""
         stmt = select(ClientModel).where(ClientModel.client_id == client_id)
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return client_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def create(self, client: Client) -> Client:
         """Persist a new OAuth2 client."""
         model = client_entity_to_model(client)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
-        return client_model_to_entity(model)
+        return self._track(model)
 
     async def update(self, client: Client) -> Client:
-        """Update an existing client by merging."""
-        model = client_entity_to_model(client)
-        merged = await self._session.merge(model)
+        """Update an existing client, writing only changed columns and child rows.
+
+        Unknown clients are inserted.
+        """
+        model = self._loaded.get(str(client.id)) or await self._session.get(
+            ClientModel, str(client.id)
+        )
+        if model is None:
+            model = client_entity_to_model(client)
+            self._session.add(model)
+        else:
+            apply_client_entity(model, client)
         await self._session.flush()
-        await self._session.refresh(merged)
-        return client_model_to_entity(merged)
+        return self._track(model)
 
     async def delete(self, client_id: uuid.UUID) -> bool:
         """Soft-delete client (set is_active=False)."""
@@ -108,15 +125,46 @@ class ClientRepository:
         include_inactive: bool = False,
     ) -> list[Client]:
         """Search clients by name or client_id (partial match)."""
-        pattern = f"%{query}%"
-        stmt = select(ClientModel).where(
-            or_(
-                ClientModel.client_id.ilike(pattern),
-                ClientModel.client_name.ilike(pattern),
-            )
+        page = await self.search_page(
+            query, skip=skip, limit=limit, include_inactive=include_inactive
         )
+        return page.items
+
+    async def search_page(
+        self,
+        query: str | None = None,
+        *,
+        include_inactive: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> SearchPage[Client]:
+        """Search clients by client_id or name with the filtered total.
+
+        Results are ordered by client_id. Pass the previous page's
+        ``next_cursor`` as ``cursor`` to seek instead of using ``skip``.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        filters = []
+        if query:
+            pattern = like_pattern(query)
+            filters.append(
+                or_(
+                    ClientModel.client_id.ilike(pattern, escape="\\"),
+                    ClientModel.client_name.ilike(pattern, escape="\\"),
+                )
+            )
         if not include_inactive:
-            stmt = stmt.where(ClientModel.is_active.is_(True))
-        stmt = stmt.offset(skip).limit(limit)
-        result = await self._session.execute(stmt)
-        return [client_model_to_entity(m) for m in result.scalars().all()]
+            filters.append(ClientModel.is_active.is_(True))
+        return await search_page(
+            self._session,
+            ClientModel,
+            client_model_to_entity,
+            filters=filters,
+            sort_key=ClientModel.client_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
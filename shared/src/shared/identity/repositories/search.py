@@ -0,0 +1,109 @@
+"""Paged admin search over identity aggregates.
+
+Substring search is ``ILIKE '%term%'``. A B-tree index cannot serve that,
+but on PostgreSQL the ``pg_trgm`` GIN indexes declared on the searched
+columns can, so the same statement is index-backed there and a plain scan
+on SQLite (tests, local development), where those indexes are skipped.
+
+The filtered total comes from ``count(*) OVER ()`` in the page query
+itself, so listing no longer runs a second, unfiltered ``count()``.
+Offset paging is kept for the admin UI. Callers can pass an opaque
+``cursor`` instead, which seeks past the last returned sort key, so deep
+pages cost the same as the first. Keyset pages skip the total, because
+computing it would need the full filtered set again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from shared.dbs.repository import decode_cursor, encode_cursor
+from shared.identity.models.base import IdentityBase
+
+M = TypeVar("M", bound=IdentityBase)
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchPage(Generic[T]):
+    """One page of search results.
+
+    Attributes:
+        items: Entities on this page.
+        total: Rows matching the filters, or ``None`` on keyset pages.
+        next_cursor: Cursor for the following page, ``None`` on the last page.
+    """
+
+    items: list[T]
+    total: int | None
+    next_cursor: str | None
+
+
+def like_pattern(term: str) -> str:
+    """Build a substring ``LIKE`` pattern, escaping wildcards in ``term``."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def search_page(
+    session: AsyncSession,
+    model: type[M],
+    to_entity: Callable[[M], T],
+    *,
+    filters: Sequence[ColumnElement[bool]],
+    sort_key: InstrumentedAttribute[str],
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> SearchPage[T]:
+    """Run a filtered page query ordered by a unique column.
+
+    Args:
+        session: Database session.
+        model: ORM model to select.
+        to_entity: Maps each row to the returned item.
+        filters: ``WHERE`` conditions.
+        sort_key: Unique column used for ordering and keyset seeks.
+        skip: Offset, ignored when ``cursor`` is given.
+        limit: Page size.
+        cursor: Cursor from a previous page's ``next_cursor``.
+
+    Returns:
+        The page, with the filtered total unless ``cursor`` was given.
+
+    Raises:
+        ValueError: If ``cursor`` is malformed.
+    """
+    total_col = func.count().over().label("total")
+    stmt = select(model, total_col).where(*filters).order_by(sort_key)
+    stmt = stmt.where(sort_key > decode_cursor(cursor)) if cursor is not None else stmt.offset(skip)
+    # One extra row tells us whether another page exists
+    stmt = stmt.limit(limit + 1)
+
+    rows = (await session.execute(stmt)).unique().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    total: int | None = None
+    if cursor is None:
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Past the end: the window had no rows to report on
+            count_stmt = select(func.count()).select_from(model).where(*filters)
+            total = (await session.execute(count_stmt)).scalar() or 0
+        else:
+            total = 0
+
+    items = [to_entity(row[0]) for row in rows]
+    next_cursor = encode_cursor(getattr(rows[-1][0], sort_key.key)) if has_more else None
+    return SearchPage(items=items, total=total, next_cursor=next_cursor)
+
+
+__all__ = ["SearchPage", "decode_cursor", "encode_cursor", "like_pattern", "search_page"]
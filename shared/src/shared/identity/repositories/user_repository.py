@@ -12,8 +12,13 @@ from typing import TYPE_CHECKING
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.identity.mappers.user_mapper import user_entity_to_model, user_model_to_entity
+from shared.identity.mappers.user_mapper import (
+    apply_user_entity,
+    user_entity_to_model,
+    user_model_to_entity,
+)
 from shared.identity.models.user import UserModel
+from shared.identity.repositories.search import SearchPage, like_pattern, search_page
 
 if TYPE_CHECKING:
     from identity_service.domain.entities import User
@@ -28,27 +33,35 @@ class UserRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        # The session's identity map only holds weak references to unmodified
+        # rows; pin the aggregates returned to callers so ``update`` can diff
+        # against them without reloading.
+        self._loaded: dict[str, UserModel] = {}
+
+    def _track(self, model: UserModel) -> User:
+        self._loaded[model.id] = model
+        return user_model_to_entity(model)
 
     async def get_by_id(self, user_id: uuid.UUID) -> User | None:
         """Get user by UUID."""
         stmt = select(UserModel).where(UserModel.id == str(user_id))
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return user_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email (case-insensitive)."""
         stmt = select(UserModel).where(func.lower(UserModel.email) == email.lower())
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return user_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def get_by_username(self, username: str) -> User | None:
         """Get user by username (case-insensitive)."""
         stmt = select(UserModel).where(func.lower(UserModel.username) == username.lower())
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return user_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def get_by_external_id(self, external_id: str, provider: str) -> User | None:
         """Get user by external provider ID."""
@@ -58,23 +71,31 @@ class UserRepository:
         )
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        return user_model_to_entity(model) if model else None
+        return self._track(model) if model else None
 
     async def create(self, user: User) -> User:
         """Persist a new user."""
         model = user_entity_to_model(user)
         self._session.add(model)
         await self._session.flush()
-        await self._session.refresh(model)
-        return user_model_to_entity(model)
+        return self._track(model)
 
     async def update(self, user: User) -> User:
-        """Update an existing user by merging the entity."""
-        model = user_entity_to_model(user)
-        merged = await self._session.merge(model)
+        """Update an existing user, writing only what changed.
+
+        The model behind an entity returned earlier by this repository is
+        reused without a query; only changed columns and child rows are
+        flushed, so a failed-login counter bump is a single ``UPDATE``.
+        Unknown users are inserted.
+        """
+        model = self._loaded.get(str(user.id)) or await self._session.get(UserModel, str(user.id))
+        if model is None:
+            model = user_entity_to_model(user)
+            self._session.add(model)
+        else:
+            apply_user_entity(model, user)
         await self._session.flush()
-        await self._session.refresh(merged)
-        return user_model_to_entity(merged)
+        return self._track(model)
 
     async def delete(self, user_id: uuid.UUID) -> bool:
         """Soft-delete user (set is_active=False)."""
@@ -137,15 +158,51 @@ class UserRepository:
         include_inactive: bool = False,
     ) -> list[User]:
         """Search users by email or username (partial match)."""
-        pattern = f"%{query}%"
-        stmt = select(UserModel).where(
-            or_(
-                UserModel.email.ilike(pattern),
-                UserModel.username.ilike(pattern),
-            )
+        page = await self.search_page(
+            query, skip=skip, limit=limit, include_inactive=include_inactive
         )
+        return page.items
+
+    async def search_page(
+        self,
+        query: str | None = None,
+        *,
+        role: str | None = None,
+        include_inactive: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> SearchPage[User]:
+        """Search users by email or username with the filtered total.
+
+        Results are ordered by email. Pass the previous page's
+        ``next_cursor`` as ``cursor`` to seek instead of using ``skip``.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        from shared.identity.models.user import UserRoleModel
+
+        filters = []
+        if query:
+            pattern = like_pattern(query)
+            filters.append(
+                or_(
+                    UserModel.email.ilike(pattern, escape="\\"),
+                    UserModel.username.ilike(pattern, escape="\\"),
+                )
+            )
+        if role:
+            filters.append(UserModel.roles.any(UserRoleModel.role_name == role))
         if not include_inactive:
-            stmt = stmt.where(UserModel.is_active.is_(True))
-        stmt = stmt.offset(skip).limit(limit)
-        result = await self._session.execute(stmt)
-        return [user_model_to_entity(m) for m in result.scalars().all()]
+            filters.append(UserModel.is_active.is_(True))
+        return await search_page(
+            self._session,
+            UserModel,
+            user_model_to_entity,
+            filters=filters,
+            sort_key=UserModel.email,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
@@ -0,0 +1,410 @@
+"""Session storage for the identity platform.
+
+Defines the ``SessionInfo`` record and a ``SessionStore`` abstraction with
+two implementations:
+
+- ``InMemorySessionStore``: per-process dicts with a bidirectional
+  session <-> token index and a purge heap, for tests and single-replica
+  deployments.
+- ``RedisSessionStore``: one hash per session, a reverse token index and a
+  per-user set. Keys expire natively at their purge deadline; per-user
+  sets are maintained with pipelined operations.
+
+Both identity-service (session lifecycle) and worker-service (periodic
+purge) use these stores, so they live in the shared identity package.
+"""
+
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+class SessionStatus(str, Enum):
+    """Session status."""
+
+    ACTIVE = "active"
+    EXPIRED = "expired"
+    REVOKED = "revoked"
+
+
+@dataclass
+class SessionInfo:
+    """Information about a user session."""
+
+    session_id: str
+    user_id: str
+    created_at: datetime
+    last_activity_at: datetime
+    expires_at: datetime
+    status: SessionStatus = SessionStatus.ACTIVE
+
+    # Device/client info
+    ip_address: str | None = None
+    user_agent: str | None = None
+    device_type: str | None = None
+    device_name: str | None = None
+    browser: str | None = None
+    os: str | None = None
+    location: str | None = None
+
+    # OAuth info
+    client_id: str | None = None
+    scope: str | None = None
+
+    # Metadata
+    is_current: bool = False  # Is this the requesting session?
+    revoked_at: datetime | None = None
+    revoke_reason: str | None = None
+
+
+_DATETIME_FIELDS = frozenset({"created_at", "last_activity_at", "expires_at", "revoked_at"})
+_TRANSIENT_FIELDS = frozenset({"is_current"})
+
+
+class SessionStore(ABC):
+    """Persistence for sessions, indexed by session ID, token hash and user.
+
+    Every stored session carries a purge deadline after which it is
+    removed entirely (expired and revoked sessions stay readable until
+    then for auditing).
+    """
+
+    @abstractmethod
+    async def add(self, session: SessionInfo, token_hash: str, purge_at: datetime) -> None:
+        """Store a new session and index it by token hash and user."""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> SessionInfo | None:
+        """Get a session by ID."""
+
+    @abstractmethod
+    async def get_by_token_hash(self, token_hash: str) -> SessionInfo | None:
+        """Resolve a session from the hash of its token."""
+
+    @abstractmethod
+    async def list_for_user(self, user_id: str) -> list[SessionInfo]:
+        """Get every stored session of a user (any status)."""
+
+    @abstractmethod
+    async def touch(self, session_id: str, last_activity_at: datetime) -> None:
+        """Update the last activity time of a session."""
+
+    @abstractmethod
+    async def mark_expired(self, session_id: str) -> None:
+        """Set a session's status to expired."""
+
+    @abstractmethod
+    async def revoke(
+        self,
+        session_ids: Sequence[str],
+        revoked_at: datetime,
+        reason: str,
+        purge_at: datetime,
+    ) -> int:
+        """Revoke sessions and move their purge deadline.
+
+        Returns:
+            Number of sessions that existed and were revoked.
+        """
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime | None = None) -> int:
+        """Remove sessions whose purge deadline has passed.
+
+        Returns:
+            Number of sessions removed.
+        """
+
+
+class InMemorySessionStore(SessionStore):
+    """Per-process session store.
+
+    Keeps a bidirectional session <-> token index so removing a session
+    never scans the token map, and a min-heap of purge deadlines so
+    ``purge_expired`` only touches sessions that are actually due.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty store."""
+        self._sessions: dict[str, SessionInfo] = {}
+        self._purge_at: dict[str, float] = {}
+        self._token_to_session: dict[str, str] = {}
+        self._session_to_token: dict[str, str] = {}
+        self._user_sessions: dict[str, set[str]] = {}
+        self._purge_heap: list[tuple[float, str]] = []
+
+    def _schedule(self, session_id: str, purge_at: datetime) -> None:
+        deadline = purge_at.timestamp()
+        self._purge_at[session_id] = deadline
+        heapq.heappush(self._purge_heap, (deadline, session_id))
+
+    async def add(self, session: SessionInfo, token_hash: str, purge_at: datetime) -> None:
+        self._sessions[session.session_id] = session
+        self._token_to_session[token_hash] = session.session_id
+        self._session_to_token[session.session_id] = token_hash
+        self._user_sessions.setdefault(session.user_id, set()).add(session.session_id)
+        self._schedule(session.session_id, purge_at)
+
+    async def get(self, session_id: str) -> SessionInfo | None:
+        return self._sessions.get(session_id)
+
+    async def get_by_token_hash(self, token_hash: str) -> SessionInfo | None:
+        session_id = self._token_to_session.get(token_hash)
+        return self._sessions.get(session_id) if session_id else None
+
+    async def list_for_user(self, user_id: str) -> list[SessionInfo]:
+        return [
+            self._sessions[sid]
+            for sid in self._user_sessions.get(user_id, ())
+            if sid in self._sessions
+        ]
+
+    async def touch(self, session_id: str, last_activity_at: datetime) -> None:
+        session = self._sessions.get(session_id)
+        if session:
+            session.last_activity_at = last_activity_at
+
+    async def mark_expired(self, session_id: str) -> None:
+        session = self._sessions.get(session_id)
+        if session:
+            session.status = SessionStatus.EXPIRED
+
+    async def revoke(
+        self,
+        session_ids: Sequence[str],
+        revoked_at: datetime,
+        reason: str,
+        purge_at: datetime,
+    ) -> int:
+        revoked = 0
+        for session_id in session_ids:
+            session = self._sessions.get(session_id)
+            if session is None:
+                continue
+            session.status = SessionStatus.REVOKED
+            session.revoked_at = revoked_at
+            session.revoke_reason = reason
+            self._schedule(session_id, purge_at)
+            revoked += 1
+        return revoked
+
+    async def purge_expired(self, now: datetime | None = None) -> int:
+        cutoff = (now or datetime.now(UTC)).timestamp()
+        heap = self._purge_heap
+        removed = 0
+        while heap and heap[0][0] <= cutoff:
+            deadline, session_id = heapq.heappop(heap)
+            # Skip entries superseded by a later reschedule
+            if self._purge_at.get(session_id) != deadline:
+                continue
+            del self._purge_at[session_id]
+            session = self._sessions.pop(session_id, None)
+            token_hash = self._session_to_token.pop(session_id, None)
+            if token_hash is not None:
+                self._token_to_session.pop(token_hash, None)
+            if session is not None:
+                user_sessions = self._user_sessions.get(session.user_id)
+                if user_sessions is not None:
+                    user_sessions.discard(session_id)
+                    if not user_sessions:
+                        del self._user_sessions[session.user_id]
+                removed += 1
+        return removed
+
+
+class RedisSessionStore(SessionStore):
+    """Redis-backed session store shared by all replicas.
+
+    Layout (``{p}`` is the key prefix):
+
+    - ``{p}:session:{id}`` - hash of session fields, expiring at purge time
+    - ``{p}:token:{hash}`` - session ID, expiring at purge time
+    - ``{p}:user:{user_id}`` - set of the user's session IDs
+    - ``{p}:purge`` - sorted set of ``user_id:session_id`` by purge time
+
+    Session and token keys disappear on their own; ``purge_expired`` only
+    has to prune the per-user sets of the entries that are due.
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "identity:sessions") -> None:
+        """Initialize store.
+
+        Args:
+            client: Async Redis client (``decode_responses=True``).
+            prefix: Key namespace.
+        """
+        self._redis = client
+        self._prefix = prefix
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self._prefix}:session:{session_id}"
+
+    def _token_key(self, token_hash: str) -> str:
+        return f"{self._prefix}:token:{token_hash}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self._prefix}:user:{user_id}"
+
+    @property
+    def _purge_key(self) -> str:
+        return f"{self._prefix}:purge"
+
+    async def add(self, session: SessionInfo, token_hash: str, purge_at: datetime) -> None:
+        session_key = self._session_key(session.session_id)
+        token_key = self._token_key(token_hash)
+        deadline_ms = int(purge_at.timestamp() * 1000)
+        mapping = _session_to_hash(session)
+        mapping["token_hash"] = token_hash
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(session_key, mapping=mapping)
+            pipe.pexpireat(session_key, deadline_ms)
+            pipe.set(token_key, session.session_id, pxat=deadline_ms)
+            pipe.sadd(self._user_key(session.user_id), session.session_id)
+            pipe.zadd(
+                self._purge_key,
+                {f"{session.user_id}:{session.session_id}": purge_at.timestamp()},
+            )
+            await pipe.execute()
+
+    async def get(self, session_id: str) -> SessionInfo | None:
+        data = await self._redis.hgetall(self._session_key(session_id))
+        return _session_from_hash(data) if data else None
+
+    async def get_by_token_hash(self, token_hash: str) -> SessionInfo | None:
+        session_id = await self._redis.get(self._token_key(token_hash))
+        return await self.get(session_id) if session_id else None
+
+    async def list_for_user(self, user_id: str) -> list[SessionInfo]:
+        session_ids = list(await self._redis.smembers(self._user_key(user_id)))
+        if not session_ids:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hgetall(self._session_key(session_id))
+            rows = await pipe.execute()
+
+        sessions: list[SessionInfo] = []
+        stale: list[str] = []
+        for session_id, data in zip(session_ids, rows, strict=True):
+            if data:
+                sessions.append(_session_from_hash(data))
+            else:
+                stale.append(session_id)
+        if stale:
+            # Hash already expired natively - drop the dangling set members
+            await self._redis.srem(self._user_key(user_id), *stale)
+        return sessions
+
+    async def touch(self, session_id: str, last_activity_at: datetime) -> None:
+        session_key = self._session_key(session_id)
+        if await self._redis.exists(session_key):
+            await self._redis.hset(session_key, "last_activity_at", last_activity_at.isoformat())
+
+    async def mark_expired(self, session_id: str) -> None:
+        session_key = self._session_key(session_id)
+        if await self._redis.exists(session_key):
+            await self._redis.hset(session_key, "status", SessionStatus.EXPIRED.value)
+
+    async def revoke(
+        self,
+        session_ids: Sequence[str],
+        revoked_at: datetime,
+        reason: str,
+        purge_at: datetime,
+    ) -> int:
+        if not session_ids:
+            return 0
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.hmget(self._session_key(session_id), "user_id", "token_hash")
+            lookups = await pipe.execute()
+
+        deadline_ms = int(purge_at.timestamp() * 1000)
+        revoked = 0
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for session_id, (user_id, token_hash) in zip(session_ids, lookups, strict=True):
+                if user_id is None:
+                    continue
+                session_key = self._session_key(session_id)
+                pipe.hset(
+                    session_key,
+                    mapping={
+                        "status": SessionStatus.REVOKED.value,
+                        "revoked_at": revoked_at.isoformat(),
+                        "revoke_reason": reason,
+                    },
+                )
+                pipe.pexpireat(session_key, deadline_ms)
+                if token_hash:
+                    pipe.pexpireat(self._token_key(token_hash), deadline_ms)
+                pipe.zadd(self._purge_key, {f"{user_id}:{session_id}": purge_at.timestamp()})
+                revoked += 1
+            if revoked:
+                await pipe.execute()
+        return revoked
+
+    async def purge_expired(self, now: datetime | None = None) -> int:
+        cutoff = (now or datetime.now(UTC)).timestamp()
+        due = await self._redis.zrangebyscore(self._purge_key, "-inf", cutoff)
+        if not due:
+            return 0
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for member in due:
+                user_id, _, session_id = member.rpartition(":")
+                pipe.srem(self._user_key(user_id), session_id)
+                pipe.delete(self._session_key(session_id))
+            pipe.zrem(self._purge_key, *due)
+            await pipe.execute()
+        return len(due)
+
+
+def _session_to_hash(session: SessionInfo) -> dict[str, str]:
+    """Flatten a session into Redis hash fields (None values are omitted)."""
+    mapping: dict[str, str] = {}
+    for f in fields(session):
+        if f.name in _TRANSIENT_FIELDS:
+            continue
+        value = getattr(session, f.name)
+        if value is None:
+            continue
+        if isinstance(value, datetime):
+            mapping[f.name] = value.isoformat()
+        elif isinstance(value, Enum):
+            mapping[f.name] = value.value
+        else:
+            mapping[f.name] = str(value)
+    return mapping
+
+
+def _session_from_hash(data: dict[str, str]) -> SessionInfo:
+    """Rebuild a session from Redis hash fields."""
+    kwargs: dict[str, Any] = {}
+    for f in fields(SessionInfo):
+        if f.name not in data:
+            continue
+        raw = data[f.name]
+        if f.name in _DATETIME_FIELDS:
+            kwargs[f.name] = datetime.fromisoformat(raw)
+        elif f.name == "status":
+            kwargs[f.name] = SessionStatus(raw)
+        else:
+            kwargs[f.name] = raw
+    return SessionInfo(**kwargs)
+
+
+__all__ = [
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "SessionInfo",
+    "SessionStatus",
+    "SessionStore",
+]
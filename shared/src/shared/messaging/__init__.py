@@ -19,12 +19,45 @@ Example:
 
 from __future__ import annotations
 
-from shared.messaging.config import KafkaSettings, RabbitMQSettings
-from shared.messaging.event_bridge import EventOutboxBridge
-from shared.messaging.kafka import KafkaEventConsumer, KafkaEventProducer
-from shared.messaging.rabbitmq import RabbitMQConsumer, RabbitMQPublisher
-from shared.messaging.serialization import EventEnvelope, EventSerializer
-from shared.messaging.types import EventCallback, EventConsumer, EventPublisher
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.messaging.config import KafkaSettings, RabbitMQSettings
+    from shared.messaging.event_bridge import EventOutboxBridge
+    from shared.messaging.kafka import KafkaEventConsumer, KafkaEventProducer
+    from shared.messaging.rabbitmq import RabbitMQConsumer, RabbitMQPublisher
+    from shared.messaging.serialization import EventEnvelope, EventSerializer
+    from shared.messaging.types import (
+        ConfirmingEventPublisher,
+        EventCallback,
+        EventConsumer,
+        EventPublisher,
+        OutgoingEvent,
+        PublishResult,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "KafkaSettings": "shared.messaging.config",
+        "RabbitMQSettings": "shared.messaging.config",
+        "EventOutboxBridge": "shared.messaging.event_bridge",
+        "KafkaEventConsumer": "shared.messaging.kafka",
+        "KafkaEventProducer": "shared.messaging.kafka",
+        "RabbitMQConsumer": "shared.messaging.rabbitmq",
+        "RabbitMQPublisher": "shared.messaging.rabbitmq",
+        "EventEnvelope": "shared.messaging.serialization",
+        "EventSerializer": "shared.messaging.serialization",
+        "ConfirmingEventPublisher": "shared.messaging.types",
+        "EventCallback": "shared.messaging.types",
+        "EventConsumer": "shared.messaging.types",
+        "EventPublisher": "shared.messaging.types",
+        "OutgoingEvent": "shared.messaging.types",
+        "PublishResult": "shared.messaging.types",
+    },
+)
 
 __all__ = [
     # Configuration
@@ -32,8 +65,11 @@ __all__ = [
     "KafkaSettings",
     # Protocols
     "EventPublisher",
+    "ConfirmingEventPublisher",
     "EventConsumer",
     "EventCallback",
+    "OutgoingEvent",
+    "PublishResult",
     # Serialization
     "EventSerializer",
     "EventEnvelope",
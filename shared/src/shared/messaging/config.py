@@ -28,6 +28,8 @@ class RabbitMQSettings(BaseSettings):
         heartbeat: Heartbeat interval in seconds.
         exchange_name: Default exchange name for domain events.
         dead_letter_exchange: Dead letter exchange name.
+        publisher_channel_pool_size: Number of confirm channels a publisher spreads load over.
+        publisher_max_in_flight: Maximum unconfirmed publishes per publisher.
 
     Example:
         >>> settings = RabbitMQSettings()
@@ -73,6 +75,18 @@ class RabbitMQSettings(BaseSettings):
         default="domain.events.dlx",
         description="Dead letter exchange name",
     )
+    publisher_channel_pool_size: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Confirm channels per publisher",
+    )
+    publisher_max_in_flight: int = Field(
+        default=256,
+        ge=1,
+        le=65535,
+        description="Maximum unconfirmed publishes per publisher",
+    )
 
     @property
     def url(self) -> str:
@@ -11,6 +11,8 @@ Architecture:
     1. Service writes entity + outbox entry in one transaction
     2. OutboxRelay polls outbox table for unpublished entries
     3. Relay publishes each entry to the broker and marks it as published
+       (with a confirming publisher the whole batch is pipelined and
+       confirmed entries are marked in one statement)
     4. Failed entries are retried with exponential backoff
 
 Example:
@@ -31,7 +33,7 @@ from __future__ import annotations
 import json
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy import Boolean, DateTime, Integer, String, Text, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,7 +41,7 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from shared.ddd.events import DomainEvent
 from shared.messaging.serialization import EventSerializer
-from shared.messaging.types import EventPublisher
+from shared.messaging.types import ConfirmingEventPublisher, EventPublisher, OutgoingEvent
 
 logger = logging.getLogger(__name__)
 
@@ -207,6 +209,24 @@ class OutboxRepository:
         )
         await self._session.execute(stmt)
 
+    async def mark_published_many(self, entry_ids: list[int]) -> None:
+        """Mark several outbox entries as published in a single statement.
+
+        Args:
+            entry_ids: Primary keys of the entries.
+        """
+        if not entry_ids:
+            return
+        stmt = (
+            update(OutboxEntry)
+            .where(OutboxEntry.id.in_(entry_ids))
+            .values(
+                published=True,
+                published_at=datetime.now(UTC),
+            )
+        )
+        await self._session.execute(stmt)
+
     async def mark_failed(self, entry_id: int, error: str) -> None:
         """Record a publish failure and increment retry count.
 
@@ -231,6 +251,10 @@ class OutboxRelay:
     Polls the outbox table for unpublished entries, publishes them
     to the configured broker, and marks them as published.
 
+    With ``pipelined=True`` the publisher must implement
+    ``ConfirmingEventPublisher``: the whole batch is handed to
+    ``publish_many`` and confirmed entries are bulk-marked.
+
     Attributes:
         outbox_repo: Repository for accessing outbox entries.
         publisher: Event publisher (RabbitMQ or Kafka).
@@ -246,6 +270,8 @@ class OutboxRelay:
         outbox_repo: OutboxRepository,
         publisher: EventPublisher,
         serializer: EventSerializer,
+        *,
+        pipelined: bool = False,
     ) -> None:
         """Initialize relay.
 
@@ -253,10 +279,19 @@ class OutboxRelay:
             outbox_repo: Repository for outbox entries.
             publisher: Event publisher for sending to broker.
             serializer: Event serializer.
+            pipelined: Publish batches through ``publish_many``.
+
+        Raises:
+            TypeError: If ``pipelined`` is set and the publisher does not
+                support per-message confirms.
         """
+        if pipelined and not isinstance(publisher, ConfirmingEventPublisher):
+            msg = f"{type(publisher).__name__} does not implement publish_many()"
+            raise TypeError(msg)
         self._outbox_repo = outbox_repo
         self._publisher = publisher
         self._serializer = serializer
+        self._pipelined = pipelined
 
     async def process_pending(
         self,
@@ -283,6 +318,24 @@ class OutboxRelay:
         if not entries:
             return 0
 
+        if self._pipelined:
+            published_count = await self._process_pipelined(entries)
+        else:
+            published_count = await self._process_sequential(entries)
+
+        logger.info(
+            "Outbox relay batch completed",
+            extra={
+                "total": len(entries),
+                "published": published_count,
+                "failed": len(entries) - published_count,
+            },
+        )
+
+        return published_count
+
+    async def _process_sequential(self, entries: list[OutboxEntry]) -> int:
+        """Publish entries one at a time, marking each individually."""
         published_count = 0
 
         for entry in entries:
@@ -324,17 +377,61 @@ class OutboxRelay:
                 )
                 await self._outbox_repo.mark_failed(entry.id, str(exc))
 
-        logger.info(
-            "Outbox relay batch completed",
-            extra={
-                "total": len(entries),
-                "published": published_count,
-                "failed": len(entries) - published_count,
-            },
-        )
-
         return published_count
 
+    async def _process_pipelined(self, entries: list[OutboxEntry]) -> int:
+        """Publish the batch with pipelined confirms and bulk-mark results."""
+        publisher = cast(ConfirmingEventPublisher, self._publisher)
+        sendable: list[OutboxEntry] = []
+        messages: list[OutgoingEvent] = []
+        for entry in entries:
+            try:
+                event = _reconstruct_minimal_event(json.loads(entry.payload), entry)
+            except Exception as exc:
+                # A poison payload must not hold back the rest of the batch
+                logger.warning(
+                    "Failed to publish outbox entry",
+                    extra={
+                        "event_id": entry.event_id,
+                        "event_type": entry.event_type,
+                        "retry_count": entry.retry_count,
+                        "error": str(exc),
+                    },
+                )
+                await self._outbox_repo.mark_failed(entry.id, str(exc))
+                continue
+            sendable.append(entry)
+            messages.append(
+                OutgoingEvent(
+                    event,
+                    routing_key=entry.routing_key,
+                    headers={
+                        "x-source": entry.source,
+                        "x-correlation-id": entry.correlation_id or "",
+                    },
+                )
+            )
+        results = await publisher.publish_many(messages) if messages else []
+
+        confirmed_ids: list[int] = []
+        for entry, result in zip(sendable, results, strict=True):
+            if result.confirmed:
+                confirmed_ids.append(entry.id)
+                continue
+            logger.warning(
+                "Failed to publish outbox entry",
+                extra={
+                    "event_id": entry.event_id,
+                    "event_type": entry.event_type,
+                    "retry_count": entry.retry_count,
+                    "error": result.error,
+                },
+            )
+            await self._outbox_repo.mark_failed(entry.id, result.error or "nacked")
+
+        await self._outbox_repo.mark_published_many(confirmed_ids)
+        return len(confirmed_ids)
+
 
 def _derive_routing_key(event: DomainEvent) -> str:
     """Derive a routing key from event type name.
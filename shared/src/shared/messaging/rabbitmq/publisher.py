@@ -2,11 +2,18 @@
 
 Publishes domain events to a RabbitMQ topic exchange with
 automatic reconnection, structured logging, and DLX support.
+
+Publishes are spread round-robin over a small pool of confirm
+channels and pipelined under a bounded in-flight window, so a batch
+waits for its slowest confirm instead of the sum of all confirms.
 """
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import aio_pika
@@ -20,6 +27,7 @@ from aio_pika.abc import (
 from shared.ddd.events import DomainEvent
 from shared.messaging.config import RabbitMQSettings
 from shared.messaging.serialization import EventSerializer
+from shared.messaging.types import OutgoingEvent, PublishResult
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +39,10 @@ class RabbitMQPublisher:
     Events are serialized into JSON envelopes with metadata for
     tracing and deduplication.
 
+    Every channel has publisher confirms enabled. Concurrent publishes
+    are distributed over ``publisher_channel_pool_size`` channels and
+    at most ``publisher_max_in_flight`` messages await a confirm at once.
+
     Attributes:
         settings: RabbitMQ connection and exchange configuration.
         serializer: Event serializer for wire-format conversion.
@@ -43,6 +55,9 @@ class RabbitMQPublisher:
         ...         UserCreated(user_id="123"),
         ...         routing_key="user.created",
         ...     )
+        ...     results = await publisher.publish_many(
+        ...         [OutgoingEvent(e, routing_key="user.created") for e in events]
+        ...     )
     """
 
     def __init__(
@@ -61,12 +76,17 @@ class RabbitMQPublisher:
         self._connection: AbstractRobustConnection | None = None
         self._channel: AbstractChannel | None = None
         self._exchange: AbstractExchange | None = None
+        self._channels: list[AbstractChannel] = []
+        self._exchanges: list[AbstractExchange] = []
+        self._exchange_cycle: itertools.cycle[AbstractExchange] | None = None
+        self._in_flight = asyncio.Semaphore(settings.publisher_max_in_flight)
 
     async def connect(self) -> None:
         """Establish connection to RabbitMQ and declare the topic exchange.
 
-        Creates a robust connection with auto-reconnect, opens a channel,
-        and declares the domain events topic exchange and its dead letter exchange.
+        Creates a robust connection with auto-reconnect, opens the pool of
+        confirm channels, and declares the domain events topic exchange and
+        its dead letter exchange.
         """
         logger.info(
             "Connecting to RabbitMQ",
@@ -77,7 +97,7 @@ class RabbitMQPublisher:
             timeout=self._settings.connection_timeout,
             heartbeat=self._settings.heartbeat,
         )
-        self._channel = await self._connection.channel()
+        self._channel = await self._connection.channel(publisher_confirms=True)
 
         # Declare dead letter exchange
         await self._channel.declare_exchange(
@@ -92,17 +112,35 @@ class RabbitMQPublisher:
             ExchangeType.TOPIC,
             durable=True,
         )
+
+        # Remaining pool channels reuse the already declared exchange
+        self._channels = [self._channel]
+        self._exchanges = [self._exchange]
+        for _ in range(self._settings.publisher_channel_pool_size - 1):
+            channel = await self._connection.channel(publisher_confirms=True)
+            exchange = await channel.get_exchange(self._settings.exchange_name, ensure=False)
+            self._channels.append(channel)
+            self._exchanges.append(exchange)
+        self._exchange_cycle = itertools.cycle(self._exchanges)
         logger.info(
             "RabbitMQ publisher connected",
-            extra={"exchange": self._settings.exchange_name},
+            extra={
+                "exchange": self._settings.exchange_name,
+                "channels": len(self._channels),
+                "max_in_flight": self._settings.publisher_max_in_flight,
+            },
         )
 
     async def disconnect(self) -> None:
-        """Close the RabbitMQ connection and channel."""
-        if self._channel and not self._channel.is_closed:
-            await self._channel.close()
+        """Close the RabbitMQ connection and channel pool."""
+        for channel in self._channels or ([self._channel] if self._channel else []):
+            if not channel.is_closed:
+                await channel.close()
         if self._connection and not self._connection.is_closed:
             await self._connection.close()
+        self._channels = []
+        self._exchanges = []
+        self._exchange_cycle = None
         logger.info("RabbitMQ publisher disconnected")
 
     async def publish(
@@ -114,6 +152,8 @@ class RabbitMQPublisher:
     ) -> None:
         """Publish a single domain event to the exchange.
 
+        Waits for the broker confirm before returning.
+
         Args:
             event: Domain event to publish.
             routing_key: Topic routing key (defaults to event_type in snake_case).
@@ -122,23 +162,10 @@ class RabbitMQPublisher:
         Raises:
             RuntimeError: If publisher is not connected.
         """
-        if self._exchange is None:
-            msg = "Publisher not connected. Call connect() or use async with."
-            raise RuntimeError(msg)
-
+        exchange = self._next_exchange()
         key = routing_key or self._default_routing_key(event)
-        correlation_id = event.metadata.get("correlation_id")
-        body = self._serializer.serialize(event, correlation_id=correlation_id)
-
-        message = Message(
-            body=body,
-            content_type="application/json",
-            message_id=event.event_id,
-            headers=headers or {},
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-        )
-
-        await self._exchange.publish(message, routing_key=key)
+        async with self._in_flight:
+            await exchange.publish(self._build_message(event, headers), routing_key=key)
         logger.debug(
             "Event published",
             extra={
@@ -153,14 +180,134 @@ class RabbitMQPublisher:
         events: list[DomainEvent],
         routing_key: str | None = None,
     ) -> None:
-        """Publish multiple domain events.
+        """Publish multiple domain events with pipelined confirms.
 
         Args:
             events: List of domain events to publish.
             routing_key: Common routing key (per-event default if None).
+
+        Raises:
+            RuntimeError: If publisher is not connected.
+            Exception: The first publish error, after every message settled.
+        """
+        errors = await self._publish_pipelined(
+            [OutgoingEvent(event, routing_key=routing_key) for event in events]
+        )
+        for error in errors:
+            if error is not None:
+                raise error
+
+    async def publish_many(
+        self,
+        messages: Sequence[OutgoingEvent],
+    ) -> list[PublishResult]:
+        """Publish events concurrently and report each broker confirm.
+
+        Unlike ``publish_batch`` this never raises for individual messages:
+        nacks, returns and channel errors are reported per message so that
+        callers such as the outbox relay can bulk-mark the outcome.
+
+        Args:
+            messages: Events with per-message routing keys and headers.
+
+        Returns:
+            One ``PublishResult`` per message, in input order.
+
+        Raises:
+            RuntimeError: If publisher is not connected.
+        """
+        errors = await self._publish_pipelined(messages)
+        results = [
+            PublishResult(
+                event_id=message.event.event_id,
+                routing_key=message.routing_key or self._default_routing_key(message.event),
+                confirmed=error is None,
+                error=None if error is None else str(error) or type(error).__name__,
+            )
+            for message, error in zip(messages, errors, strict=True)
+        ]
+        nacked = sum(1 for result in results if not result.confirmed)
+        logger.debug(
+            "Event batch published",
+            extra={"total": len(results), "confirmed": len(results) - nacked, "nacked": nacked},
+        )
+        return results
+
+    async def _publish_pipelined(
+        self,
+        messages: Sequence[OutgoingEvent],
+    ) -> list[BaseException | None]:
+        """Publish messages under the in-flight window.
+
+        A slot is acquired before each publish is started and released
+        when its confirm (or failure) arrives, so at most
+        ``publisher_max_in_flight`` confirms are outstanding at any time.
+
+        Args:
+            messages: Messages to publish.
+
+        Returns:
+            Per-message exception, or None when the message was confirmed.
+        """
+        if self._exchange is None:
+            msg = "Publisher not connected. Call connect() or use async with."
+            raise RuntimeError(msg)
+
+        errors: list[BaseException | None] = [None] * len(messages)
+
+        async def _send(index: int, exchange: AbstractExchange, message: Message, key: str) -> None:
+            try:
+                await exchange.publish(message, routing_key=key)
+            except Exception as exc:
+                errors[index] = exc
+            finally:
+                self._in_flight.release()
+
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            for index, item in enumerate(messages):
+                try:
+                    key = item.routing_key or self._default_routing_key(item.event)
+                    message = self._build_message(item.event, item.headers)
+                except Exception as exc:
+                    # One unserializable event must not abort the rest of the batch
+                    errors[index] = exc
+                    continue
+                await self._in_flight.acquire()
+                tasks.append(asyncio.create_task(_send(index, self._next_exchange(), message, key)))
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks)
+        return errors
+
+    def _next_exchange(self) -> AbstractExchange:
+        """Return the exchange bound to the next pool channel (round-robin).
+
+        Raises:
+            RuntimeError: If publisher is not connected.
         """
-        for event in events:
-            await self.publish(event, routing_key=routing_key)
+        if self._exchange is None:
+            msg = "Publisher not connected. Call connect() or use async with."
+            raise RuntimeError(msg)
+        if self._exchange_cycle is None:
+            return self._exchange
+        return next(self._exchange_cycle)
+
+    def _build_message(
+        self,
+        event: DomainEvent,
+        headers: dict[str, str] | None,
+    ) -> Message:
+        """Serialize an event into a persistent AMQP message."""
+        correlation_id = event.metadata.get("correlation_id")
+        body = self._serializer.serialize(event, correlation_id=correlation_id)
+        return Message(
+            body=body,
+            content_type="application/json",
+            message_id=event.event_id,
+            headers=headers or {},
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
 
     @staticmethod
     def _default_routing_key(event: DomainEvent) -> str:
@@ -6,7 +6,8 @@ allowing broker-agnostic service code.
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
 from shared.ddd.events import DomainEvent
@@ -62,6 +63,64 @@ class EventPublisher(Protocol):
         ...
 
 
+@dataclass(frozen=True, slots=True)
+class OutgoingEvent:
+    """A domain event queued for publishing with its own routing metadata.
+
+    Attributes:
+        event: The domain event to publish.
+        routing_key: Broker routing key (publisher default if None).
+        headers: Optional message headers.
+    """
+
+    event: DomainEvent
+    routing_key: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class PublishResult:
+    """Per-message outcome of a confirmed publish.
+
+    Attributes:
+        event_id: ID of the published event.
+        routing_key: Routing key the event was published with.
+        confirmed: True if the broker acknowledged the message.
+        error: Error description when the message was nacked or failed.
+    """
+
+    event_id: str
+    routing_key: str
+    confirmed: bool
+    error: str | None = None
+
+
+@runtime_checkable
+class ConfirmingEventPublisher(EventPublisher, Protocol):
+    """Publisher that pipelines publishes and reports per-message confirms.
+
+    Example:
+        >>> results = await publisher.publish_many(
+        ...     [OutgoingEvent(event, routing_key="user.created")]
+        ... )
+        >>> confirmed = [r.event_id for r in results if r.confirmed]
+    """
+
+    async def publish_many(
+        self,
+        messages: Sequence[OutgoingEvent],
+    ) -> list[PublishResult]:
+        """Publish messages concurrently and collect broker confirms.
+
+        Args:
+            messages: Events with per-message routing keys and headers.
+
+        Returns:
+            One result per message, in input order.
+        """
+        ...
+
+
 # Type alias for event handler callbacks
 EventCallback = Callable[[DomainEvent, dict[str, Any]], Awaitable[None]]
 
@@ -29,15 +29,33 @@ Example:
 
 from __future__ import annotations
 
-from shared.notifications.base import (
-    InMemoryNotificationChannel,
-    Notification,
-    NotificationChannel,
-    NotificationPriority,
-    NotificationResult,
-    NotificationStatus,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.notifications.base import (
+        InMemoryNotificationChannel,
+        Notification,
+        NotificationChannel,
+        NotificationPriority,
+        NotificationResult,
+        NotificationStatus,
+    )
+    from shared.notifications.service import NotificationService
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "InMemoryNotificationChannel": "shared.notifications.base",
+        "Notification": "shared.notifications.base",
+        "NotificationChannel": "shared.notifications.base",
+        "NotificationPriority": "shared.notifications.base",
+        "NotificationResult": "shared.notifications.base",
+        "NotificationStatus": "shared.notifications.base",
+        "NotificationService": "shared.notifications.service",
+    },
 )
-from shared.notifications.service import NotificationService
 
 __all__ = [
     "Notification",
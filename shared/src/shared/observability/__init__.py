@@ -27,83 +27,208 @@ Legacy Usage (stdlib logging):
 
 from __future__ import annotations
 
-from shared.observability.health import (
-    HealthCheck,
-    HealthCheckResult,
-    HealthStatus,
-    check_liveness,
-    check_readiness,
-    create_health_check,
-    get_health_status,
-    register_health_check,
-)
+from typing import TYPE_CHECKING
 
-# Legacy logging (for backward compatibility)
-from shared.observability.logging import (
-    CorrelationIdFilter,
-    JSONFormatter,
-    configure_logging,
-    get_logger,
-    with_context,
-)
-from shared.observability.metrics import (
-    Counter,
-    Gauge,
-    Histogram,
-    MetricsRegistry,
-    configure_metrics,
-    get_metrics_registry,
-    timed,
-)
-from shared.observability.middleware import (
-    RequestLoggingConfig,
-    RequestLoggingMiddleware,
-    get_correlation_id_from_request,
-)
-from shared.observability.prometheus_bridge import (
-    InMemoryMetricsBackend,
-    MetricsBackend,
-    PrometheusMetricsBackend,
-    create_metrics_backend,
-    create_prometheus_asgi_app,
-    get_metrics_backend,
-    reset_metrics_backend,
-    set_metrics_backend,
-)
+from shared._lazy import attach
 
-# Structlog-based logging (recommended)
-from shared.observability.structlog_config import (
-    # Configuration
-    Environment,
-    LoggingConfig,
-    add_opentelemetry_context,
-    # Processors
-    add_service_context,
-    bind_contextvars,
-    clear_contextvars,
-    clear_correlation_id,
-    configure_structlog,
-    configure_structlog_for_testing,
-    generate_correlation_id,
-    get_correlation_id,
-    # Logger
-    get_structlog_logger,
-    reset_structlog_configuration,
-    # Context management
-    set_correlation_id,
-    unbind_contextvars,
-)
-from shared.observability.tracing import (
-    Span,
-    SpanKind,
-    TracingConfig,
-    configure_tracing,
-    create_span,
-    extract_context,
-    get_current_span,
-    get_trace_id,
-    inject_context,
-    traced,
+if TYPE_CHECKING:
+    from shared.observability.async_logging import (
+        AsyncLogHandler,
+        AsyncLogStats,
+        DropPolicy,
+        QueuedLoggerFactory,
+    )
+    from shared.observability.health import (
+        HealthCheck,
+        HealthCheckResult,
+        HealthMonitor,
+        HealthMonitorStats,
+        HealthStatus,
+        check_liveness,
+        check_readiness,
+        create_health_check,
+        get_health_monitor,
+        get_health_status,
+        register_health_check,
+        run_health_checks,
+        set_health_monitor,
+    )
+
+    # Legacy logging (for backward compatibility)
+    from shared.observability.logging import (
+        CorrelationIdFilter,
+        JSONFormatter,
+        LogContextFilter,
+        configure_logging,
+        get_logger,
+        with_context,
+    )
+    from shared.observability.metrics import (
+        Counter,
+        Gauge,
+        Histogram,
+        MetricsRegistry,
+        configure_metrics,
+        get_metrics_registry,
+        timed,
+    )
+    from shared.observability.middleware import (
+        RequestHook,
+        RequestInfo,
+        RequestLoggingConfig,
+        RequestLoggingMiddleware,
+        get_correlation_id_from_request,
+    )
+    from shared.observability.multiprocess_metrics import (
+        ExpositionRenderer,
+        MultiprocessMetricsBackend,
+        clear_multiprocess_directory,
+        create_multiprocess_metrics_app,
+        mark_process_dead,
+    )
+    from shared.observability.prometheus_bridge import (
+        InMemoryMetricsBackend,
+        MetricsBackend,
+        PrometheusMetricsBackend,
+        create_metrics_backend,
+        create_prometheus_asgi_app,
+        get_metrics_backend,
+        reset_metrics_backend,
+        set_metrics_backend,
+    )
+    from shared.observability.span_export import (
+        BatchSpanProcessor,
+        FileSpanExporter,
+        OTLPHttpSpanExporter,
+        SpanExporter,
+    )
+
+    # Structlog-based logging (recommended)
+    from shared.observability.structlog_config import (
+        # Configuration
+        Environment,
+        LoggingConfig,
+        add_opentelemetry_context,
+        # Processors
+        add_service_context,
+        bind_contextvars,
+        clear_contextvars,
+        clear_correlation_id,
+        configure_structlog,
+        configure_structlog_for_testing,
+        generate_correlation_id,
+        get_async_log_handler,
+        get_correlation_id,
+        # Logger
+        get_structlog_logger,
+        reset_structlog_configuration,
+        # Context management
+        set_correlation_id,
+        unbind_contextvars,
+    )
+    from shared.observability.tracing import (
+        NonRecordingSpan,
+        Span,
+        SpanKind,
+        TracingConfig,
+        configure_tracing,
+        create_span,
+        extract_context,
+        get_current_span,
+        get_span_processor,
+        get_trace_id,
+        inject_context,
+        should_sample,
+        shutdown_tracing,
+        traced,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "AsyncLogHandler": "shared.observability.async_logging",
+        "AsyncLogStats": "shared.observability.async_logging",
+        "DropPolicy": "shared.observability.async_logging",
+        "QueuedLoggerFactory": "shared.observability.async_logging",
+        "HealthCheck": "shared.observability.health",
+        "HealthCheckResult": "shared.observability.health",
+        "HealthMonitor": "shared.observability.health",
+        "HealthMonitorStats": "shared.observability.health",
+        "HealthStatus": "shared.observability.health",
+        "check_liveness": "shared.observability.health",
+        "check_readiness": "shared.observability.health",
+        "create_health_check": "shared.observability.health",
+        "get_health_monitor": "shared.observability.health",
+        "get_health_status": "shared.observability.health",
+        "register_health_check": "shared.observability.health",
+        "run_health_checks": "shared.observability.health",
+        "set_health_monitor": "shared.observability.health",
+        "CorrelationIdFilter": "shared.observability.logging",
+        "JSONFormatter": "shared.observability.logging",
+        "LogContextFilter": "shared.observability.logging",
+        "configure_logging": "shared.observability.logging",
+        "get_logger": "shared.observability.logging",
+        "with_context": "shared.observability.logging",
+        "Counter": "shared.observability.metrics",
+        "Gauge": "shared.observability.metrics",
+        "Histogram": "shared.observability.metrics",
+        "MetricsRegistry": "shared.observability.metrics",
+        "configure_metrics": "shared.observability.metrics",
+        "get_metrics_registry": "shared.observability.metrics",
+        "timed": "shared.observability.metrics",
+        "RequestHook": "shared.observability.middleware",
+        "RequestInfo": "shared.observability.middleware",
+        "RequestLoggingConfig": "shared.observability.middleware",
+        "RequestLoggingMiddleware": "shared.observability.middleware",
+        "get_correlation_id_from_request": "shared.observability.middleware",
+        "ExpositionRenderer": "shared.observability.multiprocess_metrics",
+        "MultiprocessMetricsBackend": "shared.observability.multiprocess_metrics",
+        "clear_multiprocess_directory": "shared.observability.multiprocess_metrics",
+        "create_multiprocess_metrics_app": "shared.observability.multiprocess_metrics",
+        "mark_process_dead": "shared.observability.multiprocess_metrics",
+        "InMemoryMetricsBackend": "shared.observability.prometheus_bridge",
+        "MetricsBackend": "shared.observability.prometheus_bridge",
+        "PrometheusMetricsBackend": "shared.observability.prometheus_bridge",
+        "create_metrics_backend": "shared.observability.prometheus_bridge",
+        "create_prometheus_asgi_app": "shared.observability.prometheus_bridge",
+        "get_metrics_backend": "shared.observability.prometheus_bridge",
+        "reset_metrics_backend": "shared.observability.prometheus_bridge",
+        "set_metrics_backend": "shared.observability.prometheus_bridge",
+        "BatchSpanProcessor": "shared.observability.span_export",
+        "FileSpanExporter": "shared.observability.span_export",
+        "OTLPHttpSpanExporter": "shared.observability.span_export",
+        "SpanExporter": "shared.observability.span_export",
+        "Environment": "shared.observability.structlog_config",
+        "LoggingConfig": "shared.observability.structlog_config",
+        "add_opentelemetry_context": "shared.observability.structlog_config",
+        "add_service_context": "shared.observability.structlog_config",
+        "bind_contextvars": "shared.observability.structlog_config",
+        "clear_contextvars": "shared.observability.structlog_config",
+        "clear_correlation_id": "shared.observability.structlog_config",
+        "configure_structlog": "shared.observability.structlog_config",
+        "configure_structlog_for_testing": "shared.observability.structlog_config",
+        "generate_correlation_id": "shared.observability.structlog_config",
+        "get_async_log_handler": "shared.observability.structlog_config",
+        "get_correlation_id": "shared.observability.structlog_config",
+        "get_structlog_logger": "shared.observability.structlog_config",
+        "reset_structlog_configuration": "shared.observability.structlog_config",
+        "set_correlation_id": "shared.observability.structlog_config",
+        "unbind_contextvars": "shared.observability.structlog_config",
+        "NonRecordingSpan": "shared.observability.tracing",
+        "Span": "shared.observability.tracing",
+        "SpanKind": "shared.observability.tracing",
+        "TracingConfig": "shared.observability.tracing",
+        "configure_tracing": "shared.observability.tracing",
+        "create_span": "shared.observability.tracing",
+        "extract_context": "shared.observability.tracing",
+        "get_current_span": "shared.observability.tracing",
+        "get_span_processor": "shared.observability.tracing",
+        "get_trace_id": "shared.observability.tracing",
+        "inject_context": "shared.observability.tracing",
+        "should_sample": "shared.observability.tracing",
+        "shutdown_tracing": "shared.observability.tracing",
+        "traced": "shared.observability.tracing",
+    },
 )
 
 __all__ = [
@@ -114,6 +239,7 @@ __all__ = [
     "configure_structlog_for_testing",
     "reset_structlog_configuration",
     "get_structlog_logger",
+    "get_async_log_handler",
     "bind_contextvars",
     "clear_contextvars",
     "unbind_contextvars",
@@ -127,20 +253,35 @@ __all__ = [
     # Legacy logging (backward compatibility)
     "JSONFormatter",
     "CorrelationIdFilter",
+    "LogContextFilter",
     "with_context",
     "get_logger",
     "configure_logging",
+    # Async log shipping
+    "AsyncLogHandler",
+    "AsyncLogStats",
+    "DropPolicy",
+    "QueuedLoggerFactory",
     # Tracing
     "SpanKind",
     "TracingConfig",
     "Span",
+    "NonRecordingSpan",
     "configure_tracing",
+    "shutdown_tracing",
+    "should_sample",
     "get_current_span",
+    "get_span_processor",
     "get_trace_id",
     "create_span",
     "inject_context",
     "extract_context",
     "traced",
+    # Span export
+    "BatchSpanProcessor",
+    "SpanExporter",
+    "OTLPHttpSpanExporter",
+    "FileSpanExporter",
     # Metrics
     "Counter",
     "Gauge",
@@ -158,6 +299,12 @@ __all__ = [
     "set_metrics_backend",
     "reset_metrics_backend",
     "create_prometheus_asgi_app",
+    # Multiprocess metrics
+    "MultiprocessMetricsBackend",
+    "ExpositionRenderer",
+    "create_multiprocess_metrics_app",
+    "mark_process_dead",
+    "clear_multiprocess_directory",
     # Health
     "HealthStatus",
     "HealthCheckResult",
@@ -167,7 +314,14 @@ __all__ = [
     "check_liveness",
     "check_readiness",
     "get_health_status",
+    "run_health_checks",
+    "HealthMonitor",
+    "HealthMonitorStats",
+    "get_health_monitor",
+    "set_health_monitor",
     # Middleware
+    "RequestHook",
+    "RequestInfo",
     "RequestLoggingConfig",
     "RequestLoggingMiddleware",
     "get_correlation_id_from_request",
@@ -0,0 +1,239 @@
+"""Non-blocking log shipping through a bounded queue.
+
+Handlers write synchronously: when stdout is a slow pipe or a file sits
+on a busy disk, every log call on the event loop waits for it. With
+:class:`AsyncLogHandler` the caller only puts the record on a bounded
+queue, and a listener thread runs the real handlers. When the queue is
+full the record is dropped according to the :class:`DropPolicy` and
+counted, so a burst of log volume costs the request path nothing more
+than a failed ``put_nowait``.
+
+Formatting happens on the listener thread unless the handler itself has
+a formatter. Formatters that read context variables (correlation IDs,
+structlog ``merge_contextvars``) see none there, so either attach a
+filter that copies the context onto the record, such as
+:class:`~shared.observability.logging.LogContextFilter`, or set the
+formatter on the ``AsyncLogHandler`` to format before enqueueing.
+
+Already-rendered structlog output (``str`` or orjson ``bytes``) uses the
+same queue through :class:`QueuedLoggerFactory`.
+
+Example:
+    >>> handler = AsyncLogHandler(logging.StreamHandler(sys.stderr), max_queue=50_000)
+    >>> logging.getLogger().addHandler(handler)
+    >>> handler.stats().dropped
+    0
+"""
+
+from __future__ import annotations
+
+import copy
+import enum
+import logging
+import queue
+import sys
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class DropPolicy(str, enum.Enum):
+    """Which record is discarded when the log queue is full."""
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+@dataclass(frozen=True, slots=True)
+class AsyncLogStats:
+    """Point-in-time snapshot of an async log handler."""
+
+    queue_depth: int
+    max_queue: int
+    enqueued: int
+    dropped: int
+
+
+class _RenderedLine:
+    """A pre-rendered log line bound for a stream."""
+
+    __slots__ = ("line", "stream")
+
+    def __init__(self, stream: IO[Any], line: str | bytes) -> None:
+        self.stream = stream
+        self.line = line
+
+    def write(self) -> None:
+        try:
+            if isinstance(self.line, bytes):
+                buffer = getattr(self.stream, "buffer", None)
+                if buffer is not None:
+                    buffer.write(self.line + b"\n")
+                else:
+                    self.stream.write(self.line.decode("utf-8", "replace") + "\n")
+            else:
+                self.stream.write(self.line + "\n")
+            self.stream.flush()
+        except (OSError, ValueError):
+            # A closed or broken stream must not stop the listener thread
+            pass
+
+
+class _Listener(QueueListener):
+    def handle(self, record: Any) -> None:
+        if isinstance(record, _RenderedLine):
+            record.write()
+            return
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full; wait for the listener to make room
+        self.queue.put(self._sentinel)
+
+
+class AsyncLogHandler(QueueHandler):
+    """Queue records for a listener thread that runs the real handlers."""
+
+    def __init__(
+        self,
+        *handlers: logging.Handler,
+        max_queue: int = 10_000,
+        drop_policy: DropPolicy | str = DropPolicy.DROP_NEWEST,
+        respect_handler_level: bool = True,
+    ) -> None:
+        """Initialize the handler and start its listener thread.
+
+        Args:
+            *handlers: Handlers run on the listener thread.
+            max_queue: Records allowed to wait; beyond it records are dropped.
+            drop_policy: Whether the incoming or the oldest record is dropped.
+            respect_handler_level: Apply each handler's level on the listener.
+
+        Raises:
+            ValueError: If ``max_queue`` is less than 1.
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        super().__init__(queue.Queue(max_queue))
+        self.drop_policy = DropPolicy(drop_policy)
+        self.max_queue = max_queue
+        self._enqueued = 0
+        self._dropped = 0
+        self._listener: _Listener | None = _Listener(
+            self.queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self._listener.start()
+
+    @property
+    def handlers(self) -> tuple[logging.Handler, ...]:
+        """Handlers run on the listener thread."""
+        return self._listener.handlers if self._listener else ()
+
+    def stats(self) -> AsyncLogStats:
+        """Return a snapshot of the queue state."""
+        return AsyncLogStats(
+            queue_depth=self.queue.qsize(),
+            max_queue=self.max_queue,
+            enqueued=self._enqueued,
+            dropped=self._dropped,
+        )
+
+    def prepare(self, record: logging.LogRecord) -> Any:
+        """Make the record safe to hand to another thread.
+
+        With a formatter set on this handler, the record is formatted
+        here, as ``QueueHandler`` does. Otherwise only the message and
+        exception text are resolved, and formatting is left to the
+        listener's handlers.
+        """
+        if self.formatter is not None:
+            return super().prepare(record)
+        record = copy.copy(record)
+        # Arguments may be mutated after the call returns
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks hold frames that keep changing on this thread
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: Any) -> None:
+        """Put a record on the queue, dropping one if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped += 1
+            if self.drop_policy is DropPolicy.DROP_NEWEST:
+                return
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                return
+        self._enqueued += 1
+
+    def write_rendered(self, stream: IO[Any], line: str | bytes) -> None:
+        """Queue an already-rendered line to be written to ``stream``."""
+        self.enqueue(_RenderedLine(stream, line))
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close the handlers."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        super().close()
+
+
+class QueuedLogger:
+    """structlog logger writing rendered lines through an ``AsyncLogHandler``.
+
+    Accepts both ``str`` and ``bytes`` (orjson) renderer output.
+    """
+
+    def __init__(self, handler: AsyncLogHandler, file: IO[Any] | None = None) -> None:
+        """Initialize the logger.
+
+        Args:
+            handler: Handler whose queue and listener thread are used.
+            file: Stream the lines are written to (defaults to stdout).
+        """
+        self._handler = handler
+        self._file = file or sys.stdout
+
+    def msg(self, message: str | bytes) -> None:
+        """Queue a rendered log line."""
+        self._handler.write_rendered(self._file, message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class QueuedLoggerFactory:
+    """structlog logger factory producing :class:`QueuedLogger` instances."""
+
+    def __init__(self, handler: AsyncLogHandler, file: IO[Any] | None = None) -> None:
+        """Initialize the factory.
+
+        Args:
+            handler: Handler whose queue and listener thread are used.
+            file: Stream the lines are written to (defaults to stdout).
+        """
+        self._logger = QueuedLogger(handler, file)
+
+    def __call__(self, *args: Any) -> QueuedLogger:
+        """Return the shared logger (it holds no per-name state)."""
+        return self._logger
+
+
+__all__ = [
+    "AsyncLogHandler",
+    "AsyncLogStats",
+    "DropPolicy",
+    "QueuedLogger",
+    "QueuedLoggerFactory",
+]
@@ -2,17 +2,34 @@
 
 This module provides health check functionality for Kubernetes
 liveness and readiness probes.
+
+Registered checks run concurrently, each bounded by its own timeout, and
+their durations are recorded in the ``health_check_duration_seconds``
+histogram. Without further setup every probe runs every check. Set a
+:class:`HealthMonitor` to answer probes from a cached report instead:
+
+Example:
+    >>> monitor = HealthMonitor(ttl_seconds=5.0)
+    >>> set_health_monitor(monitor)
+    >>> await monitor.start()  # optional: refresh in the background
+    >>> report = await check_readiness()  # served from the cache
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from shared.observability.prometheus_bridge import get_metrics_backend
+
+# Health checks are network round trips: sub-millisecond to the timeout
+_DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
 
 class HealthStatus(Enum):
     """Health check status values."""
@@ -187,26 +204,32 @@ async def check_liveness() -> HealthCheckResult:
     )
 
 
-async def check_readiness() -> dict[str, Any]:
-    """Check if the application is ready to serve traffic.
+async def run_health_checks() -> dict[str, Any]:
+    """Run every registered check now, bypassing any health monitor.
 
-    Readiness probes check that all dependencies are available.
+    Checks run concurrently; each is bounded by its own timeout, so the
+    call takes about as long as the slowest check.
 
     Returns:
         Dictionary with overall status and individual check results.
     """
-    results: list[HealthCheckResult] = []
-
-    # Run all registered checks
-    for _name, check in _health_checks.items():
-        result = await check.run()
-        results.append(result)
+    checks = list(_health_checks.values())
+    results = await asyncio.gather(*(check.run() for check in checks))
+
+    histogram = get_metrics_backend().histogram(
+        "health_check_duration_seconds",
+        "Time taken by each health check",
+        ["check"],
+        buckets=_DURATION_BUCKETS,
+    )
+    for check, result in zip(checks, results, strict=True):
+        if result.duration_ms is not None:
+            histogram.labels(check=check.name).observe(result.duration_ms / 1000)
 
     # Determine overall status
     has_unhealthy_critical = any(
-        result.status == HealthStatus.UNHEALTHY
-        and _health_checks.get(result.name, HealthCheck(name="", check_fn=check_liveness)).critical
-        for result in results
+        result.status == HealthStatus.UNHEALTHY and check.critical
+        for check, result in zip(checks, results, strict=True)
     )
 
     has_unhealthy = any(result.status == HealthStatus.UNHEALTHY for result in results)
@@ -226,6 +249,152 @@ async def check_readiness() -> dict[str, Any]:
     }
 
 
+@dataclass(frozen=True, slots=True)
+class HealthMonitorStats:
+    """Point-in-time snapshot of a health monitor."""
+
+    refreshes: int
+    cache_hits: int
+    age_seconds: float | None
+    running: bool
+
+
+class HealthMonitor:
+    """Cache of the readiness report, optionally refreshed in the background.
+
+    A report younger than ``ttl_seconds`` is returned as is. An older one
+    is refreshed on demand, and concurrent callers share that single
+    refresh. After :meth:`start`, a background task refreshes the report
+    every ``refresh_interval_seconds`` so probes never wait on a check.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 5.0,
+        refresh_interval_seconds: float | None = None,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            ttl_seconds: Age after which a cached report is refreshed.
+            refresh_interval_seconds: Background refresh period
+                (defaults to half of ``ttl_seconds``).
+
+        Raises:
+            ValueError: If an interval is not positive.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if refresh_interval_seconds is not None and refresh_interval_seconds <= 0:
+            raise ValueError("refresh_interval_seconds must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.refresh_interval_seconds = refresh_interval_seconds or ttl_seconds / 2
+        self._report: dict[str, Any] | None = None
+        self._checked_at = 0.0
+        self._inflight: asyncio.Future[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._refreshes = 0
+        self._cache_hits = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refresh task is active."""
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> HealthMonitorStats:
+        """Return a snapshot of the cache state."""
+        return HealthMonitorStats(
+            refreshes=self._refreshes,
+            cache_hits=self._cache_hits,
+            age_seconds=(time.monotonic() - self._checked_at if self._report is not None else None),
+            running=self.running,
+        )
+
+    async def get(self) -> dict[str, Any]:
+        """Return the cached report, refreshing it if it has expired.
+
+        Returns:
+            Dictionary with overall status and individual check results.
+        """
+        if self._report is not None and time.monotonic() - self._checked_at < self.ttl_seconds:
+            self._cache_hits += 1
+            return self._report
+        return await self.refresh()
+
+    async def refresh(self) -> dict[str, Any]:
+        """Run the checks and cache the report.
+
+        A refresh already in progress is joined rather than repeated.
+
+        Returns:
+            Dictionary with overall status and individual check results.
+        """
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._run())
+        # Shielded so a cancelled probe does not cancel the shared refresh
+        return await asyncio.shield(self._inflight)
+
+    async def _run(self) -> dict[str, Any]:
+        report = await run_health_checks()
+        self._report = report
+        self._checked_at = time.monotonic()
+        self._refreshes += 1
+        return report
+
+    async def start(self) -> None:
+        """Run the checks once and start refreshing in the background."""
+        if self.running:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._refresh_loop(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            await self.refresh()
+
+
+_health_monitor: HealthMonitor | None = None
+
+
+def get_health_monitor() -> HealthMonitor | None:
+    """Return the monitor used by :func:`check_readiness`, if any."""
+    return _health_monitor
+
+
+def set_health_monitor(monitor: HealthMonitor | None) -> None:
+    """Serve readiness from ``monitor``, or run checks per call if None.
+
+    Args:
+        monitor: The monitor to use. The caller starts and stops it.
+    """
+    global _health_monitor
+    _health_monitor = monitor
+
+
+async def check_readiness() -> dict[str, Any]:
+    """Check if the application is ready to serve traffic.
+
+    Readiness probes check that all dependencies are available. With a
+    health monitor set, the cached report is returned.
+
+    Returns:
+        Dictionary with overall status and individual check results.
+    """
+    if _health_monitor is not None:
+        return await _health_monitor.get()
+    return await run_health_checks()
+
+
 async def get_health_status() -> dict[str, Any]:
     """Get overall health status.
 
@@ -238,10 +407,15 @@ async def get_health_status() -> dict[str, Any]:
 __all__ = [
     "HealthCheck",
     "HealthCheckResult",
+    "HealthMonitor",
+    "HealthMonitorStats",
     "HealthStatus",
     "check_liveness",
     "check_readiness",
     "create_health_check",
+    "get_health_monitor",
     "get_health_status",
     "register_health_check",
+    "run_health_checks",
+    "set_health_monitor",
 ]
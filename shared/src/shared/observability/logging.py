@@ -16,6 +16,8 @@ from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Any
 
+from shared.observability.async_logging import AsyncLogHandler, DropPolicy
+
 # Context variables for correlation ID and extra context
 _correlation_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "correlation_id", default=None
@@ -52,6 +54,17 @@ def generate_correlation_id() -> str:
     return str(uuid.uuid4())
 
 
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(
+    {
+        *logging.LogRecord("", 0, "", 0, "", None, None).__dict__,
+        "message",
+        "asctime",
+        "taskName",
+    }
+)
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging.
 
@@ -113,39 +126,18 @@ class JSONFormatter(logging.Formatter):
         if context:
             log_entry.update(context)
 
-        # Add exception info
+        # Add exception info (already rendered when formatted off-thread)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
 
         # Add extra fields from formatter config
         log_entry.update(self.extra_fields)
 
         # Add extra fields from record
         for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "thread",
-                "threadName",
-                "message",
-                "taskName",
-            ):
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_entry[key] = value
 
         return json.dumps(log_entry, default=str)
@@ -186,6 +178,35 @@ class CorrelationIdFilter(logging.Filter):
         return True
 
 
+class LogContextFilter(logging.Filter):
+    """Logging filter that copies the log context onto the record.
+
+    ``JSONFormatter`` reads the correlation ID and ``with_context`` fields
+    from context variables, which are not visible when records are
+    formatted on another thread. Attached to an ``AsyncLogHandler``, this
+    filter captures them on the logging thread instead.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add the correlation ID and context fields to the record.
+
+        Args:
+            record: The log record to filter.
+
+        Returns:
+            Always True (we're adding data, not filtering).
+        """
+        correlation_id = get_correlation_id()
+        if correlation_id is not None and not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id  # type: ignore[attr-defined]
+
+        context = _log_context.get()
+        if context:
+            for key, value in context.items():
+                record.__dict__.setdefault(key, value)
+        return True
+
+
 @contextmanager
 def with_context(**kwargs: Any) -> Generator[None, None, None]:
     """Context manager to add fields to log context.
@@ -238,6 +259,9 @@ def configure_logging(
     include_correlation_id: bool = True,
     extra_fields: dict[str, Any] | None = None,
     stream: Any = None,
+    async_logging: bool = False,
+    max_queue: int = 10_000,
+    drop_policy: DropPolicy | str = DropPolicy.DROP_NEWEST,
 ) -> None:
     """Configure logging for the application.
 
@@ -247,6 +271,10 @@ def configure_logging(
         include_correlation_id: Whether to include correlation ID filter.
         extra_fields: Additional fields for JSON formatter.
         stream: Output stream (defaults to sys.stderr).
+        async_logging: Write records from a listener thread through a
+            bounded queue instead of on the calling thread.
+        max_queue: Queue size for ``async_logging``.
+        drop_policy: Record dropped when the ``async_logging`` queue is full.
     """
     # Convert string level to int
     if isinstance(level, str):
@@ -259,6 +287,8 @@ def configure_logging(
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        if isinstance(handler, AsyncLogHandler):
+            handler.close()
 
     # Create handler
     handler = logging.StreamHandler(stream or sys.stderr)
@@ -272,6 +302,12 @@ def configure_logging(
 
     handler.setFormatter(formatter)
 
+    if async_logging:
+        # Filters run on the calling thread, where the context is visible
+        handler = AsyncLogHandler(handler, max_queue=max_queue, drop_policy=drop_policy)
+        handler.setLevel(level)
+        handler.addFilter(LogContextFilter())
+
     # Add correlation ID filter
     if include_correlation_id:
         handler.addFilter(CorrelationIdFilter())
@@ -282,6 +318,7 @@ def configure_logging(
 __all__ = [
     "CorrelationIdFilter",
     "JSONFormatter",
+    "LogContextFilter",
     "configure_logging",
     "generate_correlation_id",
     "get_correlation_id",
@@ -6,6 +6,12 @@ This module provides middleware that automatically:
 - Measures request duration
 - Binds request context to structlog for the request lifecycle
 
+It is a pure ASGI middleware: the application runs in the caller's task
+with the original ``receive``/``send`` (wrapped only to add headers), so
+streaming responses keep their backpressure and no per-request task or
+body buffering is added. Further per-request concerns plug in as
+:class:`RequestHook` objects instead of additional middleware layers.
+
 Usage:
     from fastapi import FastAPI
     from shared.observability.middleware import RequestLoggingMiddleware
@@ -18,6 +24,7 @@ With configuration:
         RequestLoggingMiddleware,
         RequestLoggingConfig,
     )
+    from shared.fastapi_utils.middleware import RequestContextHook
 
     app.add_middleware(
         RequestLoggingMiddleware,
@@ -27,27 +34,27 @@ With configuration:
             log_response_body=False,
             exclude_paths=["/health", "/metrics"],
         ),
+        hooks=[RequestContextHook()],
     )
 """
 
 from __future__ import annotations
 
 import time
-from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from shared.observability.structlog_config import (
+    _correlation_id_ctx,
     bind_contextvars,
     clear_contextvars,
     generate_correlation_id,
     get_correlation_id,
     get_structlog_logger,
-    set_correlation_id,
 )
 
 # =============================================================================
@@ -120,33 +127,92 @@ class RequestLoggingConfig:
 DEFAULT_CONFIG = RequestLoggingConfig()
 
 
+# =============================================================================
+# Hooks
+# =============================================================================
+
+
+@dataclass(slots=True)
+class RequestInfo:
+    """State of one request, shared by the middleware and its hooks.
+
+    Attributes:
+        scope: The ASGI connection scope.
+        method: HTTP method.
+        path: Request path.
+        client_ip: Client address, honouring proxy headers.
+        correlation_id: Correlation ID of the request.
+        start_time: ``time.perf_counter()`` value when the request arrived.
+        status_code: Response status, once the response has started.
+        error: Exception raised by the application, if any.
+        duration_ms: Request duration, set before ``on_complete`` hooks run.
+        log_fields: Extra fields added to the completion log entry.
+        state: Scratch space for hooks (e.g. context variable tokens).
+    """
+
+    scope: Scope
+    method: str
+    path: str
+    client_ip: str
+    correlation_id: str
+    start_time: float
+    status_code: int | None = None
+    error: BaseException | None = None
+    duration_ms: float = 0.0
+    log_fields: dict[str, Any] = field(default_factory=dict)
+    state: dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHook:
+    """Extension point of :class:`RequestLoggingMiddleware`.
+
+    Subclasses override any of the methods; the defaults do nothing.
+    Hooks run in the request's task, so context variables set in
+    :meth:`on_request` are visible to the application. ``on_complete``
+    hooks run in reverse order of ``on_request``.
+    """
+
+    def on_request(self, request: RequestInfo) -> None:
+        """Called before the application receives the request."""
+
+    def on_response(self, request: RequestInfo, headers: MutableHeaders) -> None:
+        """Called when the response starts; ``headers`` may be modified."""
+
+    def on_complete(self, request: RequestInfo) -> None:
+        """Called after the response is sent or the application failed."""
+
+
 # =============================================================================
 # Middleware Implementation
 # =============================================================================
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Middleware for automatic request logging and correlation ID propagation.
 
     This middleware:
     1. Extracts correlation ID from request headers (or generates one)
     2. Binds request context to structlog for the entire request
     3. Logs incoming requests with method, path, and client info
-    4. Logs outgoing responses with status code and duration
-    5. Adds correlation ID to response headers
-    6. Clears context after request completes
+    4. Runs the configured hooks
+    5. Logs outgoing responses with status code and duration
+    6. Adds correlation ID to response headers
+    7. Clears context after request completes
+
+    Excluded paths bypass all of it, including the hooks.
 
     Example:
         app = FastAPI()
         app.add_middleware(RequestLoggingMiddleware)
 
-        # Or with custom config:
+        # Or with custom config and request context hook:
         app.add_middleware(
             RequestLoggingMiddleware,
             config=RequestLoggingConfig(
                 exclude_paths=["/health", "/ready"],
                 slow_request_threshold_ms=500,
             ),
+            hooks=[RequestContextHook()],
         )
     """
 
@@ -154,83 +220,87 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         self,
         app: ASGIApp,
         config: RequestLoggingConfig | None = None,
+        hooks: list[RequestHook] | None = None,
     ) -> None:
         """Initialize the middleware.
 
         Args:
             app: The ASGI application.
             config: Optional configuration. Uses defaults if not provided.
+            hooks: Hooks run for every logged request, in order.
         """
-        super().__init__(app)
+        self.app = app
         self.config = config or DEFAULT_CONFIG
+        self.hooks = list(hooks or [])
         self.logger = get_structlog_logger("shared.observability.middleware")
+        self._exclude_paths = frozenset(self.config.exclude_paths)
+        self._exclude_prefixes = tuple(self.config.exclude_paths_startswith)
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and add logging/correlation ID.
 
         Args:
-            request: The incoming request.
-            call_next: The next middleware/handler in the chain.
-
-        Returns:
-            The response with correlation ID header added.
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
         """
-        # Check if this path should be excluded from logging
-        if self._should_exclude_path(request.url.path):
-            return await call_next(request)
-
-        # Extract or generate correlation ID
-        correlation_id = self._extract_correlation_id(request)
-        set_correlation_id(correlation_id)
+        if scope["type"] != "http" or self._should_exclude_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        correlation_id = self._extract_correlation_id(headers)
+        token = _correlation_id_ctx.set(correlation_id)
+        request = RequestInfo(
+            scope=scope,
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=self._get_client_ip(scope, headers),
+            correlation_id=correlation_id,
+            start_time=time.perf_counter(),
+        )
 
         # Bind request context to structlog
         bind_contextvars(
             correlation_id=correlation_id,
             http_method=request.method,
-            http_path=request.url.path,
-            client_ip=self._get_client_ip(request),
+            http_path=request.path,
+            client_ip=request.client_ip,
         )
-
-        # Record start time
-        start_time = time.perf_counter()
-
-        # Log incoming request
-        request_log_data = self._build_request_log_data(request)
-        self.logger.info("Request started", **request_log_data)
-
-        # Process request
-        response: Response | None = None
-        error: Exception | None = None
+        self.logger.info("Request started", **self._build_request_log_data(scope, headers))
+
+        started_hooks: list[RequestHook] = []
+        correlation_header = self.config.correlation_id_header
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                request.status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers[correlation_header] = correlation_id
+                for hook in started_hooks:
+                    hook.on_response(request, response_headers)
+                request.log_fields["content_type"] = response_headers.get("content-type")
+                if self.config.log_response_headers:
+                    request.log_fields["response_headers"] = self._sanitize_headers(
+                        dict(response_headers)
+                    )
+            await send(message)
 
         try:
-            response = await call_next(request)
+            for hook in self.hooks:
+                hook.on_request(request)
+                started_hooks.append(hook)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            error = exc
+            request.error = exc
             raise
         finally:
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Log response/error
-            self._log_response(
-                request=request,
-                response=response,
-                error=error,
-                duration_ms=duration_ms,
-            )
-
-            # Clear context
+            request.duration_ms = (time.perf_counter() - request.start_time) * 1000
+            for hook in reversed(started_hooks):
+                hook.on_complete(request)
+            self._log_response(request)
             clear_contextvars()
-
-        # Add correlation ID to response headers
-        if response is not None:
-            response.headers[self.config.correlation_id_header] = correlation_id
-
-        return response
+            _correlation_id_ctx.reset(token)
 
     def _should_exclude_path(self, path: str) -> bool:
         """Check if the path should be excluded from logging.
@@ -241,79 +311,70 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             True if the path should be excluded.
         """
-        # Exact match
-        if path in self.config.exclude_paths:
-            return True
+        return path in self._exclude_paths or path.startswith(self._exclude_prefixes)
 
-        # Prefix match
-        return any(path.startswith(prefix) for prefix in self.config.exclude_paths_startswith)
-
-    def _extract_correlation_id(self, request: Request) -> str:
+    def _extract_correlation_id(self, headers: Headers) -> str:
         """Extract correlation ID from request headers or generate one.
 
         Args:
-            request: The incoming request.
+            headers: The request headers.
 
         Returns:
             The correlation ID (extracted or generated).
         """
-        # Try primary header
-        correlation_id = request.headers.get(self.config.correlation_id_header)
-        if correlation_id:
-            return correlation_id
-
-        # Try alternative header
-        correlation_id = request.headers.get(self.config.request_id_header)
-        if correlation_id:
-            return correlation_id
-
-        # Generate new ID
-        return generate_correlation_id()
+        return (
+            headers.get(self.config.correlation_id_header)
+            or headers.get(self.config.request_id_header)
+            or generate_correlation_id()
+        )
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """Extract client IP from request, handling proxies.
 
         Args:
-            request: The incoming request.
+            scope: The ASGI connection scope.
+            headers: The request headers.
 
         Returns:
             The client IP address.
         """
         # Check X-Forwarded-For header (from load balancers/proxies)
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             # Take the first IP (original client)
             return forwarded_for.split(",")[0].strip()
 
         # Check X-Real-IP header
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fall back to direct client
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         return "unknown"
 
-    def _build_request_log_data(self, request: Request) -> dict:
+    def _build_request_log_data(self, scope: Scope, headers: Headers) -> dict:
         """Build log data for the incoming request.
 
         Args:
-            request: The incoming request.
+            scope: The ASGI connection scope.
+            headers: The request headers.
 
         Returns:
             Dictionary of log data.
         """
         data = {
-            "http_version": request.scope.get("http_version", "1.1"),
-            "query_string": str(request.query_params) if request.query_params else None,
-            "user_agent": request.headers.get("user-agent"),
+            "http_version": scope.get("http_version", "1.1"),
+            "query_string": scope.get("query_string", b"").decode("latin-1") or None,
+            "user_agent": headers.get("user-agent"),
         }
 
         # Add headers if configured
         if self.config.log_request_headers:
-            data["headers"] = self._sanitize_headers(dict(request.headers))
+            data["headers"] = self._sanitize_headers(dict(headers))
 
         # Remove None values
         return {k: v for k, v in data.items() if v is not None}
@@ -335,46 +396,33 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 sanitized[key] = value
         return sanitized
 
-    def _log_response(
-        self,
-        request: Request,
-        response: Response | None,
-        error: Exception | None,
-        duration_ms: float,
-    ) -> None:
+    def _log_response(self, request: RequestInfo) -> None:
         """Log the response or error.
 
         Args:
-            request: The original request.
-            response: The response (if successful).
-            error: The error (if failed).
-            duration_ms: Request duration in milliseconds.
+            request: State of the finished request.
         """
         log_data = {
-            "duration_ms": round(duration_ms, 2),
+            "duration_ms": round(request.duration_ms, 2),
+            **{k: v for k, v in request.log_fields.items() if v is not None},
         }
 
         # Check for slow request
-        is_slow = duration_ms >= self.config.slow_request_threshold_ms
+        is_slow = request.duration_ms >= self.config.slow_request_threshold_ms
+        status_code = request.status_code
 
-        if error is not None:
+        if request.error is not None:
             # Log error
-            log_data["error_type"] = type(error).__name__
-            log_data["error_message"] = str(error)
-            self.logger.error("Request failed", **log_data, exc_info=error)
-        elif response is not None:
-            # Log response
-            log_data["http_status"] = response.status_code
-            log_data["content_type"] = response.headers.get("content-type")
-
-            # Add response headers if configured
-            if self.config.log_response_headers:
-                log_data["response_headers"] = self._sanitize_headers(dict(response.headers))
+            log_data["error_type"] = type(request.error).__name__
+            log_data["error_message"] = str(request.error)
+            self.logger.error("Request failed", **log_data, exc_info=request.error)
+        elif status_code is not None:
+            log_data["http_status"] = status_code
 
             # Determine log level based on status and duration
-            if response.status_code >= 500:
+            if status_code >= 500:
                 self.logger.error("Request completed", **log_data)
-            elif response.status_code >= 400:
+            elif status_code >= 400:
                 self.logger.warning("Request completed", **log_data)
             elif is_slow:
                 self.logger.warning("Slow request completed", **log_data)
@@ -438,6 +486,8 @@ def get_correlation_id_from_request(request: Request) -> str | None:
 # =============================================================================
 
 __all__ = [
+    "RequestHook",
+    "RequestInfo",
     "RequestLoggingConfig",
     "RequestLoggingMiddleware",
     "get_correlation_id_from_request",
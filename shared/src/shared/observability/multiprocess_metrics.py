@@ -0,0 +1,761 @@
+"""Multiprocess-safe metrics backend with low-cost exposition.
+
+Under gunicorn or ``uvicorn --workers`` every worker has its own
+registry, so a scrape sees one worker's numbers. With
+:class:`MultiprocessMetricsBackend` each worker writes its samples to its
+own memory-mapped file in a shared directory, and a scrape of any worker
+sums the files of every worker:
+
+* counters and histograms are summed; files of exited workers are kept,
+  so totals never go backwards when a worker is replaced,
+* gauges are summed (or reduced with ``max``/``min``, or kept per
+  process with a ``pid`` label) over live workers only.
+
+Updating a sample is an in-place write of one float at a fixed offset.
+:class:`ExpositionRenderer` decodes each series key once and caches its
+rendered ``name{labels}`` prefix, then writes the text format into a
+buffer that is reused across scrapes. Files are append-only, so a scrape
+parses only entries added since the previous one; its cost is reading
+the files plus one small float formatting per sample.
+
+The directory must be empty when the first worker starts; call
+:func:`clear_multiprocess_directory` from the process manager before
+forking, and :func:`mark_process_dead` from its child-exit hook.
+
+Example:
+    >>> backend = MultiprocessMetricsBackend("/tmp/metrics", namespace="orders")
+    >>> set_metrics_backend(backend)
+    >>> app.mount("/metrics", create_multiprocess_metrics_app("/tmp/metrics"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Awaitable, Callable, MutableMapping
+from pathlib import Path
+from typing import Any, Literal
+
+from shared.observability.prometheus_bridge import (
+    _DEFAULT_PROMETHEUS_BUCKETS,
+    _MULTIPROC_DIR_ENV,
+    LabeledCounterLike,
+    LabeledGaugeLike,
+    LabeledHistogramLike,
+    MetricsBackend,
+)
+
+MULTIPROC_DIR_ENV = _MULTIPROC_DIR_ENV
+CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+GaugeMode = Literal["sum", "max", "min", "all"]
+
+# File layout: an 8-byte header holding the used length and a random file
+# id, then entries of
+# [uint32 key length][key, padded so the value is 8-byte aligned][float64]
+_HEADER = struct.Struct("<II")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+_INITIAL_FILE_SIZE = 64 * 1024
+
+_MONOTONIC_PREFIX = "metrics_"
+_GAUGE_PREFIX = "gauges_"
+
+
+def _entry_size(key_length: int) -> tuple[int, int]:
+    """Return ``(value_offset, entry_size)`` relative to the entry start."""
+    value_offset = _KEY_LENGTH.size + key_length
+    value_offset += -value_offset % 8
+    return value_offset, value_offset + _VALUE.size
+
+
+class _MmapFile:
+    """Append-only sample store for one process, readable by others."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        size = os.fstat(self._fd).st_size
+        if size < _INITIAL_FILE_SIZE:
+            os.ftruncate(self._fd, _INITIAL_FILE_SIZE)
+            size = _INITIAL_FILE_SIZE
+        self._mm = mmap.mmap(self._fd, size)
+        self._used, self._file_id = _HEADER.unpack_from(self._mm, 0)
+        if not self._used:
+            # Lets readers tell a recreated file from the one they parsed
+            self._used = _HEADER.size
+            self._file_id = int.from_bytes(os.urandom(4), "little") | 1
+            _HEADER.pack_into(self._mm, 0, self._used, self._file_id)
+        self.offsets: dict[bytes, int] = {
+            key: offset for key, offset, _ in _iter_entries(self._mm, self._used)
+        }
+
+    def offset(self, key: bytes) -> int:
+        """Return the value offset for ``key``, appending a zero entry if new."""
+        offset = self.offsets.get(key)
+        if offset is not None:
+            return offset
+        value_offset, size = _entry_size(len(key))
+        if self._used + size > len(self._mm):
+            self._grow(self._used + size)
+        start = self._used
+        _KEY_LENGTH.pack_into(self._mm, start, len(key))
+        self._mm[start + _KEY_LENGTH.size : start + _KEY_LENGTH.size + len(key)] = key
+        _VALUE.pack_into(self._mm, start + value_offset, 0.0)
+        self._used += size
+        # Publish the entry only once it is complete, for concurrent readers
+        _HEADER.pack_into(self._mm, 0, self._used, self._file_id)
+        self.offsets[key] = start + value_offset
+        return start + value_offset
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._mm)
+        while size < needed:
+            size *= 2
+        self._mm.close()
+        os.ftruncate(self._fd, size)
+        self._mm = mmap.mmap(self._fd, size)
+
+    def add(self, offset: int, amount: float) -> None:
+        _VALUE.pack_into(self._mm, offset, _VALUE.unpack_from(self._mm, offset)[0] + amount)
+
+    def set(self, offset: int, value: float) -> None:
+        _VALUE.pack_into(self._mm, offset, value)
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+
+def _iter_entries(buffer: Any, used: int, position: int = _HEADER.size) -> Any:
+    """Yield ``(key, value_offset, value)`` for each entry from ``position``."""
+    while position + _KEY_LENGTH.size <= used:
+        key_length = _KEY_LENGTH.unpack_from(buffer, position)[0]
+        key_start = position + _KEY_LENGTH.size
+        value_offset, size = _entry_size(key_length)
+        if position + size > used:
+            # Torn read of an entry still being appended
+            return
+        yield (
+            bytes(buffer[key_start : key_start + key_length]),
+            position + value_offset,
+            _VALUE.unpack_from(buffer, position + value_offset)[0],
+        )
+        position += size
+
+
+def _encode_key(
+    family: str,
+    kind: str,
+    description: str,
+    sample: str,
+    label_names: tuple[str, ...],
+    label_values: tuple[str, ...],
+) -> bytes:
+    return json.dumps(
+        [family, kind, description, sample, label_names, label_values],
+        separators=(",", ":"),
+    ).encode()
+
+
+def _format_float(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+# One file per path per process, shared by every backend using it. All
+# reads and writes of the files hold _files_lock.
+_files: dict[Path, _MmapFile] = {}
+_files_lock = threading.Lock()
+
+
+def _open_file(path: Path) -> _MmapFile:
+    file = _files.get(path)
+    if file is None:
+        file = _files[path] = _MmapFile(path)
+    return file
+
+
+def _reset_after_fork() -> None:
+    # A forked child must never write into its parent's files
+    global _files_lock
+    _files_lock = threading.Lock()
+    for file in _files.values():
+        file.close()
+    _files.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _Metric:
+    """A metric family; ``labels()`` returns a child bound to one series."""
+
+    def __init__(
+        self,
+        backend: MultiprocessMetricsBackend,
+        kind: str,
+        family: str,
+        description: str,
+        label_names: list[str] | None,
+        buckets: tuple[float, ...] = (),
+    ) -> None:
+        self._backend = backend
+        self._kind = kind
+        self._family = family
+        self._description = description
+        self._label_names = tuple(label_names or ())
+        self._buckets = buckets
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **label_values: str) -> Any:
+        if label_values:
+            values = tuple(str(label_values[name]) for name in self._label_names)
+        else:
+            values = tuple(str(value) for value in values)
+        if len(values) != len(self._label_names):
+            raise ValueError(f"{self._family} expects labels {self._label_names}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child(values)
+                    self._children[values] = child
+        return child
+
+    def _key(self, sample: str, names: tuple[str, ...], values: tuple[str, ...]) -> bytes:
+        return _encode_key(self._family, self._kind, self._description, sample, names, values)
+
+    def _unlabeled(self) -> Any:
+        if self._label_names:
+            raise ValueError(f"{self._family} has labels; call labels() first")
+        return self.labels()
+
+    def _new_child(self, values: tuple[str, ...]) -> Any:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("_backend", "_key")
+
+    def __init__(self, backend: MultiprocessMetricsBackend, key: bytes) -> None:
+        self._backend = backend
+        self._key = key
+        backend._allocate(False, (key,))
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self._backend._add(False, self._key, amount)
+
+
+class _MultiprocessCounter(_Metric):
+    def _new_child(self, values: tuple[str, ...]) -> _CounterChild:
+        key = self._key(f"{self._family}_total", self._label_names, values)
+        return _CounterChild(self._backend, key)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+
+class _GaugeChild:
+    __slots__ = ("_backend", "_key")
+
+    def __init__(self, backend: MultiprocessMetricsBackend, key: bytes) -> None:
+        self._backend = backend
+        self._key = key
+        backend._allocate(True, (key,))
+
+    def set(self, value: float) -> None:
+        self._backend._set(self._key, value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._backend._add(True, self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._backend._add(True, self._key, -amount)
+
+
+class _MultiprocessGauge(_Metric):
+    def _new_child(self, values: tuple[str, ...]) -> _GaugeChild:
+        return _GaugeChild(self._backend, self._key(self._family, self._label_names, values))
+
+    def set(self, value: float) -> None:
+        self._unlabeled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabeled().dec(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("_backend", "_bounds", "_bucket_keys", "_sum_key")
+
+    def __init__(
+        self,
+        backend: MultiprocessMetricsBackend,
+        bounds: tuple[float, ...],
+        bucket_keys: tuple[bytes, ...],
+        sum_key: bytes,
+    ) -> None:
+        self._backend = backend
+        self._bounds = bounds
+        self._bucket_keys = bucket_keys
+        self._sum_key = sum_key
+        backend._allocate(False, (*bucket_keys, sum_key))
+
+    def observe(self, value: float) -> None:
+        bucket = self._bucket_keys[bisect.bisect_left(self._bounds, value)]
+        self._backend._observe(bucket, self._sum_key, value)
+
+
+class _MultiprocessHistogram(_Metric):
+    def _new_child(self, values: tuple[str, ...]) -> _HistogramChild:
+        bounds = tuple(sorted(set(self._buckets) | {math.inf}))
+        names = (*self._label_names, "le")
+        bucket_keys = tuple(
+            self._key(f"{self._family}_bucket", names, (*values, _format_float(bound)))
+            for bound in bounds
+        )
+        sum_key = self._key(f"{self._family}_sum", self._label_names, values)
+        return _HistogramChild(self._backend, bounds, bucket_keys, sum_key)
+
+    def observe(self, value: float) -> None:
+        self._unlabeled().observe(value)
+
+
+class MultiprocessMetricsBackend(MetricsBackend):
+    """Metrics backend whose samples are shared across worker processes.
+
+    Needs only the standard library. Expose the aggregated samples with
+    :func:`create_multiprocess_metrics_app` or :class:`ExpositionRenderer`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        namespace: str = "",
+        gauge_mode: GaugeMode = "sum",
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            directory: Directory shared by all workers (defaults to the
+                ``METRICS_MULTIPROC_DIR`` environment variable).
+            namespace: Prefix for all metric names.
+            gauge_mode: How gauges of live workers are combined:
+                ``sum``, ``max``, ``min``, or ``all`` (a ``pid`` label).
+
+        Raises:
+            ValueError: If no directory is given or configured.
+        """
+        directory = directory or os.environ.get(MULTIPROC_DIR_ENV)
+        if not directory:
+            raise ValueError(f"A directory or {MULTIPROC_DIR_ENV} is required")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._namespace = namespace
+        self.gauge_mode = gauge_mode
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _full_name(self, name: str) -> str:
+        return f"{self._namespace}_{name}" if self._namespace else name
+
+    def _file(self, gauge: bool) -> _MmapFile:
+        # The PID is read on each call so a forked worker opens its own file
+        prefix = _GAUGE_PREFIX if gauge else _MONOTONIC_PREFIX
+        return _open_file(self.directory / f"{prefix}{os.getpid()}.db")
+
+    def _allocate(self, gauge: bool, keys: tuple[bytes, ...]) -> None:
+        with _files_lock:
+            file = self._file(gauge)
+            for key in keys:
+                file.offset(key)
+
+    def _add(self, gauge: bool, key: bytes, amount: float) -> None:
+        with _files_lock:
+            file = self._file(gauge)
+            file.add(file.offset(key), amount)
+
+    def _set(self, key: bytes, value: float) -> None:
+        with _files_lock:
+            file = self._file(True)
+            file.set(file.offset(key), value)
+
+    def _observe(self, bucket_key: bytes, sum_key: bytes, value: float) -> None:
+        with _files_lock:
+            file = self._file(False)
+            file.add(file.offset(bucket_key), 1.0)
+            file.add(file.offset(sum_key), value)
+
+    def _get_or_create(self, name: str, factory: Callable[[str], _Metric]) -> Any:
+        full_name = self._full_name(name)
+        with self._lock:
+            if full_name not in self._metrics:
+                self._metrics[full_name] = factory(full_name)
+            return self._metrics[full_name]
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        labels: list[str] | None = None,
+    ) -> LabeledCounterLike:
+        family = name.removesuffix("_total")
+        return self._get_or_create(
+            family,
+            lambda full: _MultiprocessCounter(self, "counter", full, description, labels),
+        )
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labels: list[str] | None = None,
+    ) -> LabeledGaugeLike:
+        return self._get_or_create(
+            name,
+            lambda full: _MultiprocessGauge(self, "gauge", full, description, labels),
+        )
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: list[str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> LabeledHistogramLike:
+        return self._get_or_create(
+            name,
+            lambda full: _MultiprocessHistogram(
+                self,
+                "histogram",
+                full,
+                description,
+                labels,
+                buckets or _DEFAULT_PROMETHEUS_BUCKETS,
+            ),
+        )
+
+    def list_metrics(self) -> list[str]:
+        with self._lock:
+            return list(self._metrics.keys())
+
+    def close(self) -> None:
+        """Unmap this process's files; the samples stay on disk."""
+        with _files_lock:
+            for gauge in (False, True):
+                file = _files.pop(self._file(gauge).path, None)
+                if file is not None:
+                    file.close()
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ExpositionRenderer:
+    """Aggregate the worker files and render Prometheus text format.
+
+    Decoded series keys and their rendered ``name{labels}`` prefixes are
+    cached, and output is written into a buffer reused across scrapes.
+    Safe to call from several threads; renders are serialized.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        gauge_mode: GaugeMode = "sum",
+        initial_buffer_size: int = 256 * 1024,
+    ) -> None:
+        """Initialize the renderer.
+
+        Args:
+            directory: Directory shared by all workers (defaults to the
+                ``METRICS_MULTIPROC_DIR`` environment variable).
+            gauge_mode: How gauges of live workers are combined.
+            initial_buffer_size: Starting size of the output buffer.
+
+        Raises:
+            ValueError: If no directory is given or configured.
+        """
+        directory = directory or os.environ.get(MULTIPROC_DIR_ENV)
+        if not directory:
+            raise ValueError(f"A directory or {MULTIPROC_DIR_ENV} is required")
+        self.directory = Path(directory)
+        self.gauge_mode = gauge_mode
+        self._buffer = bytearray(initial_buffer_size)
+        self._keys: dict[bytes, tuple[Any, ...]] = {}
+        self._prefixes: dict[tuple[bytes, str], bytes] = {}
+        # Per file: file id, parsed length and (key, value offset) of every entry
+        self._layouts: dict[Path, tuple[int, int, list[tuple[bytes, int]]]] = {}
+        self._lock = threading.Lock()
+
+    def _decode(self, key: bytes) -> tuple[Any, ...]:
+        decoded = self._keys.get(key)
+        if decoded is None:
+            family, kind, description, sample, names, values = json.loads(key)
+            decoded = (family, kind, description, sample, tuple(names), tuple(values))
+            self._keys[key] = decoded
+        return decoded
+
+    def _prefix(self, key: bytes, pid: str) -> bytes:
+        prefix = self._prefixes.get((key, pid))
+        if prefix is None:
+            _, _, _, sample, names, values = self._decode(key)
+            if pid:
+                names, values = (*names, "pid"), (*values, pid)
+            prefix = _render_prefix(sample, names, values)
+            self._prefixes[(key, pid)] = prefix
+        return prefix
+
+    def _collect(self) -> tuple[dict[bytes, float], dict[tuple[bytes, str], float]]:
+        monotonic: dict[bytes, float] = {}
+        gauges: dict[tuple[bytes, str], float] = {}
+        for path in sorted(self.directory.glob("*.db")):
+            name = path.stem
+            if name.startswith(_MONOTONIC_PREFIX):
+                target: MutableMapping[Any, float] = monotonic
+                pid = ""
+            elif name.startswith(_GAUGE_PREFIX):
+                pid = name[len(_GAUGE_PREFIX) :]
+                if not pid.isdigit() or not _process_alive(int(pid)):
+                    continue
+                target = gauges
+            else:
+                continue
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            if len(data) < _HEADER.size:
+                continue
+            used, file_id = _HEADER.unpack_from(data, 0)
+            for key, value in self._read_values(path, file_id, data, min(used, len(data))):
+                if target is monotonic:
+                    monotonic[key] = monotonic.get(key, 0.0) + value
+                else:
+                    self._merge_gauge(gauges, key, pid, value)
+        return monotonic, gauges
+
+    def _read_values(
+        self, path: Path, file_id: int, data: bytes, used: int
+    ) -> list[tuple[bytes, float]]:
+        # Files only ever grow by appending, so only new entries are parsed
+        known_id, parsed, entries = self._layouts.get(path, (file_id, _HEADER.size, []))
+        if known_id != file_id or parsed > used:
+            # The file was deleted and recreated, e.g. for a reused PID
+            parsed, entries = _HEADER.size, []
+        for key, offset, _ in _iter_entries(data, used, parsed):
+            entries.append((key, offset))
+            parsed = offset + _VALUE.size
+        self._layouts[path] = (file_id, parsed, entries)
+        unpack = _VALUE.unpack_from
+        return [(key, unpack(data, offset)[0]) for key, offset in entries]
+
+    def _merge_gauge(
+        self, gauges: dict[tuple[bytes, str], float], key: bytes, pid: str, value: float
+    ) -> None:
+        mode = self.gauge_mode
+        if mode == "all":
+            gauges[(key, pid)] = value
+            return
+        current = gauges.get((key, ""))
+        if current is None:
+            gauges[(key, "")] = value
+        elif mode == "sum":
+            gauges[(key, "")] = current + value
+        elif mode == "max":
+            gauges[(key, "")] = max(current, value)
+        else:
+            gauges[(key, "")] = min(current, value)
+
+    def render(self) -> bytes:
+        """Return the aggregated samples in Prometheus text format."""
+        with self._lock:
+            monotonic, gauges = self._collect()
+            families: dict[str, tuple[str, str, list[tuple[bytes, str, float]]]] = {}
+            for key, value in monotonic.items():
+                family, kind, description = self._decode(key)[:3]
+                families.setdefault(family, (kind, description, []))[2].append((key, "", value))
+            for (key, pid), value in gauges.items():
+                family, kind, description = self._decode(key)[:3]
+                families.setdefault(family, (kind, description, []))[2].append((key, pid, value))
+
+            buffer = self._buffer
+            position = 0
+            for family in sorted(families):
+                kind, description, samples = families[family]
+                # Counter samples carry the _total suffix, and so must their metadata
+                name = f"{family}_total" if kind == "counter" else family
+                header = (
+                    f"# HELP {name} {_escape_help(description)}\n# TYPE {name} {kind}\n"
+                ).encode()
+                buffer[position : position + len(header)] = header
+                position += len(header)
+                lines = (
+                    self._histogram_lines(samples)
+                    if kind == "histogram"
+                    else ((self._prefix(key, pid), value) for key, pid, value in samples)
+                )
+                for prefix, value in lines:
+                    line = prefix + _format_float(value).encode() + b"\n"
+                    buffer[position : position + len(line)] = line
+                    position += len(line)
+            # The buffer keeps its high-water size for the next scrape
+            return bytes(memoryview(buffer)[:position])
+
+    def _histogram_lines(
+        self, samples: list[tuple[bytes, str, float]]
+    ) -> list[tuple[bytes, float]]:
+        buckets: dict[tuple[str, ...], list[tuple[float, bytes, float]]] = {}
+        sums: dict[tuple[str, ...], tuple[bytes, float]] = {}
+        for key, _, value in samples:
+            _, _, _, sample, _, values = self._decode(key)
+            if sample.endswith("_bucket"):
+                buckets.setdefault(values[:-1], []).append((float(values[-1]), key, value))
+            else:
+                sums[values] = (key, value)
+
+        lines: list[tuple[bytes, float]] = []
+        for labels, (sum_key, total) in sums.items():
+            cumulative = 0.0
+            for _, key, value in sorted(buckets.get(labels, ())):
+                cumulative += value
+                lines.append((self._prefix(key, ""), cumulative))
+            lines.append((self._count_prefix(sum_key), cumulative))
+            lines.append((self._prefix(sum_key, ""), total))
+        return lines
+
+    def _count_prefix(self, sum_key: bytes) -> bytes:
+        prefix = self._prefixes.get((sum_key, "_count"))
+        if prefix is None:
+            _, _, _, sample, names, values = self._decode(sum_key)
+            prefix = _render_prefix(sample.removesuffix("_sum") + "_count", names, values)
+            self._prefixes[(sum_key, "_count")] = prefix
+        return prefix
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _render_prefix(sample: str, names: tuple[str, ...], values: tuple[str, ...]) -> bytes:
+    if not names:
+        return f"{sample} ".encode()
+    labels = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{sample}{{{labels}}} ".encode()
+
+
+def create_multiprocess_metrics_app(
+    directory: str | os.PathLike[str] | None = None,
+    *,
+    gauge_mode: GaugeMode = "sum",
+) -> Callable[[Any, Any, Any], Awaitable[None]]:
+    """Create an ASGI app serving the aggregated metrics of all workers.
+
+    Rendering runs in a worker thread so a large scrape does not block
+    the event loop.
+
+    Args:
+        directory: Directory shared by all workers (defaults to the
+            ``METRICS_MULTIPROC_DIR`` environment variable).
+        gauge_mode: How gauges of live workers are combined.
+
+    Returns:
+        An ASGI application.
+    """
+    renderer = ExpositionRenderer(directory, gauge_mode=gauge_mode)
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        body = await asyncio.to_thread(renderer.render)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", CONTENT_TYPE),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def mark_process_dead(pid: int, directory: str | os.PathLike[str] | None = None) -> None:
+    """Remove the gauge file of an exited worker.
+
+    Call from the process manager's child-exit hook (gunicorn:
+    ``child_exit``). Counter and histogram files are kept so that
+    totals do not go backwards.
+
+    Args:
+        pid: Process ID of the exited worker.
+        directory: Directory shared by all workers (defaults to the
+            ``METRICS_MULTIPROC_DIR`` environment variable).
+    """
+    directory = directory or os.environ.get(MULTIPROC_DIR_ENV)
+    if directory:
+        (Path(directory) / f"{_GAUGE_PREFIX}{pid}.db").unlink(missing_ok=True)
+
+
+def clear_multiprocess_directory(directory: str | os.PathLike[str] | None = None) -> None:
+    """Delete all sample files; call once before starting the workers.
+
+    Args:
+        directory: Directory shared by all workers (defaults to the
+            ``METRICS_MULTIPROC_DIR`` environment variable).
+    """
+    directory = directory or os.environ.get(MULTIPROC_DIR_ENV)
+    if not directory:
+        return
+    for pattern in (f"{_MONOTONIC_PREFIX}*.db", f"{_GAUGE_PREFIX}*.db"):
+        for path in Path(directory).glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "MULTIPROC_DIR_ENV",
+    "ExpositionRenderer",
+    "GaugeMode",
+    "MultiprocessMetricsBackend",
+    "clear_multiprocess_directory",
+    "create_multiprocess_metrics_app",
+    "mark_process_dead",
+]
@@ -5,10 +5,12 @@ to the real ``prometheus_client`` library so that metrics can be scraped by
 Prometheus in production.  For tests and local development the default
 in-memory backend remains zero-dependency.
 
-Two backends are provided:
+Three backends are provided:
 
 * **InMemoryMetricsBackend** (default) - lightweight, no external deps.
 * **PrometheusMetricsBackend** - delegates to ``prometheus_client``.
+* **MultiprocessMetricsBackend** - aggregates across worker processes
+  (see :mod:`shared.observability.multiprocess_metrics`).
 
 Usage::
 
@@ -32,6 +34,7 @@ Usage::
 
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from threading import Lock
 from typing import Protocol, runtime_checkable
@@ -304,6 +307,9 @@ class PrometheusMetricsBackend(MetricsBackend):
 # Factory helper
 # ---------------------------------------------------------------------------
 
+# Directory shared by worker processes (see multiprocess_metrics)
+_MULTIPROC_DIR_ENV = "METRICS_MULTIPROC_DIR"
+
 _active_backend: MetricsBackend | None = None
 _backend_lock = Lock()
 
@@ -317,8 +323,9 @@ def create_metrics_backend(
 
     Args:
         namespace: Prefix for all metric names.
-        backend: ``"auto"`` (try prometheus_client first), ``"prometheus"``,
-            or ``"memory"``.
+        backend: ``"auto"`` (multiprocess when ``METRICS_MULTIPROC_DIR``
+            is set, otherwise prometheus_client if installed),
+            ``"prometheus"``, ``"multiprocess"``, or ``"memory"``.
 
     Returns:
         A :class:`MetricsBackend` instance.
@@ -327,6 +334,10 @@ def create_metrics_backend(
         ImportError: If ``backend="prometheus"`` and the library is missing.
         ValueError: If *backend* is not recognised.
     """
+    if backend == "multiprocess" or (backend == "auto" and os.environ.get(_MULTIPROC_DIR_ENV)):
+        from shared.observability.multiprocess_metrics import MultiprocessMetricsBackend
+
+        return MultiprocessMetricsBackend(namespace=namespace)
     if backend == "auto":
         try:
             return PrometheusMetricsBackend(namespace=namespace)
@@ -387,6 +398,9 @@ def reset_metrics_backend() -> None:
 def create_prometheus_asgi_app() -> object:
     """Create an ASGI app that exposes ``/metrics`` for Prometheus scraping.
 
+    When the active backend is a ``MultiprocessMetricsBackend``, the app
+    serves the samples aggregated across its worker processes instead.
+
     Returns:
         An ASGI application from ``prometheus_client``.
 
@@ -401,6 +415,15 @@ def create_prometheus_asgi_app() -> object:
         app = FastAPI()
         app.mount("/metrics", create_prometheus_asgi_app())
     """
+    from shared.observability.multiprocess_metrics import (
+        MultiprocessMetricsBackend,
+        create_multiprocess_metrics_app,
+    )
+
+    backend = get_metrics_backend()
+    if isinstance(backend, MultiprocessMetricsBackend):
+        return create_multiprocess_metrics_app(backend.directory, gauge_mode=backend.gauge_mode)
+
     from prometheus_client import make_asgi_app
 
     return make_asgi_app()
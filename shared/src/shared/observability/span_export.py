@@ -0,0 +1,319 @@
+"""Span export for the built-in tracer.
+
+Finished spans are handed to a :class:`BatchSpanProcessor`, which queues
+them without blocking the caller and exports them from a background
+thread, either when ``max_export_batch_size`` spans are waiting or every
+``schedule_delay_seconds``. The queue is bounded: when it is full, new
+spans are dropped and counted rather than slowing the request path down.
+
+Two exporters are provided:
+
+* :class:`OTLPHttpSpanExporter` posts OTLP/HTTP JSON to a collector
+  (``http(s)://host:4318``; ``/v1/traces`` is appended), using only the
+  standard library.
+* :class:`FileSpanExporter` appends one JSON object per span to a local
+  file, for development or sidecar shipping.
+
+Example:
+    >>> processor = BatchSpanProcessor(FileSpanExporter("/tmp/spans.jsonl"))
+    >>> processor.on_end(span)
+    >>> processor.shutdown()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import urllib.request
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from shared.observability.tracing import Span
+
+logger = logging.getLogger(__name__)
+
+_OTLP_KIND = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Destination for batches of finished spans."""
+
+    def export(self, spans: list[Span]) -> None:
+        """Export a batch of spans (called from the processor thread)."""
+        ...
+
+    def shutdown(self) -> None:
+        """Release exporter resources."""
+        ...
+
+
+def span_to_dict(span: Span) -> dict[str, Any]:
+    """Serialize a span to a plain dictionary."""
+    return {
+        "name": span.name,
+        "trace_id": span.trace_id,
+        "span_id": span.span_id,
+        "parent_span_id": span.parent_span_id,
+        "kind": span.kind.value,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "attributes": span.attributes,
+        "events": span.events,
+        "status": span.status,
+    }
+
+
+class FileSpanExporter:
+    """Append spans to a JSON-lines file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: File to append to (parent directories are created).
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: list[Span]) -> None:
+        lines = "".join(json.dumps(span_to_dict(s), default=str) + "\n" for s in spans)
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def shutdown(self) -> None:
+        return None
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _nanos(seconds: float | None) -> str:
+    return str(int((seconds or 0.0) * 1_000_000_000))
+
+
+class OTLPHttpSpanExporter:
+    """Export spans to an OpenTelemetry collector over OTLP/HTTP JSON."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str,
+        resource_attributes: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Collector base URL; ``/v1/traces`` is appended unless
+                already present.
+            service_name: Value of the ``service.name`` resource attribute.
+            resource_attributes: Additional resource attributes.
+            headers: Extra HTTP headers (e.g. authentication).
+            timeout: Request timeout in seconds.
+        """
+        endpoint = endpoint.rstrip("/")
+        self._url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self._resource = _otlp_attributes(
+            {"service.name": service_name, **(resource_attributes or {})}
+        )
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._timeout = timeout
+
+    def encode(self, spans: list[Span]) -> dict[str, Any]:
+        """Build the OTLP ``ExportTraceServiceRequest`` JSON body."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": self._resource},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "shared.observability"},
+                            "spans": [self._encode_span(s) for s in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: list[Span]) -> None:
+        body = json.dumps(self.encode(spans), default=str).encode()
+        request = urllib.request.Request(self._url, data=body, headers=self._headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self._timeout) as response:
+            response.read()
+
+    def shutdown(self) -> None:
+        return None
+
+    @staticmethod
+    def _encode_span(span: Span) -> dict[str, Any]:
+        encoded: dict[str, Any] = {
+            # OTLP ids are 16 and 8 bytes; shorter local ids are left-padded
+            "traceId": span.trace_id.rjust(32, "0"),
+            "spanId": span.span_id.rjust(16, "0"),
+            "name": span.name,
+            "kind": _OTLP_KIND.get(span.kind.value, 1),
+            "startTimeUnixNano": _nanos(span.start_time),
+            "endTimeUnixNano": _nanos(span.end_time),
+            "attributes": _otlp_attributes(span.attributes),
+            "events": [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": _nanos(event["timestamp"]),
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in span.events
+            ],
+            "status": {"code": 2 if span.status == "ERROR" else 0},
+        }
+        if span.parent_span_id:
+            encoded["parentSpanId"] = span.parent_span_id.rjust(16, "0")
+        return encoded
+
+
+class BatchSpanProcessor:
+    """Queue finished spans and export them in batches from a thread."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        *,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay_seconds: float = 5.0,
+    ) -> None:
+        """Initialize the processor and start its worker thread.
+
+        Args:
+            exporter: Destination for span batches.
+            max_queue_size: Spans allowed to wait; further spans are dropped.
+            max_export_batch_size: Maximum spans per export call; reaching
+                it wakes the worker early.
+            schedule_delay_seconds: Maximum time a span waits for export.
+
+        Raises:
+            ValueError: If a size or the delay is not positive, or the
+                batch size exceeds the queue size.
+        """
+        if max_queue_size < 1 or max_export_batch_size < 1 or schedule_delay_seconds <= 0:
+            raise ValueError("Queue size, batch size and delay must be positive")
+        if max_export_batch_size > max_queue_size:
+            raise ValueError("max_export_batch_size must not exceed max_queue_size")
+
+        self._exporter = exporter
+        self._max_queue_size = max_queue_size
+        self._max_batch = max_export_batch_size
+        self._delay = schedule_delay_seconds
+        self._queue: deque[Span] = deque()
+        self._condition = threading.Condition()
+        self._flush_requested = 0
+        self._flushed = 0
+        self._shutdown = False
+        self.dropped = 0
+        self.exported = 0
+        self._worker = threading.Thread(target=self._run, name="span-batch-processor", daemon=True)
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Spans waiting for export."""
+        return len(self._queue)
+
+    def on_end(self, span: Span) -> None:
+        """Enqueue a finished span; never blocks on export."""
+        if self._shutdown:
+            return
+        if len(self._queue) >= self._max_queue_size:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self._max_batch:
+            with self._condition:
+                self._condition.notify()
+
+    def force_flush(self, timeout: float | None = 30.0) -> bool:
+        """Export every queued span before returning.
+
+        Args:
+            timeout: Seconds to wait for the worker.
+
+        Returns:
+            ``True`` if the queue was flushed within the timeout.
+        """
+        with self._condition:
+            self._flush_requested += 1
+            ticket = self._flush_requested
+            self._condition.notify()
+            return self._condition.wait_for(lambda: self._flushed >= ticket, timeout)
+
+    def shutdown(self, timeout: float | None = 30.0) -> None:
+        """Flush remaining spans, stop the worker and the exporter."""
+        if self._shutdown:
+            return
+        self.force_flush(timeout)
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+        self._worker.join(timeout)
+        self._exporter.shutdown()
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self._delay
+        while True:
+            with self._condition:
+                while not (
+                    self._shutdown
+                    or self._flush_requested > self._flushed
+                    or len(self._queue) >= self._max_batch
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                ticket = self._flush_requested
+                stopping = self._shutdown
+
+            self._export_available()
+            deadline = time.monotonic() + self._delay
+
+            with self._condition:
+                self._flushed = max(self._flushed, ticket)
+                self._condition.notify_all()
+            if stopping:
+                return
+
+    def _export_available(self) -> None:
+        while self._queue:
+            count = min(self._max_batch, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            try:
+                self._exporter.export(batch)
+                self.exported += len(batch)
+            except Exception:
+                logger.exception("Failed to export %d spans", len(batch))
+
+
+__all__ = [
+    "BatchSpanProcessor",
+    "FileSpanExporter",
+    "OTLPHttpSpanExporter",
+    "SpanExporter",
+    "span_to_dict",
+]
@@ -42,6 +42,8 @@ from uuid import uuid4
 import structlog
 from structlog.types import EventDict, Processor, WrappedLogger
 
+from shared.observability.async_logging import AsyncLogHandler, DropPolicy, QueuedLoggerFactory
+
 # =============================================================================
 # Context Variables for Request Context
 # =============================================================================
@@ -109,6 +111,12 @@ class LoggingConfig:
         add_timestamp: Include ISO 8601 timestamp in logs.
         utc_timestamps: Use UTC for timestamps (recommended for distributed systems).
         extra_processors: Additional custom processors to include.
+        async_logging: Write log lines from a listener thread through a
+            bounded queue, so slow output never blocks the event loop.
+            Lines are still rendered on the calling thread.
+        async_queue_size: Lines allowed to wait for the listener thread.
+        async_drop_policy: Line dropped when the queue is full
+            ("drop_newest" or "drop_oldest").
     """
 
     service_name: str
@@ -119,6 +127,9 @@ class LoggingConfig:
     add_timestamp: bool = True
     utc_timestamps: bool = True
     extra_processors: list[Processor] = field(default_factory=list)
+    async_logging: bool = False
+    async_queue_size: int = 10_000
+    async_drop_policy: DropPolicy | str = DropPolicy.DROP_NEWEST
 
     @property
     def is_development(self) -> bool:
@@ -221,6 +232,7 @@ def drop_color_message_key(
 # =============================================================================
 
 _configured: bool = False
+_async_handler: AsyncLogHandler | None = None
 
 
 def configure_structlog(config: LoggingConfig) -> None:
@@ -238,7 +250,15 @@ def configure_structlog(config: LoggingConfig) -> None:
             log_level="INFO",
         ))
     """
-    global _configured
+    global _configured, _async_handler
+
+    _close_async_handler()
+    if config.async_logging:
+        _async_handler = AsyncLogHandler(
+            logging.StreamHandler(sys.stderr),
+            max_queue=config.async_queue_size,
+            drop_policy=config.async_drop_policy,
+        )
 
     # Set service name in context
     _service_name_ctx.set(config.service_name)
@@ -287,7 +307,7 @@ def configure_structlog(config: LoggingConfig) -> None:
             import orjson
 
             processors.append(structlog.processors.JSONRenderer(serializer=orjson.dumps))
-            logger_factory = structlog.BytesLoggerFactory()
+            logger_factory: Any = structlog.BytesLoggerFactory()
         except ImportError:
             processors.append(structlog.processors.JSONRenderer())
             logger_factory = structlog.PrintLoggerFactory()
@@ -301,6 +321,10 @@ def configure_structlog(config: LoggingConfig) -> None:
         )
         logger_factory = structlog.PrintLoggerFactory()
 
+    if _async_handler is not None:
+        # Rendered str or orjson bytes go to stdout via the listener thread
+        logger_factory = QueuedLoggerFactory(_async_handler)
+
     # Get numeric log level
     numeric_level = getattr(logging, config.log_level.upper(), logging.INFO)
 
@@ -354,9 +378,18 @@ def _configure_stdlib_logging(config: LoggingConfig) -> None:
             )
         )
 
+    if _async_handler is not None:
+        # Format here, where merge_contextvars sees the context; the
+        # listener's stream handler only writes the result
+        _async_handler.setFormatter(handler.formatter)
+        handler = _async_handler
+
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.handlers.clear()
+    for existing in root_logger.handlers[:]:
+        root_logger.removeHandler(existing)
+        if isinstance(existing, AsyncLogHandler) and existing is not handler:
+            existing.close()
     root_logger.addHandler(handler)
     root_logger.setLevel(numeric_level)
 
@@ -400,9 +433,28 @@ def reset_structlog_configuration() -> None:
     """
     global _configured
     structlog.reset_defaults()
+    _close_async_handler()
     _configured = False
 
 
+def get_async_log_handler() -> AsyncLogHandler | None:
+    """Return the queue handler used when ``async_logging`` is enabled.
+
+    Returns:
+        The active handler (e.g. to read ``stats()``), or None.
+    """
+    return _async_handler
+
+
+def _close_async_handler() -> None:
+    """Drain and stop the async log handler, if any."""
+    global _async_handler
+    handler, _async_handler = _async_handler, None
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+
+
 # =============================================================================
 # Logger Factory
 # =============================================================================
@@ -484,6 +536,7 @@ __all__ = [
     "configure_structlog",
     "configure_structlog_for_testing",
     "reset_structlog_configuration",
+    "get_async_log_handler",
     # Context management
     "set_correlation_id",
     "get_correlation_id",
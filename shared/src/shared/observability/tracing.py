@@ -2,6 +2,22 @@
 
 This module provides OpenTelemetry-compatible tracing utilities including
 span creation, context propagation, and the @traced decorator.
+
+Sampling happens once per trace, when its root span is created:
+
+* Head sampling keeps a trace when the low 63 bits of its trace ID fall
+  below ``sample_rate``, so every service sharing the trace ID makes the
+  same decision without coordination.
+* Unsampled traces get a :class:`NonRecordingSpan`; its children reuse
+  it, so an unsampled request allocates one small object and no more.
+* With ``tail_sampling`` enabled, unsampled traces are recorded into a
+  per-trace buffer instead and exported only if a span failed or the
+  root took at least ``tail_latency_threshold_ms``.
+
+Finished spans of kept traces go to a
+:class:`~shared.observability.span_export.BatchSpanProcessor` when
+``exporter_endpoint`` is set: an ``http(s)://`` URL exports OTLP/HTTP to
+a collector, a ``file://`` URL or plain path appends JSON lines.
 """
 
 from __future__ import annotations
@@ -9,14 +25,23 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import functools
+import random
 import time
-import uuid
+import zlib
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, ParamSpec, TypeVar
 
+from shared.observability.span_export import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    OTLPHttpSpanExporter,
+    SpanExporter,
+)
+
 
 class SpanKind(Enum):
     """Span kind indicating the role in a trace."""
@@ -30,13 +55,33 @@ class SpanKind(Enum):
 
 @dataclass
 class TracingConfig:
-    """Configuration for tracing."""
+    """Configuration for tracing.
+
+    Attributes:
+        service_name: Exported as the ``service.name`` resource attribute.
+        enabled: Whether spans are recorded at all.
+        sample_rate: Fraction of traces kept by head sampling (0.0-1.0).
+        exporter_endpoint: OTLP/HTTP collector URL, or a ``file://`` URL
+            or path for a JSON-lines sink. ``None`` disables export.
+        extra_attributes: Additional resource attributes.
+        tail_sampling: Also keep head-dropped traces that errored or were slow.
+        tail_latency_threshold_ms: Root duration at which tail sampling
+            keeps a trace.
+        max_queue_size: Spans waiting for export before new ones are dropped.
+        max_export_batch_size: Maximum spans per export request.
+        schedule_delay_seconds: Maximum time a span waits for export.
+    """
 
     service_name: str = "unknown-service"
     enabled: bool = True
     sample_rate: float = 1.0
     exporter_endpoint: str | None = None
     extra_attributes: dict[str, Any] = field(default_factory=dict)
+    tail_sampling: bool = False
+    tail_latency_threshold_ms: float = 500.0
+    max_queue_size: int = 2048
+    max_export_batch_size: int = 512
+    schedule_delay_seconds: float = 5.0
 
 
 @dataclass
@@ -54,6 +99,12 @@ class Span:
     events: list[dict[str, Any]] = field(default_factory=list)
     status: str = "OK"
     exception: BaseException | None = None
+    sampled: bool = True
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether attributes and events set on this span are kept."""
+        return True
 
     def set_attribute(self, key: str, value: Any) -> None:
         """Set an attribute on the span.
@@ -100,24 +151,145 @@ class Span:
         self.end_time = time.time()
 
 
+class NonRecordingSpan(Span):
+    """Span of an unsampled trace; every operation is a no-op.
+
+    It carries only the IDs needed for context propagation and log
+    correlation, and is reused by all child spans of its trace.
+    """
+
+    name = ""
+    attributes = MappingProxyType({})  # type: ignore[assignment]
+    events = ()  # type: ignore[assignment]
+    sampled = False
+
+    def __init__(self, trace_id: str = "", span_id: str = "") -> None:
+        """Initialize the span.
+
+        Args:
+            trace_id: Trace ID to propagate.
+            span_id: Span ID to propagate.
+        """
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    @property
+    def is_recording(self) -> bool:
+        """Always ``False``."""
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Discard the attribute."""
+
+    def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
+        """Discard the event."""
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Discard the exception."""
+
+    def end(self) -> None:
+        """Do nothing."""
+
+
+_DISABLED_SPAN = NonRecordingSpan()
+
 # Context variables for tracing
 _current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
     "current_span", default=None
 )
 _trace_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_id", default=None)
+# Spans of a trace held back for the tail-sampling decision
+_tail_buffer: contextvars.ContextVar[list[Span] | None] = contextvars.ContextVar(
+    "tail_buffer", default=None
+)
 
 # Global tracing configuration
 _tracing_config: TracingConfig = TracingConfig()
+_span_processor: BatchSpanProcessor | None = None
+_sample_bound: int = 1 << 63
+
+_ID_MASK = (1 << 63) - 1
 
 
-def configure_tracing(config: TracingConfig) -> None:
+def configure_tracing(config: TracingConfig, *, exporter: SpanExporter | None = None) -> None:
     """Configure tracing globally.
 
+    A previously configured span processor is flushed and replaced.
+
     Args:
         config: Tracing configuration.
+        exporter: Exporter to use instead of the one derived from
+            ``config.exporter_endpoint``.
+
+    Raises:
+        ValueError: If ``sample_rate`` is outside 0.0-1.0.
     """
-    global _tracing_config
+    global _tracing_config, _span_processor, _sample_bound
+    if not 0.0 <= config.sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0.0 and 1.0")
+
+    shutdown_tracing()
     _tracing_config = config
+    _sample_bound = int(config.sample_rate * (1 << 63))
+
+    if exporter is None and config.exporter_endpoint:
+        exporter = _create_exporter(config)
+    if config.enabled and exporter is not None:
+        _span_processor = BatchSpanProcessor(
+            exporter,
+            max_queue_size=config.max_queue_size,
+            max_export_batch_size=config.max_export_batch_size,
+            schedule_delay_seconds=config.schedule_delay_seconds,
+        )
+
+
+def shutdown_tracing(timeout: float | None = 30.0) -> None:
+    """Export pending spans and stop the span processor.
+
+    Args:
+        timeout: Seconds to wait for the final export.
+    """
+    global _span_processor
+    processor, _span_processor = _span_processor, None
+    if processor is not None:
+        processor.shutdown(timeout)
+
+
+def get_span_processor() -> BatchSpanProcessor | None:
+    """Return the active span processor, if spans are being exported."""
+    return _span_processor
+
+
+def _create_exporter(config: TracingConfig) -> SpanExporter:
+    endpoint = config.exporter_endpoint or ""
+    if endpoint.startswith(("http://", "https://")):
+        return OTLPHttpSpanExporter(
+            endpoint,
+            service_name=config.service_name,
+            resource_attributes=config.extra_attributes,
+        )
+    return FileSpanExporter(endpoint.removeprefix("file://"))
+
+
+def should_sample(trace_id: str) -> bool:
+    """Return the head-sampling decision for a trace.
+
+    The decision depends only on the trace ID and ``sample_rate``, so all
+    services configured with the same rate agree on it.
+
+    Args:
+        trace_id: Hex trace ID.
+
+    Returns:
+        ``True`` if the trace is sampled.
+    """
+    if _sample_bound >= 1 << 63:
+        return True
+    try:
+        value = int(trace_id[-16:], 16)
+    except ValueError:
+        value = zlib.crc32(trace_id.encode())
+    return (value & _ID_MASK) < _sample_bound
 
 
 def get_current_span() -> Span | None:
@@ -140,7 +312,8 @@ def get_trace_id() -> str | None:
 
 def _generate_id() -> str:
     """Generate a unique ID for spans/traces."""
-    return uuid.uuid4().hex[:16]
+    # IDs must be unique, not unpredictable; this avoids a urandom syscall per span
+    return f"{random.getrandbits(64):016x}"
 
 
 @contextmanager
@@ -166,28 +339,51 @@ def create_span(
             # Do work
     """
     if not _tracing_config.enabled:
-        # Return a no-op span when tracing is disabled
-        yield Span(name=name, trace_id="", span_id="")
+        yield _DISABLED_SPAN
         return
 
-    # Get or create trace ID
-    trace_id = _trace_id.get()
-    if trace_id is None:
-        trace_id = _generate_id()
-        _trace_id.set(trace_id)
-
-    # Get parent span
     parent_span = _current_span.get()
-    parent_span_id = parent_span.span_id if parent_span else None
+    if parent_span is not None and not parent_span.is_recording:
+        # The whole trace is unsampled; children share the parent's no-op span
+        yield parent_span
+        return
+
+    trace_token = None
+    if parent_span is not None:
+        trace_id = parent_span.trace_id
+    else:
+        # A trace ID already in context belongs to a remote parent; otherwise
+        # each local root starts a new trace with its own sampling decision
+        trace_id = _trace_id.get()
+        if trace_id is None:
+            trace_id = _generate_id()
+            trace_token = _trace_id.set(trace_id)
+
+    tail_token = None
+    if parent_span is None:
+        sampled = should_sample(trace_id)
+        if not sampled and not _tracing_config.tail_sampling:
+            token = _current_span.set(NonRecordingSpan(trace_id, _generate_id()))
+            try:
+                yield _current_span.get()  # type: ignore[misc]
+            finally:
+                _current_span.reset(token)
+                if trace_token is not None:
+                    _trace_id.reset(trace_token)
+            return
+        # A new local root starts its own tail buffer (or none if head-sampled)
+        tail_token = _tail_buffer.set(None if sampled else [])
+    else:
+        sampled = parent_span.sampled
 
-    # Create new span
     span = Span(
         name=name,
         trace_id=trace_id,
         span_id=_generate_id(),
-        parent_span_id=parent_span_id,
+        parent_span_id=parent_span.span_id if parent_span else None,
         kind=kind,
-        attributes=attributes or {},
+        attributes=dict(attributes) if attributes else {},
+        sampled=sampled,
     )
 
     # Set as current span
@@ -201,6 +397,36 @@ def create_span(
     finally:
         span.end()
         _current_span.reset(token)
+        buffer = _tail_buffer.get()
+        if tail_token is not None:
+            _tail_buffer.reset(tail_token)
+        if trace_token is not None:
+            _trace_id.reset(trace_token)
+        _finish_span(span, buffer, is_root=tail_token is not None)
+
+
+def _finish_span(span: Span, buffer: list[Span] | None, *, is_root: bool) -> None:
+    """Hand a finished span to the processor or the tail buffer."""
+    if buffer is None:
+        if _span_processor is not None:
+            _span_processor.on_end(span)
+        return
+
+    buffer.append(span)
+    if not is_root:
+        return
+
+    duration_ms = ((span.end_time or span.start_time) - span.start_time) * 1000
+    if any(s.status == "ERROR" for s in buffer):
+        reason = "error"
+    elif duration_ms >= _tracing_config.tail_latency_threshold_ms:
+        reason = "latency"
+    else:
+        return
+    span.set_attribute("sampling.tail_reason", reason)
+    if _span_processor is not None:
+        for buffered in buffer:
+            _span_processor.on_end(buffered)
 
 
 def inject_context(carrier: dict[str, str]) -> None:
@@ -213,7 +439,9 @@ def inject_context(carrier: dict[str, str]) -> None:
     span = get_current_span()
 
     if trace_id:
-        carrier["traceparent"] = f"00-{trace_id}-{span.span_id if span else '0' * 16}-01"
+        span_id = span.span_id if span else "0" * 16
+        sampled = span.sampled if span else should_sample(trace_id)
+        carrier["traceparent"] = f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
 
 
 def extract_context(carrier: dict[str, str]) -> dict[str, str | None]:
@@ -294,6 +522,7 @@ def traced(
 
 
 __all__ = [
+    "NonRecordingSpan",
     "Span",
     "SpanKind",
     "TracingConfig",
@@ -301,7 +530,10 @@ __all__ = [
     "create_span",
     "extract_context",
     "get_current_span",
+    "get_span_processor",
     "get_trace_id",
     "inject_context",
+    "should_sample",
+    "shutdown_tracing",
     "traced",
 ]
@@ -11,15 +11,32 @@ This module provides helpers for building gRPC-based microservices:
    Requires the ``grpc`` extras: ``pip install shared[grpc]``
 """
 
-from shared.proto.serialization import (
-    ProtobufSerializer,
-    pydantic_to_struct,
-    struct_to_dict,
-)
-from shared.proto.status_mapping import (
-    GrpcServiceConfig,
-    grpc_status_to_http,
-    http_status_to_grpc,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.proto.serialization import (
+        ProtobufSerializer,
+        pydantic_to_struct,
+        struct_to_dict,
+    )
+    from shared.proto.status_mapping import (
+        GrpcServiceConfig,
+        grpc_status_to_http,
+        http_status_to_grpc,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "ProtobufSerializer": "shared.proto.serialization",
+        "pydantic_to_struct": "shared.proto.serialization",
+        "struct_to_dict": "shared.proto.serialization",
+        "GrpcServiceConfig": "shared.proto.status_mapping",
+        "grpc_status_to_http": "shared.proto.status_mapping",
+        "http_status_to_grpc": "shared.proto.status_mapping",
+    },
 )
 
 __all__ = [
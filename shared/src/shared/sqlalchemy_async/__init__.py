@@ -31,20 +31,25 @@ Example:
     ...     page = await repo.paginate(PageRequest(page=1, size=10))
 """
 
-# Re-export from shared.dbs for convenience (always available)
-from shared.dbs.repository import (
-    Filter,
-    FilterOperator,
-    OrderBy,
-    OrderDirection,
-    PageRequest,
-    PageResponse,
-)
+import importlib.util
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    # Re-export from shared.dbs for convenience (always available)
+    from shared.dbs.repository import (
+        Filter,
+        FilterOperator,
+        OrderBy,
+        OrderDirection,
+        PageRequest,
+        PageResponse,
+    )
 
-# SQLAlchemy-dependent imports - guarded so the package can be imported
-# even when sqlalchemy is not installed (e.g. lightweight services that
-# only use the shared library's non-DB utilities).
-try:
+    # SQLAlchemy-dependent names are only imported when first used, so
+    # the package can be imported even when sqlalchemy is not installed
+    # (e.g. lightweight services that only use the non-DB utilities).
     from shared.sqlalchemy_async.database import (
         AsyncDatabaseManager,
         DatabaseConfig,
@@ -80,11 +85,53 @@ try:
         AsyncCRUDRepository,
         AsyncRepository,
     )
+    from shared.sqlalchemy_async.specification import (
+        compile_specification,
+        filter_clause,
+    )
     from shared.sqlalchemy_async.unit_of_work import SqlAlchemyUnitOfWork
 
-    _HAS_SQLALCHEMY = True
-except ImportError:  # pragma: no cover
-    _HAS_SQLALCHEMY = False
+_HAS_SQLALCHEMY = importlib.util.find_spec("sqlalchemy") is not None
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Filter": "shared.dbs.repository",
+        "FilterOperator": "shared.dbs.repository",
+        "OrderBy": "shared.dbs.repository",
+        "OrderDirection": "shared.dbs.repository",
+        "PageRequest": "shared.dbs.repository",
+        "PageResponse": "shared.dbs.repository",
+        "AsyncDatabaseManager": "shared.sqlalchemy_async.database",
+        "DatabaseConfig": "shared.sqlalchemy_async.database",
+        "get_async_session": "shared.sqlalchemy_async.database",
+        "SQLAlchemyInstrumentationConfig": "shared.sqlalchemy_async.instrumentation",
+        "configure_sqlalchemy_instrumentation": "shared.sqlalchemy_async.instrumentation",
+        "instrument_engine": "shared.sqlalchemy_async.instrumentation",
+        "reset_sqlalchemy_instrumentation": "shared.sqlalchemy_async.instrumentation",
+        "uninstrument_engine": "shared.sqlalchemy_async.instrumentation",
+        "AlembicMigrationConfig": "shared.sqlalchemy_async.migrations",
+        "create_alembic_config": "shared.sqlalchemy_async.migrations",
+        "generate_migration_scaffold": "shared.sqlalchemy_async.migrations",
+        "get_current_revision": "shared.sqlalchemy_async.migrations",
+        "run_downgrade": "shared.sqlalchemy_async.migrations",
+        "run_upgrade_to_head": "shared.sqlalchemy_async.migrations",
+        "stamp_head": "shared.sqlalchemy_async.migrations",
+        "AuditMixin": "shared.sqlalchemy_async.models",
+        "FullAuditMixin": "shared.sqlalchemy_async.models",
+        "SoftDeleteMixin": "shared.sqlalchemy_async.models",
+        "TenantAuditMixin": "shared.sqlalchemy_async.models",
+        "TenantMixin": "shared.sqlalchemy_async.models",
+        "TimestampMixin": "shared.sqlalchemy_async.models",
+        "UUIDPrimaryKeyMixin": "shared.sqlalchemy_async.models",
+        "VersionMixin": "shared.sqlalchemy_async.models",
+        "AsyncCRUDRepository": "shared.sqlalchemy_async.repository",
+        "AsyncRepository": "shared.sqlalchemy_async.repository",
+        "compile_specification": "shared.sqlalchemy_async.specification",
+        "filter_clause": "shared.sqlalchemy_async.specification",
+        "SqlAlchemyUnitOfWork": "shared.sqlalchemy_async.unit_of_work",
+    },
+)
 
 __all__ = [
     # Database management
@@ -94,6 +141,8 @@ __all__ = [
     # Repository pattern
     "AsyncRepository",
     "AsyncCRUDRepository",
+    "compile_specification",
+    "filter_clause",
     # Unit of Work
     "SqlAlchemyUnitOfWork",
     # Instrumentation
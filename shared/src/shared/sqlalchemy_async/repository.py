@@ -4,31 +4,65 @@ This module provides generic async repository classes:
 - AsyncRepository: Base repository interface
 - AsyncCRUDRepository: Full CRUD implementation with filtering/pagination
 
+Set-based writes (``create_many``, ``upsert_many``, ``update_where``,
+``delete_where``) and ``stream`` handle imports, backfills and retention
+in a constant number of round trips instead of one per row.
+
+``paginate`` pages by OFFSET and runs a separate ``count()``; both grow
+with the page number and table size. ``paginate_keyset`` instead seeks
+past the last row's sort key with a row-value comparison, so every page
+costs the same, and its total is optional and approximate.
+
 Integrates with shared.dbs abstract patterns for consistency.
 """
 
 from __future__ import annotations
 
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
-
-from sqlalchemy import asc, desc, func, select
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, ClassVar, Generic, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Update,
+    and_,
+    asc,
+    delete,
+    desc,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import Select
 
 from shared.dbs.repository import (
     Filter,
-    FilterOperator,
     OrderBy,
     OrderDirection,
     PageRequest,
     PageResponse,
+    decode_cursor,
+    encode_cursor,
 )
+from shared.dbs.specification import Specification
+from shared.sqlalchemy_async.specification import compile_specification, filter_clause
 
 # Type variables for generic repository
 T = TypeVar("T", bound=DeclarativeBase)  # Entity type
 ID = TypeVar("ID")  # Primary key type
+S = TypeVar("S", Select, Update, Delete)  # Filterable statement type
 
 
 class AsyncRepository(ABC, Generic[T, ID]):
@@ -103,61 +137,45 @@ class AsyncCRUDRepository(AsyncRepository[T, ID]):
         ...
         ...     # Using pagination
         ...     page = await repo.paginate(PageRequest(page=1, size=10))
+        ...
+        ...     # Using set-based writes
+        ...     users = await repo.create_many([{"name": "Ann"}, {"name": "Ben"}])
+        ...     await repo.delete_where([Filter(field="name", value="Ben")])
+        ...
+        ...     # Using keyset pagination
+        ...     page = await repo.paginate_keyset(None, [OrderBy(field="name")], 10)
+        ...     page = await repo.paginate_keyset(page.next_cursor, [OrderBy(field="name")], 10)
     """
 
-    def _apply_filter(self, stmt: Select, filter_spec: Filter) -> Select:
+    #: Seconds a cached count backing an approximate total stays valid.
+    count_cache_ttl: ClassVar[float] = 60.0
+    #: Maximum cached counts per repository class.
+    count_cache_size: ClassVar[int] = 1024
+
+    # filters -> (expires_at, count), per repository class and in insertion
+    # order, so the oldest entries expire first. Created on first use.
+    _count_cache: ClassVar[OrderedDict[str, tuple[float, int]]]
+
+    def _apply_filter(self, stmt: S, filter_spec: Filter) -> S:
         """Apply a single filter to a query statement.
 
         Args:
-            stmt: SQLAlchemy select statement.
+            stmt: SQLAlchemy select, update or delete statement.
             filter_spec: Filter to apply.
 
         Returns:
             Modified statement with filter applied.
         """
-        column = getattr(self.model_class, filter_spec.field, None)
-        if column is None:
+        clause = filter_clause(self.model_class, filter_spec)
+        if clause is None:
             return stmt
+        return stmt.where(clause)
 
-        match filter_spec.operator:
-            case FilterOperator.EQ:
-                stmt = stmt.where(column == filter_spec.value)
-            case FilterOperator.NE:
-                stmt = stmt.where(column != filter_spec.value)
-            case FilterOperator.GT:
-                stmt = stmt.where(column > filter_spec.value)
-            case FilterOperator.GE | FilterOperator.GTE:
-                stmt = stmt.where(column >= filter_spec.value)
-            case FilterOperator.LT:
-                stmt = stmt.where(column < filter_spec.value)
-            case FilterOperator.LE | FilterOperator.LTE:
-                stmt = stmt.where(column <= filter_spec.value)
-            case FilterOperator.LIKE:
-                stmt = stmt.where(column.like(str(filter_spec.value)))
-            case FilterOperator.CONTAINS:
-                stmt = stmt.where(column.contains(str(filter_spec.value)))
-            case FilterOperator.STARTS_WITH:
-                stmt = stmt.where(column.startswith(str(filter_spec.value)))
-            case FilterOperator.ENDS_WITH:
-                stmt = stmt.where(column.endswith(str(filter_spec.value)))
-            case FilterOperator.IN:
-                if isinstance(filter_spec.value, (list, tuple, set)):
-                    stmt = stmt.where(column.in_(filter_spec.value))
-            case FilterOperator.NOT_IN:
-                if isinstance(filter_spec.value, (list, tuple, set)):
-                    stmt = stmt.where(column.not_in(filter_spec.value))
-            case FilterOperator.IS_NULL:
-                stmt = stmt.where(column.is_(None))
-            case FilterOperator.IS_NOT_NULL:
-                stmt = stmt.where(column.is_not(None))
-
-        return stmt
-
-    def _apply_filters(self, stmt: Select, filters: list[Filter] | None) -> Select:
+    def _apply_filters(self, stmt: S, filters: list[Filter] | None) -> S:
         """Apply multiple filters to a query statement.
 
         Args:
-            stmt: SQLAlchemy select statement.
+            stmt: SQLAlchemy select, update or delete statement.
             filters: List of filters to apply.
 
         Returns:
@@ -284,6 +302,201 @@ class AsyncCRUDRepository(AsyncRepository[T, ID]):
         await self._session.flush()
         return True
 
+    async def create_many(self, rows: Sequence[Mapping[str, Any]]) -> list[T]:
+        """Insert many entities in one executemany ``INSERT ... RETURNING``.
+
+        Args:
+            rows: Attribute mappings, one per entity.
+
+        Returns:
+            Created entities, in input order, with generated columns set.
+        """
+        if not rows:
+            return []
+        stmt = insert(self.model_class).returning(self.model_class, sort_by_parameter_order=True)
+        result = await self._session.scalars(stmt, [dict(row) for row in rows])
+        return list(result.all())
+
+    async def upsert_many(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        conflict_columns: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+    ) -> list[T]:
+        """Insert many entities, updating those that already exist.
+
+        Uses ``INSERT ... ON CONFLICT DO UPDATE`` on PostgreSQL and SQLite.
+
+        Args:
+            rows: Attribute mappings, one per entity; all must have the same keys.
+            conflict_columns: Unique columns identifying an existing row
+                (default: the primary key).
+            update_columns: Columns overwritten on conflict (default: every
+                supplied column not in ``conflict_columns``). When empty,
+                existing rows are left untouched and are loaded with one
+                extra ``SELECT``; every row must then supply the
+                ``conflict_columns``.
+
+        Returns:
+            One entity per input row, in input order: inserted, updated or,
+            with empty ``update_columns``, the existing row as stored.
+
+        Raises:
+            NotImplementedError: If the dialect has no ``ON CONFLICT``.
+            ValueError: If ``update_columns`` is empty and a row lacks a
+                conflict column.
+        """
+        if not rows:
+            return []
+
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            raise NotImplementedError(f"upsert_many is not supported on {dialect}")
+
+        if conflict_columns is None:
+            mapper = self.model_class.__mapper__
+            conflict_columns = [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+        if update_columns is None:
+            update_columns = [key for key in rows[0] if key not in conflict_columns]
+        if not update_columns and any(c not in row for row in rows for c in conflict_columns):
+            raise ValueError(f"Every row must supply {list(conflict_columns)} to skip conflicts")
+
+        stmt = dialect_insert(self.model_class)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={key: stmt.excluded[key] for key in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        stmt = stmt.returning(self.model_class, sort_by_parameter_order=True)
+
+        result = await self._session.scalars(
+            stmt,
+            [dict(row) for row in rows],
+            # Refresh entities already in the session with the upserted values
+            execution_options={"populate_existing": True},
+        )
+        entities = list(result.all())
+        if len(entities) == len(rows):
+            return entities
+        return await self._with_skipped_rows(entities, rows, conflict_columns)
+
+    async def _with_skipped_rows(
+        self,
+        inserted: list[T],
+        rows: Sequence[Mapping[str, Any]],
+        conflict_columns: Sequence[str],
+    ) -> list[T]:
+        """Line ``DO NOTHING`` results up with the input, loading skipped rows."""
+
+        def key_of(values: Mapping[str, Any]) -> tuple[Any, ...]:
+            return tuple(values[name] for name in conflict_columns)
+
+        by_key = {
+            key_of({name: getattr(e, name) for name in conflict_columns}): e for e in inserted
+        }
+        skipped = list({key_of(row) for row in rows} - by_key.keys())
+        if skipped:
+            columns = tuple_(*(getattr(self.model_class, name) for name in conflict_columns))
+            existing = await self._session.scalars(
+                select(self.model_class).where(columns.in_(skipped))
+            )
+            for entity in existing:
+                by_key[key_of({name: getattr(entity, name) for name in conflict_columns})] = entity
+        return [by_key[key_of(row)] for row in rows]
+
+    async def update_where(
+        self, filters: list[Filter], values: Mapping[str, Any], *, all_rows: bool = False
+    ) -> int:
+        """Update all matching rows in one ``UPDATE`` without loading them.
+
+        Args:
+            filters: Filters selecting the rows.
+            values: Attributes to set.
+            all_rows: Allow an empty ``filters`` list to update every row.
+
+        Returns:
+            Number of rows updated.
+
+        Raises:
+            ValueError: If a filter cannot be applied, or ``filters`` is
+                empty and ``all_rows`` is not set.
+        """
+        stmt = update(self.model_class).where(*self._bulk_conditions(filters, all_rows))
+        result = await self._session.execute(stmt.values(dict(values)))
+        return result.rowcount
+
+    async def delete_where(self, filters: list[Filter], *, all_rows: bool = False) -> int:
+        """Delete all matching rows in one ``DELETE`` without loading them.
+
+        Args:
+            filters: Filters selecting the rows.
+            all_rows: Allow an empty ``filters`` list to delete every row.
+
+        Returns:
+            Number of rows deleted.
+
+        Raises:
+            ValueError: If a filter cannot be applied, or ``filters`` is
+                empty and ``all_rows`` is not set.
+        """
+        stmt = delete(self.model_class).where(*self._bulk_conditions(filters, all_rows))
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    def _bulk_conditions(self, filters: list[Filter], all_rows: bool) -> list[ColumnElement[bool]]:
+        """Resolve the filters of a set-based write, refusing any it cannot apply.
+
+        Queries skip filters that do not resolve; for ``UPDATE`` and
+        ``DELETE`` that would widen the statement to unintended rows.
+        """
+        if not filters and not all_rows:
+            raise ValueError("Refusing a bulk write without filters; pass all_rows=True")
+        conditions = []
+        for filter_spec in filters:
+            clause = filter_clause(self.model_class, filter_spec)
+            if clause is None:
+                raise ValueError(
+                    f"Cannot apply {filter_spec.operator.value!r} filter on "
+                    f"{self.model_class.__name__}.{filter_spec.field} "
+                    f"with value {filter_spec.value!r}"
+                )
+            conditions.append(clause)
+        return conditions
+
+    async def stream(
+        self,
+        filters: list[Filter] | None = None,
+        order_by: list[OrderBy] | None = None,
+        *,
+        yield_per: int = 1000,
+    ) -> AsyncIterator[T]:
+        """Iterate over matching entities without buffering the full result.
+
+        Rows are fetched through a server-side cursor ``yield_per`` at a
+        time, so memory stays bounded on large tables.
+
+        Args:
+            filters: Optional filters to apply.
+            order_by: Optional ordering specifications.
+            yield_per: Rows fetched per batch.
+
+        Yields:
+            Matching entities.
+        """
+        stmt = select(self.model_class)
+        stmt = self._apply_filters(stmt, filters)
+        stmt = self._apply_ordering(stmt, order_by)
+        result = await self._session.stream_scalars(stmt.execution_options(yield_per=yield_per))
+        async for entity in result:
+            yield entity
+
     async def exists(self, id: ID) -> bool:
         """Check if entity exists.
 
@@ -386,6 +599,246 @@ class AsyncCRUDRepository(AsyncRepository[T, ID]):
             size=page_request.size,
         )
 
+    async def paginate_keyset(
+        self,
+        cursor: str | None,
+        order_by: list[OrderBy] | None,
+        size: int,
+        filters: list[Filter] | None = None,
+        *,
+        approximate_total: bool = False,
+    ) -> PageResponse[T]:
+        """Get a page by seeking past the previous page's last row.
+
+        The primary key is appended to ``order_by`` as a tie-breaker, so the
+        order is total and no row is skipped or repeated between pages.
+        Sort columns should be non-nullable.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, ``None`` for the first.
+            order_by: Ordering; must be the same for every page of a walk.
+            size: Items per page.
+            filters: Optional filters to apply.
+            approximate_total: Also report ``estimate_count(filters)`` as the
+                total, flagged with ``total_is_estimate``.
+
+        Returns:
+            Page with ``next_cursor`` set when more rows follow. ``page`` is
+            always 1, as keyset pages have no position.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or was issued for a
+                different ordering.
+
+        Example:
+            >>> order = [OrderBy(field="created_at", direction=OrderDirection.DESC)]
+            >>> page = await repo.paginate_keyset(None, order, 50)
+            >>> while page.next_cursor:
+            ...     page = await repo.paginate_keyset(page.next_cursor, order, 50)
+        """
+        keys = self._keyset_order(order_by)
+        fingerprint = ",".join(f"{name}:{direction.value}" for name, _, direction in keys)
+
+        stmt = select(self.model_class)
+        stmt = self._apply_filters(stmt, filters)
+        for _, column, direction in keys:
+            stmt = stmt.order_by(desc(column) if direction == OrderDirection.DESC else asc(column))
+
+        if cursor is not None:
+            payload = decode_cursor(cursor)
+            if (
+                not isinstance(payload, dict)
+                or payload.get("o") != fingerprint
+                or not isinstance(payload.get("k"), list)
+                or len(payload["k"]) != len(keys)
+            ):
+                raise ValueError("Invalid pagination cursor")
+            try:
+                values = [
+                    self._load_key(column, value)
+                    for (_, column, _), value in zip(keys, payload["k"], strict=True)
+                ]
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid pagination cursor") from e
+            stmt = stmt.where(self._keyset_after(keys, values))
+
+        # One extra row tells us whether another page exists
+        stmt = stmt.limit(size + 1)
+        result = await self._session.execute(stmt)
+        items = list(result.scalars().all())
+        has_more = len(items) > size
+        items = items[:size]
+
+        next_cursor = None
+        if has_more:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                {
+                    "o": fingerprint,
+                    "k": [self._dump_key(getattr(last, name)) for name, _, _ in keys],
+                }
+            )
+
+        total = await self.estimate_count(filters) if approximate_total else None
+        return PageResponse(
+            items=items,
+            total=total,
+            page=1,
+            size=size,
+            next_cursor=next_cursor,
+            total_is_estimate=approximate_total,
+        )
+
+    async def estimate_count(self, filters: list[Filter] | None = None) -> int:
+        """Cheaply estimate the number of matching rows.
+
+        Unfiltered counts on PostgreSQL read the planner statistics in
+        ``pg_class.reltuples`` (as fresh as the last ``ANALYZE``). Otherwise
+        an exact ``count()`` is run and cached for ``count_cache_ttl``
+        seconds, shared by instances of the repository class and bounded
+        by ``count_cache_size``.
+
+        Args:
+            filters: Optional filters to apply.
+
+        Returns:
+            Estimated number of matching entities.
+        """
+        table = self.model_class.__table__
+        if not filters and self._session.get_bind().dialect.name == "postgresql":
+            stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+            estimate = (await self._session.execute(stmt, {"table": table.fullname})).scalar()
+            # -1 means the table has never been analyzed
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        cache = self._class_count_cache()
+        key = repr(filters or [])
+        now = time.monotonic()
+        cached = cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        total = await self.count(filters)
+        cache.pop(key, None)
+        cache[key] = (now + self.count_cache_ttl, total)
+        # Drop expired entries and, past the size bound, the oldest ones
+        while cache and (
+            len(cache) > self.count_cache_size or next(iter(cache.values()))[0] <= now
+        ):
+            cache.popitem(last=False)
+        return total
+
+    @classmethod
+    def _class_count_cache(cls) -> OrderedDict[str, tuple[float, int]]:
+        cache = cls.__dict__.get("_count_cache")
+        if cache is None:
+            cache = cls._count_cache = OrderedDict()
+        return cache
+
+    def _keyset_order(
+        self, order_by: list[OrderBy] | None
+    ) -> list[tuple[str, Any, OrderDirection]]:
+        """Resolve ordering to ``(name, column, direction)`` ending in the primary key."""
+        keys: list[tuple[str, Any, OrderDirection]] = []
+        for order in order_by or []:
+            column = getattr(self.model_class, order.field, None)
+            if column is not None:
+                keys.append((order.field, column, order.direction))
+        named = {name for name, _, _ in keys}
+        mapper = self.model_class.__mapper__
+        for pk in mapper.primary_key:
+            name = mapper.get_property_by_column(pk).key
+            if name not in named:
+                keys.append((name, getattr(self.model_class, name), OrderDirection.ASC))
+        return keys
+
+    @staticmethod
+    def _keyset_after(
+        keys: list[tuple[str, Any, OrderDirection]], values: list[Any]
+    ) -> ColumnElement[bool]:
+        """Build the condition selecting rows strictly after ``values``."""
+        directions = {direction for _, _, direction in keys}
+        columns = [column for _, column, _ in keys]
+        if len(directions) == 1:
+            # Uniform direction: a single row-value comparison the index can seek on
+            row, after = tuple_(*columns), tuple_(*values)
+            return row < after if OrderDirection.DESC in directions else row > after
+
+        # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+        clauses = []
+        for i, (_, column, direction) in enumerate(keys):
+            step = column < values[i] if direction == OrderDirection.DESC else column > values[i]
+            equal = [keys[j][1] == values[j] for j in range(i)]
+            clauses.append(and_(*equal, step))
+        return or_(*clauses)
+
+    @staticmethod
+    def _dump_key(value: Any) -> Any:
+        """Convert a sort-key value to its JSON form for the cursor."""
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, (uuid.UUID, Decimal)):
+            return str(value)
+        return value
+
+    @staticmethod
+    def _load_key(column: Any, value: Any) -> Any:
+        """Convert a cursor value back to the column's Python type."""
+        if value is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type in (uuid.UUID, Decimal):
+            return python_type(value)
+        return value
+
+    async def find_by_specification(
+        self,
+        spec: Specification[T],
+        order_by: list[OrderBy] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[T]:
+        """Find entities matching a specification, evaluated in the database.
+
+        The whole tree, including OR and NOT, is compiled to one ``WHERE``
+        clause. Trees containing custom specifications that have no SQL
+        form are evaluated in Python over a ``stream`` of the table.
+
+        Args:
+            spec: The specification to match.
+            order_by: Optional ordering specifications.
+            limit: Maximum number of results.
+
+        Returns:
+            List of matching entities.
+
+        Raises:
+            ValueError: If an attribute specification names an unknown field.
+        """
+        try:
+            clause = compile_specification(spec, self.model_class)
+        except NotImplementedError:
+            results: list[T] = []
+            async for entity in self.stream(order_by=order_by):
+                if spec.is_satisfied_by(entity):
+                    results.append(entity)
+                    if limit is not None and len(results) >= limit:
+                        break
+            return results
+
+        stmt = self._apply_ordering(select(self.model_class).where(clause), order_by)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def find_by(self, **kwargs: Any) -> list[T]:
         """Find entities by attribute values.
 
@@ -0,0 +1,133 @@
+"""Compile specifications and filters to SQLAlchemy expressions.
+
+:meth:`Specification.to_filters` can only express conjunctions, so OR and
+NOT trees used to fall back to loading every row and evaluating
+``is_satisfied_by`` in Python. :func:`compile_specification` turns any
+``And``/``Or``/``Not``/``AttributeSpec`` tree into one boolean expression
+that the database evaluates instead.
+
+Negation follows the in-memory semantics: ``~Attr("age", 18, "gt")``
+matches rows where ``age`` is ``NULL``, as ``is_satisfied_by`` does,
+rather than dropping them the way SQL's three-valued ``NOT`` would.
+
+Example:
+    >>> spec = Attr("status", "active") & (Attr("plan", "pro") | ~Attr("trial", True))
+    >>> stmt = select(User).where(compile_specification(spec, User))
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, false, or_, true
+
+from shared.dbs.repository import Filter, FilterOperator
+from shared.dbs.specification import (
+    AlwaysFalse,
+    AlwaysTrue,
+    AndSpecification,
+    AttributeSpec,
+    NotSpecification,
+    OrSpecification,
+    Specification,
+)
+
+
+def filter_clause(model: type[Any], filter_spec: Filter) -> ColumnElement[bool] | None:
+    """Build the ``WHERE`` condition for a single filter.
+
+    Args:
+        model: Mapped model class.
+        filter_spec: Filter to translate.
+
+    Returns:
+        The condition, or ``None`` if the field does not exist on ``model``
+        or the value does not fit the operator.
+    """
+    column = getattr(model, filter_spec.field, None)
+    if column is None:
+        return None
+
+    value = filter_spec.value
+    match filter_spec.operator:
+        case FilterOperator.EQ:
+            return column == value
+        case FilterOperator.NE:
+            return column != value
+        case FilterOperator.GT:
+            return column > value
+        case FilterOperator.GE | FilterOperator.GTE:
+            return column >= value
+        case FilterOperator.LT:
+            return column < value
+        case FilterOperator.LE | FilterOperator.LTE:
+            return column <= value
+        case FilterOperator.LIKE:
+            return column.like(str(value))
+        case FilterOperator.CONTAINS:
+            return column.contains(str(value))
+        case FilterOperator.STARTS_WITH:
+            return column.startswith(str(value))
+        case FilterOperator.ENDS_WITH:
+            return column.endswith(str(value))
+        case FilterOperator.IN:
+            if isinstance(value, (list, tuple, set)):
+                return column.in_(value)
+        case FilterOperator.NOT_IN:
+            if isinstance(value, (list, tuple, set)):
+                return column.not_in(value)
+        case FilterOperator.IS_NULL:
+            return column.is_(None)
+        case FilterOperator.IS_NOT_NULL:
+            return column.is_not(None)
+    return None
+
+
+def compile_specification(spec: Specification[Any], model: type[Any]) -> ColumnElement[bool]:
+    """Compile a specification tree to a SQLAlchemy boolean expression.
+
+    Args:
+        spec: Specification built from ``AttributeSpec``, ``AlwaysTrue``,
+            ``AlwaysFalse`` and the ``&``/``|``/``~`` combinators.
+        model: Mapped model class the attribute names refer to.
+
+    Returns:
+        Expression usable in ``Select.where``.
+
+    Raises:
+        ValueError: If an ``AttributeSpec`` names an unknown column or
+            has a value its operator cannot use.
+        NotImplementedError: If the tree contains a custom specification,
+            whose rule only exists as Python code.
+    """
+    match spec:
+        case AndSpecification():
+            return and_(
+                compile_specification(spec.left, model),
+                compile_specification(spec.right, model),
+            )
+        case OrSpecification():
+            return or_(
+                compile_specification(spec.left, model),
+                compile_specification(spec.right, model),
+            )
+        case NotSpecification():
+            # NULL comparisons are false in Python, so their negation is true
+            return compile_specification(spec.inner, model).is_not(true())
+        case AttributeSpec():
+            [filter_spec] = spec.to_filters()
+            clause = filter_clause(model, filter_spec)
+            if clause is None:
+                raise ValueError(
+                    f"Cannot compile {spec!r} against {model.__name__}: "
+                    "unknown field or unsupported value"
+                )
+            return clause
+        case AlwaysTrue():
+            return true()
+        case AlwaysFalse():
+            return false()
+    raise NotImplementedError(f"{type(spec).__name__} cannot be compiled to SQL")
+
+
+__all__ = ["compile_specification", "filter_clause"]
@@ -25,17 +25,37 @@ Example:
 
 from __future__ import annotations
 
-from shared.tasks.base import (
-    PeriodicTask,
-    Task,
-    TaskContext,
-    TaskMiddleware,
-    TaskPriority,
-    TaskResult,
-    TaskState,
-    TaskStatus,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.tasks.base import (
+        PeriodicTask,
+        Task,
+        TaskContext,
+        TaskMiddleware,
+        TaskPriority,
+        TaskResult,
+        TaskState,
+        TaskStatus,
+    )
+    from shared.tasks.runner import TaskRunner
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "PeriodicTask": "shared.tasks.base",
+        "Task": "shared.tasks.base",
+        "TaskContext": "shared.tasks.base",
+        "TaskMiddleware": "shared.tasks.base",
+        "TaskPriority": "shared.tasks.base",
+        "TaskResult": "shared.tasks.base",
+        "TaskState": "shared.tasks.base",
+        "TaskStatus": "shared.tasks.base",
+        "TaskRunner": "shared.tasks.runner",
+    },
 )
-from shared.tasks.runner import TaskRunner
 
 __all__ = [
     # Core
@@ -14,42 +14,82 @@ Example:
 
 from __future__ import annotations
 
-from shared.utils.datetime import (
-    end_of_day,
-    format_iso8601,
-    format_relative_time,
-    get_date_range,
-    is_business_day,
-    now_utc,
-    parse_iso8601,
-    start_of_day,
-    utc_timestamp,
-)
-from shared.utils.serialization import (
-    CustomJSONEncoder,
-    deserialize_json,
-    safe_serialize,
-    serialize_json,
-)
-from shared.utils.strings import (
-    camel_to_snake,
-    generate_random_string,
-    mask_sensitive,
-    pluralize,
-    sanitize_filename,
-    slugify,
-    snake_to_camel,
-    truncate,
-)
-from shared.utils.validation import (
-    ValidationResult,
-    is_valid_email,
-    is_valid_url,
-    is_valid_uuid,
-    sanitize_html,
-    validate_length,
-    validate_range,
-    validate_required,
+from typing import TYPE_CHECKING
+
+from shared._lazy import attach
+
+if TYPE_CHECKING:
+    from shared.utils.datetime import (
+        end_of_day,
+        format_iso8601,
+        format_relative_time,
+        get_date_range,
+        is_business_day,
+        now_utc,
+        parse_iso8601,
+        start_of_day,
+        utc_timestamp,
+    )
+    from shared.utils.serialization import (
+        CustomJSONEncoder,
+        deserialize_json,
+        safe_serialize,
+        serialize_json,
+    )
+    from shared.utils.strings import (
+        camel_to_snake,
+        generate_random_string,
+        mask_sensitive,
+        pluralize,
+        sanitize_filename,
+        slugify,
+        snake_to_camel,
+        truncate,
+    )
+    from shared.utils.validation import (
+        ValidationResult,
+        is_valid_email,
+        is_valid_url,
+        is_valid_uuid,
+        sanitize_html,
+        validate_length,
+        validate_range,
+        validate_required,
+    )
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "end_of_day": "shared.utils.datetime",
+        "format_iso8601": "shared.utils.datetime",
+        "format_relative_time": "shared.utils.datetime",
+        "get_date_range": "shared.utils.datetime",
+        "is_business_day": "shared.utils.datetime",
+        "now_utc": "shared.utils.datetime",
+        "parse_iso8601": "shared.utils.datetime",
+        "start_of_day": "shared.utils.datetime",
+        "utc_timestamp": "shared.utils.datetime",
+        "CustomJSONEncoder": "shared.utils.serialization",
+        "deserialize_json": "shared.utils.serialization",
+        "safe_serialize": "shared.utils.serialization",
+        "serialize_json": "shared.utils.serialization",
+        "camel_to_snake": "shared.utils.strings",
+        "generate_random_string": "shared.utils.strings",
+        "mask_sensitive": "shared.utils.strings",
+        "pluralize": "shared.utils.strings",
+        "sanitize_filename": "shared.utils.strings",
+        "slugify": "shared.utils.strings",
+        "snake_to_camel": "shared.utils.strings",
+        "truncate": "shared.utils.strings",
+        "ValidationResult": "shared.utils.validation",
+        "is_valid_email": "shared.utils.validation",
+        "is_valid_url": "shared.utils.validation",
+        "is_valid_uuid": "shared.utils.validation",
+        "sanitize_html": "shared.utils.validation",
+        "validate_length": "shared.utils.validation",
+        "validate_range": "shared.utils.validation",
+        "validate_required": "shared.utils.validation",
+    },
 )
 
 __all__ = [
@@ -0,0 +1,213 @@
+"""Tests for shared.audit.buffered — BufferedAuditLogger."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from shared.audit import (
+    AuditAction,
+    AuditEvent,
+    AuditQuery,
+    BufferedAuditLogger,
+    InMemoryAuditLogger,
+    OverflowPolicy,
+)
+from shared.fastapi_utils.lifespan import LifespanManager
+
+
+def _event(n: int) -> AuditEvent:
+    return AuditEvent(
+        action=AuditAction.UPDATE, actor_id="u", resource_type="Doc", resource_id=str(n)
+    )
+
+
+class RecordingSink(InMemoryAuditLogger):
+    """In-memory sink that records batch sizes and can be held or failed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def log_many(self, events: list[AuditEvent]) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("sink down")
+        self.batches.append(len(events))
+        await super().log_many(events)
+
+
+@pytest.fixture
+def sink() -> RecordingSink:
+    return RecordingSink()
+
+
+@pytest.mark.unit
+class TestBufferedAuditLogger:
+    async def test_writes_through_when_not_started(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink)
+        await buffered.log(_event(1))
+        assert len(sink.events) == 1
+        assert sink.batches == []
+
+    async def test_flushes_on_batch_size(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink, batch_size=3, flush_interval=60)
+        await buffered.start()
+        for i in range(3):
+            await buffered.log(_event(i))
+        assert sink.events == []  # queued, not written inline
+
+        await asyncio.sleep(0.01)
+        assert sink.batches == [3]
+        await buffered.stop()
+
+    async def test_flushes_on_interval(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink, batch_size=100, flush_interval=0.02)
+        await buffered.start()
+        await buffered.log(_event(1))
+        await asyncio.sleep(0.06)
+        assert sink.batches == [1]
+        await buffered.stop()
+
+    async def test_stop_drains_queue(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink, batch_size=4, flush_interval=60)
+        await buffered.start()
+        await buffered.log_many([_event(i) for i in range(10)])
+        await buffered.stop()
+
+        assert len(sink.events) == 10
+        assert buffered.stats().queue_depth == 0
+        assert buffered.stats().flushed == 10
+
+    async def test_query_sees_queued_events(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink, flush_interval=60)
+        await buffered.start()
+        await buffered.log(_event(1))
+        assert len(await buffered.query(AuditQuery())) == 1
+        await buffered.stop()
+
+    async def test_drop_oldest(self, sink: RecordingSink):
+        sink.gate.clear()
+        buffered = BufferedAuditLogger(
+            sink, max_queue=3, batch_size=100, flush_interval=60, overflow="drop_oldest"
+        )
+        await buffered.start()
+        for i in range(5):
+            await buffered.log(_event(i))
+
+        stats = buffered.stats()
+        assert (stats.queue_depth, stats.dropped) == (3, 2)
+        sink.gate.set()
+        await buffered.stop()
+        assert [e.resource_id for e in sink.events] == ["2", "3", "4"]
+
+    async def test_block_waits_for_flush(self, sink: RecordingSink):
+        buffered = BufferedAuditLogger(sink, max_queue=2, batch_size=2, flush_interval=60)
+        sink.gate.clear()
+        await buffered.start()
+        await buffered.log(_event(0))
+        await buffered.log(_event(1))
+        await asyncio.sleep(0.01)  # flusher takes the batch and waits on the sink
+        await buffered.log(_event(2))
+        await buffered.log(_event(3))
+
+        blocked = asyncio.create_task(buffered.log(_event(4)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        sink.gate.set()
+        await asyncio.wait_for(blocked, 1)
+        await buffered.stop()
+        assert len(sink.events) == 5
+        assert buffered.stats().dropped == 0
+
+    async def test_spill_on_overflow(self, sink: RecordingSink, tmp_path):
+        spill = tmp_path / "audit.jsonl"
+        sink.gate.clear()
+        buffered = BufferedAuditLogger(
+            sink, max_queue=1, flush_interval=60, overflow=OverflowPolicy.SPILL, spill_path=spill
+        )
+        await buffered.start()
+        await buffered.log(_event(1))
+        await buffered.log(_event(2))
+
+        lines = spill.read_text().splitlines()
+        assert [json.loads(line)["resource_id"] for line in lines] == ["2"]
+        assert buffered.stats().spilled == 1
+        sink.gate.set()
+        await buffered.stop()
+
+    async def test_failed_flush_is_spilled(self, sink: RecordingSink, tmp_path):
+        spill = tmp_path / "audit.jsonl"
+        sink.fail = True
+        buffered = BufferedAuditLogger(sink, flush_interval=60, spill_path=spill)
+        await buffered.start()
+        await buffered.log_many([_event(1), _event(2)])
+        await buffered.stop()
+
+        stats = buffered.stats()
+        assert (stats.failed_flushes, stats.spilled, stats.flushed) == (1, 2, 0)
+        assert len(spill.read_text().splitlines()) == 2
+
+    async def test_spill_errors_are_counted_as_dropped(self, sink: RecordingSink, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        sink.gate.clear()
+        buffered = BufferedAuditLogger(
+            sink,
+            max_queue=1,
+            flush_interval=60,
+            overflow=OverflowPolicy.SPILL,
+            spill_path=blocker / "audit.jsonl",
+        )
+        await buffered.start()
+        await buffered.log(_event(1))
+        await buffered.log(_event(2))  # spill fails; must not raise into the caller
+
+        stats = buffered.stats()
+        assert (stats.spilled, stats.dropped) == (0, 1)
+        sink.gate.set()
+        await buffered.stop()
+
+    async def test_flusher_survives_flush_errors(self, sink: RecordingSink, monkeypatch):
+        buffered = BufferedAuditLogger(sink, flush_interval=0.01)
+        calls = 0
+        flush = buffered.flush
+
+        async def _flaky_flush() -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            await flush()
+
+        monkeypatch.setattr(buffered, "flush", _flaky_flush)
+        await buffered.start()
+        await asyncio.sleep(0.05)
+
+        assert buffered.running
+        await buffered.log(_event(1))
+        await buffered.stop()
+        assert len(sink.events) == 1
+
+    async def test_spill_requires_path(self, sink: RecordingSink):
+        with pytest.raises(ValueError):
+            BufferedAuditLogger(sink, overflow=OverflowPolicy.SPILL)
+
+    async def test_attach_to_lifespan(self, sink: RecordingSink):
+        lifespan = LifespanManager()
+        buffered = BufferedAuditLogger(sink, flush_interval=60)
+        buffered.attach(lifespan)
+
+        await lifespan.startup()
+        assert buffered.running
+        await buffered.log(_event(1))
+        await lifespan.shutdown()
+
+        assert not buffered.running
+        assert len(sink.events) == 1
@@ -0,0 +1,71 @@
+"""Tests for shared.auth.hashing_pool module."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from shared.auth.hashing_pool import HashingPool, HashingPoolSaturatedError
+
+
+@pytest.fixture
+def pool() -> Iterator[HashingPool]:
+    """Create a single-worker pool with one queue slot."""
+    pool = HashingPool(max_workers=1, max_queue=1, name="test")
+    yield pool
+    pool.shutdown()
+
+
+class TestHashingPool:
+    """Tests for HashingPool class."""
+
+    async def test_runs_on_worker_thread(self, pool: HashingPool) -> None:
+        """Should run the callable off the event loop thread."""
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("hashing-test")
+
+    async def test_propagates_exceptions(self, pool: HashingPool) -> None:
+        """Should re-raise errors from the callable and free the slot."""
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await pool.run(fail)
+
+        stats = pool.stats()
+        assert stats.in_flight == 0
+        assert stats.queue_depth == 0
+
+    async def test_rejects_when_queue_full(self, pool: HashingPool) -> None:
+        """Should shed calls beyond workers + queue and report stats."""
+        release = threading.Event()
+        running = asyncio.create_task(pool.run(release.wait))
+        queued = asyncio.create_task(pool.run(lambda: "queued"))
+        await asyncio.sleep(0.01)
+
+        assert pool.saturated
+        with pytest.raises(HashingPoolSaturatedError):
+            await pool.run(lambda: "rejected")
+
+        stats = pool.stats()
+        assert stats.in_flight == 1
+        assert stats.queue_depth == 1
+        assert stats.rejected == 1
+
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        assert not pool.saturated
+        assert pool.stats().completed == 2
+
+    def test_invalid_sizes(self) -> None:
+        """Should validate pool sizes."""
+        with pytest.raises(ValueError):
+            HashingPool(max_workers=0)
+        with pytest.raises(ValueError):
+            HashingPool(max_workers=1, max_queue=-1)
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import pytest
 
+from shared.auth.hashing_pool import HashingPool
 from shared.auth.password import (
     PasswordService,
     PasswordStrengthError,
@@ -95,6 +96,19 @@ class TestPasswordService:
         hashed = service.hash("mypassword123")
         assert service.verify("mypassword123", hashed) is True
 
+    async def test_async_hash_and_verify(self) -> None:
+        """Async variants should run on the configured pool."""
+        pool = HashingPool(max_workers=1, max_queue=1, name="test-password")
+        service = PasswordService(pool=pool)
+        try:
+            hashed = await service.hash_async("mypassword123")
+
+            assert await service.verify_async("mypassword123", hashed) is True
+            assert await service.verify_async("wrongpassword", hashed) is False
+            assert pool.stats().completed == 3
+        finally:
+            pool.shutdown()
+
 
 class TestCheckPasswordStrength:
     """Tests for check_password_strength function."""
@@ -17,6 +17,7 @@ from shared.cqrs import (
     LoggingBehavior,
     Mediator,
     PipelineBehavior,
+    PublishMode,
     Query,
     QueryBus,
     QueryHandler,
@@ -638,3 +639,136 @@ class TestMediatorEventPublishing:
         m.clear()
         # After clear, no error and no handlers invoked
         await m.publish(SomeEvent())
+
+
+# ======================================================================
+# TestCompiledPipelines
+# ======================================================================
+
+
+class TestCompiledPipelines:
+    async def test_pipeline_compiled_once_per_type(self) -> None:
+        """applies_to runs once per request type, not per dispatch."""
+        checks: list[str] = []
+
+        class CountingBehavior(PipelineBehavior):
+            def applies_to(self, request: Any) -> bool:
+                checks.append(type(request).__name__)
+                return True
+
+            async def handle(self, request: Any, next_: Any) -> Any:
+                return await next_(request)
+
+        m = Mediator(behaviors=[CountingBehavior()])
+        m.register_command_handler(CreateItem, CreateItemHandler())
+        m.register_query_handler(ListItems, ListItemsHandler())
+
+        for _ in range(3):
+            await m.send(CreateItem(name="x"))
+            await m.send(ListItems())
+
+        assert checks == ["CreateItem", "ListItems"]
+
+    async def test_add_behavior_recompiles(self) -> None:
+        calls: list[str] = []
+
+        class Recording(PipelineBehavior):
+            async def handle(self, request: Any, next_: Any) -> Any:
+                calls.append("late")
+                return await next_(request)
+
+        m = Mediator()
+        m.register_command_handler(CreateItem, CreateItemHandler())
+        await m.send(CreateItem(name="x"))
+
+        m.add_behavior(Recording())
+        await m.send(CreateItem(name="y"))
+
+        assert calls == ["late"]
+
+    async def test_applies_per_request(self) -> None:
+        """Behaviors can opt into per-dispatch applies_to checks."""
+        calls: list[str] = []
+
+        class OnlyNamed(PipelineBehavior):
+            applies_per_request = True
+
+            def applies_to(self, request: Any) -> bool:
+                return request.name == "audit"
+
+            async def handle(self, request: Any, next_: Any) -> Any:
+                calls.append(request.name)
+                return await next_(request)
+
+        m = Mediator(behaviors=[OnlyNamed()])
+        m.register_command_handler(CreateItem, CreateItemHandler())
+        await m.send(CreateItem(name="plain"))
+        await m.send(CreateItem(name="audit"))
+
+        assert calls == ["audit"]
+
+
+# ======================================================================
+# TestPublishModes
+# ======================================================================
+
+
+@dataclass
+class Ping(DomainEvent):
+    pass
+
+
+class SlowHandler(DomainEventHandler[Ping]):
+    def __init__(self, tracker: dict[str, int], fail: bool = False) -> None:
+        self.tracker = tracker
+        self.fail = fail
+        self.done = False
+
+    async def handle(self, event: Ping) -> None:
+        self.tracker["running"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["running"])
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError("handler failed")
+            self.done = True
+        finally:
+            self.tracker["running"] -= 1
+
+
+class TestPublishModes:
+    def _mediator(self, count: int, failing: int | None = None, **kwargs: Any):
+        tracker = {"running": 0, "peak": 0}
+        m = Mediator(**kwargs)
+        handlers = [SlowHandler(tracker, fail=i == failing) for i in range(count)]
+        for handler in handlers:
+            m.register_event_handler(Ping, handler)
+        return m, handlers, tracker
+
+    async def test_sequential_default(self) -> None:
+        m, handlers, tracker = self._mediator(3)
+        assert await m.publish(Ping()) == []
+        assert tracker["peak"] == 1
+        assert all(h.done for h in handlers)
+
+    async def test_concurrent_bounded(self) -> None:
+        m, handlers, tracker = self._mediator(6)
+        await m.publish(Ping(), mode=PublishMode.CONCURRENT, max_concurrency=2)
+        assert tracker["peak"] == 2
+        assert all(h.done for h in handlers)
+
+    async def test_concurrent_failure_raises_group(self) -> None:
+        m, _, _ = self._mediator(3, failing=1, publish_mode=PublishMode.CONCURRENT)
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await m.publish(Ping())
+        assert exc_info.group_contains(RuntimeError)
+
+    async def test_isolated_collects_errors(self, caplog: pytest.LogCaptureFixture) -> None:
+        m, handlers, tracker = self._mediator(4, failing=2)
+        with caplog.at_level(logging.ERROR):
+            errors = await m.publish(Ping(), mode=PublishMode.ISOLATED)
+
+        assert [str(e) for e in errors] == ["handler failed"]
+        assert [h.done for h in handlers] == [True, True, False, True]
+        assert tracker["peak"] == 4
+        assert "SlowHandler failed for Ping" in caplog.text
@@ -0,0 +1,179 @@
+"""Tests for shared.dbs.indexes and the indexed InMemoryRepository."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from shared.dbs.indexes import HashIndex, SortedIndex
+from shared.dbs.repository import (
+    Filter,
+    FilterOperator,
+    InMemoryRepository,
+    OrderBy,
+    OrderDirection,
+    PageRequest,
+)
+
+
+@dataclass
+class Item:
+    """Sample entity for index tests."""
+
+    id: str
+    status: str
+    score: int | None
+    name: str = ""
+
+
+class TestHashIndex:
+    """Tests for HashIndex."""
+
+    def test_eq_and_in(self) -> None:
+        """Should resolve EQ and IN filters to ids."""
+        index = HashIndex("status")
+        index.add("1", "active")
+        index.add("2", "active")
+        index.add("3", "closed")
+        index.remove("2", "active")
+
+        assert index.lookup(Filter(field="status", value="active")) == {"1"}
+        assert index.lookup(
+            Filter(field="status", operator=FilterOperator.IN, value=["active", "closed"])
+        ) == {"1", "3"}
+        assert index.lookup(Filter(field="status", operator=FilterOperator.GT, value="a")) is None
+
+
+class TestSortedIndex:
+    """Tests for SortedIndex."""
+
+    @pytest.fixture
+    def index(self) -> SortedIndex:
+        index = SortedIndex("score")
+        for entity_id, score in [("a", 10), ("b", 20), ("c", 20), ("d", 30), ("e", None)]:
+            index.add(entity_id, score)
+        return index
+
+    def test_ranges(self, index: SortedIndex) -> None:
+        """Should answer range filters with bounds handled correctly."""
+
+        def lookup(op: FilterOperator, value: int) -> set[str] | None:
+            return index.lookup(Filter(field="score", operator=op, value=value))
+
+        assert lookup(FilterOperator.EQ, 20) == {"b", "c"}
+        assert lookup(FilterOperator.GT, 20) == {"d"}
+        assert lookup(FilterOperator.GTE, 20) == {"b", "c", "d"}
+        assert lookup(FilterOperator.LT, 20) == {"a"}
+        assert lookup(FilterOperator.LE, 20) == {"a", "b", "c"}
+
+    def test_ordering_and_nulls(self, index: SortedIndex) -> None:
+        """Should iterate in order and report NULL values."""
+        assert index.has_nulls
+        index.remove("e", None)
+        index.remove("b", 20)
+
+        assert not index.has_nulls
+        assert list(index.ordered_ids(descending=True)) == ["d", "c", "a"]
+
+
+class TestIndexedInMemoryRepository:
+    """Indexed queries must return exactly what a full scan returns."""
+
+    @pytest.fixture
+    async def repos(self) -> tuple[InMemoryRepository[Item], InMemoryRepository[Item]]:
+        rng = random.Random(7)
+        plain = InMemoryRepository[Item]()
+        indexed = InMemoryRepository[Item](hash_indexes=["status"], sorted_indexes=["score"])
+        for i in range(500):
+            item = Item(
+                id=f"{i:04d}",
+                status=rng.choice(["active", "pending", "closed"]),
+                score=rng.randrange(100),
+                name=f"item-{i}",
+            )
+            await plain.add(item)
+            await indexed.add(item)
+        return plain, indexed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [Filter(field="status", value="active")],
+            [Filter(field="status", operator=FilterOperator.IN, value=["active", "closed"])],
+            [Filter(field="score", operator=FilterOperator.GTE, value=50)],
+            [
+                Filter(field="status", value="pending"),
+                Filter(field="score", operator=FilterOperator.LT, value=20),
+                Filter(field="name", operator=FilterOperator.LIKE, value="-1"),
+            ],
+        ],
+    )
+    async def test_matches_full_scan(self, repos, filters: list[Filter]) -> None:
+        """Should find and count the same entities as an unindexed repository."""
+        plain, indexed = repos
+        order_by = [OrderBy(field="id")]
+
+        assert await indexed.find(filters, order_by) == await plain.find(filters, order_by)
+        assert await indexed.count(filters) == await plain.count(filters)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operator", list(FilterOperator))
+    async def test_every_operator_matches_full_scan(self, repos, operator: FilterOperator) -> None:
+        """Should agree with a full scan for every operator on a sorted field."""
+        plain, indexed = repos
+        values: dict[FilterOperator, object] = {
+            FilterOperator.IN: [10, 50, 90],
+            FilterOperator.NOT_IN: [10, 50, 90],
+            FilterOperator.IS_NULL: None,
+            FilterOperator.IS_NOT_NULL: None,
+        }
+        string_operators = {
+            FilterOperator.LIKE,
+            FilterOperator.CONTAINS,
+            FilterOperator.STARTS_WITH,
+            FilterOperator.ENDS_WITH,
+        }
+        value = "5" if operator in string_operators else values.get(operator, 50)
+        filters = [Filter(field="score", operator=operator, value=value)]
+        order_by = [OrderBy(field="id")]
+
+        assert await indexed.find(filters, order_by) == await plain.find(filters, order_by)
+        assert await indexed.count(filters) == await plain.count(filters)
+
+    @pytest.mark.asyncio
+    async def test_paginates_in_index_order(self, repos) -> None:
+        """Should page through the sorted index without a full sort."""
+        _, indexed = repos
+        order_by = [OrderBy(field="score", direction=OrderDirection.DESC)]
+        filters = [Filter(field="status", value="active")]
+        expected = [e.score for e in await indexed.find(filters, order_by)]
+
+        page = await indexed.find_paginated(PageRequest(page=2, size=10), filters, order_by)
+
+        assert page.total == len(expected)
+        assert [e.score for e in page.items] == expected[10:20]
+        assert expected == sorted(expected, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_maintain_indexes(self) -> None:
+        """Should re-index updated entities and drop deleted ones."""
+        repo = InMemoryRepository[Item](hash_indexes=["status"], sorted_indexes=["score"])
+        item = Item(id="1", status="active", score=5)
+        await repo.add(item)
+
+        item.status, item.score = "closed", 50
+        await repo.update(item)
+        await repo.add(Item(id="2", status="active", score=None))
+
+        assert await repo.count([Filter(field="status", value="active")]) == 1
+        assert await repo.count([Filter(field="status", value="closed")]) == 1
+        assert await repo.find([Filter(field="score", operator=FilterOperator.LT, value=10)]) == []
+
+        await repo.delete("1")
+        assert await repo.count([Filter(field="status", value="closed")]) == 0
+
+        await repo.clear()
+        assert await repo.count([Filter(field="status", value="active")]) == 0
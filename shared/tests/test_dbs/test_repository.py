@@ -119,6 +119,12 @@ class TestPageRequest:
         page = PageRequest(page=3, size=10)
         assert page.offset == 20  # (3-1) * 10
 
+    def test_keyset_request(self) -> None:
+        """Should switch to keyset paging when a cursor is given."""
+        assert PageRequest().is_keyset is False
+        assert PageRequest(keyset=True).is_keyset is True
+        assert PageRequest(cursor="abc").is_keyset is True
+
 
 class TestPageResponse:
     """Tests for PageResponse dataclass."""
@@ -156,6 +162,15 @@ class TestPageResponse:
         response2 = PageResponse(items=[], total=100, page=2, size=10)
         assert response2.has_previous is True
 
+    def test_keyset_page_follows_cursor(self) -> None:
+        """Should derive has_next from the cursor when the total is unknown."""
+        response = PageResponse(items=[], total=None, page=1, size=10, next_cursor="abc")
+        assert response.has_next is True
+        assert response.total_pages == 0
+
+        last = PageResponse(items=[], total=500, page=1, size=10, total_is_estimate=True)
+        assert last.has_next is False
+
 
 class TestAbstractRepository:
     """Tests for AbstractRepository interface."""
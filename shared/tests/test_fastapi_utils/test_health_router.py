@@ -0,0 +1,66 @@
+"""Tests for shared.fastapi_utils.health_router module."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shared.fastapi_utils.health_router import create_health_router
+from shared.observability import health
+from shared.observability.health import (
+    HealthCheck,
+    HealthCheckResult,
+    HealthStatus,
+    get_health_monitor,
+    register_health_check,
+)
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    """Register a single counting check in an empty registry."""
+    checks: dict[str, HealthCheck] = {}
+    monkeypatch.setattr(health, "_health_checks", checks)
+    calls: list[str] = []
+
+    async def check_db() -> HealthCheckResult:
+        calls.append("db")
+        return HealthCheckResult(name="db", status=HealthStatus.HEALTHY)
+
+    register_health_check(name="db", check_fn=check_db, critical=True)
+    yield calls
+
+
+class TestCreateHealthRouter:
+    """Tests for create_health_router."""
+
+    def test_runs_checks_per_probe_by_default(self, calls: list[str]) -> None:
+        """Should run the checks on every readiness probe."""
+        app = FastAPI()
+        app.include_router(create_health_router(service_name="svc"))
+
+        with TestClient(app) as client:
+            assert client.get("/health/ready").status_code == 200
+            assert client.get("/health/ready").status_code == 200
+
+        assert calls == ["db", "db"]
+
+    def test_cached_probes_use_monitor(self, calls: list[str]) -> None:
+        """Should answer probes from the monitor while the app runs."""
+        app = FastAPI()
+        app.include_router(create_health_router(service_name="svc", cache_ttl_seconds=60))
+
+        with TestClient(app) as client:
+            monitor = get_health_monitor()
+            assert monitor is not None
+            assert monitor.running
+            for _ in range(5):
+                response = client.get("/health/ready")
+                assert response.json()["status"] == "healthy"
+            assert client.get("/health").json()["checks"][0]["name"] == "db"
+
+        assert calls == ["db"]
+        assert get_health_monitor() is None
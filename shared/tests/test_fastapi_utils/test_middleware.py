@@ -12,10 +12,12 @@ from fastapi.testclient import TestClient
 
 from shared.fastapi_utils.middleware import (
     RequestContext,
+    RequestContextHook,
     RequestContextMiddleware,
     get_correlation_id,
     get_request_context,
 )
+from shared.observability.middleware import RequestLoggingMiddleware
 from shared.observability.structlog_config import (
     _correlation_id_ctx,
 )
@@ -201,3 +203,41 @@ class TestCorrelationIdConsolidation:
         data = response.json()
         assert data["fastapi_utils_id"] == "provided-corr-id"
         assert data["observability_id"] == "provided-corr-id"
+
+
+class TestRequestContextHook:
+    """Tests for RequestContextHook on RequestLoggingMiddleware."""
+
+    @pytest.fixture
+    def app_with_hook(self) -> FastAPI:
+        """Create FastAPI app with request logging and the context hook."""
+        app = FastAPI()
+        app.add_middleware(RequestLoggingMiddleware, hooks=[RequestContextHook()])
+
+        @app.get("/test")
+        async def test_endpoint(request: Request):
+            ctx = get_request_context()
+            return {
+                "request_id": ctx.request_id if ctx else None,
+                "correlation_id": ctx.correlation_id if ctx else None,
+            }
+
+        return app
+
+    def test_hook_sets_request_context(self, app_with_hook: FastAPI) -> None:
+        """Should expose request and correlation IDs to the handler."""
+        client = TestClient(app_with_hook)
+        response = client.get("/test", headers={"X-Correlation-ID": "hook-corr-id"})
+
+        data = response.json()
+        assert data["correlation_id"] == "hook-corr-id"
+        assert data["request_id"] is not None
+
+    def test_hook_adds_response_headers(self, app_with_hook: FastAPI) -> None:
+        """Should return both IDs in the response headers."""
+        client = TestClient(app_with_hook)
+        response = client.get("/test")
+
+        data = response.json()
+        assert response.headers["X-Request-ID"] == data["request_id"]
+        assert response.headers["X-Correlation-ID"] == data["correlation_id"]
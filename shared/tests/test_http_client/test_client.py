@@ -5,6 +5,7 @@ This module tests the HTTP service client implementation.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -17,6 +18,16 @@ from shared.http_client.client import (
     ServiceResponse,
     ServiceUnavailableError,
 )
+from shared.http_client.pool import HTTPClientRegistry, set_http_client_registry
+
+
+@pytest.fixture(autouse=True)
+def registry() -> Iterator[HTTPClientRegistry]:
+    """Give each test its own client registry."""
+    registry = HTTPClientRegistry()
+    set_http_client_registry(registry)
+    yield registry
+    set_http_client_registry(None)
 
 
 class TestServiceClientConfig:
@@ -267,12 +278,47 @@ class TestServiceClient:
             assert client is not None
 
     @pytest.mark.asyncio
-    async def test_close(self, client: ServiceClient) -> None:
-        """Should close client properly."""
+    async def test_close(self, config: ServiceClientConfig) -> None:
+        """Should close a client it owns."""
+        config.use_shared_pool = False
+        client = ServiceClient(config)
+
         with patch.object(client._client, "aclose", new_callable=AsyncMock) as mock_close:
             await client.close()
             mock_close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self, client: ServiceClient) -> None:
+        """Should leave the registry's client open for other users."""
+        await client.close()
+
+        assert client._client.is_closed is False
+
+    def test_clients_share_pool(
+        self, config: ServiceClientConfig, registry: HTTPClientRegistry
+    ) -> None:
+        """Should reuse one pooled client per base URL."""
+        first = ServiceClient(config)
+        second = ServiceClient(config)
+
+        assert first._client is second._client
+        assert first._client is registry.get(config.base_url)
+
+    @pytest.mark.asyncio
+    async def test_default_headers_sent_with_shared_pool(self, config: ServiceClientConfig) -> None:
+        """Should send the configured headers on every request."""
+        config.headers = {"X-Api-Key": "secret"}
+        client = ServiceClient(config)
+
+        with patch.object(client._client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = httpx.Response(200, json={})
+
+            await client.get("/api/resource", headers={"X-Extra": "1"})
+
+            call_kwargs = mock_request.call_args.kwargs
+            assert call_kwargs["headers"] == {"X-Api-Key": "secret", "X-Extra": "1"}
+            assert call_kwargs["timeout"] == 5.0
+
 
 class TestServiceClientRetry:
     """Tests for ServiceClient retry functionality."""
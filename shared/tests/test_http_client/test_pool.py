@@ -0,0 +1,188 @@
+"""Tests for shared.http_client.pool module."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from collections.abc import AsyncIterator
+
+import httpcore
+import httpx
+import pytest
+
+from shared.http_client.pool import (
+    HTTPClientRegistry,
+    HTTPPoolConfig,
+    close_http_clients,
+    get_http_client_registry,
+    set_http_client_registry,
+)
+
+
+class _KeepAliveServer:
+    """Minimal HTTP/1.1 server that counts accepted connections."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[_KeepAliveServer]:
+    """Run a local keep-alive HTTP server."""
+    server = _KeepAliveServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def registry() -> AsyncIterator[HTTPClientRegistry]:
+    """Create a registry and close its clients afterwards."""
+    registry = HTTPClientRegistry()
+    yield registry
+    await registry.aclose()
+
+
+class TestHTTPClientRegistry:
+    """Tests for HTTPClientRegistry."""
+
+    async def test_returns_same_client_per_base_url(self, registry: HTTPClientRegistry) -> None:
+        """Should share one client per base URL and configuration."""
+        client = registry.get("https://a.example.com")
+
+        assert registry.get("https://a.example.com") is client
+        assert registry.get("https://b.example.com") is not client
+        assert registry.get("https://a.example.com", HTTPPoolConfig(http2=True)) is not client
+
+    async def test_recreates_closed_client(self, registry: HTTPClientRegistry) -> None:
+        """Should replace a client that a caller closed."""
+        client = registry.get("https://a.example.com")
+        await client.aclose()
+
+        assert registry.get("https://a.example.com") is not client
+
+    async def test_reuses_connections(
+        self, registry: HTTPClientRegistry, server: _KeepAliveServer
+    ) -> None:
+        """Should keep one connection alive across requests."""
+        client = registry.get(f"http://127.0.0.1:{server.port}")
+
+        for _ in range(5):
+            response = await client.get("/")
+            assert response.text == "ok"
+
+        (stats,) = registry.stats()
+        assert server.connections == 1
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert (stats.connections, stats.idle_connections) == (1, 1)
+
+    async def test_caches_dns_lookups(
+        self, registry: HTTPClientRegistry, server: _KeepAliveServer
+    ) -> None:
+        """Should resolve a host once per TTL, even for new connections."""
+        config = HTTPPoolConfig(max_keepalive_connections=0)
+        client = registry.get(f"http://localhost:{server.port}", config)
+
+        for _ in range(3):
+            await client.get("/")
+
+        (stats,) = registry.stats()
+        assert stats.connections_opened == 3
+        assert (stats.dns_cache_misses, stats.dns_cache_hits) == (1, 2)
+
+    async def test_dns_cache_can_be_disabled(
+        self, registry: HTTPClientRegistry, server: _KeepAliveServer
+    ) -> None:
+        """Should leave lookups to the system resolver when disabled."""
+        client = registry.get(f"http://localhost:{server.port}", HTTPPoolConfig(dns_cache_ttl=None))
+
+        await client.get("/")
+
+        (stats,) = registry.stats()
+        assert (stats.dns_cache_misses, stats.dns_cache_hits) == (0, 0)
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+    async def test_http2_without_h2_falls_back(
+        self, registry: HTTPClientRegistry, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Should use HTTP/1.1 and warn when h2 is missing."""
+        with caplog.at_level(logging.WARNING, logger="shared.http_client.pool"):
+            client = registry.get("https://a.example.com", HTTPPoolConfig(http2=True))
+
+        assert client.is_closed is False
+        assert "h2 is not installed" in caplog.text
+
+    async def test_uses_environment_proxies(
+        self, registry: HTTPClientRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should route through HTTPS_PROXY except for NO_PROXY hosts."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+        client = registry.get()
+        proxied = client._transport_for_url(httpx.URL("https://api.example.com/"))
+        direct = client._transport_for_url(httpx.URL("https://internal.example.com/"))
+
+        assert isinstance(proxied._pool, httpcore.AsyncHTTPProxy)
+        assert not isinstance(direct._pool, httpcore.AsyncHTTPProxy)
+
+    async def test_trust_env_disabled_ignores_proxies(
+        self, registry: HTTPClientRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should connect directly when trust_env is off."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+
+        client = registry.get(config=HTTPPoolConfig(trust_env=False))
+        transport = client._transport_for_url(httpx.URL("https://api.example.com/"))
+
+        assert not isinstance(transport._pool, httpcore.AsyncHTTPProxy)
+
+    async def test_aclose_closes_clients(self, registry: HTTPClientRegistry) -> None:
+        """Should close every client and forget it."""
+        client = registry.get("https://a.example.com")
+
+        await registry.aclose()
+
+        assert client.is_closed is True
+        assert registry.stats() == []
+
+
+class TestProcessRegistry:
+    """Tests for the process-wide registry helpers."""
+
+    async def test_close_http_clients(self) -> None:
+        """Should close clients of the process-wide registry."""
+        set_http_client_registry(None)
+        try:
+            client = get_http_client_registry().get("https://a.example.com")
+
+            await close_http_clients()
+
+            assert client.is_closed is True
+        finally:
+            set_http_client_registry(None)
@@ -287,3 +287,32 @@ class TestModelCreation:
             )
             assert len(claims) == 1
             assert claims[0].claim_type == "department"
+
+
+class TestSearchIndexes:
+    """Test the PostgreSQL-only trigram search indexes."""
+
+    def test_trigram_indexes_compile_for_postgresql(self) -> None:
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+
+        index = next(i for i in UserModel.__table__.indexes if i.name == "ix_users_email_trgm")
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "USING gin (email gin_trgm_ops)" in ddl
+
+    @pytest.mark.asyncio
+    async def test_trigram_indexes_skipped_on_sqlite(self) -> None:
+        from sqlalchemy import inspect
+
+        db_manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+        await db_manager.create_all(IdentityBase)
+
+        async with db_manager.engine.connect() as conn:
+            names = await conn.run_sync(
+                lambda sync_conn: {i["name"] for i in inspect(sync_conn).get_indexes("users")}
+            )
+        await db_manager.dispose()
+
+        assert "ix_users_email" in names
+        assert "ix_users_email_trgm" not in names
@@ -0,0 +1,69 @@
+"""Tests for the in-memory identity session store."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from shared.identity.sessions import InMemorySessionStore, SessionInfo, SessionStatus
+
+
+def _session(session_id: str, user_id: str = "user-1") -> SessionInfo:
+    now = datetime.now(UTC)
+    return SessionInfo(
+        session_id=session_id,
+        user_id=user_id,
+        created_at=now,
+        last_activity_at=now,
+        expires_at=now + timedelta(hours=1),
+        status=SessionStatus.ACTIVE,
+    )
+
+
+@pytest.fixture
+def store() -> InMemorySessionStore:
+    return InMemorySessionStore()
+
+
+class TestInMemorySessionStore:
+    async def test_lookup_by_id_token_and_user(self, store: InMemorySessionStore) -> None:
+        purge_at = datetime.now(UTC) + timedelta(days=1)
+        await store.add(_session("s1"), "hash-1", purge_at)
+        await store.add(_session("s2"), "hash-2", purge_at)
+        await store.add(_session("s3", user_id="user-2"), "hash-3", purge_at)
+
+        assert (await store.get("s1")).session_id == "s1"
+        assert (await store.get_by_token_hash("hash-2")).session_id == "s2"
+        assert await store.get_by_token_hash("missing") is None
+        assert {s.session_id for s in await store.list_for_user("user-1")} == {"s1", "s2"}
+
+    async def test_revoke_counts_only_known_sessions(self, store: InMemorySessionStore) -> None:
+        now = datetime.now(UTC)
+        await store.add(_session("s1"), "hash-1", now + timedelta(days=1))
+
+        revoked = await store.revoke(["s1", "unknown"], now, "logout", now + timedelta(hours=1))
+
+        assert revoked == 1
+        session = await store.get("s1")
+        assert session.status == SessionStatus.REVOKED
+        assert session.revoke_reason == "logout"
+
+    async def test_purge_removes_only_due_sessions(self, store: InMemorySessionStore) -> None:
+        now = datetime.now(UTC)
+        await store.add(_session("old"), "hash-old", now - timedelta(minutes=1))
+        await store.add(_session("new"), "hash-new", now + timedelta(days=1))
+
+        assert await store.purge_expired(now) == 1
+        assert await store.get("old") is None
+        assert await store.get_by_token_hash("hash-old") is None
+        assert [s.session_id for s in await store.list_for_user("user-1")] == ["new"]
+
+    async def test_revoke_reschedules_purge(self, store: InMemorySessionStore) -> None:
+        now = datetime.now(UTC)
+        await store.add(_session("s1"), "hash-1", now + timedelta(days=1))
+        await store.revoke(["s1"], now, "logout", now - timedelta(seconds=1))
+
+        assert await store.purge_expired(now) == 1
+        # The superseded heap entry is skipped once its deadline passes
+        assert await store.purge_expired(now + timedelta(days=2)) == 0
@@ -0,0 +1,71 @@
+"""Tests for lazy loading of the shared package exports."""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import shared
+
+PACKAGES = [
+    "shared",
+    *sorted(f"shared.{info.name}" for info in pkgutil.iter_modules(shared.__path__) if info.ispkg),
+]
+
+HEAVY_DEPENDENCIES = {"fastapi", "pydantic", "redis", "sqlalchemy", "starlette", "structlog"}
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+class TestLazyImports:
+    """Tests for PEP 562 lazy exports."""
+
+    def test_light_subpackages_do_not_import_heavy_dependencies(self) -> None:
+        """Should keep third-party frameworks out of a plain import."""
+        loaded = _loaded_after("import shared, shared.exceptions, shared.utils, shared.constants")
+
+        assert loaded & HEAVY_DEPENDENCIES == set()
+
+    def test_names_load_only_their_module(self) -> None:
+        """Should import just the submodule that defines the name."""
+        loaded = _loaded_after("from shared.cache import MemoryCache")
+
+        assert "sqlalchemy" not in loaded
+
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_all_exports_resolve(self, package: str) -> None:
+        """Should resolve every name listed in __all__."""
+        module = importlib.import_module(package)
+
+        missing = [name for name in module.__all__ if getattr(module, name, None) is None]
+
+        assert missing == []
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Should raise AttributeError for names that are not exported."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = shared.no_such_name
+
+    def test_alias_resolves_to_original(self) -> None:
+        """Should resolve re-exports under an alias."""
+        from shared.application import ValidationError
+
+        assert shared.ServiceValidationError is ValidationError
+
+    def test_name_shadowing_submodule(self) -> None:
+        """Should export the function, not the submodule of the same name."""
+        module = importlib.import_module("shared.extensions.transactional")
+        from shared.extensions import transactional
+
+        assert transactional is module.transactional
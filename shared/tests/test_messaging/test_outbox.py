@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from shared.ddd.events import DomainEvent
 from shared.messaging.outbox import OutboxBase, OutboxEntry, OutboxRelay, OutboxRepository
 from shared.messaging.serialization import EventSerializer
+from shared.messaging.types import PublishResult
 
 # ---- test fixtures ----
 
@@ -24,6 +25,34 @@ class ItemCreated(DomainEvent):
     name: str = ""
 
 
+class _ConfirmingPublisher:
+    """Publisher double that confirms every message except the nacked positions."""
+
+    def __init__(self, nacked: set[int] | None = None):
+        self.batches = []
+        self._nacked = nacked or set()
+
+    async def connect(self): ...
+
+    async def disconnect(self): ...
+
+    async def publish(self, event, routing_key=None, *, headers=None): ...
+
+    async def publish_batch(self, events, routing_key=None): ...
+
+    async def publish_many(self, messages):
+        self.batches.append(messages)
+        return [
+            PublishResult(
+                event_id=m.event.event_id,
+                routing_key=m.routing_key,
+                confirmed=i not in self._nacked,
+                error="nacked" if i in self._nacked else None,
+            )
+            for i, m in enumerate(messages)
+        ]
+
+
 @pytest.fixture
 async def engine():
     """Create an in-memory SQLite async engine for testing."""
@@ -212,3 +241,67 @@ class TestOutboxRelay:
         pending = await repo.get_pending()
         assert len(pending) == 1
         assert pending[0].retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pipelined_relay_bulk_marks_confirmed(self, session: AsyncSession):
+        """Pipelined relay should bulk-mark confirmed entries and fail nacked ones."""
+        repo = OutboxRepository(session)
+        for i in range(3):
+            await repo.add(OutboxEntry.from_domain_event(ItemCreated(item_id=f"p-{i}")))
+        await session.commit()
+
+        publisher = _ConfirmingPublisher(nacked={1})
+        relay = OutboxRelay(repo, publisher, EventSerializer(source="test"), pipelined=True)
+        count = await relay.process_pending(batch_size=10)
+        await session.commit()
+
+        assert count == 2
+        assert len(publisher.batches) == 1
+        assert publisher.batches[0][0].routing_key == "item.created"
+        pending = await repo.get_pending()
+        assert len(pending) == 1
+        assert pending[0].error == "nacked"
+
+    @pytest.mark.asyncio
+    async def test_pipelined_relay_fails_poison_payloads(self, session: AsyncSession):
+        """Pipelined relay should fail unreadable entries and publish the rest."""
+        repo = OutboxRepository(session)
+        entries = [OutboxEntry.from_domain_event(ItemCreated(item_id=f"p-{i}")) for i in range(3)]
+        entries[1].payload = "{not json"
+        for entry in entries:
+            await repo.add(entry)
+        await session.commit()
+
+        publisher = _ConfirmingPublisher()
+        relay = OutboxRelay(repo, publisher, EventSerializer(source="test"), pipelined=True)
+        count = await relay.process_pending(batch_size=10)
+        await session.commit()
+
+        assert count == 2
+        assert [m.event.event_id for m in publisher.batches[0]] == [
+            entries[0].event_id,
+            entries[2].event_id,
+        ]
+        pending = await repo.get_pending()
+        assert [p.event_id for p in pending] == [entries[1].event_id]
+        assert pending[0].retry_count == 1
+
+    def test_pipelined_requires_confirming_publisher(self, session: AsyncSession):
+        """pipelined=True should reject publishers without publish_many."""
+
+        class _PlainPublisher:
+            async def connect(self): ...
+
+            async def disconnect(self): ...
+
+            async def publish(self, event, routing_key=None, *, headers=None): ...
+
+            async def publish_batch(self, events, routing_key=None): ...
+
+        with pytest.raises(TypeError):
+            OutboxRelay(
+                OutboxRepository(session),
+                _PlainPublisher(),
+                EventSerializer(source="test"),
+                pipelined=True,
+            )
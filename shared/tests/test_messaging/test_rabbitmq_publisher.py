@@ -0,0 +1,162 @@
+"""Tests for shared.messaging.rabbitmq.publisher — channel pool and pipelined confirms."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.ddd.events import DomainEvent
+from shared.messaging.config import RabbitMQSettings
+from shared.messaging.rabbitmq.publisher import RabbitMQPublisher
+from shared.messaging.serialization import EventSerializer
+from shared.messaging.types import ConfirmingEventPublisher, OutgoingEvent
+
+
+@dataclass
+class OrderPlaced(DomainEvent):
+    """Test domain event."""
+
+    order_id: str = ""
+
+
+class _FakeExchange:
+    """Exchange double that resolves confirms after a short delay."""
+
+    def __init__(self, tracker: dict[str, int], fail_ids: set[str] | None = None) -> None:
+        self.published: list[tuple[str, str]] = []
+        self._tracker = tracker
+        self._fail_ids = fail_ids or set()
+
+    async def publish(self, message, routing_key: str) -> None:
+        self._tracker["in_flight"] += 1
+        self._tracker["peak"] = max(self._tracker["peak"], self._tracker["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            if message.message_id in self._fail_ids:
+                raise RuntimeError("nack")
+            self.published.append((message.message_id, routing_key))
+        finally:
+            self._tracker["in_flight"] -= 1
+
+
+@pytest.fixture
+def tracker() -> dict[str, int]:
+    return {"in_flight": 0, "peak": 0}
+
+
+async def _connected_publisher(
+    settings: RabbitMQSettings,
+    exchanges: list[_FakeExchange],
+) -> RabbitMQPublisher:
+    """Connect a publisher whose channels hand out the given exchanges."""
+    channels = []
+    for exchange in exchanges:
+        channel = MagicMock()
+        channel.is_closed = False
+        channel.declare_exchange = AsyncMock(return_value=exchange)
+        channel.get_exchange = AsyncMock(return_value=exchange)
+        channel.close = AsyncMock()
+        channels.append(channel)
+
+    connection = MagicMock()
+    connection.is_closed = False
+    connection.channel = AsyncMock(side_effect=channels)
+    connection.close = AsyncMock()
+
+    publisher = RabbitMQPublisher(settings, EventSerializer(source="test"))
+    with patch("aio_pika.connect_robust", AsyncMock(return_value=connection)):
+        await publisher.connect()
+    return publisher
+
+
+class TestRabbitMQPublisherPipelining:
+    """Tests for channel pooling and pipelined publisher confirms."""
+
+    def test_implements_confirming_protocol(self):
+        publisher = RabbitMQPublisher(RabbitMQSettings(), EventSerializer(source="test"))
+        assert isinstance(publisher, ConfirmingEventPublisher)
+
+    async def test_publish_many_spreads_over_channel_pool(self, tracker):
+        settings = RabbitMQSettings(publisher_channel_pool_size=3)
+        exchanges = [_FakeExchange(tracker) for _ in range(3)]
+        publisher = await _connected_publisher(settings, exchanges)
+
+        events = [OrderPlaced(order_id=str(i)) for i in range(9)]
+        results = await publisher.publish_many([OutgoingEvent(e) for e in events])
+
+        assert [r.event_id for r in results] == [e.event_id for e in events]
+        assert all(r.confirmed for r in results)
+        assert all(r.routing_key == "order.placed" for r in results)
+        assert [len(x.published) for x in exchanges] == [3, 3, 3]
+        assert tracker["peak"] > 1
+
+    async def test_in_flight_window_is_bounded(self, tracker):
+        settings = RabbitMQSettings(publisher_channel_pool_size=2, publisher_max_in_flight=4)
+        exchanges = [_FakeExchange(tracker) for _ in range(2)]
+        publisher = await _connected_publisher(settings, exchanges)
+
+        await publisher.publish_many([OutgoingEvent(OrderPlaced()) for _ in range(20)])
+
+        assert tracker["peak"] == 4
+
+    async def test_publish_many_reports_nacks_per_message(self, tracker):
+        events = [OrderPlaced(order_id=str(i)) for i in range(3)]
+        exchange = _FakeExchange(tracker, fail_ids={events[1].event_id})
+        settings = RabbitMQSettings(publisher_channel_pool_size=1)
+        publisher = await _connected_publisher(settings, [exchange])
+
+        results = await publisher.publish_many(
+            [OutgoingEvent(e, routing_key="orders") for e in events]
+        )
+
+        assert [r.confirmed for r in results] == [True, False, True]
+        assert results[1].error == "nack"
+        assert results[1].routing_key == "orders"
+
+    async def test_publish_many_reports_serialization_errors_per_message(self, tracker):
+        events = [OrderPlaced(order_id=str(i)) for i in range(3)]
+        exchange = _FakeExchange(tracker)
+        settings = RabbitMQSettings(publisher_channel_pool_size=1)
+        publisher = await _connected_publisher(settings, [exchange])
+        serialize = publisher._serializer.serialize
+
+        def _serialize(event, **kwargs):
+            if event is events[1]:
+                raise TypeError("not serializable")
+            return serialize(event, **kwargs)
+
+        with patch.object(publisher._serializer, "serialize", side_effect=_serialize):
+            results = await publisher.publish_many([OutgoingEvent(e) for e in events])
+
+        assert [r.confirmed for r in results] == [True, False, True]
+        assert results[1].error == "not serializable"
+        assert len(exchange.published) == 2
+
+    async def test_publish_batch_raises_first_error(self, tracker):
+        events = [OrderPlaced(order_id=str(i)) for i in range(3)]
+        exchange = _FakeExchange(tracker, fail_ids={events[0].event_id})
+        settings = RabbitMQSettings(publisher_channel_pool_size=1)
+        publisher = await _connected_publisher(settings, [exchange])
+
+        with pytest.raises(RuntimeError, match="nack"):
+            await publisher.publish_batch(events)
+        # Remaining messages are still published before the error surfaces
+        assert len(exchange.published) == 2
+
+    async def test_publish_many_requires_connection(self):
+        publisher = RabbitMQPublisher(RabbitMQSettings(), EventSerializer(source="test"))
+        with pytest.raises(RuntimeError, match="not connected"):
+            await publisher.publish_many([OutgoingEvent(OrderPlaced())])
+
+    async def test_disconnect_closes_all_pool_channels(self, tracker):
+        settings = RabbitMQSettings(publisher_channel_pool_size=3)
+        publisher = await _connected_publisher(settings, [_FakeExchange(tracker) for _ in range(3)])
+        channels = list(publisher._channels)
+
+        await publisher.disconnect()
+
+        for channel in channels:
+            channel.close.assert_awaited_once()
@@ -0,0 +1,223 @@
+"""Tests for shared.observability.async_logging module."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from shared.observability.async_logging import (
+    AsyncLogHandler,
+    DropPolicy,
+    QueuedLogger,
+)
+from shared.observability.logging import (
+    JSONFormatter,
+    LogContextFilter,
+    configure_logging,
+    set_correlation_id,
+    with_context,
+)
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting records, optionally blocking until released."""
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.gate = gate
+        self.entered = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.records.append(record)
+
+
+def _record(msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, "test.py", 1, msg, args, None)
+
+
+def _messages(handler: ListHandler) -> list[str]:
+    return [record.getMessage() for record in handler.records]
+
+
+class TestAsyncLogHandler:
+    """Tests for AsyncLogHandler."""
+
+    def test_delivers_records_on_listener_thread(self) -> None:
+        """Should hand records to the downstream handlers."""
+        downstream = ListHandler()
+        handler = AsyncLogHandler(downstream)
+
+        handler.handle(_record("hello %s", "world"))
+        handler.close()
+
+        assert _messages(downstream) == ["hello world"]
+        assert handler.stats().enqueued == 1
+
+    def test_close_drains_queue(self) -> None:
+        """Should write every queued record before close returns."""
+        downstream = ListHandler()
+        handler = AsyncLogHandler(downstream)
+
+        for i in range(500):
+            handler.handle(_record("line %d", i))
+        handler.close()
+
+        assert len(downstream.records) == 500
+
+    def test_resolves_arguments_before_enqueue(self) -> None:
+        """Should not see later mutation of the arguments."""
+        gate = threading.Event()
+        downstream = ListHandler(gate)
+        handler = AsyncLogHandler(downstream)
+        payload = {"state": "before"}
+
+        handler.handle(_record("%s", payload))
+        payload["state"] = "after"
+        gate.set()
+        handler.close()
+
+        assert _messages(downstream) == ["{'state': 'before'}"]
+
+    def test_drop_newest_when_full(self) -> None:
+        """Should discard incoming records and count them."""
+        gate = threading.Event()
+        downstream = ListHandler(gate)
+        handler = AsyncLogHandler(downstream, max_queue=2)
+
+        handler.handle(_record("blocking"))
+        assert downstream.entered.wait(timeout=5)
+        for name in ("a", "b", "c", "d"):
+            handler.handle(_record(name))
+        stats = handler.stats()
+        gate.set()
+        handler.close()
+
+        assert stats.dropped == 2
+        assert stats.queue_depth == 2
+        assert _messages(downstream) == ["blocking", "a", "b"]
+
+    def test_drop_oldest_when_full(self) -> None:
+        """Should discard the oldest queued records and keep the newest."""
+        gate = threading.Event()
+        downstream = ListHandler(gate)
+        handler = AsyncLogHandler(downstream, max_queue=2, drop_policy="drop_oldest")
+
+        handler.handle(_record("blocking"))
+        assert downstream.entered.wait(timeout=5)
+        for name in ("a", "b", "c", "d"):
+            handler.handle(_record(name))
+        gate.set()
+        handler.close()
+
+        assert handler.drop_policy is DropPolicy.DROP_OLDEST
+        assert handler.stats().dropped == 2
+        assert _messages(downstream) == ["blocking", "c", "d"]
+
+    def test_rejects_empty_queue(self) -> None:
+        """Should require room for at least one record."""
+        with pytest.raises(ValueError, match="max_queue"):
+            AsyncLogHandler(ListHandler(), max_queue=0)
+
+    def test_exception_text_survives_thread_handoff(self) -> None:
+        """Should format the traceback before the record leaves the thread."""
+        stream = io.StringIO()
+        downstream = logging.StreamHandler(stream)
+        downstream.setFormatter(JSONFormatter())
+        handler = AsyncLogHandler(downstream)
+        logger = logging.getLogger("test.async.exception")
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        logger.removeHandler(handler)
+        handler.close()
+
+        log_data = json.loads(stream.getvalue())
+        assert "ValueError: boom" in log_data["exception"]
+
+    def test_log_context_filter_captures_context(self) -> None:
+        """Should carry correlation ID and context fields to the listener."""
+        stream = io.StringIO()
+        downstream = logging.StreamHandler(stream)
+        downstream.setFormatter(JSONFormatter())
+        handler = AsyncLogHandler(downstream)
+        handler.addFilter(LogContextFilter())
+        logger = logging.getLogger("test.async.context")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        set_correlation_id("corr-async")
+        with with_context(order_id="o-1"):
+            logger.info("placed")
+        set_correlation_id(None)
+        logger.removeHandler(handler)
+        handler.close()
+
+        log_data = json.loads(stream.getvalue())
+        assert log_data["correlation_id"] == "corr-async"
+        assert log_data["order_id"] == "o-1"
+
+
+class TestQueuedLogger:
+    """Tests for QueuedLogger rendered-line output."""
+
+    def test_writes_str_and_bytes(self) -> None:
+        """Should write str lines as text and bytes lines to the buffer."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+        handler = AsyncLogHandler()
+        logger = QueuedLogger(handler, stream)
+
+        logger.info('{"event": "text"}')
+        logger.info(b'{"event": "bytes"}')
+        handler.close()
+
+        lines = raw.getvalue().decode().splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["text", "bytes"]
+
+    def test_decodes_bytes_without_buffer(self) -> None:
+        """Should fall back to text for streams without a buffer."""
+        stream = io.StringIO()
+        handler = AsyncLogHandler()
+
+        QueuedLogger(handler, stream).info(b"line")
+        handler.close()
+
+        assert stream.getvalue() == "line\n"
+
+
+class TestConfigureAsyncLogging:
+    """Tests for configure_logging with async_logging."""
+
+    def test_installs_async_handler(self) -> None:
+        """Should route root logging through an AsyncLogHandler."""
+        stream = io.StringIO()
+        configure_logging(stream=stream, async_logging=True, max_queue=100)
+        root = logging.getLogger()
+        (handler,) = root.handlers
+        try:
+            assert isinstance(handler, AsyncLogHandler)
+            assert handler.max_queue == 100
+
+            set_correlation_id("corr-root")
+            logging.getLogger("test.async.root").info("queued")
+            set_correlation_id(None)
+        finally:
+            configure_logging(stream=io.StringIO())
+
+        assert handler.handlers == ()
+        log_data = json.loads(stream.getvalue())
+        assert log_data["message"] == "queued"
+        assert log_data["correlation_id"] == "corr-root"
@@ -7,18 +7,29 @@ readiness probes, and dependency health checks.
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Iterator
 
 import pytest
 
+from shared.observability import health
 from shared.observability.health import (
     HealthCheck,
     HealthCheckResult,
+    HealthMonitor,
     HealthStatus,
     check_liveness,
     check_readiness,
     create_health_check,
     get_health_status,
     register_health_check,
+    run_health_checks,
+    set_health_monitor,
+)
+from shared.observability.prometheus_bridge import (
+    InMemoryMetricsBackend,
+    get_metrics_backend,
+    set_metrics_backend,
 )
 
 
@@ -341,3 +352,142 @@ class TestHealthCheckIntegration:
         assert isinstance(status, dict)
         assert "status" in status
         assert status["status"] in ["healthy", "unhealthy", "degraded"]
+
+
+@pytest.fixture
+def isolated_checks(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, HealthCheck]]:
+    """Give the test an empty check registry and no health monitor."""
+    checks: dict[str, HealthCheck] = {}
+    monkeypatch.setattr(health, "_health_checks", checks)
+    yield checks
+    set_health_monitor(None)
+
+
+def _counting_check(name: str, calls: list[str], delay: float = 0.0) -> None:
+    async def check() -> HealthCheckResult:
+        calls.append(name)
+        await asyncio.sleep(delay)
+        return HealthCheckResult(name=name, status=HealthStatus.HEALTHY)
+
+    register_health_check(name=name, check_fn=check)
+
+
+class TestRunHealthChecks:
+    """Tests for concurrent execution of registered checks."""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self, isolated_checks: dict) -> None:
+        """Should take about as long as the slowest check."""
+        calls: list[str] = []
+        for name in ("db", "cache", "broker"):
+            _counting_check(name, calls, delay=0.2)
+
+        started = time.perf_counter()
+        report = await run_health_checks()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.5
+        assert [c["name"] for c in report["checks"]] == ["db", "cache", "broker"]
+        assert report["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out_alone(self, isolated_checks: dict) -> None:
+        """Should fail only the check that exceeds its own timeout."""
+        calls: list[str] = []
+        _counting_check("fast", calls)
+
+        async def hang() -> HealthCheckResult:
+            await asyncio.sleep(10)
+            return HealthCheckResult(name="slow", status=HealthStatus.HEALTHY)
+
+        register_health_check(name="slow", check_fn=hang, critical=True, timeout_seconds=0.1)
+
+        report = await run_health_checks()
+
+        statuses = {c["name"]: c["status"] for c in report["checks"]}
+        assert statuses == {"fast": "healthy", "slow": "unhealthy"}
+        assert report["status"] == "unhealthy"
+
+    @pytest.mark.asyncio
+    async def test_records_duration_histogram(self, isolated_checks: dict) -> None:
+        """Should observe each check's duration labelled by check name."""
+        previous = get_metrics_backend()
+        backend = InMemoryMetricsBackend()
+        set_metrics_backend(backend)
+        try:
+            _counting_check("db", [], delay=0.01)
+            await run_health_checks()
+        finally:
+            set_metrics_backend(previous)
+
+        histogram = backend.histogram("health_check_duration_seconds", "")
+        (observed,) = histogram._observations["check=db"]
+        assert 0.01 <= observed < 1.0
+
+
+class TestHealthMonitor:
+    """Tests for HealthMonitor caching and background refresh."""
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_report_within_ttl(self, isolated_checks: dict) -> None:
+        """Should run the checks once per TTL."""
+        calls: list[str] = []
+        _counting_check("db", calls)
+        monitor = HealthMonitor(ttl_seconds=60)
+        set_health_monitor(monitor)
+
+        first = await check_readiness()
+        second = await check_readiness()
+
+        assert calls == ["db"]
+        assert second is first
+        assert monitor.stats().refreshes == 1
+        assert monitor.stats().cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_expired_report(self, isolated_checks: dict) -> None:
+        """Should rerun the checks once the report is older than the TTL."""
+        calls: list[str] = []
+        _counting_check("db", calls)
+        monitor = HealthMonitor(ttl_seconds=0.05)
+
+        await monitor.get()
+        await asyncio.sleep(0.06)
+        await monitor.get()
+
+        assert calls == ["db", "db"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_one_refresh(self, isolated_checks: dict) -> None:
+        """Should not stampede the dependencies when the cache is empty."""
+        calls: list[str] = []
+        _counting_check("db", calls, delay=0.05)
+        monitor = HealthMonitor(ttl_seconds=60)
+
+        reports = await asyncio.gather(*(monitor.get() for _ in range(20)))
+
+        assert calls == ["db"]
+        assert all(report is reports[0] for report in reports)
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self, isolated_checks: dict) -> None:
+        """Should refresh on its own interval until stopped."""
+        calls: list[str] = []
+        _counting_check("db", calls)
+        monitor = HealthMonitor(ttl_seconds=60, refresh_interval_seconds=0.02)
+
+        await monitor.start()
+        assert monitor.running
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        refreshed = len(calls)
+        await asyncio.sleep(0.05)
+
+        assert not monitor.running
+        assert refreshed >= 3
+        assert len(calls) == refreshed
+
+    def test_rejects_non_positive_ttl(self) -> None:
+        """Should require a positive TTL."""
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            HealthMonitor(ttl_seconds=0)
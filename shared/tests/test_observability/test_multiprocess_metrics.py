@@ -0,0 +1,273 @@
+"""Tests for shared.observability.multiprocess_metrics module."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shared.observability.multiprocess_metrics import (
+    CONTENT_TYPE,
+    ExpositionRenderer,
+    MultiprocessMetricsBackend,
+    clear_multiprocess_directory,
+    create_multiprocess_metrics_app,
+    mark_process_dead,
+)
+from shared.observability.prometheus_bridge import create_metrics_backend
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def _lines(directory: Path, **kwargs: Any) -> list[str]:
+    return ExpositionRenderer(directory, **kwargs).render().decode().splitlines()
+
+
+def _in_child(work: Any) -> None:
+    """Run ``work`` in a forked worker process and wait for it to exit."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            work()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+
+def _copy_gauge_file(directory: Path, source_pid: int, target_pid: int, value: float) -> None:
+    """Copy a single-gauge file to another live PID with a different value."""
+    data = bytearray((directory / f"gauges_{source_pid}.db").read_bytes())
+    used = struct.unpack_from("<I", data, 0)[0]
+    struct.pack_into("<d", data, used - 8, value)
+    (directory / f"gauges_{target_pid}.db").write_bytes(bytes(data))
+
+
+class TestMultiprocessMetricsBackend:
+    """Tests for MultiprocessMetricsBackend."""
+
+    def test_renders_counter(self, tmp_path: Path) -> None:
+        """Should expose counters with HELP, TYPE and _total samples."""
+        backend = MultiprocessMetricsBackend(tmp_path, namespace="svc")
+        counter = backend.counter("requests_total", "Total requests", ["method"])
+        counter.labels(method="GET").inc()
+        counter.labels(method="GET").inc(2)
+
+        assert _lines(tmp_path) == [
+            "# HELP svc_requests_total Total requests",
+            "# TYPE svc_requests_total counter",
+            'svc_requests_total{method="GET"} 3.0',
+        ]
+
+    def test_renders_cumulative_histogram(self, tmp_path: Path) -> None:
+        """Should expose cumulative buckets, count and sum."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        histogram = backend.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert _lines(tmp_path)[2:] == [
+            'latency_seconds_bucket{le="0.1"} 1.0',
+            'latency_seconds_bucket{le="1.0"} 2.0',
+            'latency_seconds_bucket{le="+Inf"} 3.0',
+            "latency_seconds_count 3.0",
+            "latency_seconds_sum 5.55",
+        ]
+
+    def test_output_parses_with_prometheus_client(self, tmp_path: Path) -> None:
+        """Should round-trip through the prometheus_client text parser."""
+        parser = pytest.importorskip("prometheus_client.parser")
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.counter("requests_total", "Requests", ["method"]).labels(method="GET").inc(3)
+        backend.gauge("queue_depth", "Depth").set(7)
+        backend.histogram("latency_seconds", "Latency", buckets=(1.0,)).observe(0.5)
+
+        families = {
+            f.name: f
+            for f in parser.text_string_to_metric_families(
+                ExpositionRenderer(tmp_path).render().decode()
+            )
+        }
+
+        assert {name: f.type for name, f in families.items()} == {
+            "latency_seconds": "histogram",
+            "queue_depth": "gauge",
+            "requests": "counter",
+        }
+        (sample,) = families["requests"].samples
+        assert (sample.name, sample.labels, sample.value) == (
+            "requests_total",
+            {"method": "GET"},
+            3.0,
+        )
+        assert families["queue_depth"].samples[0].value == 7.0
+        assert len(families["latency_seconds"].samples) == 4
+
+    def test_escapes_label_values(self, tmp_path: Path) -> None:
+        """Should escape quotes, backslashes and newlines in label values."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.gauge("paths", "Paths", ["path"]).labels(path='a"b\\c\n').set(1)
+
+        assert _lines(tmp_path)[-1] == r'paths{path="a\"b\\c\n"} 1.0'
+
+    def test_renderer_picks_up_new_series_and_values(self, tmp_path: Path) -> None:
+        """Should reflect samples recorded between scrapes."""
+        counter = MultiprocessMetricsBackend(tmp_path).counter("hits_total", "Hits", ["key"])
+        renderer = ExpositionRenderer(tmp_path)
+        counter.labels(key="a").inc()
+        renderer.render()
+
+        counter.labels(key="a").inc()
+        counter.labels(key="b").inc(5)
+
+        assert renderer.render().decode().splitlines()[2:] == [
+            'hits_total{key="a"} 2.0',
+            'hits_total{key="b"} 5.0',
+        ]
+
+    def test_renderer_survives_cleared_directory(self, tmp_path: Path) -> None:
+        """Should re-read files recreated after the directory was cleared."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.counter("old_total", "Old").labels().inc()
+        renderer = ExpositionRenderer(tmp_path)
+        renderer.render()
+        backend.close()
+        clear_multiprocess_directory(tmp_path)
+
+        MultiprocessMetricsBackend(tmp_path).counter("new_total", "New").inc(2)
+
+        assert renderer.render().decode().splitlines()[2:] == ["new_total 2.0"]
+
+    def test_rejects_negative_counter_increment(self, tmp_path: Path) -> None:
+        """Should only allow counters to go up."""
+        counter = MultiprocessMetricsBackend(tmp_path).counter("events_total", "Events")
+
+        with pytest.raises(ValueError, match="non-negative"):
+            counter.inc(-1)
+
+    def test_many_label_sets_grow_the_file(self, tmp_path: Path) -> None:
+        """Should keep every series when the file outgrows its mapping."""
+        counter = MultiprocessMetricsBackend(tmp_path).counter("hits_total", "Hits", ["key"])
+        for i in range(3000):
+            counter.labels(key=f"key-{i:05d}").inc(i)
+
+        samples = [line for line in _lines(tmp_path) if not line.startswith("#")]
+        assert len(samples) == 3000
+        assert samples[-1] == 'hits_total{key="key-02999"} 2999.0'
+
+    def test_requires_directory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should refuse to start without a shared directory."""
+        monkeypatch.delenv("METRICS_MULTIPROC_DIR", raising=False)
+
+        with pytest.raises(ValueError, match="METRICS_MULTIPROC_DIR"):
+            MultiprocessMetricsBackend()
+
+    def test_created_from_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should be chosen automatically when the directory is configured."""
+        monkeypatch.setenv("METRICS_MULTIPROC_DIR", str(tmp_path))
+
+        backend = create_metrics_backend()
+
+        assert isinstance(backend, MultiprocessMetricsBackend)
+        assert backend.directory == tmp_path
+
+
+@requires_fork
+class TestAggregation:
+    """Tests for aggregation across worker processes."""
+
+    def test_sums_counters_and_histograms_across_workers(self, tmp_path: Path) -> None:
+        """Should add the samples of every worker, including exited ones."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        counter = backend.counter("jobs_total", "Jobs", ["queue"])
+        histogram = backend.histogram("job_seconds", "Job time", buckets=(1.0,))
+        counter.labels(queue="default").inc()
+        histogram.observe(0.5)
+
+        def worker() -> None:
+            counter.labels(queue="default").inc(4)
+            histogram.observe(2.0)
+
+        _in_child(worker)
+        _in_child(worker)
+
+        lines = _lines(tmp_path)
+        assert 'jobs_total{queue="default"} 9.0' in lines
+        assert 'job_seconds_bucket{le="1.0"} 1.0' in lines
+        assert "job_seconds_count 3.0" in lines
+        assert len(list(tmp_path.glob("metrics_*.db"))) == 3
+
+    def test_gauges_count_live_workers_only(self, tmp_path: Path) -> None:
+        """Should drop gauges of exited workers."""
+        gauge = MultiprocessMetricsBackend(tmp_path).gauge("inflight", "In flight")
+        gauge.set(2)
+        _in_child(lambda: gauge.set(100))
+
+        assert _lines(tmp_path)[-1] == "inflight 2.0"
+
+    def test_gauge_modes(self, tmp_path: Path) -> None:
+        """Should combine gauges of live processes per gauge mode."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.gauge("workers", "Workers").set(3)
+        pid, other = os.getpid(), os.getppid()
+        _copy_gauge_file(tmp_path, pid, other, value=5.0)
+
+        assert _lines(tmp_path, gauge_mode="sum")[-1] == "workers 8.0"
+        assert _lines(tmp_path, gauge_mode="max")[-1] == "workers 5.0"
+        assert _lines(tmp_path, gauge_mode="min")[-1] == "workers 3.0"
+        assert sorted(_lines(tmp_path, gauge_mode="all")[2:]) == sorted(
+            [f'workers{{pid="{pid}"}} 3.0', f'workers{{pid="{other}"}} 5.0']
+        )
+
+
+class TestMaintenance:
+    """Tests for directory maintenance helpers."""
+
+    def test_mark_process_dead_removes_gauges_only(self, tmp_path: Path) -> None:
+        """Should delete the gauge file and keep the counter file."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.counter("c_total", "C").inc()
+        backend.gauge("g", "G").set(1)
+        backend.close()
+
+        mark_process_dead(os.getpid(), tmp_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == [f"metrics_{os.getpid()}.db"]
+
+    def test_clear_directory(self, tmp_path: Path) -> None:
+        """Should delete every sample file."""
+        backend = MultiprocessMetricsBackend(tmp_path)
+        backend.counter("c_total", "C").inc()
+        backend.close()
+
+        clear_multiprocess_directory(tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestMetricsApp:
+    """Tests for the ASGI exposition app."""
+
+    def test_serves_exposition(self, tmp_path: Path) -> None:
+        """Should answer with the text format and its content type."""
+        MultiprocessMetricsBackend(tmp_path).counter("hits_total", "Hits").inc()
+        app = create_multiprocess_metrics_app(tmp_path)
+        messages: list[dict[str, Any]] = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            messages.append(message)
+
+        asyncio.run(app({"type": "http", "method": "GET", "path": "/"}, receive, send))
+
+        start, body = messages
+        assert start["status"] == 200
+        assert (b"content-type", CONTENT_TYPE) in start["headers"]
+        assert body["body"].endswith(b"hits_total 1.0\n")
@@ -0,0 +1,143 @@
+"""Tests for shared.observability.span_export module."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from shared.observability.span_export import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    OTLPHttpSpanExporter,
+)
+from shared.observability.tracing import Span, SpanKind
+
+
+def _span(name: str = "op", **kwargs: object) -> Span:
+    span = Span(name=name, trace_id="ab" * 8, span_id="cd" * 8, **kwargs)  # type: ignore[arg-type]
+    span.end()
+    return span
+
+
+class RecordingExporter:
+    """Exporter recording batch sizes, optionally blocking until released."""
+
+    def __init__(self, *, block: bool = False) -> None:
+        self.batches: list[list[Span]] = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.shut_down = False
+
+    def export(self, spans: list[Span]) -> None:
+        self.release.wait(5)
+        self.batches.append(spans)
+
+    def shutdown(self) -> None:
+        self.shut_down = True
+
+
+class TestBatchSpanProcessor:
+    """Tests for BatchSpanProcessor."""
+
+    def test_rejects_batch_larger_than_queue(self) -> None:
+        """Should validate sizes."""
+        with pytest.raises(ValueError):
+            BatchSpanProcessor(RecordingExporter(), max_queue_size=10, max_export_batch_size=20)
+
+    def test_exports_in_batches_on_flush(self) -> None:
+        """Should split queued spans into batches of at most max_export_batch_size."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(exporter, max_export_batch_size=4, schedule_delay_seconds=60)
+        for i in range(10):
+            processor.on_end(_span(f"op{i}"))
+
+        assert processor.force_flush(timeout=5)
+        processor.shutdown()
+
+        assert sum(len(b) for b in exporter.batches) == 10
+        assert max(len(b) for b in exporter.batches) == 4
+        assert exporter.shut_down
+
+    def test_exports_on_schedule(self) -> None:
+        """Should export a partial batch once the delay elapses."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(exporter, schedule_delay_seconds=0.05)
+        processor.on_end(_span())
+
+        deadline = time.monotonic() + 5
+        while not exporter.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        processor.shutdown()
+
+        assert len(exporter.batches[0]) == 1
+
+    def test_drops_spans_when_queue_is_full(self) -> None:
+        """Should count and drop spans instead of blocking when the queue is full."""
+        exporter = RecordingExporter(block=True)
+        processor = BatchSpanProcessor(
+            exporter, max_queue_size=4, max_export_batch_size=2, schedule_delay_seconds=60
+        )
+        for _ in range(2):
+            processor.on_end(_span())
+        # Wait for the worker to take the first batch and block on export
+        deadline = time.monotonic() + 5
+        while processor.queue_depth and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        for _ in range(6):
+            processor.on_end(_span())
+        exporter.release.set()
+        processor.shutdown()
+
+        assert processor.dropped == 2
+        assert processor.exported == 6
+
+    def test_ignores_spans_after_shutdown(self) -> None:
+        """Should not queue spans once shut down."""
+        exporter = RecordingExporter()
+        processor = BatchSpanProcessor(exporter)
+        processor.shutdown()
+        processor.on_end(_span())
+
+        assert processor.queue_depth == 0
+
+
+class TestExporters:
+    """Tests for the span exporters."""
+
+    def test_file_exporter_writes_json_lines(self, tmp_path: Path) -> None:
+        """Should append one JSON object per span."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = FileSpanExporter(path)
+        exporter.export([_span("a"), _span("b")])
+        exporter.export([_span("c")])
+
+        names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+        assert names == ["a", "b", "c"]
+
+    def test_otlp_encoding(self) -> None:
+        """Should encode spans as an OTLP ExportTraceServiceRequest."""
+        exporter = OTLPHttpSpanExporter("http://collector:4318/", service_name="orders")
+        span = _span("GET /orders", kind=SpanKind.SERVER, parent_span_id="ef" * 4)
+        span.set_attribute("http.status_code", 500)
+        span.record_exception(ValueError("bad"))
+
+        body = exporter.encode([span])
+        resource_spans = body["resourceSpans"][0]
+        encoded = resource_spans["scopeSpans"][0]["spans"][0]
+
+        assert exporter._url == "http://collector:4318/v1/traces"
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "orders"}}
+        ]
+        assert len(encoded["traceId"]) == 32
+        assert encoded["parentSpanId"] == "0" * 8 + "ef" * 4
+        assert encoded["kind"] == 2
+        assert encoded["status"] == {"code": 2}
+        assert encoded["attributes"] == [{"key": "http.status_code", "value": {"intValue": "500"}}]
+        assert encoded["events"][0]["name"] == "exception"
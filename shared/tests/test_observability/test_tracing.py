@@ -6,17 +6,27 @@ context propagation, and trace configuration.
 
 from __future__ import annotations
 
+import contextvars
+import time
+from collections.abc import Callable, Generator
+from typing import Any
+
 import pytest
 
+from shared.observability import tracing
 from shared.observability.tracing import (
+    NonRecordingSpan,
+    Span,
     SpanKind,
     TracingConfig,
     configure_tracing,
     create_span,
     extract_context,
     get_current_span,
+    get_span_processor,
     get_trace_id,
     inject_context,
+    should_sample,
     traced,
 )
 
@@ -241,3 +251,156 @@ class TestConfigureTracing:
         # Operations should still work (as no-ops)
         with create_span("test"):
             pass
+
+
+class ListExporter:
+    """Exporter keeping spans in memory."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, batch: list[Span]) -> None:
+        self.spans.extend(batch)
+
+    def shutdown(self) -> None:
+        pass
+
+    def configure(self, **kwargs: Any) -> None:
+        """Enable tracing with this exporter and the given config options."""
+        configure_tracing(TracingConfig(service_name="test", **kwargs), exporter=self)
+
+
+@pytest.fixture
+def exporter() -> Generator[ListExporter, None, None]:
+    """Export spans to memory and restore the default config afterwards."""
+    exporter = ListExporter()
+    exporter.configure()
+    yield exporter
+    configure_tracing(TracingConfig())
+
+
+def _in_new_trace(fn: Callable[[], Any]) -> Any:
+    """Run ``fn`` in an empty context so it starts a new trace."""
+    return contextvars.Context().run(fn)
+
+
+def _flush() -> None:
+    processor = get_span_processor()
+    assert processor is not None
+    assert processor.force_flush(timeout=5)
+
+
+class TestSampling:
+    """Tests for head and tail sampling."""
+
+    def test_rate_must_be_a_fraction(self) -> None:
+        """Should reject sample rates outside 0-1."""
+        with pytest.raises(ValueError):
+            configure_tracing(TracingConfig(sample_rate=1.5))
+
+    def test_decision_is_deterministic_per_trace_id(self, exporter: ListExporter) -> None:
+        """Should sample the same trace IDs on every call and roughly at the rate."""
+        exporter.configure(sample_rate=0.25)
+        trace_ids = [f"{i * 0x9E3779B97F4A7C15 % (1 << 64):016x}" for i in range(4000)]
+
+        first = [should_sample(t) for t in trace_ids]
+        assert first == [should_sample(t) for t in trace_ids]
+        assert 0.2 < sum(first) / len(first) < 0.3
+
+    def test_sequential_roots_start_new_traces(self, exporter: ListExporter) -> None:
+        """Should give each root in one context its own trace ID and sampling decision."""
+        exporter.configure(sample_rate=0.5)
+
+        def run() -> list[Span]:
+            roots = []
+            for _ in range(400):
+                with create_span("job") as root:
+                    roots.append(root)
+            assert get_trace_id() is None
+            return roots
+
+        roots = _in_new_trace(run)
+
+        assert len({root.trace_id for root in roots}) == len(roots)
+        sampled = sum(root.is_recording for root in roots)
+        assert 0.35 < sampled / len(roots) < 0.65
+
+    def test_root_joins_remote_trace(self, exporter: ListExporter) -> None:
+        """Should keep a trace ID that was already set for a remote parent."""
+
+        def run() -> str:
+            tracing._trace_id.set("4bf92f3577b34da6a3ce929d0e0e4736")
+            with create_span("consumer") as root:
+                return root.trace_id
+
+        assert _in_new_trace(run) == "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    def test_unsampled_trace_uses_shared_noop_span(self, exporter: ListExporter) -> None:
+        """Should hand children the root's non-recording span and export nothing."""
+        exporter.configure(sample_rate=0.0)
+
+        def run() -> tuple[Span, Span, dict[str, str]]:
+            with create_span("root") as root, create_span("child") as child:
+                child.set_attribute("key", "value")
+                carrier: dict[str, str] = {}
+                inject_context(carrier)
+                return root, child, carrier
+
+        root, child, carrier = _in_new_trace(run)
+        _flush()
+
+        assert isinstance(root, NonRecordingSpan)
+        assert child is root
+        assert dict(child.attributes) == {}
+        assert root.trace_id and carrier["traceparent"].endswith("-00")
+        assert exporter.spans == []
+
+    def test_sampled_trace_is_exported(self, exporter: ListExporter) -> None:
+        """Should export every span of a sampled trace with parent links."""
+
+        def run() -> dict[str, str]:
+            with create_span("root"), create_span("child"):
+                carrier: dict[str, str] = {}
+                inject_context(carrier)
+                return carrier
+
+        carrier = _in_new_trace(run)
+        _flush()
+
+        child, root = exporter.spans
+        assert (root.name, child.name) == ("root", "child")
+        assert child.parent_span_id == root.span_id
+        assert carrier["traceparent"].endswith("-01")
+
+    def test_tail_sampling_keeps_error_traces(self, exporter: ListExporter) -> None:
+        """Should export head-dropped traces in which a span failed."""
+        exporter.configure(sample_rate=0.0, tail_sampling=True)
+
+        def ok() -> None:
+            with create_span("fast"), create_span("child"):
+                pass
+
+        def failing() -> None:
+            with create_span("root"), create_span("child"):
+                raise RuntimeError("boom")
+
+        _in_new_trace(ok)
+        with pytest.raises(RuntimeError):
+            _in_new_trace(failing)
+        _flush()
+
+        assert [s.name for s in exporter.spans] == ["child", "root"]
+        assert exporter.spans[1].attributes["sampling.tail_reason"] == "error"
+
+    def test_tail_sampling_keeps_slow_traces(self, exporter: ListExporter) -> None:
+        """Should export head-dropped traces slower than the threshold."""
+        exporter.configure(sample_rate=0.0, tail_sampling=True, tail_latency_threshold_ms=10)
+
+        def slow() -> None:
+            with create_span("slow"):
+                time.sleep(0.02)
+
+        _in_new_trace(slow)
+        _flush()
+
+        assert [s.attributes["sampling.tail_reason"] for s in exporter.spans] == ["latency"]
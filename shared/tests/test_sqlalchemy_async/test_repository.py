@@ -521,3 +521,278 @@ class TestFilteringAndPagination:
 
             # Should return all users (order ignored)
             assert len(users) == 5
+
+
+class TestKeysetPagination:
+    """Tests for AsyncCRUDRepository.paginate_keyset."""
+
+    @pytest.fixture
+    async def db_manager(self):
+        """Create a database seeded with users sharing some names."""
+        manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+        await manager.create_all(Base)
+        async with manager.get_session() as session:
+            repo = UserRepository(session)
+            for i, name in enumerate(["Eve", "Bob", "Alice", "Bob", "Dan", "Alice", "Carl"]):
+                await repo.create(name=name, email=f"user{i}@example.com")
+        yield manager
+        await manager.dispose()
+
+    async def _walk(self, repo: UserRepository, order_by: list[OrderBy], size: int) -> list[int]:
+        ids: list[int] = []
+        cursor = None
+        while True:
+            page = await repo.paginate_keyset(cursor, order_by, size)
+            ids.extend(u.id for u in page.items)
+            if page.next_cursor is None:
+                assert page.has_next is False
+                return ids
+            cursor = page.next_cursor
+
+    @pytest.mark.asyncio
+    async def test_walk_matches_offset_order(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should visit every row once, with the primary key breaking ties."""
+        order_by = [OrderBy(field="name", direction=OrderDirection.ASC)]
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            expected = [
+                u.id
+                for u in await repo.find_with_filters(order_by=[*order_by, OrderBy(field="id")])
+            ]
+            assert await self._walk(repo, order_by, size=2) == expected
+
+    @pytest.mark.asyncio
+    async def test_mixed_directions(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should seek correctly when sort directions differ."""
+        order_by = [
+            OrderBy(field="name", direction=OrderDirection.DESC),
+            OrderBy(field="id", direction=OrderDirection.ASC),
+        ]
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            expected = [u.id for u in await repo.find_with_filters(order_by=order_by)]
+            assert await self._walk(repo, order_by, size=3) == expected
+
+    @pytest.mark.asyncio
+    async def test_filters_and_approximate_total(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should apply filters and report a flagged total on request."""
+        filters = [Filter(field="name", operator=FilterOperator.IN, value=["Alice", "Bob"])]
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            page = await repo.paginate_keyset(None, None, 3, filters, approximate_total=True)
+            plain = await repo.paginate_keyset(page.next_cursor, None, 3, filters)
+
+        assert page.total == 4
+        assert page.total_is_estimate is True
+        assert page.has_next is True
+        assert plain.total is None
+        assert len(plain.items) == 1
+
+    @pytest.mark.asyncio
+    async def test_count_cache_is_bounded_per_class(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should keep the newest counts per repository class, up to the bound."""
+
+        class SmallCacheRepository(UserRepository):
+            count_cache_size = 2
+
+        class OtherRepository(UserRepository):
+            pass
+
+        async with db_manager.get_session() as session:
+            repo = SmallCacheRepository(session)
+            totals = [
+                await repo.estimate_count([Filter(field="name", value=name)])
+                for name in ("Alice", "Bob", "Carl")
+            ]
+            await OtherRepository(session).estimate_count()
+
+        assert totals == [2, 2, 1]
+        cached = list(SmallCacheRepository._count_cache)
+        assert len(cached) == 2
+        assert "Bob" in cached[0] and "Carl" in cached[1]
+        assert len(OtherRepository._count_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_count_cache_drops_expired_entries(
+        self, db_manager: AsyncDatabaseManager
+    ) -> None:
+        """Should not keep counts past their TTL."""
+
+        class UncachedRepository(UserRepository):
+            count_cache_ttl = 0.0
+
+        async with db_manager.get_session() as session:
+            repo = UncachedRepository(session)
+            for name in ("Alice", "Bob"):
+                await repo.estimate_count([Filter(field="name", value=name)])
+
+        assert len(UncachedRepository._count_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cursor_bound_to_ordering(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should reject a cursor issued for another ordering or tampered with."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            page = await repo.paginate_keyset(None, [OrderBy(field="name")], 2)
+            with pytest.raises(ValueError):
+                await repo.paginate_keyset(page.next_cursor, [OrderBy(field="email")], 2)
+            with pytest.raises(ValueError):
+                await repo.paginate_keyset("not-a-cursor!", [OrderBy(field="name")], 2)
+
+
+class TestBulkOperations:
+    """Tests for set-based writes and streaming."""
+
+    @pytest.fixture
+    async def db_manager(self):
+        """Create an empty database."""
+        manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+        await manager.create_all(Base)
+        yield manager
+        await manager.dispose()
+
+    @staticmethod
+    def _rows(count: int) -> list[dict[str, str]]:
+        return [{"name": f"user{i}", "email": f"user{i}@example.com"} for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should insert all rows and return them with generated keys."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            users = await repo.create_many(self._rows(50))
+
+            assert [u.name for u in users] == [f"user{i}" for i in range(50)]
+            assert all(u.id is not None for u in users)
+            assert await repo.count() == 50
+            assert await repo.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_many(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should insert new rows and update conflicting ones."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(2))
+
+            users = await repo.upsert_many(
+                [
+                    {"name": "renamed", "email": "user0@example.com"},
+                    {"name": "new", "email": "new@example.com"},
+                ],
+                conflict_columns=["email"],
+            )
+
+            assert [u.name for u in users] == ["renamed", "new"]
+            assert await repo.count() == 3
+            assert (await repo.find_one_by(email="user0@example.com")).name == "renamed"
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_do_nothing_returns_every_row(
+        self, db_manager: AsyncDatabaseManager
+    ) -> None:
+        """Should return existing rows unchanged alongside inserted ones, in input order."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(2))
+
+            users = await repo.upsert_many(
+                [
+                    {"name": "new", "email": "new@example.com"},
+                    {"name": "ignored", "email": "user1@example.com"},
+                    {"name": "ignored", "email": "user0@example.com"},
+                ],
+                conflict_columns=["email"],
+                update_columns=[],
+            )
+
+            assert [u.email for u in users] == [
+                "new@example.com",
+                "user1@example.com",
+                "user0@example.com",
+            ]
+            assert [u.name for u in users] == ["new", "user1", "user0"]
+            assert await repo.count() == 3
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_do_nothing_needs_conflict_columns(
+        self, db_manager: AsyncDatabaseManager
+    ) -> None:
+        """Should reject rows that cannot be matched to an existing row."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+
+            with pytest.raises(ValueError, match="email"):
+                await repo.upsert_many(
+                    [{"name": "no email"}], conflict_columns=["email"], update_columns=[]
+                )
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_where(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should update and delete matching rows without loading them."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(10))
+            low = [Filter(field="id", operator=FilterOperator.LE, value=4)]
+
+            assert await repo.update_where(low, {"name": "archived"}) == 4
+            assert await repo.count([Filter(field="name", value="archived")]) == 4
+            assert await repo.delete_where(low) == 4
+            assert await repo.count() == 6
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "bad_filter",
+        [
+            Filter(field="nmae", value="user1"),
+            Filter(field="name", operator=FilterOperator.IN, value="user1"),
+        ],
+    )
+    async def test_bulk_writes_reject_unresolvable_filters(
+        self, db_manager: AsyncDatabaseManager, bad_filter: Filter
+    ) -> None:
+        """Should raise instead of dropping a filter and touching every row."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(2))
+
+            with pytest.raises(ValueError, match="Cannot apply"):
+                await repo.update_where([bad_filter], {"name": "archived"})
+            with pytest.raises(ValueError, match="Cannot apply"):
+                await repo.delete_where([bad_filter])
+            assert await repo.count([Filter(field="name", value="archived")]) == 0
+            assert await repo.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_need_filters_or_all_rows(
+        self, db_manager: AsyncDatabaseManager
+    ) -> None:
+        """Should only write every row when all_rows is passed."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(3))
+
+            with pytest.raises(ValueError, match="all_rows"):
+                await repo.update_where([], {"name": "archived"})
+            with pytest.raises(ValueError, match="all_rows"):
+                await repo.delete_where([])
+            assert await repo.update_where([], {"name": "archived"}, all_rows=True) == 3
+            assert await repo.delete_where([], all_rows=True) == 3
+            assert await repo.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_stream(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should yield every matching row in order across batches."""
+        async with db_manager.get_session() as session:
+            repo = UserRepository(session)
+            await repo.create_many(self._rows(25))
+
+            names = [
+                u.name
+                async for u in repo.stream(
+                    [Filter(field="name", operator=FilterOperator.STARTS_WITH, value="user1")],
+                    [OrderBy(field="id")],
+                    yield_per=4,
+                )
+            ]
+
+            assert names == ["user1", *(f"user{i}" for i in range(10, 20))]
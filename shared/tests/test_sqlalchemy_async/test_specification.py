@@ -0,0 +1,128 @@
+"""Tests for shared.sqlalchemy_async.specification module."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.orm import DeclarativeBase
+
+from shared.dbs.repository import OrderBy
+from shared.dbs.specification import AlwaysFalse, AlwaysTrue, Attr, Specification
+from shared.sqlalchemy_async.database import AsyncDatabaseManager, DatabaseConfig
+from shared.sqlalchemy_async.repository import AsyncCRUDRepository
+from shared.sqlalchemy_async.specification import compile_specification
+
+
+class Base(DeclarativeBase):
+    """Test base class."""
+
+    pass
+
+
+class Product(Base):
+    """Test product model."""
+
+    __tablename__ = "products"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    category = Column(String(50))
+    price = Column(Integer, nullable=True)
+
+
+class ProductRepository(AsyncCRUDRepository[Product, int]):
+    """Test product repository."""
+
+    @property
+    def model_class(self) -> type[Product]:
+        return Product
+
+
+class ShortName(Specification[Product]):
+    """Custom specification with no SQL form."""
+
+    def is_satisfied_by(self, candidate: Product) -> bool:
+        return len(candidate.name) <= 4
+
+
+PRODUCTS = [
+    ("Desk", "furniture", 300),
+    ("Chair", "furniture", 120),
+    ("Lamp", "lighting", 40),
+    ("Bulb", "lighting", None),
+    ("Rug", "decor", 80),
+]
+
+
+@pytest.fixture
+async def db_manager():
+    """Create a database seeded with products."""
+    manager = AsyncDatabaseManager(DatabaseConfig(url="sqlite+aiosqlite:///:memory:"))
+    await manager.create_all(Base)
+    async with manager.get_session() as session:
+        await ProductRepository(session).create_many(
+            [{"name": n, "category": c, "price": p} for n, c, p in PRODUCTS]
+        )
+    yield manager
+    await manager.dispose()
+
+
+class TestCompileSpecification:
+    """Tests for compile_specification."""
+
+    def test_compiles_or_and_not(self) -> None:
+        """Should render every combinator into one WHERE clause."""
+        spec = Attr("category", "lighting") | ~Attr("price", 100, "gt")
+        sql = str(select(Product).where(compile_specification(spec, Product)))
+
+        assert " OR " in sql
+        assert "IS NOT true" in sql
+
+    def test_unknown_field_raises(self) -> None:
+        """Should refuse to silently drop a predicate."""
+        with pytest.raises(ValueError):
+            compile_specification(Attr("missing", 1) | Attr("name", "Desk"), Product)
+
+    def test_custom_specification_raises(self) -> None:
+        """Should reject specifications that only exist as Python code."""
+        with pytest.raises(NotImplementedError):
+            compile_specification(Attr("name", "Desk") & ShortName(), Product)
+
+
+class TestFindBySpecification:
+    """Tests for AsyncCRUDRepository.find_by_specification."""
+
+    async def _names(self, db_manager: AsyncDatabaseManager, spec: Specification) -> list[str]:
+        async with db_manager.get_session() as session:
+            repo = ProductRepository(session)
+            return [p.name for p in await repo.find_by_specification(spec, [OrderBy(field="id")])]
+
+    @pytest.mark.asyncio
+    async def test_or(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should push OR predicates to the database."""
+        spec = Attr("category", "decor") | Attr("price", 200, "gte")
+        assert await self._names(db_manager, spec) == ["Desk", "Rug"]
+
+    @pytest.mark.asyncio
+    async def test_not_matches_in_memory_semantics(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should keep NULL rows under negation, like is_satisfied_by."""
+        spec = ~Attr("price", 100, "gt")
+        expected = [
+            n for n, c, p in PRODUCTS if spec.is_satisfied_by(Product(name=n, category=c, price=p))
+        ]
+
+        assert await self._names(db_manager, spec) == expected == ["Lamp", "Bulb", "Rug"]
+
+    @pytest.mark.asyncio
+    async def test_nested_tree(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should compile nested combinations and constants."""
+        spec = (Attr("category", "furniture") & ~Attr("name", "Desk")) | (
+            AlwaysFalse() & AlwaysTrue()
+        )
+        assert await self._names(db_manager, spec) == ["Chair"]
+
+    @pytest.mark.asyncio
+    async def test_custom_specification_falls_back(self, db_manager: AsyncDatabaseManager) -> None:
+        """Should evaluate custom specifications in Python."""
+        spec = Attr("category", "lighting") & ShortName()
+        assert await self._names(db_manager, spec) == ["Lamp", "Bulb"]
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
+from starlette.datastructures import MutableHeaders
 
 from shared.observability import (
     configure_structlog_for_testing,
     get_correlation_id,
 )
 from shared.observability.middleware import (
+    RequestHook,
+    RequestInfo,
     RequestLoggingConfig,
     RequestLoggingMiddleware,
 )
@@ -334,3 +338,94 @@ class TestSlowRequestDetection:
 
         config2 = RequestLoggingConfig(slow_request_threshold_ms=5000.0)
         assert config2.slow_request_threshold_ms == 5000.0
+
+
+class RecordingHook(RequestHook):
+    """Hook recording the calls it receives."""
+
+    def __init__(self, name: str, calls: list[str]) -> None:
+        self.name = name
+        self.calls = calls
+
+    def on_request(self, request: RequestInfo) -> None:
+        self.calls.append(f"{self.name}.request")
+        request.log_fields[self.name] = True
+
+    def on_response(self, request: RequestInfo, headers: MutableHeaders) -> None:
+        self.calls.append(f"{self.name}.response:{request.status_code}")
+        headers[f"X-Hook-{self.name}"] = request.correlation_id
+
+    def on_complete(self, request: RequestInfo) -> None:
+        error = type(request.error).__name__ if request.error else None
+        self.calls.append(f"{self.name}.complete:{request.status_code}:{error}")
+
+
+class TestRequestHooks:
+    """Tests for RequestHook integration."""
+
+    @pytest.fixture
+    def calls(self) -> list[str]:
+        """Record of hook calls."""
+        return []
+
+    @pytest.fixture
+    def hooked_client(self, calls: list[str]) -> TestClient:
+        """Client for an app whose middleware runs two recording hooks."""
+        app = FastAPI()
+        app.add_middleware(
+            RequestLoggingMiddleware,
+            hooks=[RecordingHook("a", calls), RecordingHook("b", calls)],
+        )
+
+        @app.get("/ok")
+        async def ok():
+            return {"ok": True}
+
+        @app.get("/error")
+        async def error():
+            raise ValueError("Test error")
+
+        @app.get("/stream")
+        async def stream():
+            async def chunks():
+                for i in range(3):
+                    yield f"chunk{i}\n"
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_hooks_run_in_order_and_add_headers(self, hooked_client: TestClient, calls: list[str]):
+        """Hooks run in order, complete in reverse and can set response headers."""
+        response = hooked_client.get("/ok", headers={"X-Correlation-ID": "hook-id"})
+
+        assert response.headers["X-Hook-a"] == "hook-id"
+        assert response.headers["X-Hook-b"] == "hook-id"
+        assert calls == [
+            "a.request",
+            "b.request",
+            "a.response:200",
+            "b.response:200",
+            "b.complete:200:None",
+            "a.complete:200:None",
+        ]
+
+    def test_hooks_see_application_errors(self, hooked_client: TestClient, calls: list[str]):
+        """on_complete receives the exception raised by the application."""
+        hooked_client.get("/error")
+
+        assert calls[-1] == "a.complete:None:ValueError"
+
+    def test_streaming_response_passes_through(self, hooked_client: TestClient, calls: list[str]):
+        """Streaming bodies are forwarded unchanged with headers added."""
+        response = hooked_client.get("/stream")
+
+        assert response.text == "chunk0\nchunk1\nchunk2\n"
+        assert "X-Correlation-ID" in response.headers
+        assert calls[-1] == "a.complete:200:None"
+
+    def test_excluded_paths_skip_hooks(self, hooked_client: TestClient, calls: list[str]):
+        """Excluded paths bypass the hooks."""
+        hooked_client.get("/health")
+
+        assert calls == []
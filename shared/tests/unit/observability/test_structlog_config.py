@@ -11,6 +11,7 @@ from shared.observability import (
     configure_structlog,
     configure_structlog_for_testing,
     generate_correlation_id,
+    get_async_log_handler,
     get_correlation_id,
     get_structlog_logger,
     reset_structlog_configuration,
@@ -117,6 +118,29 @@ class TestConfigureStructlog:
         captured = capsys.readouterr()
         assert "my-test-service" in captured.out or "my-test-service" in captured.err
 
+    def test_async_logging_writes_from_listener(self, capsys):
+        """Test that async logging renders in context and writes on close."""
+        configure_structlog(
+            LoggingConfig(
+                service_name="async-service",
+                environment="production",
+                json_logs=True,
+                async_logging=True,
+            )
+        )
+        handler = get_async_log_handler()
+        assert handler is not None
+
+        set_correlation_id("corr-queued")
+        get_structlog_logger("test").info("queued message")
+        reset_structlog_configuration()
+
+        captured = capsys.readouterr()
+        assert get_async_log_handler() is None
+        assert handler.stats().enqueued == 1
+        assert "queued message" in captured.out
+        assert "corr-queued" in captured.out
+
 
 class TestCorrelationId:
     """Tests for correlation ID management."""